@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from apps.accounts.models import Address, BankDetails, User
+from apps.accounts.models import Address, BankDetails, RevokedToken, User
 
 
 @admin.register(User)
@@ -23,3 +23,10 @@ class BankDetailsAdmin(admin.ModelAdmin):
     list_display = ("id", "user", "account_holder_name", "account_number", "ifsc_code", "upi_id", "updated_at")
     search_fields = ("user__email", "account_holder_name", "account_number", "ifsc_code", "upi_id")
     ordering = ("-updated_at",)
+
+
+@admin.register(RevokedToken)
+class RevokedTokenAdmin(admin.ModelAdmin):
+    list_display = ("jti", "user", "expires_at", "created_at")
+    search_fields = ("jti", "user__email")
+    raw_id_fields = ("user",)
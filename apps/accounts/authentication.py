@@ -0,0 +1,85 @@
+"""
+JWT authentication without a ``User`` query per request.
+
+The little a request needs to be authorised (active flag, token version,
+role, email, staff flags) is kept in the cache under the user's id for
+``USER_STATE_CACHE_SECONDS`` and dropped whenever the user row is saved.
+The request user is a ``LazyUser`` holding just those fields: permission
+classes that check ``role`` cost nothing, and the full row is read in one
+query only when a view touches another field.
+
+Tokens carry the user's ``token_version`` as "ver". Bumping the version
+(``revoke_user_tokens``) or deactivating the user cuts off every token
+issued before, once the cached state is dropped. Single tokens are revoked
+by ``jti`` through ``apps.accounts.revocation``.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.accounts.models import LazyUser, User
+from apps.accounts.revocation import is_revoked
+
+TOKEN_VERSION_CLAIM = "ver"
+USER_STATE_FIELDS = ["id", "email", "role", "is_active", "is_staff", "is_superuser", "token_version"]
+
+
+def _state_key(user_id) -> str:
+	return f"accounts:user-state:{user_id}"
+
+
+def get_user_state(user_id) -> dict | None:
+	"""The cached auth state of a user, read from the database on a miss."""
+	key = _state_key(user_id)
+	state = cache.get(key)
+	if state is None:
+		state = User.objects.filter(pk=user_id).values(*USER_STATE_FIELDS).first()
+		if state is not None:
+			cache.set(key, state, settings.USER_STATE_CACHE_SECONDS)
+	return state
+
+
+def invalidate_user_state(user_id) -> None:
+	"""Drops the cached state once the current transaction commits."""
+	transaction.on_commit(lambda: cache.delete(_state_key(user_id)))
+
+
+def revoke_user_tokens(user_id) -> None:
+	"""Invalidates every token issued to the user so far."""
+	User.objects.filter(pk=user_id).update(token_version=F("token_version") + 1)
+	invalidate_user_state(user_id)
+
+
+def lazy_user(state: dict) -> LazyUser:
+	"""A ``LazyUser`` with only the state fields loaded; ``from_db`` defers the rest."""
+	values = [state[field.attname] for field in User._meta.concrete_fields if field.attname in state]
+	return LazyUser.from_db(DEFAULT_DB_ALIAS, USER_STATE_FIELDS, values)
+
+
+class LazyJWTAuthentication(JWTAuthentication):
+	"""``JWTAuthentication`` whose user comes from the cached auth state."""
+
+	def get_validated_token(self, raw_token):
+		token = super().get_validated_token(raw_token)
+		if is_revoked(token.get(api_settings.JTI_CLAIM)):
+			raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+		return token
+
+	def get_user(self, validated_token):
+		try:
+			user_id = validated_token[api_settings.USER_ID_CLAIM]
+		except KeyError as e:
+			raise InvalidToken("Token contained no recognizable user identification") from e
+
+		state = get_user_state(user_id)
+		if state is None:
+			raise AuthenticationFailed("User not found", code="user_not_found")
+		if not state["is_active"]:
+			raise AuthenticationFailed("User is inactive", code="user_inactive")
+		if validated_token.get(TOKEN_VERSION_CLAIM, 0) != state["token_version"]:
+			raise AuthenticationFailed("Token has been revoked.", code="token_revoked")
+		return lazy_user(state)
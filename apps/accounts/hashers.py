@@ -0,0 +1,23 @@
+"""
+Password hashers tuned from settings.
+
+``PASSWORD_HASH_PROFILE`` picks which of these is first in
+``PASSWORD_HASHERS``. Django re-encodes a password with the first hasher
+whenever it verifies one stored under another algorithm or other costs, so
+changing the profile or its costs upgrades existing hashes on each user's
+next successful login.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher, ScryptPasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+	time_cost = settings.PASSWORD_ARGON2["time_cost"]
+	memory_cost = settings.PASSWORD_ARGON2["memory_cost"]
+	parallelism = settings.PASSWORD_ARGON2["parallelism"]
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+	work_factor = settings.PASSWORD_SCRYPT["work_factor"]
+	block_size = settings.PASSWORD_SCRYPT["block_size"]
+	parallelism = settings.PASSWORD_SCRYPT["parallelism"]
@@ -0,0 +1,73 @@
+import time
+import uuid
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils.module_loading import import_string
+from rest_framework.test import APIRequestFactory
+
+from apps.accounts.models import User
+from apps.accounts.views import LoginView
+
+BENCH_PASSWORD = "bench-Passw0rd!"
+# TEST-NET address, so the throttle counters written here never match a real client.
+BENCH_IP = "192.0.2.10"
+
+
+class Command(BaseCommand):
+	help = "Measures hashing cost per configured hasher and login throughput of this worker."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--iterations", type=int, default=20)
+
+	def handle(self, *args, **options):
+		iterations = options["iterations"]
+		self.stdout.write(f"Hash profile: {settings.PASSWORD_HASH_PROFILE}")
+		for path in settings.PASSWORD_HASHERS:
+			self._bench_hasher(path, iterations)
+		with transaction.atomic():
+			email = f"bench-{uuid.uuid4().hex}@example.invalid"
+			User.objects.create_user(email=email, password=BENCH_PASSWORD)
+			self._bench_view(email, iterations)
+			transaction.set_rollback(True)
+
+	def _bench_hasher(self, path, iterations):
+		hasher = import_string(path)()
+		try:
+			encoded = hasher.encode(BENCH_PASSWORD, hasher.salt())
+		except ValueError as exc:
+			self.stdout.write(f"  {hasher.algorithm:<14} unavailable ({exc})")
+			return
+		started = time.perf_counter()
+		for _ in range(iterations):
+			hasher.verify(BENCH_PASSWORD, encoded)
+		per_hash = (time.perf_counter() - started) / iterations
+		self.stdout.write(f"  {hasher.algorithm:<14} {per_hash * 1000:8.1f} ms/verify  {1 / per_hash:8.1f} verifies/s")
+
+	def _post(self, view, email, password):
+		request = APIRequestFactory().post(
+			"/api/auth/login/", {"email": email, "password": password}, format="json", REMOTE_ADDR=BENCH_IP
+		)
+		return view(request)
+
+	def _bench_view(self, email, iterations):
+		throttles = LoginView.throttle_classes
+		LoginView.throttle_classes = []
+		try:
+			view = LoginView.as_view()
+			started = time.perf_counter()
+			for _ in range(iterations):
+				response = self._post(view, email, BENCH_PASSWORD)
+			elapsed = time.perf_counter() - started
+		finally:
+			LoginView.throttle_classes = throttles
+		self.stdout.write(f"Successful logins: {iterations / elapsed:8.1f}/s (last status {response.status_code})")
+
+		view = LoginView.as_view()
+		rejected, started = 0, time.perf_counter()
+		for _ in range(iterations * 10):
+			if self._post(view, email, "wrong-password").status_code == 429:
+				rejected += 1
+		elapsed = time.perf_counter() - started
+		self.stdout.write(f"Attempts under a burst: {iterations * 10 / elapsed:8.1f}/s, {rejected} throttled with 429")
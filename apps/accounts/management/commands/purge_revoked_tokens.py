@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.accounts.revocation import purge_expired
+
+
+class Command(BaseCommand):
+	help = "Deletes denylisted access tokens that have expired anyway."
+
+	def handle(self, *args, **options):
+		deleted = purge_expired()
+		self.stdout.write(f"Deleted {deleted} expired revoked tokens.")
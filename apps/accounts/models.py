@@ -1,6 +1,7 @@
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 
@@ -41,16 +42,44 @@ class User(AbstractBaseUser, PermissionsMixin):
 	is_staff = models.BooleanField(default=False)
 	is_verified = models.BooleanField(default=False)
 	date_joined = models.DateTimeField(default=timezone.now)
+	# Embedded in access tokens as "ver"; bumping it invalidates every token issued before.
+	token_version = models.PositiveIntegerField(default=0)
 
 	USERNAME_FIELD = "email"
 	REQUIRED_FIELDS: list[str] = []
 
 	objects = UserManager()
 
+	class Meta:
+		indexes = [
+			# Case-insensitive email lookups (``email__iexact`` compiles to UPPER(email) = UPPER(%s)).
+			models.Index(Upper("email"), name="accounts_user_email_upper"),
+			models.Index(fields=["role", "-date_joined", "-id"]),
+		]
+
 	def __str__(self) -> str:
 		return self.email
 
 
+class LazyUser(User):
+	"""
+	The request user built by ``apps.accounts.authentication`` from cached auth state.
+
+	Only the state fields are loaded; touching any other field loads the rest
+	of the row in one query. Saves send signals with this class as sender, so
+	receivers that watch ``User`` listen for it too.
+	"""
+
+	class Meta:
+		proxy = True
+
+	def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+		deferred = self.get_deferred_fields()
+		if fields is not None and deferred and set(fields) <= deferred:
+			fields = deferred
+		super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+
+
 class Address(models.Model):
 	user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="addresses")
 	name = models.CharField(max_length=150)
@@ -80,3 +109,14 @@ class BankDetails(models.Model):
 
 	def __str__(self) -> str:
 		return f"BankDetails for {self.user.email}"
+
+
+class RevokedToken(models.Model):
+	"""An access token that must be rejected before it expires, by its ``jti``"""
+	jti = models.CharField(max_length=64, unique=True)
+	user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="revoked_tokens")
+	expires_at = models.DateTimeField(db_index=True)
+	created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+	def __str__(self) -> str:
+		return self.jti
@@ -10,3 +10,15 @@ class IsAdmin(permissions.BasePermission):
 class IsCustomer(permissions.BasePermission):
     def has_permission(self, request, view):
         return bool(request.user and request.user.is_authenticated and request.user.role == User.Role.CUSTOMER)
+
+class IsBoutiqueOwner(permissions.BasePermission):
+    def has_permission(self, request, view):
+        return bool(request.user and request.user.is_authenticated and request.user.role == User.Role.BOUTIQUE_OWNER)
+
+class IsAdminOrBoutiqueOwner(permissions.BasePermission):
+    def has_permission(self, request, view):
+        return bool(
+            request.user
+            and request.user.is_authenticated
+            and request.user.role in {User.Role.ADMIN, User.Role.BOUTIQUE_OWNER}
+        )
@@ -0,0 +1,142 @@
+"""
+Access token denylist.
+
+Revoked ``jti`` values are stored in ``RevokedToken`` until the token would
+have expired anyway. Each worker keeps them in memory as a bloom filter in
+front of an exact set: a token that was never revoked (nearly every request)
+is cleared by a few hash probes, and the set rules out the filter's false
+positives. Workers pick up revocations made elsewhere by re-reading rows
+created since their last refresh, at most every
+``REVOKED_TOKEN_REFRESH_SECONDS``, and rebuild from scratch every
+``FULL_RELOAD_SECONDS`` to drop expired entries.
+"""
+import hashlib
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from apps.accounts.models import RevokedToken
+
+BLOOM_HASHES = 4
+FULL_RELOAD_SECONDS = 3600
+# Rows are re-read this far back so a revocation committed late is not missed.
+REFRESH_OVERLAP = timedelta(seconds=60)
+
+
+class BloomFilter:
+	def __init__(self, bits: int, hashes: int = BLOOM_HASHES):
+		self.bits = bits
+		self.hashes = hashes
+		self.array = bytearray((bits + 7) // 8)
+
+	def _positions(self, value: str):
+		digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+		first = int.from_bytes(digest[:8], "little")
+		step = int.from_bytes(digest[8:], "little") | 1
+		return ((first + i * step) % self.bits for i in range(self.hashes))
+
+	def add(self, value: str) -> None:
+		for position in self._positions(value):
+			self.array[position >> 3] |= 1 << (position & 7)
+
+	def __contains__(self, value: str) -> bool:
+		return all(self.array[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+
+class Denylist:
+	"""
+	Per-worker view of ``RevokedToken``.
+
+	The filter and its exact set live in one tuple that readers take in a
+	single load. A full reload builds the replacements off to the side and
+	swaps them in only once the read is done, so other threads keep checking
+	against the old, complete pair meanwhile. ``add`` and the swap share a
+	short lock: a revocation added while the reload reads is replayed into
+	the new pair, and one added after the replay lands in the new pair.
+	"""
+
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._swap_lock = threading.Lock()
+		self._entries = self._empty()
+		# Revocations made in this worker while a full reload reads the table.
+		self._added_during_reload = None
+		self.loaded_at = time.monotonic()
+		self.synced_until = None
+		self.refreshed_at = None
+
+	@staticmethod
+	def _empty() -> tuple[BloomFilter, set]:
+		return BloomFilter(settings.REVOKED_TOKEN_BLOOM_BITS), set()
+
+	@staticmethod
+	def _insert(entries: tuple[BloomFilter, set], jti: str) -> None:
+		bloom, jtis = entries
+		bloom.add(jti)
+		jtis.add(jti)
+
+	def add(self, jti: str) -> None:
+		with self._swap_lock:
+			self._insert(self._entries, jti)
+			if self._added_during_reload is not None:
+				self._added_during_reload.append(jti)
+
+	def refresh(self, force: bool = False) -> None:
+		now = time.monotonic()
+		if not force and self.refreshed_at is not None and now - self.refreshed_at < settings.REVOKED_TOKEN_REFRESH_SECONDS:
+			return
+		if not self._lock.acquire(blocking=force):
+			return
+		try:
+			started = timezone.now()
+			rows = RevokedToken.objects.filter(expires_at__gt=started)
+			if self.synced_until is None or now - self.loaded_at >= FULL_RELOAD_SECONDS:
+				with self._swap_lock:
+					self._added_during_reload = []
+				entries = self._empty()
+				for jti in rows.values_list("jti", flat=True).iterator():
+					self._insert(entries, jti)
+				with self._swap_lock:
+					for jti in self._added_during_reload:
+						self._insert(entries, jti)
+					self._entries = entries
+					self._added_during_reload = None
+				self.loaded_at = now
+			else:
+				rows = rows.filter(created_at__gte=self.synced_until - REFRESH_OVERLAP)
+				for jti in rows.values_list("jti", flat=True).iterator():
+					self.add(jti)
+			self.synced_until = started
+			self.refreshed_at = now
+		finally:
+			self._lock.release()
+
+	def __contains__(self, jti: str) -> bool:
+		self.refresh()
+		bloom, jtis = self._entries
+		return jti in bloom and jti in jtis
+
+
+denylist = Denylist()
+
+
+def is_revoked(jti) -> bool:
+	return bool(jti) and jti in denylist
+
+
+def revoke_token(token, user_id) -> None:
+	"""Denylists one validated access token until it expires."""
+	jti = token[api_settings.JTI_CLAIM]
+	expires_at = datetime.fromtimestamp(token["exp"], tz=dt_timezone.utc)
+	RevokedToken.objects.get_or_create(jti=jti, defaults={"user_id": user_id, "expires_at": expires_at})
+	transaction.on_commit(lambda: denylist.add(jti))
+
+
+def purge_expired() -> int:
+	deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+	return deleted
@@ -0,0 +1,6 @@
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+
+
+class LazyJWTScheme(SimpleJWTScheme):
+	"""Documents ``LazyJWTAuthentication`` as the same bearer scheme as simplejwt's."""
+	target_class = "apps.accounts.authentication.LazyJWTAuthentication"
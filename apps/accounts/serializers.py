@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 
+from apps.accounts.authentication import TOKEN_VERSION_CLAIM
 from apps.accounts.models import Address, BankDetails, User
 
 
@@ -111,6 +112,7 @@ class AccessTokenSerializer(TokenObtainPairSerializer):
 		token = super().get_token(user)
 		token["role"] = user.role
 		token["email"] = user.email
+		token[TOKEN_VERSION_CLAIM] = user.token_version
 		return token
 
 	def validate(self, attrs):
@@ -0,0 +1,13 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.authentication import invalidate_user_state
+from apps.accounts.models import LazyUser, User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=LazyUser)
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=LazyUser)
+def drop_user_state(sender, instance, **kwargs):
+	invalidate_user_state(instance.pk)
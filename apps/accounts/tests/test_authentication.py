@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+from apps.accounts.authentication import LazyJWTAuthentication, revoke_user_tokens
+from apps.accounts.models import LazyUser, User
+from apps.accounts.serializers import AccessTokenSerializer
+from apps.common.testing import make_seller
+
+
+def access_token(user) -> str:
+	return str(AccessTokenSerializer.get_token(user).access_token)
+
+
+class LazyJWTAuthenticationTests(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.user = make_seller(first_name="Asha", phone="9999999999")
+		self.token = access_token(self.user)
+
+	def authenticate(self, token=None):
+		request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token or self.token}")
+		return LazyJWTAuthentication().authenticate(request)[0]
+
+	def client_for(self, token) -> APIClient:
+		client = APIClient()
+		client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+		return client
+
+	def test_cached_state_authenticates_without_queries(self):
+		self.authenticate()
+
+		with self.assertNumQueries(0):
+			user = self.authenticate()
+
+		self.assertIsInstance(user, LazyUser)
+		self.assertEqual((user.pk, user.role, user.email), (self.user.pk, User.Role.BOUTIQUE_OWNER, self.user.email))
+
+	def test_other_fields_load_in_one_query(self):
+		user = self.authenticate()
+
+		with self.assertNumQueries(1):
+			self.assertEqual((user.first_name, user.phone, user.last_name), ("Asha", "9999999999", ""))
+
+	def test_bumped_version_refuses_older_tokens(self):
+		self.authenticate()
+
+		with self.captureOnCommitCallbacks(execute=True):
+			revoke_user_tokens(self.user.pk)
+
+		with self.assertRaises(AuthenticationFailed) as raised:
+			self.authenticate()
+		self.assertEqual(raised.exception.detail["code"], "token_revoked")
+		self.user.refresh_from_db()
+		self.assertEqual(self.authenticate(access_token(self.user)).pk, self.user.pk)
+
+	def test_logout_all_cuts_off_the_callers_tokens(self):
+		other = access_token(self.user)
+
+		with self.captureOnCommitCallbacks(execute=True):
+			response = self.client_for(self.token).post("/api/auth/logout-all/")
+
+		self.assertEqual(response.status_code, 204)
+		self.assertEqual(self.client_for(other).get("/api/auth/me/").status_code, 401)
+
+	def test_deactivated_user_is_refused(self):
+		self.authenticate()
+
+		with self.captureOnCommitCallbacks(execute=True):
+			self.user.is_active = False
+			self.user.save()
+
+		with self.assertRaises(AuthenticationFailed):
+			self.authenticate()
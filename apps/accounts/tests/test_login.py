@@ -0,0 +1,91 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework.throttling import SimpleRateThrottle
+
+from apps.accounts.models import User
+from apps.accounts.throttling import LoginIPThrottle
+
+FAST_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+@override_settings(PASSWORD_HASHERS=FAST_HASHERS)
+class LoginThrottleTests(TestCase):
+	def setUp(self):
+		cache.clear()
+		rates = mock.patch.dict(SimpleRateThrottle.THROTTLE_RATES, {"login_ip": "5/min", "login_account": "3/min"})
+		rates.start()
+		self.addCleanup(rates.stop)
+		self.client = APIClient()
+
+	def login(self, email, password="wrong"):
+		return self.client.post("/api/auth/login/", {"email": email, "password": password}, format="json")
+
+	def test_account_limit_counts_every_spelling_of_the_email(self):
+		for email in ["asha@example.com", "ASHA@example.com", " asha@example.com"]:
+			self.assertEqual(self.login(email).status_code, 401)
+
+		response = self.login("Asha@Example.com")
+
+		self.assertEqual(response.status_code, 429)
+		self.assertGreater(int(response["Retry-After"]), 0)
+		self.assertEqual(self.login("ravi@example.com").status_code, 401)
+
+	def test_ip_limit_covers_every_account(self):
+		for number in range(5):
+			self.assertEqual(self.login(f"user{number}@example.com").status_code, 401)
+
+		self.assertEqual(self.login("another@example.com").status_code, 429)
+
+	def test_rejected_attempts_never_reach_the_hasher(self):
+		for _ in range(3):
+			self.login("asha@example.com")
+
+		with mock.patch("django.contrib.auth.hashers.MD5PasswordHasher.encode") as encode:
+			self.assertEqual(self.login("asha@example.com").status_code, 429)
+		encode.assert_not_called()
+
+
+class SlidingWindowTests(TestCase):
+	def setUp(self):
+		cache.clear()
+		rates = mock.patch.dict(SimpleRateThrottle.THROTTLE_RATES, {"login_ip": "4/min"})
+		rates.start()
+		self.addCleanup(rates.stop)
+		self.request = APIRequestFactory().post("/api/auth/login/")
+
+	def allowed_at(self, now) -> bool:
+		throttle = LoginIPThrottle()
+		throttle.timer = lambda: now
+		return throttle.allow_request(self.request, None)
+
+	def test_previous_window_counts_by_its_remaining_overlap(self):
+		self.assertTrue(all(self.allowed_at(50) for _ in range(4)))
+		self.assertFalse(self.allowed_at(59))
+
+		# 15s into the next window three quarters of the previous four still count.
+		self.assertTrue(self.allowed_at(75))
+		self.assertFalse(self.allowed_at(75))
+		self.assertTrue(self.allowed_at(100))
+
+
+@override_settings(
+	PASSWORD_HASHERS=["apps.accounts.hashers.TunedScryptPasswordHasher", *FAST_HASHERS],
+)
+class PasswordUpgradeTests(TestCase):
+	def test_login_rehashes_with_the_configured_profile(self):
+		cache.clear()
+		with override_settings(PASSWORD_HASHERS=FAST_HASHERS):
+			user = User.objects.create_user(email="asha@example.com", password="s3cret-pass")
+		self.assertTrue(user.password.startswith("md5$"))
+
+		response = APIClient().post(
+			"/api/auth/login/", {"email": "asha@example.com", "password": "s3cret-pass"}, format="json"
+		)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertIn("access", response.data)
+		user.refresh_from_db()
+		self.assertTrue(user.password.startswith("scrypt$"))
@@ -0,0 +1,104 @@
+import threading
+from datetime import timedelta
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import RevokedToken, User
+from apps.accounts.revocation import BloomFilter, Denylist, purge_expired
+from apps.accounts.serializers import AccessTokenSerializer
+from apps.common.testing import make_user
+
+
+class BloomFilterTests(SimpleTestCase):
+	def test_added_values_are_always_found(self):
+		bloom = BloomFilter(1024)
+		jtis = [f"jti-{number}" for number in range(50)]
+		for jti in jtis:
+			bloom.add(jti)
+
+		self.assertTrue(all(jti in bloom for jti in jtis))
+		self.assertLess(sum(f"other-{number}" in bloom for number in range(1000)), 100)
+
+
+class DenylistReloadTests(TestCase):
+	def setUp(self):
+		user = User.objects.create_user(email="customer@example.com", password=None)
+		RevokedToken.objects.create(jti="stored", user=user, expires_at=timezone.now() + timedelta(minutes=5))
+		self.denylist = Denylist()
+
+	def test_revocation_added_while_the_table_is_read_survives_the_swap(self):
+		read = RevokedToken.objects.filter(jti="stored").values_list("jti", flat=True)
+
+		def rows_then_add(*args, **kwargs):
+			yield from read
+			self.denylist.add("added-during-read")
+
+		with mock.patch("django.db.models.query.QuerySet.iterator", rows_then_add):
+			self.denylist.refresh(force=True)
+
+		self.assertIn("stored", self.denylist)
+		self.assertIn("added-during-read", self.denylist)
+
+	def test_revocation_racing_the_swap_lands_in_the_new_entries(self):
+		read = RevokedToken.objects.filter(jti="stored").values_list("jti", flat=True)
+		writer = threading.Thread(target=self.denylist.add, args=("added-at-swap",))
+
+		def rows_then_race(*args, **kwargs):
+			yield from read
+			writer.start()
+
+		with mock.patch("django.db.models.query.QuerySet.iterator", rows_then_race):
+			self.denylist.refresh(force=True)
+		writer.join()
+
+		self.assertIn("stored", self.denylist)
+		self.assertIn("added-at-swap", self.denylist)
+
+
+@override_settings(REVOKED_TOKEN_REFRESH_SECONDS=0)
+class DenylistRefreshTests(TestCase):
+	def setUp(self):
+		self.user = make_user("customer@example.com")
+		self.denylist = Denylist()
+
+	def revoke(self, jti, expires_in=timedelta(minutes=5)):
+		RevokedToken.objects.create(jti=jti, user=self.user, expires_at=timezone.now() + expires_in)
+
+	def test_revocations_from_other_workers_are_picked_up(self):
+		self.assertNotIn("elsewhere", self.denylist)
+
+		self.revoke("elsewhere")
+
+		self.assertIn("elsewhere", self.denylist)
+
+	def test_expired_rows_are_neither_loaded_nor_kept(self):
+		self.revoke("expired", expires_in=-timedelta(seconds=1))
+		self.revoke("live")
+
+		self.assertNotIn("expired", self.denylist)
+		self.assertIn("live", self.denylist)
+		self.assertEqual(purge_expired(), 1)
+		self.assertEqual(list(RevokedToken.objects.values_list("jti", flat=True)), ["live"])
+
+
+class LogoutTests(TestCase):
+	def client_for(self, token) -> APIClient:
+		client = APIClient()
+		client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+		return client
+
+	def test_logout_revokes_only_the_token_used(self):
+		user = make_user("customer@example.com")
+		used, other = (str(AccessTokenSerializer.get_token(user).access_token) for _ in range(2))
+
+		with self.captureOnCommitCallbacks(execute=True):
+			response = self.client_for(used).post("/api/auth/logout/")
+
+		self.assertEqual(response.status_code, 204)
+		refused = self.client_for(used).get("/api/auth/me/")
+		self.assertEqual(refused.status_code, 401)
+		self.assertEqual(refused.data["code"], "token_revoked")
+		self.assertEqual(self.client_for(other).get("/api/auth/me/").status_code, 200)
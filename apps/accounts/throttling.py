@@ -0,0 +1,67 @@
+"""
+Login rate limits.
+
+Each limit is a sliding window approximated from two fixed-window counters
+in the cache: the current window's count plus the previous window's count
+weighted by how much of it still overlaps the sliding window. Counters are
+bumped with ``cache.incr``, which is atomic on Redis, so every worker shares
+one count when ``REDIS_URL`` is set. Throttles run before the view parses
+credentials, so a rejected attempt never reaches the password hasher.
+"""
+import hashlib
+import math
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class SlidingWindowThrottle(SimpleRateThrottle):
+	cache_format = "throttle:%(scope)s:%(ident)s"
+
+	def _counter_keys(self, window: int) -> tuple[str, str]:
+		return f"{self.key}:{window}", f"{self.key}:{window - 1}"
+
+	def allow_request(self, request, view):
+		if self.rate is None:
+			return True
+		self.key = self.get_cache_key(request, view)
+		if self.key is None:
+			return True
+
+		self.now = self.timer()
+		window, offset = divmod(self.now, self.duration)
+		current_key, previous_key = self._counter_keys(int(window))
+		counts = self.cache.get_many([current_key, previous_key])
+		overlap = 1 - offset / self.duration
+		estimate = counts.get(current_key, 0) + counts.get(previous_key, 0) * overlap
+		if estimate >= self.num_requests:
+			self.retry_after = math.ceil(self.duration - offset)
+			return False
+
+		# Kept for two windows: one as the current counter, one as the previous.
+		self.cache.add(current_key, 0, self.duration * 2)
+		try:
+			self.cache.incr(current_key)
+		except ValueError:
+			self.cache.set(current_key, 1, self.duration * 2)
+		return True
+
+	def wait(self):
+		return getattr(self, "retry_after", None)
+
+
+class LoginIPThrottle(SlidingWindowThrottle):
+	scope = "login_ip"
+
+	def get_cache_key(self, request, view):
+		return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class LoginAccountThrottle(SlidingWindowThrottle):
+	scope = "login_account"
+
+	def get_cache_key(self, request, view):
+		email = request.data.get("email") if hasattr(request.data, "get") else None
+		if not isinstance(email, str) or not email.strip():
+			return None
+		ident = hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+		return self.cache_format % {"scope": self.scope, "ident": ident}
@@ -1,7 +1,15 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from apps.accounts.views import BankDetailsViewSet, AddressViewSet, LoginView, MeView, RegisterView
+from apps.accounts.views import (
+    AddressViewSet,
+    BankDetailsViewSet,
+    LoginView,
+    LogoutAllView,
+    LogoutView,
+    MeView,
+    RegisterView,
+)
 
 router = DefaultRouter()
 router.register("addresses", AddressViewSet, basename="address")
@@ -11,5 +19,7 @@ urlpatterns = [
     path("", include(router.urls)),
     path("register/", RegisterView.as_view(), name="register"),
     path("login/", LoginView.as_view(), name="login"),
+    path("logout/", LogoutView.as_view(), name="logout"),
+    path("logout-all/", LogoutAllView.as_view(), name="logout-all"),
     path("me/", MeView.as_view(), name="me"),
 ]
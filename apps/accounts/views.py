@@ -1,8 +1,13 @@
-from rest_framework import generics, permissions, viewsets
+from drf_spectacular.utils import extend_schema
+from rest_framework import generics, permissions, status, viewsets
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from apps.accounts.authentication import revoke_user_tokens
 from apps.accounts.models import Address, BankDetails, User
+from apps.accounts.revocation import revoke_token
+from apps.accounts.throttling import LoginAccountThrottle, LoginIPThrottle
 from apps.accounts.serializers import (
 	AccessTokenSerializer,
 	AddressSerializer,
@@ -20,6 +25,25 @@ class RegisterView(generics.CreateAPIView):
 class LoginView(TokenObtainPairView):
 	permission_classes = [permissions.AllowAny]
 	serializer_class = AccessTokenSerializer
+	throttle_classes = [LoginIPThrottle, LoginAccountThrottle]
+
+
+class LogoutView(APIView):
+	"""Revokes the access token used for this request"""
+
+	@extend_schema(request=None, responses={204: None})
+	def post(self, request):
+		revoke_token(request.auth, request.user.pk)
+		return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class LogoutAllView(APIView):
+	"""Revokes every access token issued to the caller so far"""
+
+	@extend_schema(request=None, responses={204: None})
+	def post(self, request):
+		revoke_user_tokens(request.user.pk)
+		return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class MeView(generics.RetrieveUpdateAPIView):
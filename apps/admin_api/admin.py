@@ -1,8 +1,40 @@
 from django.contrib import admin
 
-from apps.admin_api.models import MarketplaceSettings
+from apps.admin_api.models import (
+    DailyCategoryStat,
+    DailySellerStat,
+    DailyStat,
+    MarketplaceSettings,
+    ModerationAuditLog,
+)
 
 
 @admin.register(MarketplaceSettings)
 class MarketplaceSettingsAdmin(admin.ModelAdmin):
     list_display = ("id", "auto_approve_products", "updated_at")
+
+
+@admin.register(DailyStat)
+class DailyStatAdmin(admin.ModelAdmin):
+    list_display = ("date", "orders_count", "paid_orders_count", "gmv", "commission", "updated_at")
+    date_hierarchy = "date"
+
+
+@admin.register(DailySellerStat)
+class DailySellerStatAdmin(admin.ModelAdmin):
+    list_display = ("date", "seller", "orders_count", "gmv")
+    list_select_related = ("seller",)
+
+
+@admin.register(DailyCategoryStat)
+class DailyCategoryStatAdmin(admin.ModelAdmin):
+    list_display = ("date", "category", "orders_count", "units", "gmv")
+    list_select_related = ("category",)
+
+
+@admin.register(ModerationAuditLog)
+class ModerationAuditLogAdmin(admin.ModelAdmin):
+    list_display = ("id", "action", "to_status", "actor", "matched_count", "updated_count", "created_at")
+    list_filter = ("action", "to_status")
+    list_select_related = ("actor",)
+    readonly_fields = [field.name for field in ModerationAuditLog._meta.fields]
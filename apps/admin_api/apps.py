@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class AdminApiConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.admin_api"
+
+    def ready(self):
+        from apps.admin_api import signals  # noqa: F401
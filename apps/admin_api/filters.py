@@ -0,0 +1,84 @@
+"""
+Filter sets for the admin list endpoints.
+
+Date filters take whole days in ``TIME_ZONE`` and turn them into datetime
+bounds, so they use the ``created_at``/``date_joined`` indexes. Email
+filters resolve to user ids first: a full address is an ``iexact`` match
+served by the ``UPPER(email)`` index, anything else is a prefix match.
+"""
+import django_filters
+from django.db.models import Q
+
+from apps.accounts.models import User
+from apps.catalog.models import Product
+from apps.common.dates import day_bounds
+from apps.orders.models import Order
+
+
+class DayFilter(django_filters.DateFilter):
+	"""Inclusive day bound on a datetime field; ``bound`` is "from" or "to"."""
+
+	def __init__(self, *args, bound: str, **kwargs):
+		self.bound = bound
+		super().__init__(*args, **kwargs)
+
+	def filter(self, qs, value):
+		if not value:
+			return qs
+		start, end = day_bounds(value)
+		if self.bound == "from":
+			return qs.filter(**{f"{self.field_name}__gte": start})
+		return qs.filter(**{f"{self.field_name}__lt": end})
+
+
+def email_q(value: str, field: str = "email") -> Q:
+	value = value.strip()
+	lookup = "iexact" if "@" in value else "istartswith"
+	return Q(**{f"{field}__{lookup}": value})
+
+
+def user_ids_by_email(value: str):
+	return User.objects.filter(email_q(value)).values("id")
+
+
+class UserAdminFilter(django_filters.FilterSet):
+	email = django_filters.CharFilter(method="filter_email")
+	date_from = DayFilter(field_name="date_joined", bound="from")
+	date_to = DayFilter(field_name="date_joined", bound="to")
+
+	class Meta:
+		model = User
+		fields = ["role", "is_active", "is_verified"]
+
+	def filter_email(self, queryset, name, value):
+		return queryset.filter(email_q(value))
+
+
+class ProductModerationFilter(django_filters.FilterSet):
+	seller_email = django_filters.CharFilter(method="filter_seller_email")
+	date_from = DayFilter(field_name="created_at", bound="from")
+	date_to = DayFilter(field_name="created_at", bound="to")
+
+	class Meta:
+		model = Product
+		fields = ["status", "seller", "category", "product_type", "is_active"]
+
+	def filter_seller_email(self, queryset, name, value):
+		return queryset.filter(seller_id__in=user_ids_by_email(value))
+
+
+class OrderAdminFilter(django_filters.FilterSet):
+	customer_email = django_filters.CharFilter(method="filter_customer_email")
+	seller_email = django_filters.CharFilter(method="filter_seller_email")
+	date_from = DayFilter(field_name="created_at", bound="from")
+	date_to = DayFilter(field_name="created_at", bound="to")
+
+	class Meta:
+		model = Order
+		fields = ["status", "payment_status", "seller", "customer", "seller_settlement_credited"]
+
+	def filter_customer_email(self, queryset, name, value):
+		return queryset.filter(customer_id__in=user_ids_by_email(value))
+
+	def filter_seller_email(self, queryset, name, value):
+		return queryset.filter(seller_id__in=user_ids_by_email(value))
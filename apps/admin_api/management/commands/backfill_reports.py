@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.admin_api.reporting import backfill
+
+
+class Command(BaseCommand):
+	help = "Rebuilds the daily reporting rollups from orders and users. Without dates every day with activity is rebuilt."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--from", dest="date_from", default=None, help="First day to rebuild (YYYY-MM-DD).")
+		parser.add_argument("--to", dest="date_to", default=None, help="Last day to rebuild (YYYY-MM-DD).")
+
+	def handle(self, *args, **options):
+		date_from = self._parse(options["date_from"], "--from")
+		date_to = self._parse(options["date_to"], "--to")
+		days = backfill(date_from, date_to)
+		self.stdout.write(f"Rebuilt reporting rollups for {days} days.")
+
+	@staticmethod
+	def _parse(value, option):
+		if value is None:
+			return None
+		day = parse_date(value)
+		if day is None:
+			raise CommandError(f"{option} must be YYYY-MM-DD.")
+		return day
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.admin_api.reporting import refresh_dirty_days
+
+
+class Command(BaseCommand):
+	help = "Recomputes the daily reporting rollups of days whose orders or signups changed since their last refresh."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--batch-size", type=int, default=100)
+		parser.add_argument("--loop", action="store_true", help="Keep polling for dirty days.")
+		parser.add_argument("--interval", type=float, default=30.0, help="Seconds to sleep when idle.")
+
+	def handle(self, *args, **options):
+		total = 0
+		while True:
+			refreshed = refresh_dirty_days(limit=options["batch_size"])
+			total += refreshed
+			if refreshed == options["batch_size"]:
+				continue
+			if not options["loop"]:
+				break
+			time.sleep(options["interval"])
+		self.stdout.write(f"Refreshed reporting rollups for {total} days.")
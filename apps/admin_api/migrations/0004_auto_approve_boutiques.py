@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-19 18:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_api', '0003_moderation_audit_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='marketplacesettings',
+            name='auto_approve_boutiques',
+            field=models.BooleanField(default=False),
+        ),
+    ]
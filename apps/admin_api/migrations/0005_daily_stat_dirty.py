@@ -0,0 +1,22 @@
+# Generated by Django 5.2.11 on 2026-10-19 18:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_api', '0004_auto_approve_boutiques'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dailystat',
+            name='dirty_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='dailystat',
+            index=models.Index(condition=models.Q(('dirty_at__isnull', False)), fields=['date'], name='dailystat_dirty_idx'),
+        ),
+    ]
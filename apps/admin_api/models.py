@@ -1,8 +1,13 @@
 from django.db import models
+from django.db.models import Q
+
+from apps.accounts.models import User
+from apps.catalog.models import Category
 
 
 class MarketplaceSettings(models.Model):
 	auto_approve_products = models.BooleanField(default=False)
+	auto_approve_boutiques = models.BooleanField(default=False)
 	created_at = models.DateTimeField(auto_now_add=True)
 	updated_at = models.DateTimeField(auto_now=True)
 
@@ -15,3 +20,71 @@ class MarketplaceSettings(models.Model):
 
 	def __str__(self) -> str:
 		return "Marketplace Settings"
+
+
+class DailyStat(models.Model):
+	"""Marketplace totals for one day (in TIME_ZONE), rebuilt by ``apps.admin_api.reporting``."""
+
+	date = models.DateField(unique=True)
+	orders_count = models.PositiveIntegerField(default=0)
+	paid_orders_count = models.PositiveIntegerField(default=0)
+	gmv = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+	commission = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+	orders_by_status = models.JSONField(default=dict, blank=True)
+	new_users_by_role = models.JSONField(default=dict, blank=True)
+	# Set when an order or signup of this day changed after the last refresh.
+	dirty_at = models.DateTimeField(null=True, blank=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	class Meta:
+		ordering = ["date"]
+		indexes = [models.Index(fields=["date"], condition=Q(dirty_at__isnull=False), name="dailystat_dirty_idx")]
+
+	def __str__(self) -> str:
+		return f"Stats for {self.date}"
+
+
+class DailySellerStat(models.Model):
+	date = models.DateField()
+	seller = models.ForeignKey(User, on_delete=models.CASCADE, related_name="daily_stats")
+	orders_count = models.PositiveIntegerField(default=0)
+	gmv = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+	class Meta:
+		constraints = [models.UniqueConstraint(fields=["date", "seller"], name="unique_daily_seller_stat")]
+		indexes = [models.Index(fields=["seller", "date"])]
+
+	def __str__(self) -> str:
+		return f"{self.seller_id} on {self.date}"
+
+
+class DailyCategoryStat(models.Model):
+	date = models.DateField(db_index=True)
+	category = models.ForeignKey(
+		Category, on_delete=models.CASCADE, related_name="daily_stats", null=True, blank=True
+	)
+	orders_count = models.PositiveIntegerField(default=0)
+	units = models.PositiveIntegerField(default=0)
+	gmv = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+	def __str__(self) -> str:
+		return f"{self.category_id or 'uncategorized'} on {self.date}"
+
+
+class ModerationAuditLog(models.Model):
+	"""One bulk status change of products, as requested and as applied."""
+
+	actor = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name="moderation_actions")
+	action = models.CharField(max_length=20)
+	to_status = models.CharField(max_length=20)
+	selector = models.JSONField(default=dict, help_text="The ids or filters the request selected products by.")
+	matched_count = models.PositiveIntegerField(default=0)
+	updated_count = models.PositiveIntegerField(default=0)
+	updated_ids = models.JSONField(default=list, blank=True)
+	created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+	class Meta:
+		ordering = ["-created_at"]
+
+	def __str__(self) -> str:
+		return f"{self.action} of {self.updated_count} products by {self.actor_id}"
@@ -0,0 +1,85 @@
+"""
+Bulk product status changes.
+
+A batch is selected by explicit ids or by a filter on whitelisted fields,
+then moved to the target status with one ``UPDATE`` while the matched rows
+are locked. Each batch writes a single ``ModerationAuditLog`` row and
+answers with a result per product. ``.update()`` skips ``post_save``, so the
+listing cards of changed products are refreshed explicitly.
+"""
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.admin_api.models import ModerationAuditLog
+from apps.catalog.cards import refresh_cards_on_commit
+from apps.catalog.models import Product
+
+BULK_MODERATION_LIMIT = 5000
+BULK_FILTER_FIELDS = {
+	"seller": "seller_id",
+	"status": "status",
+	"category": "category_id",
+	"product_type": "product_type",
+}
+
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+NOT_FOUND = "not_found"
+
+
+def select_products(queryset, ids=None, filters=None):
+	if ids:
+		return queryset.filter(id__in=ids)
+	unknown = set(filters) - BULK_FILTER_FIELDS.keys()
+	if unknown:
+		raise ValidationError({"filters": f"Unsupported filters: {', '.join(sorted(unknown))}."})
+	try:
+		return queryset.filter(**{BULK_FILTER_FIELDS[name]: value for name, value in filters.items()})
+	except (TypeError, ValueError) as exc:
+		raise ValidationError({"filters": str(exc)})
+
+
+@transaction.atomic
+def bulk_set_status(queryset, to_status: str, action: str, actor, ids=None, filters=None) -> dict:
+	"""
+	Moves the selected products in ``queryset`` to ``to_status``.
+
+	``queryset`` scopes what the caller may touch (all products for admins,
+	their own for sellers); requested ids outside it are reported as
+	not found.
+	"""
+	matched = dict(
+		select_products(queryset, ids, filters)
+		.select_for_update()
+		.order_by("id")
+		.values_list("id", "status")[: BULK_MODERATION_LIMIT + 1]
+	)
+	if len(matched) > BULK_MODERATION_LIMIT:
+		raise ValidationError(f"A batch can change at most {BULK_MODERATION_LIMIT} products; narrow the selection.")
+
+	to_update = [product_id for product_id, status in matched.items() if status != to_status]
+	updated = 0
+	if to_update:
+		updated = Product.objects.filter(id__in=to_update).update(status=to_status, updated_at=timezone.now())
+		refresh_cards_on_commit(to_update)
+
+	log = ModerationAuditLog.objects.create(
+		actor=actor,
+		action=action,
+		to_status=to_status,
+		selector={"ids": ids} if ids else {"filters": filters},
+		matched_count=len(matched),
+		updated_count=updated,
+		updated_ids=to_update,
+	)
+	changed = set(to_update)
+	requested = ids if ids else list(matched)
+	results = [
+		{
+			"id": product_id,
+			"result": UPDATED if product_id in changed else UNCHANGED if product_id in matched else NOT_FOUND,
+		}
+		for product_id in dict.fromkeys(requested)
+	]
+	return {"audit_id": log.id, "matched": len(matched), "updated": updated, "results": results}
@@ -0,0 +1,176 @@
+"""
+Daily reporting rollups.
+
+Every day in ``TIME_ZONE`` gets one ``DailyStat`` row plus one row per seller
+and per category that sold that day. Writes to orders and users only flag
+their day as dirty (one upsert after commit); the ``refresh_reports`` job
+then recomputes each dirty day once from its own orders and signups,
+however many writes touched it. That keeps each refresh bounded by a day of
+data, keeps aggregation out of the request path and lets dashboards read
+one row per day instead of scanning ``Order`` and ``User``.
+
+Orders are bucketed by the day they were placed. GMV counts paid orders;
+commission is what the wallet ledger recorded as withheld on the day's
+orders (settlements and collected late fees), less what refund reversals
+gave back.
+"""
+from datetime import date
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Case, Count, DecimalField, Sum, Value, When
+from django.db.models.fields.json import KT
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.admin_api.models import DailyCategoryStat, DailySellerStat, DailyStat
+from apps.common.dates import day_bounds
+from apps.orders.models import Order, OrderItem
+from apps.wallet.ledger import COMMISSIONED_SOURCES
+from apps.wallet.models import WalletTransaction
+
+ZERO = Decimal("0.00")
+MONEY = DecimalField(max_digits=14, decimal_places=2)
+
+
+def _money_sum(expression):
+	return Coalesce(Sum(expression, output_field=MONEY), Value(ZERO), output_field=MONEY)
+
+
+def _commission(orders):
+	"""Commission withheld on ``orders`` by the ledger, net of what refund reversals returned."""
+	commission = Cast(KT("meta__commission_amount"), MONEY)
+	return (
+		WalletTransaction.objects.filter(
+			order__in=orders, source__in=[*COMMISSIONED_SOURCES, WalletTransaction.Source.REFUND_REVERSAL]
+		)
+		.order_by()
+		.aggregate(
+			value=_money_sum(
+				Case(
+					When(source=WalletTransaction.Source.REFUND_REVERSAL, then=-commission),
+					default=commission,
+					output_field=MONEY,
+				)
+			)
+		)["value"]
+	)
+
+
+def refresh_day(day: date) -> DailyStat:
+	"""
+	Recomputes every rollup row for ``day`` from the transactional tables.
+
+	Writes happen under a lock on the day's ``DailyStat`` row, so two refreshes
+	of one day never interleave. The dirty flag is cleared only if no write
+	flagged the day again while it was being aggregated.
+	"""
+	seen_dirty_at = DailyStat.objects.filter(date=day).values_list("dirty_at", flat=True).first()
+	start, end = day_bounds(day)
+	orders = Order.objects.filter(created_at__gte=start, created_at__lt=end).order_by()
+	paid = orders.filter(payment_status=Order.PaymentStatus.PAID)
+
+	paid_totals = paid.aggregate(count=Count("id"), gmv=_money_sum("total"))
+	commission = _commission(orders)
+	orders_by_status = dict(orders.values_list("status").annotate(count=Count("id")))
+	new_users_by_role = dict(
+		User.objects.filter(date_joined__gte=start, date_joined__lt=end)
+		.order_by()
+		.values_list("role")
+		.annotate(count=Count("id"))
+	)
+	seller_rows = [
+		DailySellerStat(date=day, seller_id=row["seller_id"], orders_count=row["orders_count"], gmv=row["gmv"])
+		for row in paid.values("seller_id").annotate(orders_count=Count("id"), gmv=_money_sum("total"))
+	]
+	category_rows = [
+		DailyCategoryStat(
+			date=day,
+			category_id=row["product__category_id"],
+			orders_count=row["orders_count"],
+			units=row["units"] or 0,
+			gmv=row["gmv"],
+		)
+		for row in OrderItem.objects.filter(order__in=paid)
+		.values("product__category_id")
+		.annotate(
+			orders_count=Count("order_id", distinct=True),
+			units=Sum("quantity"),
+			gmv=_money_sum("line_total"),
+		)
+		.order_by()
+	]
+
+	with transaction.atomic():
+		stat, _ = DailyStat.objects.select_for_update().get_or_create(date=day)
+		stat.orders_count = sum(orders_by_status.values())
+		stat.paid_orders_count = paid_totals["count"]
+		stat.gmv = paid_totals["gmv"]
+		stat.commission = commission
+		stat.orders_by_status = orders_by_status
+		stat.new_users_by_role = new_users_by_role
+		if stat.dirty_at == seen_dirty_at:
+			stat.dirty_at = None
+		stat.save()
+		DailySellerStat.objects.bulk_create(
+			seller_rows,
+			update_conflicts=True,
+			unique_fields=["date", "seller"],
+			update_fields=["orders_count", "gmv"],
+		)
+		DailySellerStat.objects.filter(date=day).exclude(seller_id__in=[row.seller_id for row in seller_rows]).delete()
+		DailyCategoryStat.objects.filter(date=day).delete()
+		DailyCategoryStat.objects.bulk_create(category_rows)
+	return stat
+
+
+def mark_days_dirty(days) -> None:
+	"""Flags ``days`` for the next refresh; a single upsert that concurrent writers can repeat safely."""
+	now = timezone.now()
+	DailyStat.objects.bulk_create(
+		[DailyStat(date=day, dirty_at=now) for day in sorted(set(days))],
+		update_conflicts=True,
+		unique_fields=["date"],
+		update_fields=["dirty_at"],
+	)
+
+
+def mark_days_dirty_on_commit(days) -> None:
+	days = set(days)
+	if days:
+		transaction.on_commit(lambda: mark_days_dirty(days))
+
+
+def refresh_dirty_days(limit: int = 100) -> int:
+	"""Recomputes up to ``limit`` dirty days, oldest first."""
+	days = list(DailyStat.objects.filter(dirty_at__isnull=False).order_by("date").values_list("date", flat=True)[:limit])
+	for day in days:
+		refresh_day(day)
+	return len(days)
+
+
+def days_with_activity(date_from: date | None = None, date_to: date | None = None) -> list[date]:
+	days = set()
+	for model, field in ((Order, "created_at"), (User, "date_joined")):
+		queryset = model.objects.order_by()
+		if date_from:
+			queryset = queryset.filter(**{f"{field}__gte": day_bounds(date_from)[0]})
+		if date_to:
+			queryset = queryset.filter(**{f"{field}__lt": day_bounds(date_to)[1]})
+		days.update(value.date() for value in queryset.datetimes(field, "day"))
+	return sorted(days)
+
+
+def backfill(date_from: date | None = None, date_to: date | None = None) -> int:
+	days = days_with_activity(date_from, date_to)
+	stale = DailyStat.objects.exclude(date__in=days)
+	if date_from:
+		stale = stale.filter(date__gte=date_from)
+	if date_to:
+		stale = stale.filter(date__lte=date_to)
+	for day in stale.values_list("date", flat=True):
+		refresh_day(day)
+	for day in days:
+		refresh_day(day)
+	return len(days)
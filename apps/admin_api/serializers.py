@@ -1,7 +1,10 @@
+from decimal import Decimal
+
 from rest_framework import serializers
 
 from apps.accounts.models import User
 from apps.admin_api.models import MarketplaceSettings
+from apps.admin_api.moderation import BULK_MODERATION_LIMIT, NOT_FOUND, UNCHANGED, UPDATED
 from apps.catalog.models import Product
 from apps.orders.models import Order
 
@@ -9,7 +12,7 @@ from apps.orders.models import Order
 class MarketplaceSettingsSerializer(serializers.ModelSerializer):
 	class Meta:
 		model = MarketplaceSettings
-		fields = ["id", "auto_approve_products", "created_at", "updated_at"]
+		fields = ["id", "auto_approve_products", "auto_approve_boutiques", "created_at", "updated_at"]
 		read_only_fields = ["id", "created_at", "updated_at"]
 
 
@@ -65,12 +68,74 @@ class OrderAdminSerializer(serializers.ModelSerializer):
 			"seller_settlement_amount",
 			"subtotal",
 			"total",
+			"late_fees",
+			"late_fees_collected",
 			"currency",
 			"created_at",
 		]
 		read_only_fields = ["id", "created_at", "customer_email", "seller", "seller_email"]
 
 
+class LateFeeCollectionSerializer(serializers.Serializer):
+	amount = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=Decimal("0.01"), required=False)
+
+
+class ReportTotalsSerializer(serializers.Serializer):
+	orders_count = serializers.IntegerField()
+	paid_orders_count = serializers.IntegerField()
+	gmv = serializers.DecimalField(max_digits=14, decimal_places=2)
+	commission = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class DailyReportSerializer(ReportTotalsSerializer):
+	date = serializers.DateField()
+
+
+class TopSellerSerializer(serializers.Serializer):
+	seller_id = serializers.IntegerField()
+	seller_email = serializers.EmailField()
+	orders_count = serializers.IntegerField()
+	gmv = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class TopCategorySerializer(serializers.Serializer):
+	category_id = serializers.IntegerField(allow_null=True)
+	category_name = serializers.CharField(allow_null=True)
+	orders_count = serializers.IntegerField()
+	units = serializers.IntegerField()
+	gmv = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
 class ReportsSerializer(serializers.Serializer):
+	date_from = serializers.DateField(allow_null=True, read_only=True)
+	date_to = serializers.DateField(allow_null=True, read_only=True)
+	totals = ReportTotalsSerializer(read_only=True)
 	users_by_role = serializers.ListField(child=serializers.DictField(), read_only=True)
 	orders_by_status = serializers.ListField(child=serializers.DictField(), read_only=True)
+	daily = DailyReportSerializer(many=True, read_only=True)
+	top_sellers = TopSellerSerializer(many=True, read_only=True)
+	top_categories = TopCategorySerializer(many=True, read_only=True)
+
+
+class BulkModerationSerializer(serializers.Serializer):
+	ids = serializers.ListField(
+		child=serializers.IntegerField(min_value=1), required=False, max_length=BULK_MODERATION_LIMIT
+	)
+	filters = serializers.DictField(required=False)
+
+	def validate(self, attrs):
+		if bool(attrs.get("ids")) == bool(attrs.get("filters")):
+			raise serializers.ValidationError("Pass either a non-empty ids list or filters, not both.")
+		return attrs
+
+
+class BulkModerationItemSerializer(serializers.Serializer):
+	id = serializers.IntegerField()
+	result = serializers.ChoiceField(choices=[UPDATED, UNCHANGED, NOT_FOUND])
+
+
+class BulkModerationResultSerializer(serializers.Serializer):
+	audit_id = serializers.IntegerField()
+	matched = serializers.IntegerField()
+	updated = serializers.IntegerField()
+	results = BulkModerationItemSerializer(many=True)
@@ -0,0 +1,55 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from apps.accounts.models import LazyUser, User
+from apps.admin_api.reporting import mark_days_dirty_on_commit
+from apps.orders.models import Order
+from apps.orders.signals import orders_updated
+
+REPORTED_ORDER_FIELDS = {
+	"status",
+	"payment_status",
+	"total",
+	"amount_refunded",
+	"late_fees_collected",
+	"seller_settlement_credited",
+	"seller_settlement_amount",
+}
+REPORTED_USER_FIELDS = {"role", "date_joined"}
+
+
+def _touches(update_fields, reported: set[str]) -> bool:
+	return update_fields is None or bool(reported.intersection(update_fields))
+
+
+@receiver(post_save, sender=Order)
+def mark_order_day(sender, instance, created, update_fields=None, **kwargs):
+	if created or _touches(update_fields, REPORTED_ORDER_FIELDS):
+		mark_days_dirty_on_commit([timezone.localdate(instance.created_at)])
+
+
+@receiver(post_delete, sender=Order)
+def mark_deleted_order_day(sender, instance, **kwargs):
+	mark_days_dirty_on_commit([timezone.localdate(instance.created_at)])
+
+
+@receiver(orders_updated)
+def mark_bulk_order_days(sender, order_ids, fields=None, **kwargs):
+	if not _touches(fields, REPORTED_ORDER_FIELDS):
+		return
+	created = Order.objects.filter(id__in=order_ids).order_by().values_list("created_at", flat=True)
+	mark_days_dirty_on_commit(timezone.localdate(value) for value in created)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=LazyUser)
+def mark_signup_day(sender, instance, created, update_fields=None, **kwargs):
+	if created or _touches(update_fields, REPORTED_USER_FIELDS):
+		mark_days_dirty_on_commit([timezone.localdate(instance.date_joined)])
+
+
+@receiver(post_delete, sender=User)
+@receiver(post_delete, sender=LazyUser)
+def mark_deleted_user_day(sender, instance, **kwargs):
+	mark_days_dirty_on_commit([timezone.localdate(instance.date_joined)])
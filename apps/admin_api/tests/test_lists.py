@@ -0,0 +1,66 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.catalog.models import Product
+from apps.common.testing import api_client, make_order, make_product, make_seller, make_user
+from apps.orders.models import Order
+
+
+class AdminListTests(TestCase):
+	def setUp(self):
+		self.admin = make_user("admin@example.com", User.Role.ADMIN)
+		self.client = api_client(self.admin)
+		self.asha = make_user("asha@example.com")
+		self.ashok = make_user("ashok@example.com")
+		self.seller = make_seller()
+
+	def ids(self, url, **params):
+		response = self.client.get(url, params)
+		self.assertEqual(response.status_code, 200)
+		return [row["id"] for row in response.data["results"]]
+
+	def test_full_email_matches_exactly_and_partial_by_prefix(self):
+		asha = make_order(self.asha, self.seller)
+		ashok = make_order(self.ashok, self.seller)
+
+		self.assertEqual(self.ids("/api/admin/orders/", customer_email="ASHA@example.com"), [asha.id])
+		self.assertEqual(self.ids("/api/admin/orders/", customer_email="ash"), [ashok.id, asha.id])
+		self.assertEqual(self.ids("/api/admin/orders/", seller_email="nobody@example.com"), [])
+
+	def test_days_are_inclusive_bounds(self):
+		old = make_order(self.asha, self.seller)
+		Order.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=2))
+		new = make_order(self.asha, self.seller, status=Order.Status.SHIPPED)
+		today = timezone.localdate()
+
+		self.assertEqual(self.ids("/api/admin/orders/", date_from=today), [new.id])
+		self.assertEqual(self.ids("/api/admin/orders/", date_to=today - timedelta(days=2)), [old.id])
+		self.assertEqual(self.ids("/api/admin/orders/", status=Order.Status.SHIPPED, date_to=today), [new.id])
+
+	def test_keyset_pages_break_created_at_ties_by_id(self):
+		orders = [make_order(self.asha, self.seller) for _ in range(5)]
+		Order.objects.update(created_at=timezone.now())
+
+		seen, url = [], "/api/admin/orders/?page_size=2"
+		while url:
+			response = self.client.get(url)
+			seen.extend(row["id"] for row in response.data["results"])
+			url = response.data["next"]
+
+		self.assertEqual(seen, sorted((order.id for order in orders), reverse=True))
+
+	def test_user_and_product_filters(self):
+		with self.captureOnCommitCallbacks(execute=True):
+			product = make_product(self.seller, status=Product.Status.DRAFT)
+			make_product(make_seller("other-seller@example.com"), status=Product.Status.DRAFT)
+
+		self.assertEqual(
+			self.ids("/api/admin/users/", role=User.Role.CUSTOMER, email="ash"), [self.ashok.id, self.asha.id]
+		)
+		self.assertEqual(self.ids("/api/admin/products/", seller_email="sell", status=Product.Status.DRAFT), [product.id])
+
+	def test_lists_are_admin_only(self):
+		self.assertEqual(api_client(self.seller).get("/api/admin/orders/").status_code, 403)
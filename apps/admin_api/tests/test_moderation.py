@@ -0,0 +1,80 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.accounts.models import User
+from apps.admin_api.models import ModerationAuditLog
+from apps.catalog.models import Product, ProductCard
+from apps.common.testing import api_client, make_product, make_seller, make_user
+
+DRAFT = Product.Status.DRAFT
+PUBLISHED = Product.Status.PUBLISHED
+
+
+class BulkModerationTests(TestCase):
+	def setUp(self):
+		self.seller = make_seller()
+		self.admin = make_user("admin@example.com", User.Role.ADMIN)
+		with self.captureOnCommitCallbacks(execute=True):
+			self.draft = make_product(self.seller, status=DRAFT)
+			self.live = make_product(self.seller)
+			self.theirs = make_product(make_seller("other-seller@example.com"), status=DRAFT)
+
+	def post(self, user, url, payload):
+		with self.captureOnCommitCallbacks(execute=True):
+			return api_client(user).post(url, payload, format="json")
+
+	def test_seller_publish_reports_per_id_within_their_scope(self):
+		response = self.post(
+			self.seller,
+			"/api/catalog/products/bulk_publish/",
+			{"ids": [self.draft.id, self.live.id, self.theirs.id, 999999]},
+		)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(
+			[(row["id"], row["result"]) for row in response.data["results"]],
+			[
+				(self.draft.id, "updated"),
+				(self.live.id, "unchanged"),
+				(self.theirs.id, "not_found"),
+				(999999, "not_found"),
+			],
+		)
+		self.assertEqual((response.data["matched"], response.data["updated"]), (2, 1))
+		self.assertEqual(Product.objects.get(pk=self.theirs.pk).status, DRAFT)
+		self.assertEqual(ProductCard.objects.get(pk=self.draft.pk).status, PUBLISHED)
+
+	def test_each_batch_writes_one_audit_row(self):
+		response = self.post(
+			self.admin, "/api/admin/products/bulk_archive/", {"filters": {"seller": self.seller.id}}
+		)
+
+		log = ModerationAuditLog.objects.get()
+		self.assertEqual(log.id, response.data["audit_id"])
+		self.assertEqual((log.actor, log.action, log.to_status), (self.admin, "archive", Product.Status.ARCHIVED))
+		self.assertEqual(log.selector, {"filters": {"seller": self.seller.id}})
+		self.assertEqual(sorted(log.updated_ids), [self.draft.id, self.live.id])
+
+	def test_selector_is_validated(self):
+		url = "/api/admin/products/bulk_publish/"
+
+		self.assertEqual(self.post(self.admin, url, {}).status_code, 400)
+		both = {"ids": [self.draft.id], "filters": {"status": DRAFT}}
+		self.assertEqual(self.post(self.admin, url, both).status_code, 400)
+		self.assertEqual(self.post(self.admin, url, {"filters": {"name": "Kurta"}}).status_code, 400)
+		self.assertFalse(ModerationAuditLog.objects.exists())
+
+	def test_oversized_batches_are_refused(self):
+		with mock.patch("apps.admin_api.moderation.BULK_MODERATION_LIMIT", 1):
+			response = self.post(self.admin, "/api/admin/products/bulk_publish/", {"filters": {"status": DRAFT}})
+
+		self.assertEqual(response.status_code, 400)
+		self.assertEqual(Product.objects.get(pk=self.draft.pk).status, DRAFT)
+
+	def test_customers_cannot_use_admin_endpoints(self):
+		customer = make_user("customer@example.com")
+
+		response = self.post(customer, "/api/admin/products/bulk_publish/", {"ids": [self.draft.id]})
+
+		self.assertEqual(response.status_code, 403)
@@ -0,0 +1,115 @@
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.admin_api.models import DailySellerStat, DailyStat
+from apps.admin_api.reporting import refresh_day, refresh_dirty_days
+from apps.common.testing import api_client, make_order, make_seller, make_user
+from apps.orders.models import Order
+from apps.wallet.services import collect_late_fees, reverse_refunded_settlements, settle_delivered_orders
+
+
+@override_settings(PLATFORM_COMMISSION_PERCENT="10")
+class DailyCommissionTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.seller = make_seller()
+
+	def order(self, total, **fields):
+		return make_order(
+			self.customer,
+			self.seller,
+			total,
+			status=Order.Status.DELIVERED,
+			payment_status=Order.PaymentStatus.PAID,
+			**fields,
+		)
+
+	def refund(self, order, amount):
+		order.refresh_from_db()
+		order.amount_refunded += Decimal(amount)
+		order.save(update_fields=["amount_refunded", "updated_at"])
+		reverse_refunded_settlements([(order, Decimal(amount))])
+
+	def commission(self):
+		return refresh_day(timezone.localdate()).commission
+
+	def test_refund_before_settlement_is_not_commission(self):
+		self.order("1000.00", amount_refunded=Decimal("100.00"))
+		settle_delivered_orders()
+
+		self.assertEqual(self.commission(), Decimal("90.00"))
+
+	def test_partial_refund_after_settlement_returns_its_commission(self):
+		order = self.order("1000.00", amount_refunded=Decimal("100.00"))
+		settle_delivered_orders()
+		self.refund(order, "300.00")
+
+		self.assertEqual(self.commission(), Decimal("60.00"))
+
+	def test_full_refund_returns_all_commission(self):
+		order = self.order("1000.00", amount_refunded=Decimal("100.00"))
+		settle_delivered_orders()
+		self.refund(order, "300.00")
+		self.refund(order, "600.00")
+
+		self.assertEqual(self.commission(), Decimal("0.00"))
+
+	def test_collected_late_fees_add_their_commission(self):
+		order = self.order("500.00", late_fees=Decimal("50.00"))
+		settle_delivered_orders()
+		collect_late_fees(order)
+
+		self.assertEqual(self.commission(), Decimal("55.00"))
+
+
+class DirtyDayRollupTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.seller = make_seller()
+		self.today = timezone.localdate()
+
+	def place_order(self, total="1000.00", **fields):
+		with self.captureOnCommitCallbacks(execute=True):
+			return make_order(self.customer, self.seller, total, **fields)
+
+	def test_writes_flag_their_day_until_the_next_refresh(self):
+		self.place_order(payment_status=Order.PaymentStatus.PAID)
+		self.place_order("400.00")
+
+		self.assertIsNotNone(DailyStat.objects.get(date=self.today).dirty_at)
+		self.assertEqual(refresh_dirty_days(), 1)
+
+		stat = DailyStat.objects.get(date=self.today)
+		self.assertIsNone(stat.dirty_at)
+		self.assertEqual((stat.orders_count, stat.paid_orders_count, stat.gmv), (2, 1, Decimal("1000.00")))
+		self.assertEqual(stat.new_users_by_role, {User.Role.CUSTOMER: 1, User.Role.BOUTIQUE_OWNER: 1})
+		self.assertEqual(DailySellerStat.objects.get(date=self.today, seller=self.seller).gmv, Decimal("1000.00"))
+		self.assertEqual(refresh_dirty_days(), 0)
+
+	def test_only_reported_fields_flag_the_day(self):
+		order = self.place_order()
+		refresh_dirty_days()
+
+		with self.captureOnCommitCallbacks(execute=True):
+			order.shipping_city = "Mumbai"
+			order.save(update_fields=["shipping_city", "updated_at"])
+		self.assertIsNone(DailyStat.objects.get(date=self.today).dirty_at)
+
+		with self.captureOnCommitCallbacks(execute=True):
+			order.payment_status = Order.PaymentStatus.PAID
+			order.save(update_fields=["payment_status", "updated_at"])
+		self.assertIsNotNone(DailyStat.objects.get(date=self.today).dirty_at)
+
+	def test_reports_read_the_rollups(self):
+		self.place_order(payment_status=Order.PaymentStatus.PAID)
+		refresh_dirty_days()
+		admin = make_user("admin@example.com", User.Role.ADMIN)
+
+		response = api_client(admin).get("/api/admin/reports/", {"date_from": self.today, "date_to": self.today})
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.data["totals"]["paid_orders_count"], 1)
+		self.assertEqual(response.data["top_sellers"][0]["seller_email"], self.seller.email)
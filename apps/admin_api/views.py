@@ -1,13 +1,23 @@
+from collections import Counter
+from decimal import Decimal
+
 from django.db import transaction
-from django.db.models import Count
+from django.db.models import F, Sum
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import generics, permissions, viewsets
 from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from apps.accounts.models import User
 from apps.accounts.permissions import IsAdmin
-from apps.admin_api.models import MarketplaceSettings
+from apps.admin_api.filters import OrderAdminFilter, ProductModerationFilter, UserAdminFilter
+from apps.admin_api.models import DailyCategoryStat, DailySellerStat, DailyStat, MarketplaceSettings
+from apps.admin_api.moderation import bulk_set_status
 from apps.admin_api.serializers import (
+	BulkModerationResultSerializer,
+	BulkModerationSerializer,
+	LateFeeCollectionSerializer,
 	MarketplaceSettingsSerializer,
 	OrderAdminSerializer,
 	ProductModerationSerializer,
@@ -15,8 +25,26 @@ from apps.admin_api.serializers import (
 	UserAdminSerializer,
 )
 from apps.catalog.models import Product
+from apps.common.exports import (
+	EXPORT_PARAMETERS,
+	get_export_format,
+	parse_day_param,
+	stream_export,
+)
+from apps.common.pagination import DateJoinedCursorPagination, NewestFirstCursorPagination
 from apps.orders.models import Order
-from apps.wallet.services import credit_seller_on_order_delivery
+from apps.orders.status import change_status
+from apps.orders.views import ORDER_EXPORT_COLUMNS
+from apps.wallet.services import collect_late_fees
+
+ADMIN_ORDER_EXPORT_COLUMNS = [
+	*ORDER_EXPORT_COLUMNS[:6],
+	("customer_email", "customer__email"),
+	("seller_email", "seller__email"),
+	*ORDER_EXPORT_COLUMNS[6:],
+]
+DEFAULT_TOP_ROWS = 10
+MAX_TOP_ROWS = 50
 
 
 class MarketplaceSettingsView(generics.RetrieveUpdateAPIView):
@@ -28,15 +56,21 @@ class MarketplaceSettingsView(generics.RetrieveUpdateAPIView):
 
 
 class UserAdminViewSet(viewsets.ModelViewSet):
-	queryset = User.objects.all().order_by("-date_joined")
+	queryset = User.objects.all().order_by("-date_joined", "-id")
 	serializer_class = UserAdminSerializer
 	permission_classes = [IsAdmin]
+	filterset_class = UserAdminFilter
+	pagination_class = DateJoinedCursorPagination
+	ordering_fields = ["date_joined"]
 
 
 class ProductModerationViewSet(viewsets.ModelViewSet):
-	queryset = Product.objects.all().order_by("-created_at")
+	queryset = Product.objects.select_related("seller").order_by("-created_at", "-id")
 	serializer_class = ProductModerationSerializer
 	permission_classes = [IsAdmin]
+	filterset_class = ProductModerationFilter
+	pagination_class = NewestFirstCursorPagination
+	ordering_fields = ["created_at"]
 
 	@action(detail=True, methods=["post"], permission_classes=[IsAdmin])
 	def publish(self, request, pk=None):
@@ -52,39 +86,140 @@ class ProductModerationViewSet(viewsets.ModelViewSet):
 		product.save(update_fields=["status", "updated_at"])
 		return Response(self.get_serializer(product).data)
 
+	def _bulk_set_status(self, request, to_status: str, action_name: str):
+		serializer = BulkModerationSerializer(data=request.data)
+		serializer.is_valid(raise_exception=True)
+		result = bulk_set_status(
+			Product.objects.all(),
+			to_status,
+			action_name,
+			request.user,
+			ids=serializer.validated_data.get("ids"),
+			filters=serializer.validated_data.get("filters"),
+		)
+		return Response(BulkModerationResultSerializer(result).data)
+
+	@extend_schema(request=BulkModerationSerializer, responses=BulkModerationResultSerializer)
+	@action(detail=False, methods=["post"], permission_classes=[IsAdmin])
+	def bulk_publish(self, request):
+		"""Publish many products by ids or filters in one statement"""
+		return self._bulk_set_status(request, Product.Status.PUBLISHED, "publish")
+
+	@extend_schema(request=BulkModerationSerializer, responses=BulkModerationResultSerializer)
+	@action(detail=False, methods=["post"], permission_classes=[IsAdmin])
+	def bulk_archive(self, request):
+		"""Archive many products by ids or filters in one statement"""
+		return self._bulk_set_status(request, Product.Status.ARCHIVED, "archive")
+
 
 class OrderAdminViewSet(viewsets.ReadOnlyModelViewSet):
-	queryset = Order.objects.all().order_by("-created_at")
+	queryset = Order.objects.select_related("customer", "seller").order_by("-created_at", "-id")
 	serializer_class = OrderAdminSerializer
 	permission_classes = [IsAdmin]
+	filterset_class = OrderAdminFilter
+	pagination_class = NewestFirstCursorPagination
+	ordering_fields = ["created_at"]
 
 	@action(detail=True, methods=["post"], permission_classes=[IsAdmin])
 	@transaction.atomic
 	def update_status(self, request, pk=None):
 		order = self.get_object()
-		new_status = request.data.get("status")
-		if new_status not in Order.Status.values:
-			return Response({"detail": "Invalid status."}, status=400)
-		was_delivered = order.status == Order.Status.DELIVERED
-		if new_status == Order.Status.DELIVERED and order.payment_status != Order.PaymentStatus.PAID:
-			return Response({"detail": "Cannot mark unpaid order as delivered."}, status=400)
-		order.status = new_status
-		order.save(update_fields=["status", "updated_at"])
-		if new_status == Order.Status.DELIVERED and not was_delivered:
-			credit_seller_on_order_delivery(order)
+		change_status(order, request.data.get("status"))
 		return Response(self.get_serializer(order).data)
 
+	@extend_schema(request=LateFeeCollectionSerializer, responses=OrderAdminSerializer)
+	@action(detail=True, methods=["post"], permission_classes=[IsAdmin])
+	def collect_late_fees(self, request, pk=None):
+		"""Record late fees collected from the customer (all outstanding by default) and credit the seller"""
+		serializer = LateFeeCollectionSerializer(data=request.data)
+		serializer.is_valid(raise_exception=True)
+		order = self.get_object()
+		collect_late_fees(order, serializer.validated_data.get("amount"))
+		order.refresh_from_db()
+		return Response(self.get_serializer(order).data)
+
+	@extend_schema(
+		summary="Export orders",
+		description="Streams all orders as CSV or JSONL, optionally limited to a date range.",
+		parameters=EXPORT_PARAMETERS,
+		responses={(200, "text/csv"): OpenApiTypes.STR},
+	)
+	@action(detail=False, methods=["get"], permission_classes=[IsAdmin])
+	def export(self, request):
+		# date_from/date_to are applied by OrderAdminFilter along with the other filters.
+		queryset = self.filter_queryset(self.get_queryset())
+		return stream_export(queryset, ADMIN_ORDER_EXPORT_COLUMNS, get_export_format(request), "orders")
+
 
 class ReportsView(generics.GenericAPIView):
 	serializer_class = ReportsSerializer
 	permission_classes = [IsAdmin]
 
+	@extend_schema(
+		summary="Marketplace reports",
+		description=(
+			"Reads the daily rollups for an optional inclusive date range (all days by default): "
+			"totals, users by role, orders by status, a per-day series and the top sellers and categories by GMV."
+		),
+		parameters=[
+			OpenApiParameter("date_from", OpenApiTypes.DATE),
+			OpenApiParameter("date_to", OpenApiTypes.DATE),
+			OpenApiParameter("top", int, description=f"Number of top sellers and categories (max {MAX_TOP_ROWS})."),
+		],
+	)
 	def get(self, request, *args, **kwargs):
-		users_by_role = User.objects.values("role").annotate(count=Count("id"))
-		orders_by_status = Order.objects.values("status").annotate(count=Count("id"))
+		date_from = parse_day_param(request, "date_from")
+		date_to = parse_day_param(request, "date_to")
+		top = self._top_limit(request)
+		days = DailyStat.objects.all()
+		sellers = DailySellerStat.objects.order_by()
+		categories = DailyCategoryStat.objects.order_by()
+		if date_from:
+			days, sellers, categories = (qs.filter(date__gte=date_from) for qs in (days, sellers, categories))
+		if date_to:
+			days, sellers, categories = (qs.filter(date__lte=date_to) for qs in (days, sellers, categories))
+
+		totals = {"orders_count": 0, "paid_orders_count": 0, "gmv": Decimal("0.00"), "commission": Decimal("0.00")}
+		users_by_role, orders_by_status, daily = Counter(), Counter(), []
+		for day in days:
+			row = {field: getattr(day, field) for field in totals}
+			daily.append({"date": day.date, **row})
+			for field, value in row.items():
+				totals[field] += value
+			users_by_role.update(day.new_users_by_role)
+			orders_by_status.update(day.orders_by_status)
+
+		top_sellers = (
+			sellers.values("seller_id", seller_email=F("seller__email"))
+			.annotate(orders_count=Sum("orders_count"), gmv=Sum("gmv"))
+			.order_by("-gmv", "seller_id")[:top]
+		)
+		top_categories = (
+			categories.values("category_id", category_name=F("category__name"))
+			.annotate(orders_count=Sum("orders_count"), units=Sum("units"), gmv=Sum("gmv"))
+			.order_by("-gmv")[:top]
+		)
 		return Response(
-			{
-				"users_by_role": list(users_by_role),
-				"orders_by_status": list(orders_by_status),
-			}
+			self.get_serializer(
+				{
+					"date_from": date_from,
+					"date_to": date_to,
+					"totals": totals,
+					"users_by_role": [{"role": role, "count": count} for role, count in users_by_role.items()],
+					"orders_by_status": [
+						{"status": status, "count": count} for status, count in orders_by_status.items()
+					],
+					"daily": daily,
+					"top_sellers": list(top_sellers),
+					"top_categories": list(top_categories),
+				}
+			).data
 		)
+
+	@staticmethod
+	def _top_limit(request) -> int:
+		try:
+			top = int(request.query_params.get("top", DEFAULT_TOP_ROWS))
+		except (TypeError, ValueError):
+			top = DEFAULT_TOP_ROWS
+		return max(1, min(top, MAX_TOP_ROWS))
@@ -1,12 +1,29 @@
 from django.contrib import admin
 
-from apps.boutiques.models import Boutique
+from apps.boutiques.models import Boutique, SellerStats
 
 
 @admin.register(Boutique)
 class BoutiqueAdmin(admin.ModelAdmin):
-    list_display = ("id", "name", "owner", "status", "is_active", "created_at")
+    list_display = ("id", "name", "owner", "city", "state", "status", "is_active", "created_at")
     list_filter = ("status", "is_active", "created_at")
-    search_fields = ("name", "owner__email", "city", "state")
+    search_fields = ("name", "owner__email", "city_key", "state_key")
+    readonly_fields = ("city_key", "state_key", "geohash")
     ordering = ("-created_at",)
     autocomplete_fields = ['owner']
+
+
+@admin.register(SellerStats)
+class SellerStatsAdmin(admin.ModelAdmin):
+    list_display = (
+        "seller",
+        "published_products",
+        "new_products",
+        "used_products",
+        "rental_products",
+        "fulfilled_orders",
+        "updated_at",
+    )
+    search_fields = ("seller__email",)
+    list_select_related = ("seller",)
+    readonly_fields = ("updated_at",)
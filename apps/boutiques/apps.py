@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BoutiquesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.boutiques"
+
+    def ready(self):
+        from apps.boutiques import signals  # noqa: F401
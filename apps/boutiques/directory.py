@@ -0,0 +1,107 @@
+"""
+Boutique directory helpers.
+
+City and state are matched on normalized keys (``slugify``), so "New Delhi",
+"new delhi " and "new-delhi" hit the same indexed value. Boutiques with
+coordinates carry a geohash; a "near me" search scans the 3x3 block of cells
+around the point, each an indexed prefix lookup, and ranks the candidates by
+great-circle distance. Public per-city listings are cached under a per-city
+version number that boutique writes bump, which drops every cached page of
+that city at once.
+"""
+import math
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.text import slugify
+
+from apps.common.cache import bump_versions, get_or_build, versioned_key
+
+GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+GEOHASH_PRECISION = 9
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+CITY_LISTING_NAMESPACE = "boutiques:city-listing"
+
+
+def place_key(value: str | None) -> str:
+	return slugify(value or "")[:120]
+
+
+def encode_geohash(latitude: float, longitude: float, precision: int = GEOHASH_PRECISION) -> str:
+	lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+	chars, bits, char, even = [], 0, 0, True
+	while len(chars) < precision:
+		value, bounds = (longitude, lng_range) if even else (latitude, lat_range)
+		middle = (bounds[0] + bounds[1]) / 2
+		char <<= 1
+		if value >= middle:
+			char |= 1
+			bounds[0] = middle
+		else:
+			bounds[1] = middle
+		even = not even
+		bits += 1
+		if bits == 5:
+			chars.append(GEOHASH_ALPHABET[char])
+			bits, char = 0, 0
+	return "".join(chars)
+
+
+def cell_size(precision: int) -> tuple[float, float]:
+	"""Height and width in degrees of a geohash cell of ``precision`` characters."""
+	lng_bits = math.ceil(precision * 5 / 2)
+	lat_bits = precision * 5 // 2
+	return 180 / 2**lat_bits, 360 / 2**lng_bits
+
+
+def search_precision(latitude: float, radius_km: float) -> int:
+	"""The finest precision whose cells are at least ``radius_km`` across at ``latitude``."""
+	shrink = max(math.cos(math.radians(latitude)), 0.01)
+	for precision in range(GEOHASH_PRECISION, 0, -1):
+		height, width = cell_size(precision)
+		if height * KM_PER_DEGREE >= radius_km and width * KM_PER_DEGREE * shrink >= radius_km:
+			return precision
+	return 1
+
+
+def nearby_cells(latitude: float, longitude: float, radius_km: float) -> set[str]:
+	"""Geohash prefixes of the cell holding the point and its eight neighbours."""
+	precision = search_precision(latitude, radius_km)
+	height, width = cell_size(precision)
+	cells = set()
+	for dy in (-1, 0, 1):
+		for dx in (-1, 0, 1):
+			lat = min(max(latitude + dy * height, -90.0), 90.0)
+			lng = (longitude + dx * width + 180) % 360 - 180
+			cells.add(encode_geohash(lat, lng, precision))
+	return cells
+
+
+def distance_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+	lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+	a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+	return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def near(queryset, latitude: float, longitude: float, radius_km: float, limit: int) -> list:
+	"""Boutiques of ``queryset`` within ``radius_km``, nearest first, with ``distance_km`` set."""
+	cells = Q()
+	for cell in nearby_cells(latitude, longitude, radius_km):
+		cells |= Q(geohash__startswith=cell)
+	ranked = []
+	for boutique in queryset.filter(cells):
+		boutique.distance_km = distance_km(latitude, longitude, float(boutique.latitude), float(boutique.longitude))
+		if boutique.distance_km <= radius_km:
+			ranked.append(boutique)
+	ranked.sort(key=lambda boutique: (boutique.distance_km, boutique.id))
+	return ranked[:limit]
+
+
+def cached_listing(city_key: str, query_string: str, build) -> dict:
+	key = versioned_key(CITY_LISTING_NAMESPACE, city_key, query_string)
+	return get_or_build(key, settings.BOUTIQUE_LISTING_CACHE_SECONDS, build)
+
+
+def invalidate_cities(*city_keys: str) -> None:
+	bump_versions(CITY_LISTING_NAMESPACE, city_keys)
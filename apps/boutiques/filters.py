@@ -0,0 +1,20 @@
+import django_filters
+
+from apps.boutiques.directory import place_key
+from apps.boutiques.models import Boutique
+
+
+class BoutiqueFilter(django_filters.FilterSet):
+	"""City and state match on normalized keys, so case and spacing do not matter."""
+	city = django_filters.CharFilter(method="filter_city")
+	state = django_filters.CharFilter(method="filter_state")
+
+	class Meta:
+		model = Boutique
+		fields = ["status", "is_active"]
+
+	def filter_city(self, queryset, name, value):
+		return queryset.filter(city_key=place_key(value))
+
+	def filter_state(self, queryset, name, value):
+		return queryset.filter(state_key=place_key(value))
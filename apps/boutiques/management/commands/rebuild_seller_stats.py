@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.boutiques.storefront import rebuild_all
+
+
+class Command(BaseCommand):
+	help = "Recomputes the storefront counters of every seller."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--batch-size", type=int, default=500)
+
+	def handle(self, *args, **options):
+		count = rebuild_all(batch_size=options["batch_size"])
+		self.stdout.write(f"Rebuilt stats for {count} sellers.")
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.11 on 2026-10-19 18:09
+
+from django.conf import settings
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def fill_place_keys(apps, schema_editor):
+    Boutique = apps.get_model("boutiques", "Boutique")
+    boutiques = list(Boutique.objects.only("id", "city", "state"))
+    for boutique in boutiques:
+        boutique.city_key = slugify(boutique.city or "")[:120]
+        boutique.state_key = slugify(boutique.state or "")[:120]
+    Boutique.objects.bulk_update(boutiques, ["city_key", "state_key"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('boutiques', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='boutique',
+            name='city_key',
+            field=models.CharField(blank=True, editable=False, max_length=120),
+        ),
+        migrations.AddField(
+            model_name='boutique',
+            name='geohash',
+            field=models.CharField(blank=True, editable=False, max_length=12),
+        ),
+        migrations.AddField(
+            model_name='boutique',
+            name='latitude',
+            field=models.DecimalField(blank=True, decimal_places=6, max_digits=9, null=True),
+        ),
+        migrations.AddField(
+            model_name='boutique',
+            name='longitude',
+            field=models.DecimalField(blank=True, decimal_places=6, max_digits=9, null=True),
+        ),
+        migrations.AddField(
+            model_name='boutique',
+            name='state_key',
+            field=models.CharField(blank=True, editable=False, max_length=120),
+        ),
+        migrations.RunPython(fill_place_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='boutique',
+            index=models.Index(fields=['city_key', 'status', 'is_active', '-created_at', '-id'], name='boutiques_b_city_ke_7b7425_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boutique',
+            index=models.Index(fields=['state_key', 'status', 'is_active', '-created_at', '-id'], name='boutiques_b_state_k_62d820_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boutique',
+            index=models.Index(fields=['status', 'is_active', '-created_at', '-id'], name='boutiques_b_status_b588d8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='boutique',
+            index=models.Index(fields=['geohash'], name='boutique_geohash_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.11 on 2026-10-19 18:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_admin_list_indexes'),
+        ('boutiques', '0002_directory_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SellerStats',
+            fields=[
+                ('seller', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='storefront_stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('published_products', models.PositiveIntegerField(default=0)),
+                ('new_products', models.PositiveIntegerField(default=0)),
+                ('used_products', models.PositiveIntegerField(default=0)),
+                ('rental_products', models.PositiveIntegerField(default=0)),
+                ('fulfilled_orders', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'seller stats',
+            },
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 
 from apps.accounts.models import User
+from apps.boutiques.directory import encode_geohash, place_key
 
 
 class Boutique(models.Model):
@@ -18,6 +19,12 @@ class Boutique(models.Model):
 	city = models.CharField(max_length=120, blank=True)
 	state = models.CharField(max_length=120, blank=True)
 	country = models.CharField(max_length=120, default="India")
+	# Normalized city/state for indexed, case- and spacing-insensitive lookups; set on save.
+	city_key = models.CharField(max_length=120, blank=True, editable=False)
+	state_key = models.CharField(max_length=120, blank=True, editable=False)
+	latitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+	longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
+	geohash = models.CharField(max_length=12, blank=True, editable=False)
 	status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
 	is_active = models.BooleanField(default=True)
 	created_at = models.DateTimeField(auto_now_add=True)
@@ -25,6 +32,42 @@ class Boutique(models.Model):
 
 	class Meta:
 		ordering = ["-created_at"]
+		indexes = [
+			models.Index(fields=["city_key", "status", "is_active", "-created_at", "-id"]),
+			models.Index(fields=["state_key", "status", "is_active", "-created_at", "-id"]),
+			models.Index(fields=["status", "is_active", "-created_at", "-id"]),
+			# Prefix scans for "near me"; the opclass makes LIKE 'abc%' indexable on Postgres.
+			models.Index(fields=["geohash"], name="boutique_geohash_idx", opclasses=["varchar_pattern_ops"]),
+		]
 
 	def __str__(self) -> str:
 		return self.name
+
+	def save(self, *args, **kwargs):
+		self.city_key = place_key(self.city)
+		self.state_key = place_key(self.state)
+		if self.latitude is not None and self.longitude is not None:
+			self.geohash = encode_geohash(float(self.latitude), float(self.longitude))
+		else:
+			self.geohash = ""
+		update_fields = kwargs.get("update_fields")
+		if update_fields is not None:
+			kwargs["update_fields"] = {*update_fields, "city_key", "state_key", "geohash"}
+		super().save(*args, **kwargs)
+
+
+class SellerStats(models.Model):
+	"""Storefront counters of one seller, recomputed by ``apps.boutiques.storefront`` when they change."""
+	seller = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="storefront_stats")
+	published_products = models.PositiveIntegerField(default=0)
+	new_products = models.PositiveIntegerField(default=0)
+	used_products = models.PositiveIntegerField(default=0)
+	rental_products = models.PositiveIntegerField(default=0)
+	fulfilled_orders = models.PositiveIntegerField(default=0)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	class Meta:
+		verbose_name_plural = "seller stats"
+
+	def __str__(self) -> str:
+		return f"Stats for seller {self.seller_id}"
@@ -1,10 +1,21 @@
 from rest_framework import serializers
 
-from apps.boutiques.models import Boutique
+from apps.boutiques.models import Boutique, SellerStats
+from apps.boutiques.storefront import STAT_FIELDS
+from apps.catalog.serializers import ProductCardSerializer
+
+MAX_NEARBY_RADIUS_KM = 50
+MAX_NEARBY_RESULTS = 50
 
 
 class BoutiqueSerializer(serializers.ModelSerializer):
-	owner_id = serializers.IntegerField(source="owner.id", read_only=True)
+	owner_id = serializers.IntegerField(read_only=True)
+	latitude = serializers.DecimalField(
+		max_digits=9, decimal_places=6, min_value=-90, max_value=90, required=False, allow_null=True
+	)
+	longitude = serializers.DecimalField(
+		max_digits=9, decimal_places=6, min_value=-180, max_value=180, required=False, allow_null=True
+	)
 
 	class Meta:
 		model = Boutique
@@ -19,9 +30,52 @@ class BoutiqueSerializer(serializers.ModelSerializer):
 			"city",
 			"state",
 			"country",
+			"latitude",
+			"longitude",
 			"status",
 			"is_active",
 			"created_at",
 			"updated_at",
 		]
 		read_only_fields = ["id", "status", "created_at", "updated_at", "owner_id"]
+
+	def validate(self, attrs):
+		latitude = attrs.get("latitude", getattr(self.instance, "latitude", None))
+		longitude = attrs.get("longitude", getattr(self.instance, "longitude", None))
+		if (latitude is None) != (longitude is None):
+			raise serializers.ValidationError("Pass both latitude and longitude, or neither.")
+		return attrs
+
+
+class NearbyBoutiqueSerializer(BoutiqueSerializer):
+	distance_km = serializers.FloatField(read_only=True)
+
+	class Meta(BoutiqueSerializer.Meta):
+		fields = [*BoutiqueSerializer.Meta.fields, "distance_km"]
+
+
+class NearbyQuerySerializer(serializers.Serializer):
+	lat = serializers.FloatField(min_value=-90, max_value=90)
+	lng = serializers.FloatField(min_value=-180, max_value=180)
+	radius_km = serializers.FloatField(min_value=0.1, max_value=MAX_NEARBY_RADIUS_KM, default=10)
+	limit = serializers.IntegerField(min_value=1, max_value=MAX_NEARBY_RESULTS, default=20)
+
+
+class SellerStatsSerializer(serializers.ModelSerializer):
+	class Meta:
+		model = SellerStats
+		fields = [*STAT_FIELDS, "updated_at"]
+		read_only_fields = fields
+
+
+class StorefrontProductPageSerializer(serializers.Serializer):
+	next = serializers.URLField(allow_null=True)
+	previous = serializers.URLField(allow_null=True)
+	results = ProductCardSerializer(many=True)
+
+
+class StorefrontSerializer(serializers.Serializer):
+	seller_id = serializers.IntegerField()
+	boutique = BoutiqueSerializer(allow_null=True)
+	stats = SellerStatsSerializer()
+	products = StorefrontProductPageSerializer()
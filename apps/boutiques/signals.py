@@ -0,0 +1,51 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.boutiques.directory import invalidate_cities
+from apps.boutiques.models import Boutique
+from apps.boutiques.storefront import invalidate_storefronts, refresh_seller_stats, refresh_stats_on_commit
+from apps.catalog.cards import cards_refreshed
+from apps.catalog.models import Product
+from apps.orders.models import Order
+from apps.orders.signals import orders_updated
+
+
+@receiver(pre_save, sender=Boutique)
+def remember_previous_city(sender, instance, **kwargs):
+	instance._previous_city_key = None
+	if instance.pk:
+		instance._previous_city_key = (
+			Boutique.objects.filter(pk=instance.pk).values_list("city_key", flat=True).first()
+		)
+
+
+@receiver(post_save, sender=Boutique)
+@receiver(post_delete, sender=Boutique)
+def invalidate_city_listings(sender, instance, **kwargs):
+	city_keys = [instance.city_key, getattr(instance, "_previous_city_key", None)]
+	transaction.on_commit(lambda: invalidate_cities(*filter(None, city_keys)))
+	transaction.on_commit(lambda: invalidate_storefronts([instance.owner_id]))
+
+
+@receiver(cards_refreshed)
+def refresh_stats_for_cards(sender, seller_ids, **kwargs):
+	refresh_seller_stats(seller_ids)
+
+
+@receiver(post_delete, sender=Product)
+def refresh_stats_for_deleted_product(sender, instance, **kwargs):
+	refresh_stats_on_commit([instance.seller_id])
+
+
+@receiver(post_save, sender=Order)
+def refresh_stats_for_order(sender, instance, created, update_fields=None, **kwargs):
+	if created or update_fields is None or "status" in update_fields:
+		refresh_stats_on_commit([instance.seller_id])
+
+
+@receiver(orders_updated)
+def refresh_stats_for_bulk_orders(sender, order_ids, fields=None, **kwargs):
+	if fields is not None and "status" not in fields:
+		return
+	refresh_stats_on_commit(Order.objects.filter(id__in=order_ids).values_list("seller_id", flat=True))
@@ -0,0 +1,88 @@
+"""
+Seller storefronts.
+
+A storefront response is the seller's boutique, one page of product cards
+and the seller's ``SellerStats`` counters. The counters are recomputed from
+``ProductCard`` and ``Order`` with one grouped query each, for any number of
+sellers, after a card rebuild or an order status change, so a page view only
+reads one row. Whole responses are cached per seller and query string under
+a per-seller version that those writes, and edits to the seller's
+boutiques, bump.
+"""
+from django.db import transaction
+from django.db.models import Count
+
+from apps.accounts.models import User
+from apps.boutiques.models import SellerStats
+from apps.catalog.models import Product, ProductCard
+from apps.common.cache import bump_versions
+from apps.orders.models import Order
+
+STOREFRONT_NAMESPACE = "boutiques:storefront"
+SELLER_ROLES = [User.Role.BOUTIQUE_OWNER, User.Role.MANUFACTURER]
+STAT_FIELDS = ["published_products", "new_products", "used_products", "rental_products", "fulfilled_orders"]
+
+
+def refresh_seller_stats(seller_ids) -> int:
+	"""Recomputes the counters of ``seller_ids`` and drops their cached storefronts; ids of non-sellers are skipped."""
+	seller_ids = set(
+		User.objects.filter(id__in=set(seller_ids), role__in=SELLER_ROLES).values_list("id", flat=True)
+	)
+	if not seller_ids:
+		return 0
+	counts = {seller_id: dict.fromkeys(STAT_FIELDS, 0) for seller_id in seller_ids}
+	cards = (
+		ProductCard.objects.filter(seller_id__in=seller_ids, status=Product.Status.PUBLISHED, is_active=True)
+		.values("seller_id", "product_type")
+		.annotate(total=Count("pk"))
+		.order_by()
+	)
+	for row in cards:
+		counts[row["seller_id"]]["published_products"] += row["total"]
+		counts[row["seller_id"]][f"{row['product_type']}_products"] = row["total"]
+	orders = (
+		Order.objects.filter(seller_id__in=seller_ids, status=Order.Status.DELIVERED)
+		.values("seller_id")
+		.annotate(total=Count("id"))
+		.order_by()
+	)
+	for row in orders:
+		counts[row["seller_id"]]["fulfilled_orders"] = row["total"]
+	SellerStats.objects.bulk_create(
+		[SellerStats(seller_id=seller_id, **values) for seller_id, values in counts.items()],
+		update_conflicts=True,
+		unique_fields=["seller"],
+		update_fields=[*STAT_FIELDS, "updated_at"],
+	)
+	invalidate_storefronts(seller_ids)
+	return len(seller_ids)
+
+
+def refresh_stats_on_commit(seller_ids) -> None:
+	seller_ids = set(seller_ids)
+	if seller_ids:
+		transaction.on_commit(lambda: refresh_seller_stats(seller_ids))
+
+
+def seller_stats(seller_id) -> SellerStats | None:
+	"""The seller's counters, computed on first use; None when the user does not exist or is not a seller."""
+	stats = SellerStats.objects.filter(seller_id=seller_id, seller__role__in=SELLER_ROLES)
+	found = stats.first()
+	if found is None and refresh_seller_stats([seller_id]):
+		found = stats.first()
+	return found
+
+
+def invalidate_storefronts(seller_ids) -> None:
+	bump_versions(STOREFRONT_NAMESPACE, seller_ids)
+
+
+def rebuild_all(batch_size: int = 500) -> int:
+	ids = list(
+		User.objects.filter(role__in=SELLER_ROLES)
+		.order_by("id")
+		.values_list("id", flat=True)
+	)
+	for start in range(0, len(ids), batch_size):
+		refresh_seller_stats(ids[start:start + batch_size])
+	return len(ids)
@@ -0,0 +1,109 @@
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from apps.accounts.models import User
+from apps.admin_api.models import MarketplaceSettings
+from apps.boutiques.directory import cell_size, distance_km, encode_geohash, nearby_cells, search_precision
+from apps.boutiques.models import Boutique
+from apps.common.testing import api_client, make_seller, make_user
+
+APPROVED = Boutique.Status.APPROVED
+KM_PER_DEGREE = 111.19
+
+
+class GeohashTests(SimpleTestCase):
+	def test_encodes_the_reference_point(self):
+		self.assertEqual(encode_geohash(57.64911, 10.40744), "u4pruydqq")
+
+	def test_search_cells_are_at_least_the_radius_across(self):
+		for latitude, radius_km in [(28.6, 0.5), (28.6, 10), (60.0, 50)]:
+			with self.subTest(latitude=latitude, radius_km=radius_km):
+				height, _ = cell_size(search_precision(latitude, radius_km))
+				self.assertGreaterEqual(height * KM_PER_DEGREE, radius_km)
+				self.assertEqual(len(nearby_cells(latitude, 77.2, radius_km)), 9)
+
+	def test_distance(self):
+		self.assertAlmostEqual(distance_km(28.6139, 77.2090, 19.0760, 72.8777), 1148, delta=5)
+
+
+class BoutiqueDirectoryTests(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.owner = make_seller()
+
+	def boutique(self, name, city="New Delhi", state="Delhi", point=None, **fields):
+		latitude, longitude = point or (None, None)
+		values = {"status": APPROVED, "latitude": latitude, "longitude": longitude, **fields}
+		with self.captureOnCommitCallbacks(execute=True):
+			return Boutique.objects.create(owner=self.owner, name=name, city=city, state=state, **values)
+
+	def names(self, response):
+		self.assertEqual(response.status_code, 200)
+		rows = response.data["results"] if isinstance(response.data, dict) else response.data
+		return [row["name"] for row in rows]
+
+	def test_city_and_state_match_whatever_the_spelling(self):
+		self.boutique("Chandni")
+		self.boutique("Colaba", city="Mumbai", state="Maharashtra")
+		self.boutique("Pending", status=Boutique.Status.PENDING)
+		self.boutique("Closed", is_active=False)
+		client = api_client()
+
+		for city in ["New Delhi", " new delhi ", "new-delhi"]:
+			with self.subTest(city=city):
+				self.assertEqual(self.names(client.get("/api/boutiques/", {"city": city})), ["Chandni"])
+		self.assertEqual(self.names(client.get("/api/boutiques/", {"state": "MAHARASHTRA"})), ["Colaba"])
+
+	def test_city_listing_cache_drops_on_writes_to_either_city(self):
+		chandni = self.boutique("Chandni")
+		client = api_client()
+		self.assertEqual(self.names(client.get("/api/boutiques/", {"city": "New Delhi"})), ["Chandni"])
+
+		with self.captureOnCommitCallbacks(execute=True):
+			chandni.city = "Mumbai"
+			chandni.save()
+
+		self.assertEqual(self.names(client.get("/api/boutiques/", {"city": "New Delhi"})), [])
+		self.assertEqual(self.names(client.get("/api/boutiques/", {"city": "Mumbai"})), ["Chandni"])
+
+	def test_near_ranks_by_distance_within_the_radius(self):
+		self.boutique("India Gate", point=(Decimal("28.612900"), Decimal("77.229500")))
+		self.boutique("Connaught Place", point=(Decimal("28.631500"), Decimal("77.216700")))
+		self.boutique("Noida", point=(Decimal("28.535500"), Decimal("77.391000")))
+		self.boutique("Bandra", city="Mumbai", point=(Decimal("19.059600"), Decimal("72.829500")))
+		self.boutique("No coordinates")
+		client = api_client()
+
+		nearby = client.get("/api/boutiques/near/", {"lat": 28.6304, "lng": 77.2177, "radius_km": 5})
+		wider = client.get("/api/boutiques/near/", {"lat": 28.6304, "lng": 77.2177, "radius_km": 25})
+
+		self.assertEqual(self.names(nearby), ["Connaught Place", "India Gate"])
+		self.assertEqual(self.names(wider), ["Connaught Place", "India Gate", "Noida"])
+		self.assertLess(nearby.data[0]["distance_km"], 1)
+		too_wide = client.get("/api/boutiques/near/", {"lat": 28.6, "lng": 77.2, "radius_km": 51})
+		self.assertEqual(too_wide.status_code, 400)
+
+	def test_match_just_across_a_cell_edge_is_found(self):
+		height, width = cell_size(search_precision(28.6, 2))
+		edge = (int(77.2 / width) + 1) * width
+		self.boutique("East of the edge", point=(Decimal("28.600000"), Decimal(f"{edge + 0.001:.6f}")))
+
+		response = api_client().get("/api/boutiques/near/", {"lat": 28.6, "lng": edge - 0.001, "radius_km": 2})
+
+		self.assertEqual(self.names(response), ["East of the edge"])
+
+	def test_new_boutiques_wait_for_approval_unless_auto_approved(self):
+		client = api_client(self.owner)
+
+		pending = client.post("/api/boutiques/", {"name": "First", "city": "Pune"}, format="json")
+		settings = MarketplaceSettings.get_settings()
+		settings.auto_approve_boutiques = True
+		settings.save()
+		approved = client.post("/api/boutiques/", {"name": "Second", "city": "Pune"}, format="json")
+
+		self.assertEqual((pending.data["status"], approved.data["status"]), (Boutique.Status.PENDING, APPROVED))
+		customer = api_client(make_user("customer@example.com"))
+		self.assertEqual(customer.post("/api/boutiques/", {"name": "X"}).status_code, 403)
+		self.assertEqual(User.objects.get(pk=self.owner.pk).boutiques.count(), 2)
@@ -0,0 +1,72 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.boutiques.models import Boutique, SellerStats
+from apps.catalog.models import Product
+from apps.common.testing import api_client, make_order, make_product, make_seller, make_user
+from apps.orders.models import Order
+
+
+class StorefrontTests(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.seller = make_seller()
+		self.customer = make_user("customer@example.com")
+		self.url = f"/api/boutiques/storefront/{self.seller.id}/"
+		with self.captureOnCommitCallbacks(execute=True):
+			self.kurta = make_product(self.seller)
+			make_product(self.seller, name="Lehenga", product_type=Product.ProductType.RENTAL)
+			make_product(self.seller, name="Draft", status=Product.Status.DRAFT)
+			Boutique.objects.create(owner=self.seller, name="Chandni", city="Delhi", status=Boutique.Status.APPROVED)
+
+	def get(self, **params):
+		response = api_client().get(self.url, params)
+		self.assertEqual(response.status_code, 200)
+		return response.data
+
+	def test_storefront_combines_boutique_counters_and_cards(self):
+		data = self.get()
+
+		self.assertEqual(data["boutique"]["name"], "Chandni")
+		self.assertEqual(
+			{field: data["stats"][field] for field in ["published_products", "new_products", "rental_products"]},
+			{"published_products": 2, "new_products": 1, "rental_products": 1},
+		)
+		self.assertEqual({row["name"] for row in data["products"]["results"]}, {"Kurta", "Lehenga"})
+
+	def test_non_sellers_are_not_found(self):
+		self.assertEqual(api_client().get(f"/api/boutiques/storefront/{self.customer.id}/").status_code, 404)
+		self.assertEqual(api_client().get("/api/boutiques/storefront/999999/").status_code, 404)
+		self.assertFalse(SellerStats.objects.filter(seller=self.customer).exists())
+
+	def test_cached_page_is_served_until_the_seller_changes(self):
+		self.get()
+		Product.objects.filter(pk=self.kurta.pk).update(name="Renamed without signals")
+
+		with self.assertNumQueries(0):
+			cached = self.get()
+		self.assertIn("Kurta", {row["name"] for row in cached["products"]["results"]})
+
+		with self.captureOnCommitCallbacks(execute=True):
+			make_product(self.seller, name="Saree")
+		self.assertEqual(self.get()["stats"]["published_products"], 3)
+
+	def test_delivered_orders_count_as_fulfilled(self):
+		self.get()
+		with self.captureOnCommitCallbacks(execute=True):
+			order = make_order(self.customer, self.seller, payment_status=Order.PaymentStatus.PAID)
+		self.assertEqual(self.get()["stats"]["fulfilled_orders"], 0)
+
+		with self.captureOnCommitCallbacks(execute=True):
+			order.status = Order.Status.DELIVERED
+			order.save(update_fields=["status", "updated_at"])
+
+		self.assertEqual(self.get()["stats"]["fulfilled_orders"], 1)
+
+	def test_boutique_edits_refresh_the_storefront(self):
+		self.get()
+
+		with self.captureOnCommitCallbacks(execute=True):
+			Boutique.objects.filter(owner=self.seller).get().delete()
+
+		self.assertIsNone(self.get()["boutique"])
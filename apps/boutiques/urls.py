@@ -1,11 +1,12 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from apps.boutiques.views import BoutiqueViewSet
+from apps.boutiques.views import BoutiqueViewSet, StorefrontView
 
 router = DefaultRouter()
 router.register("", BoutiqueViewSet, basename="boutique")
 
 urlpatterns = [
+    path("storefront/<int:seller_id>/", StorefrontView.as_view(), name="storefront"),
     path("", include(router.urls)),
 ]
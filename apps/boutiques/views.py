@@ -1,31 +1,128 @@
-from rest_framework import permissions, viewsets
+from django.conf import settings
+from drf_spectacular.utils import extend_schema
+from rest_framework import generics, permissions, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
 
 from apps.accounts.models import User
-from apps.accounts.permissions import IsAdmin, IsAdminOrBoutiqueOwner, IsBoutiqueOwner
+from apps.accounts.permissions import IsAdminOrBoutiqueOwner
 from apps.admin_api.models import MarketplaceSettings
+from apps.boutiques.directory import cached_listing, near, place_key
+from apps.boutiques.filters import BoutiqueFilter
 from apps.boutiques.models import Boutique
-from apps.boutiques.serializers import BoutiqueSerializer
+from apps.boutiques.serializers import (
+	BoutiqueSerializer,
+	NearbyBoutiqueSerializer,
+	NearbyQuerySerializer,
+	SellerStatsSerializer,
+	StorefrontSerializer,
+)
+from apps.boutiques.storefront import STOREFRONT_NAMESPACE, seller_stats
+from apps.catalog.models import Product, ProductCard
+from apps.catalog.serializers import ProductCardSerializer
+from apps.common.cache import get_or_build, versioned_key
+from apps.common.pagination import CreatedAtCursorPagination, NewestFirstCursorPagination
+
+
+def public_boutiques():
+	return Boutique.objects.filter(status=Boutique.Status.APPROVED, is_active=True)
 
 
 class BoutiqueViewSet(viewsets.ModelViewSet):
 	serializer_class = BoutiqueSerializer
+	filterset_class = BoutiqueFilter
+	pagination_class = NewestFirstCursorPagination
+	ordering_fields = ["created_at"]
+
+	def _is_public(self) -> bool:
+		user = self.request.user
+		return not (user.is_authenticated and user.role in {User.Role.ADMIN, User.Role.BOUTIQUE_OWNER})
 
 	def get_queryset(self):
+		if getattr(self, "swagger_fake_view", False):
+			return Boutique.objects.none()
 		user = self.request.user
 		if user.is_authenticated and user.role == User.Role.ADMIN:
 			return Boutique.objects.all()
 		if user.is_authenticated and user.role == User.Role.BOUTIQUE_OWNER:
 			return Boutique.objects.filter(owner=user)
-		return Boutique.objects.filter(status=Boutique.Status.APPROVED, is_active=True)
+		return public_boutiques()
 
 	def get_permissions(self):
-		if self.action in {"list", "retrieve"}:
+		if self.action in {"list", "retrieve", "near"}:
 			return [permissions.AllowAny()]
 		if self.action in {"create", "update", "partial_update", "destroy"}:
 			return [IsAdminOrBoutiqueOwner()]
 		return [permissions.IsAuthenticated()]
 
+	def list(self, request, *args, **kwargs):
+		"""Public listings of one city are served from the cache until a boutique there changes."""
+		city_key = place_key(request.query_params.get("city"))
+		if not city_key or not self._is_public():
+			return super().list(request, *args, **kwargs)
+		params = request.query_params.copy()
+		params["city"] = city_key
+		query_string = "&".join(sorted(params.urlencode().split("&")))
+		data = cached_listing(
+			city_key, query_string, lambda: super(BoutiqueViewSet, self).list(request, *args, **kwargs).data
+		)
+		return Response(data)
+
+	@extend_schema(parameters=[NearbyQuerySerializer], responses=NearbyBoutiqueSerializer(many=True))
+	@action(detail=False, methods=["get"])
+	def near(self, request):
+		"""Approved boutiques within radius_km of lat/lng, nearest first"""
+		params = NearbyQuerySerializer(data=request.query_params)
+		params.is_valid(raise_exception=True)
+		boutiques = near(
+			public_boutiques(),
+			params.validated_data["lat"],
+			params.validated_data["lng"],
+			params.validated_data["radius_km"],
+			params.validated_data["limit"],
+		)
+		return Response(NearbyBoutiqueSerializer(boutiques, many=True).data)
+
 	def perform_create(self, serializer):
-		settings = MarketplaceSettings.get_settings()
-		status = Boutique.Status.APPROVED if settings.auto_approve_boutiques else Boutique.Status.PENDING
+		marketplace = MarketplaceSettings.get_settings()
+		status = Boutique.Status.APPROVED if marketplace.auto_approve_boutiques else Boutique.Status.PENDING
 		serializer.save(owner=self.request.user, status=status)
+
+
+class StorefrontView(generics.GenericAPIView):
+	"""
+	A seller's storefront in one response: boutique, counters and a page of product cards.
+
+	Cached per seller and query string until one of the seller's products,
+	orders or boutiques changes.
+	"""
+	permission_classes = [permissions.AllowAny]
+	serializer_class = ProductCardSerializer
+	pagination_class = CreatedAtCursorPagination
+	filter_backends = []
+
+	def get_queryset(self):
+		return ProductCard.objects.filter(
+			seller_id=self.kwargs["seller_id"], status=Product.Status.PUBLISHED, is_active=True
+		)
+
+	@extend_schema(responses=StorefrontSerializer)
+	def get(self, request, seller_id):
+		query_string = "&".join(sorted(request.query_params.urlencode().split("&")))
+		key = versioned_key(STOREFRONT_NAMESPACE, seller_id, query_string)
+		return Response(get_or_build(key, settings.STOREFRONT_CACHE_SECONDS, lambda: self._build(seller_id)))
+
+	def _build(self, seller_id) -> dict:
+		stats = seller_stats(seller_id)
+		if stats is None:
+			raise NotFound("Seller not found.")
+		boutique = public_boutiques().filter(owner_id=seller_id).order_by("created_at", "id").first()
+		page = self.paginate_queryset(self.get_queryset())
+		products = self.get_paginated_response(self.get_serializer(page, many=True).data).data
+		return {
+			"seller_id": seller_id,
+			"boutique": BoutiqueSerializer(boutique).data if boutique else None,
+			"stats": SellerStatsSerializer(stats).data,
+			"products": products,
+		}
@@ -18,4 +18,4 @@ class CartAdmin(admin.ModelAdmin):
 @admin.register(CartItem)
 class CartItemAdmin(admin.ModelAdmin):
     list_display = ("id", "cart", "product", "variant", "quantity", "price_snapshot")
-    search_fields = ("product__name", "variant__name", "cart__user__email")
+    search_fields = ("product__name", "variant__sku", "cart__user__email")
@@ -24,7 +24,7 @@ class CartItemViewSet(viewsets.ModelViewSet):
 		if not self.request.user.is_authenticated:
 			return CartItem.objects.none()
 		cart, _ = Cart.objects.get_or_create(user=self.request.user)
-		return CartItem.objects.filter(cart=cart).select_related("product", "variant")
+		return CartItem.objects.filter(cart=cart).select_related("product", "variant__color", "variant__size")
 
 	def get_serializer_class(self):
 		if self.action == "create":
@@ -3,17 +3,19 @@ from django.contrib import admin
 from apps.catalog.models import (
 	Category,
 	Product,
+	ProductCard,
 	ProductColor,
 	ProductImage,
 	ProductSize,
 	ProductVariant,
 	RentalAvailability,
+	RentalBooking,
 )
 
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
-	list_display = ("id", "name", "slug", "parent")
+	list_display = ("id", "name", "slug", "parent", "path", "depth")
 	search_fields = ("name", "slug")
 
 
@@ -72,3 +74,19 @@ class RentalAvailabilityAdmin(admin.ModelAdmin):
 	list_display = ("id", "product", "is_available_from", "is_available_to", "min_rental_days", "max_rental_days")
 	list_filter = ("is_available_from", "is_available_to")
 	search_fields = ("product__name",)
+
+
+@admin.register(RentalBooking)
+class RentalBookingAdmin(admin.ModelAdmin):
+	list_display = ("id", "product", "kind", "status", "start_date", "end_date", "created_by")
+	list_filter = ("kind", "status")
+	search_fields = ("product__name",)
+	raw_id_fields = ("product", "created_by")
+
+
+@admin.register(ProductCard)
+class ProductCardAdmin(admin.ModelAdmin):
+	list_display = ("product", "name", "seller", "status", "selling_price", "in_stock", "refreshed_at")
+	list_filter = ("status", "is_active", "in_stock")
+	search_fields = ("name",)
+	readonly_fields = [field.name for field in ProductCard._meta.fields]
@@ -0,0 +1,168 @@
+"""
+Product card read model.
+
+``ProductCard`` holds what a listing tile shows, flattened into one row per
+product. Product, variant and image writes, edits and deletes of the colors
+and sizes variants use, and category deletes and moves queue a rebuild of
+the affected cards; the rebuild runs once per transaction, after commit, for every product
+touched in it. Facets (``apps.catalog.facets``) and the product's effective
+price range are rewritten in the same pass.
+"""
+from django.db import transaction
+from django.db.models import Prefetch
+from django.dispatch import Signal
+
+from apps.catalog.facets import replace_facets
+from apps.catalog.models import Product, ProductCard, ProductImage, ProductVariant
+
+# Sent with the ``product_ids`` passed in and the ``seller_ids`` of the cards written, after each rebuild.
+cards_refreshed = Signal()
+
+CARD_FIELDS = [
+	"seller",
+	"category",
+	"name",
+	"product_type",
+	"condition",
+	"status",
+	"is_active",
+	"currency",
+	"selling_price",
+	"original_price",
+	"rental_price_per_day",
+	"thumbnail",
+	"colors",
+	"sizes",
+	"in_stock",
+	"effective_min_price",
+	"effective_max_price",
+	"created_at",
+]
+
+
+def effective_prices(product: Product, variants) -> tuple:
+	"""Returns the (min, max) price a shopper can pay; rentals are priced per day."""
+	if product.product_type == Product.ProductType.RENTAL:
+		price = product.rental_price_per_day or product.selling_price
+		return price, price
+	prices = [variant.price_override or product.selling_price for variant in variants]
+	if not prices:
+		return product.selling_price, product.selling_price
+	return min(prices), max(prices)
+
+
+def build_card(product: Product) -> ProductCard:
+	"""Builds an unsaved card from a product with ``images`` and ``variants`` prefetched."""
+	images = list(product.images.all())
+	variants = [variant for variant in product.variants.all() if variant.is_active]
+	colors, sizes = {}, {}
+	for variant in variants:
+		if variant.color is not None:
+			colors[variant.color_id] = {
+				"id": variant.color_id,
+				"name": variant.color.name,
+				"hex_code": variant.color.hex_code,
+			}
+		if variant.size is not None:
+			sizes[variant.size_id] = {"id": variant.size_id, "size": variant.size.get_size_display()}
+	if product.product_type == Product.ProductType.RENTAL:
+		in_stock = True
+	elif product.has_variants:
+		in_stock = any(variant.quantity > 0 for variant in variants)
+	else:
+		in_stock = product.stock_quantity > 0
+	min_price, max_price = effective_prices(product, variants)
+	return ProductCard(
+		product=product,
+		seller_id=product.seller_id,
+		category_id=product.category_id,
+		name=product.name,
+		product_type=product.product_type,
+		condition=product.condition,
+		status=product.status,
+		is_active=product.is_active,
+		currency=product.currency,
+		selling_price=product.selling_price,
+		original_price=product.original_price,
+		rental_price_per_day=product.rental_price_per_day,
+		thumbnail=images[0].image.name if images else "",
+		colors=list(colors.values()),
+		sizes=list(sizes.values()),
+		in_stock=in_stock,
+		effective_min_price=min_price,
+		effective_max_price=max_price,
+		created_at=product.created_at,
+	)
+
+
+def refresh_cards(product_ids) -> int:
+	"""Rebuilds the cards and facets for ``product_ids`` with one read pass and one upsert."""
+	product_ids = list(product_ids)
+	products = list(
+		Product.objects.filter(id__in=product_ids).prefetch_related(
+			Prefetch("images", queryset=ProductImage.objects.order_by("sort_order", "id")),
+			Prefetch("variants", queryset=ProductVariant.objects.select_related("color", "size")),
+		)
+	)
+	cards = [build_card(product) for product in products]
+	repriced = []
+	for product, card in zip(products, cards):
+		if (product.effective_min_price, product.effective_max_price) != (card.effective_min_price, card.effective_max_price):
+			product.effective_min_price = card.effective_min_price
+			product.effective_max_price = card.effective_max_price
+			repriced.append(product)
+	with transaction.atomic():
+		Product.objects.bulk_update(repriced, ["effective_min_price", "effective_max_price"])
+		ProductCard.objects.bulk_create(
+			cards,
+			update_conflicts=True,
+			unique_fields=["product"],
+			update_fields=[*CARD_FIELDS, "refreshed_at"],
+		)
+		replace_facets(cards, product_ids)
+	cards_refreshed.send(
+		sender=ProductCard, product_ids=product_ids, seller_ids={card.seller_id for card in cards}
+	)
+	return len(cards)
+
+
+class _PendingRefresh:
+	"""Card rebuilds queued on one connection, shared by the callbacks of one commit."""
+
+	def __init__(self):
+		self.rebuilt = set()
+
+
+def refresh_cards_on_commit(product_ids) -> None:
+	"""
+	Queues a card rebuild for when the current transaction commits.
+
+	Every call registers its own ``on_commit`` callback, so ids queued inside
+	a savepoint that rolls back are dropped along with it. The callbacks of
+	one commit share the set of products already rebuilt, so creating a
+	product with ten images and variants rebuilds its card once. Outside a
+	transaction the rebuild runs immediately.
+	"""
+	connection = transaction.get_connection()
+	pending = getattr(connection, "pending_card_refresh", None)
+	if pending is None:
+		pending = connection.pending_card_refresh = _PendingRefresh()
+	product_ids = set(product_ids)
+
+	def rebuild():
+		# The commit is under way: later calls belong to the next transaction.
+		if getattr(connection, "pending_card_refresh", None) is pending:
+			connection.pending_card_refresh = None
+		ids = product_ids - pending.rebuilt
+		if ids:
+			pending.rebuilt.update(ids)
+			refresh_cards(ids)
+
+	transaction.on_commit(rebuild)
+
+
+def rebuild_all(batch_size: int = 500) -> int:
+	ids = list(Product.objects.order_by("id").values_list("id", flat=True))
+	for start in range(0, len(ids), batch_size):
+		refresh_cards(ids[start:start + batch_size])
+	return len(ids)
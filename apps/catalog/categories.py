@@ -0,0 +1,49 @@
+"""
+Category tree helpers.
+
+``Category.path`` is a materialized path ("3/17/42/"), so a subtree is a
+single indexed prefix lookup and the whole tree is built from one query.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+from apps.catalog.models import Category
+
+CATEGORY_TREE_CACHE_KEY = "catalog:category-tree"
+
+
+def subtree_q(category_id, field: str = "category") -> Q:
+	"""Q matching rows whose ``field`` is the category or any of its descendants."""
+	try:
+		category_id = int(category_id)
+	except (TypeError, ValueError):
+		raise ValidationError({"in_category": "Must be a category id."})
+	path = Category.objects.filter(pk=category_id).values_list("path", flat=True).first()
+	if not path:
+		return Q(pk__in=[])
+	return Q(**{f"{field}__path__startswith": path})
+
+
+def build_tree(serialize) -> list[dict]:
+	"""Nests every category under its parent; ``serialize`` turns one category into a dict."""
+	nodes, roots = {}, []
+	for category in Category.objects.order_by("depth", "name"):
+		node = {**serialize(category), "children": []}
+		nodes[category.id] = node
+		parent = nodes.get(category.parent_id)
+		(parent["children"] if parent else roots).append(node)
+	return roots
+
+
+def cached_tree(serialize) -> list[dict]:
+	tree = cache.get(CATEGORY_TREE_CACHE_KEY)
+	if tree is None:
+		tree = build_tree(serialize)
+		cache.set(CATEGORY_TREE_CACHE_KEY, tree, settings.CATEGORY_TREE_CACHE_SECONDS)
+	return tree
+
+
+def invalidate_tree() -> None:
+	cache.delete(CATEGORY_TREE_CACHE_KEY)
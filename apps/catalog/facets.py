@@ -0,0 +1,134 @@
+"""
+Catalog facets.
+
+Each product has one ``ProductFacet`` row per filterable value (category,
+color, size, condition, type and price bucket), written alongside its card.
+Filters become indexed ``(facet, value)`` lookups intersected in SQL, and the
+counts for every facet come from one ``GROUP BY`` over the matching products.
+"""
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Count
+from rest_framework.exceptions import ValidationError
+
+from apps.catalog.models import ProductCard, ProductFacet
+
+Facet = ProductFacet.Facet
+
+# Query parameter -> facet. Each parameter takes a comma-separated list; values
+# of one facet are OR-ed, different facets are AND-ed.
+FACET_PARAMS = {
+	"category": Facet.CATEGORY,
+	"color": Facet.COLOR,
+	"size": Facet.SIZE,
+	"condition": Facet.CONDITION,
+	"type": Facet.TYPE,
+	"price": Facet.PRICE,
+}
+
+# Upper bounds (exclusive) of the price buckets; the last bucket is open-ended.
+PRICE_BUCKET_BOUNDS = [Decimal(bound) for bound in ("500", "1000", "2500", "5000", "10000")]
+
+
+def price_bucket(price) -> str:
+	lower = Decimal("0")
+	for upper in PRICE_BUCKET_BOUNDS:
+		if price < upper:
+			return f"{lower:.0f}-{upper:.0f}"
+		lower = upper
+	return f"{lower:.0f}+"
+
+
+def card_facets(card: ProductCard) -> list[ProductFacet]:
+	values = [
+		(Facet.CONDITION, card.condition),
+		(Facet.TYPE, card.product_type),
+		(Facet.PRICE, price_bucket(card.effective_min_price)),
+	]
+	if card.category_id:
+		values.append((Facet.CATEGORY, str(card.category_id)))
+	values.extend((Facet.COLOR, str(color["id"])) for color in card.colors)
+	values.extend((Facet.SIZE, str(size["id"])) for size in card.sizes)
+	return [ProductFacet(product_id=card.product_id, facet=facet, value=value) for facet, value in values]
+
+
+def replace_facets(cards, product_ids) -> None:
+	"""
+	Brings the facet rows of ``product_ids`` in line with their cards.
+
+	Only the difference is written: stale rows are deleted by id and new ones
+	inserted with ``ignore_conflicts``, so two refreshes of one product running
+	at once cannot trip the unique (facet, value, product) key.
+	"""
+	wanted = {(facet.product_id, facet.facet, facet.value): facet for card in cards for facet in card_facets(card)}
+	stale = []
+	for facet_id, *key in ProductFacet.objects.filter(product_id__in=list(product_ids)).values_list(
+		"id", "product_id", "facet", "value"
+	):
+		if wanted.pop(tuple(key), None) is None:
+			stale.append(facet_id)
+	if stale:
+		ProductFacet.objects.filter(id__in=stale).delete()
+	ProductFacet.objects.bulk_create(list(wanted.values()), ignore_conflicts=True)
+
+
+def selected_facets(query_params) -> dict[str, list[str]]:
+	selected = {}
+	for param, facet in FACET_PARAMS.items():
+		values = [value.strip() for value in query_params.get(param, "").split(",") if value.strip()]
+		if values:
+			selected[facet] = values
+	return selected
+
+
+def filter_by_facets(queryset, selected: dict[str, list[str]]):
+	"""Narrows a ProductCard queryset to products matching every selected facet."""
+	for facet, values in selected.items():
+		queryset = queryset.filter(
+			product_id__in=ProductFacet.objects.filter(facet=facet, value__in=values).values("product_id")
+		)
+	return queryset
+
+
+def facet_counts(cards) -> dict[str, list[dict]]:
+	"""Counts matching products per facet value with a single grouped query."""
+	counts = defaultdict(list)
+	rows = (
+		ProductFacet.objects.filter(product_id__in=cards.values("product_id"))
+		.values("facet", "value")
+		.annotate(count=Count("product_id"))
+		.order_by("facet", "-count", "value")
+	)
+	for row in rows:
+		counts[row["facet"]].append({"value": row["value"], "count": row["count"]})
+	return {facet: counts.get(facet, []) for facet in Facet.values}
+
+
+def _price_param(query_params, param: str) -> Decimal | None:
+	value = query_params.get(param)
+	if not value:
+		return None
+	try:
+		price = Decimal(value)
+	except InvalidOperation:
+		raise ValidationError({param: "Must be a number."})
+	if not price.is_finite() or price < 0:
+		raise ValidationError({param: "Must be a non-negative number."})
+	return price
+
+
+def filter_by_price(queryset, query_params):
+	"""
+	Applies ``min_price``/``max_price`` to a Product or ProductCard queryset.
+
+	A product matches when any price it can be bought at falls in the range,
+	i.e. its effective price range overlaps the requested one.
+	"""
+	min_price = _price_param(query_params, "min_price")
+	max_price = _price_param(query_params, "max_price")
+	if min_price is not None:
+		queryset = queryset.filter(effective_max_price__gte=min_price)
+	if max_price is not None:
+		queryset = queryset.filter(effective_min_price__lte=max_price)
+	return queryset
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.catalog.cards import rebuild_all
+
+
+class Command(BaseCommand):
+	help = "Rebuilds the ProductCard listing rows for every product."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--batch-size", type=int, default=500)
+
+	def handle(self, *args, **options):
+		count = rebuild_all(batch_size=options["batch_size"])
+		self.stdout.write(f"Rebuilt {count} product cards.")
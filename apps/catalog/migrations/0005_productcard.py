@@ -0,0 +1,90 @@
+# Generated by Django 5.2.11 on 2026-10-19 17:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+SIZE_LABELS = {"xs": "XS", "s": "S", "m": "M", "l": "L", "xl": "XL", "xxl": "XXL", "onesize": "One Size"}
+
+
+def build_cards(apps, schema_editor):
+    Product = apps.get_model("catalog", "Product")
+    ProductCard = apps.get_model("catalog", "ProductCard")
+    cards = []
+    for product in Product.objects.prefetch_related("images", "variants__color", "variants__size").iterator(chunk_size=500):
+        images = sorted(product.images.all(), key=lambda image: (image.sort_order, image.id))
+        variants = [variant for variant in product.variants.all() if variant.is_active]
+        colors, sizes = {}, {}
+        for variant in variants:
+            if variant.color is not None:
+                colors[variant.color_id] = {"id": variant.color_id, "name": variant.color.name, "hex_code": variant.color.hex_code}
+            if variant.size is not None:
+                sizes[variant.size_id] = {"id": variant.size_id, "size": SIZE_LABELS.get(variant.size.size, variant.size.size)}
+        if product.product_type == "rental":
+            in_stock = True
+        elif product.has_variants:
+            in_stock = any(variant.quantity > 0 for variant in variants)
+        else:
+            in_stock = product.stock_quantity > 0
+        cards.append(
+            ProductCard(
+                product_id=product.id,
+                seller_id=product.seller_id,
+                category_id=product.category_id,
+                name=product.name,
+                product_type=product.product_type,
+                condition=product.condition,
+                status=product.status,
+                is_active=product.is_active,
+                currency=product.currency,
+                selling_price=product.selling_price,
+                original_price=product.original_price,
+                rental_price_per_day=product.rental_price_per_day,
+                thumbnail=images[0].image.name if images else "",
+                colors=list(colors.values()),
+                sizes=list(sizes.values()),
+                in_stock=in_stock,
+                created_at=product.created_at,
+            )
+        )
+    ProductCard.objects.bulk_create(cards, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0004_remove_productimage_image_url_category_image_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductCard',
+            fields=[
+                ('product', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='card', serialize=False, to='catalog.product')),
+                ('name', models.CharField(max_length=200)),
+                ('product_type', models.CharField(choices=[('new', 'New'), ('used', 'Used'), ('rental', 'Rental')], max_length=20)),
+                ('condition', models.CharField(choices=[('new', 'New'), ('gently_used', 'Gently Used'), ('worn_3_4', '3-4 Times Worn'), ('fair', 'Fair')], max_length=20)),
+                ('status', models.CharField(choices=[('draft', 'Draft'), ('published', 'Published'), ('archived', 'Archived')], max_length=20)),
+                ('is_active', models.BooleanField(default=True)),
+                ('currency', models.CharField(default='INR', max_length=3)),
+                ('selling_price', models.DecimalField(decimal_places=2, max_digits=10)),
+                ('original_price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('rental_price_per_day', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('thumbnail', models.CharField(blank=True, max_length=255)),
+                ('colors', models.JSONField(blank=True, default=list)),
+                ('sizes', models.JSONField(blank=True, default=list)),
+                ('in_stock', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField()),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='catalog.category')),
+                ('seller', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_cards', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'is_active', '-created_at'], name='catalog_pro_status_d81510_idx'), models.Index(fields=['seller', 'status', 'is_active'], name='catalog_pro_seller__ba38d2_idx')],
+            },
+        ),
+        migrations.RunPython(build_cards, migrations.RunPython.noop),
+    ]
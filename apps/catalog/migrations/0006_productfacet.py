@@ -0,0 +1,55 @@
+# Generated by Django 5.2.11 on 2026-10-19 17:42
+
+from decimal import Decimal
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+PRICE_BUCKET_BOUNDS = [Decimal(bound) for bound in ("500", "1000", "2500", "5000", "10000")]
+
+
+def price_bucket(price):
+    lower = Decimal("0")
+    for upper in PRICE_BUCKET_BOUNDS:
+        if price < upper:
+            return f"{lower:.0f}-{upper:.0f}"
+        lower = upper
+    return f"{lower:.0f}+"
+
+
+def build_facets(apps, schema_editor):
+    ProductCard = apps.get_model("catalog", "ProductCard")
+    ProductFacet = apps.get_model("catalog", "ProductFacet")
+    facets = []
+    for card in ProductCard.objects.iterator(chunk_size=500):
+        values = [("condition", card.condition), ("type", card.product_type), ("price", price_bucket(card.selling_price))]
+        if card.category_id:
+            values.append(("category", str(card.category_id)))
+        values.extend(("color", str(color["id"])) for color in card.colors)
+        values.extend(("size", str(size["id"])) for size in card.sizes)
+        facets.extend(ProductFacet(product_id=card.product_id, facet=facet, value=value) for facet, value in values)
+    ProductFacet.objects.bulk_create(facets, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0005_productcard'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('facet', models.CharField(choices=[('category', 'Category'), ('color', 'Color'), ('size', 'Size'), ('condition', 'Condition'), ('type', 'Type'), ('price', 'Price')], max_length=20)),
+                ('value', models.CharField(max_length=64)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='facets', to='catalog.product')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('facet', 'value', 'product'), name='unique_product_facet_value')],
+            },
+        ),
+        migrations.RunPython(build_facets, migrations.RunPython.noop),
+    ]
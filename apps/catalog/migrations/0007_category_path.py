@@ -0,0 +1,49 @@
+# Generated by Django 5.2.11 on 2026-10-19 17:44
+
+from django.db import migrations, models
+
+
+def build_paths(apps, schema_editor):
+    Category = apps.get_model("catalog", "Category")
+    parents = dict(Category.objects.values_list("id", "parent_id"))
+    paths = {}
+
+    def path_for(category_id, seen=()):
+        if category_id in paths:
+            return paths[category_id]
+        parent_id = parents.get(category_id)
+        if parent_id is None or parent_id in seen or parent_id not in parents:
+            # Roots, dangling parents and existing cycles all become roots.
+            paths[category_id] = f"{category_id}/"
+        else:
+            paths[category_id] = f"{path_for(parent_id, (*seen, category_id))}{category_id}/"
+        return paths[category_id]
+
+    categories = list(Category.objects.all())
+    for category in categories:
+        category.path = path_for(category.id)
+        category.depth = category.path.count("/") - 1
+        if category.path == f"{category.id}/":
+            category.parent_id = None
+    Category.objects.bulk_update(categories, ["path", "depth", "parent"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0006_productfacet'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='path',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(build_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 5.2.11 on 2026-10-19 17:45
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+PRICE_BUCKET_BOUNDS = [Decimal(bound) for bound in ("500", "1000", "2500", "5000", "10000")]
+
+
+def price_bucket(price):
+    lower = Decimal("0")
+    for upper in PRICE_BUCKET_BOUNDS:
+        if price < upper:
+            return f"{lower:.0f}-{upper:.0f}"
+        lower = upper
+    return f"{lower:.0f}+"
+
+
+def fill_effective_prices(apps, schema_editor):
+    Product = apps.get_model("catalog", "Product")
+    ProductCard = apps.get_model("catalog", "ProductCard")
+    ProductFacet = apps.get_model("catalog", "ProductFacet")
+    products, facets = [], []
+    for product in Product.objects.prefetch_related("variants").iterator(chunk_size=500):
+        if product.product_type == "rental":
+            prices = [product.rental_price_per_day or product.selling_price]
+        else:
+            prices = [
+                variant.price_override or product.selling_price
+                for variant in product.variants.all()
+                if variant.is_active
+            ] or [product.selling_price]
+        product.effective_min_price, product.effective_max_price = min(prices), max(prices)
+        products.append(product)
+        facets.append(ProductFacet(product_id=product.id, facet="price", value=price_bucket(min(prices))))
+    Product.objects.bulk_update(products, ["effective_min_price", "effective_max_price"], batch_size=500)
+    for product in products:
+        ProductCard.objects.filter(product_id=product.id).update(
+            effective_min_price=product.effective_min_price,
+            effective_max_price=product.effective_max_price,
+        )
+    carded = set(ProductCard.objects.values_list("product_id", flat=True))
+    ProductFacet.objects.filter(facet="price").delete()
+    ProductFacet.objects.bulk_create([facet for facet in facets if facet.product_id in carded], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_bankdetails'),
+        ('catalog', '0007_category_path'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='effective_max_price',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='product',
+            name='effective_min_price',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='productcard',
+            name='effective_max_price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='productcard',
+            name='effective_min_price',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['effective_min_price', 'id'], name='catalog_pro_effecti_8d3902_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['effective_max_price', 'id'], name='catalog_pro_effecti_c4c03f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productcard',
+            index=models.Index(fields=['status', 'is_active', 'effective_min_price', 'product'], name='catalog_pro_status_0adf2e_idx'),
+        ),
+        migrations.RunPython(fill_effective_prices, migrations.RunPython.noop),
+    ]
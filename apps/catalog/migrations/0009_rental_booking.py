@@ -0,0 +1,65 @@
+# Generated by Django 5.2.11 on 2026-10-19 17:49
+
+from datetime import date, timedelta
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def blocked_runs(values):
+    days = set()
+    for value in values or []:
+        try:
+            days.add(date.fromisoformat(str(value)[:10]))
+        except ValueError:
+            continue
+    runs = []
+    for day in sorted(days):
+        if runs and day == runs[-1][1] + timedelta(days=1):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
+def copy_blocked_dates(apps, schema_editor):
+    RentalAvailability = apps.get_model("catalog", "RentalAvailability")
+    RentalBooking = apps.get_model("catalog", "RentalBooking")
+    blocks = [
+        RentalBooking(product_id=product_id, kind="block", start_date=start, end_date=end)
+        for product_id, blocked_dates in RentalAvailability.objects.values_list("product_id", "blocked_dates").iterator()
+        for start, end in blocked_runs(blocked_dates)
+    ]
+    RentalBooking.objects.bulk_create(blocks, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0008_effective_price'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RentalBooking',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('booking', 'Booking'), ('block', 'Block')], default='booking', max_length=10)),
+                ('status', models.CharField(choices=[('active', 'Active'), ('cancelled', 'Cancelled')], default='active', max_length=10)),
+                ('start_date', models.DateField()),
+                ('end_date', models.DateField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='rental_bookings', to=settings.AUTH_USER_MODEL)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rental_bookings', to='catalog.product')),
+            ],
+            options={
+                'ordering': ['start_date', 'id'],
+                'indexes': [models.Index(fields=['product', 'status', 'start_date', 'end_date'], name='catalog_ren_product_66a801_idx'), models.Index(fields=['status', 'start_date', 'end_date'], name='catalog_ren_status_0aded0_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('end_date__gte', models.F('start_date'))), name='rental_booking_end_after_start')],
+            },
+        ),
+        migrations.RunPython(copy_blocked_dates, migrations.RunPython.noop),
+    ]
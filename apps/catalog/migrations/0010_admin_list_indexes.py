@@ -0,0 +1,20 @@
+# Generated by Django 5.2.11 on 2026-10-19 18:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_admin_list_indexes'),
+        ('catalog', '0009_rental_booking'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='catalog_pro_status_4f1060_idx'),
+        ),
+    ]
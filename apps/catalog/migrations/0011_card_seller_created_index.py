@@ -0,0 +1,23 @@
+# Generated by Django 5.2.11 on 2026-10-19 18:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0010_admin_list_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='productcard',
+            name='catalog_pro_seller__ba38d2_idx',
+        ),
+        migrations.AddIndex(
+            model_name='productcard',
+            index=models.Index(fields=['seller', 'status', 'is_active', '-created_at'], name='catalog_pro_seller__6af964_idx'),
+        ),
+    ]
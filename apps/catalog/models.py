@@ -1,8 +1,13 @@
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.validators import MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Concat, Substr
 
 from apps.accounts.models import Address, User
 
+CATEGORY_CYCLE_MESSAGE = "A category cannot be moved under itself or its subcategories."
+
 
 class Category(models.Model):
 	name = models.CharField(max_length=150)
@@ -11,6 +16,10 @@ class Category(models.Model):
 	parent = models.ForeignKey(
 		"self", on_delete=models.SET_NULL, related_name="children", null=True, blank=True
 	)
+	# Materialized path of ids from the root, e.g. "3/17/42/"; a subtree is every
+	# category whose path starts with its root's path.
+	path = models.CharField(max_length=255, db_index=True, editable=False, default="")
+	depth = models.PositiveSmallIntegerField(default=0, editable=False)
 
 	class Meta:
 		verbose_name_plural = "categories"
@@ -18,6 +27,45 @@ class Category(models.Model):
 	def __str__(self) -> str:
 		return self.name
 
+	def clean(self):
+		super().clean()
+		if self.creates_cycle():
+			raise DjangoValidationError({"parent": CATEGORY_CYCLE_MESSAGE})
+
+	def creates_cycle(self) -> bool:
+		"""True when ``parent`` is this category or one of its descendants."""
+		if not (self.pk and self.parent_id):
+			return False
+		own_path = Category.objects.filter(pk=self.pk).values_list("path", flat=True).first()
+		return bool(own_path) and Category.objects.filter(pk=self.parent_id, path__startswith=own_path).exists()
+
+	def save(self, *args, **kwargs):
+		"""Keeps ``path``/``depth`` in sync and moves the whole subtree when the parent changes."""
+		with transaction.atomic():
+			current = Category.objects.filter(pk=self.pk).values_list("path", "depth").first() if self.pk else None
+			old_path, old_depth = current or ("", 0)
+			parent_path = ""
+			if self.parent_id:
+				parent_path = Category.objects.filter(pk=self.parent_id).values_list("path", flat=True).get()
+				if old_path and parent_path.startswith(old_path):
+					raise DjangoValidationError(CATEGORY_CYCLE_MESSAGE)
+			if self.pk:
+				self.path = f"{parent_path}{self.pk}/"
+				self.depth = self.path.count("/") - 1
+			update_fields = kwargs.get("update_fields")
+			if update_fields is not None and "parent" in update_fields:
+				kwargs["update_fields"] = {*update_fields, "path", "depth"}
+			super().save(*args, **kwargs)
+			if not current:
+				self.path = f"{parent_path}{self.pk}/"
+				self.depth = self.path.count("/") - 1
+				Category.objects.filter(pk=self.pk).update(path=self.path, depth=self.depth)
+			elif old_path and self.path != old_path:
+				Category.objects.filter(path__startswith=old_path).exclude(pk=self.pk).update(
+					path=Concat(Value(self.path), Substr("path", len(old_path) + 1)),
+					depth=F("depth") + (self.depth - old_depth),
+				)
+
 
 class ProductColor(models.Model):
 	"""Color model with hex code representation"""
@@ -116,11 +164,21 @@ class Product(models.Model):
 	base_sku = models.CharField(max_length=64, blank=True)
 	stock_quantity = models.PositiveIntegerField(default=0)
 	is_active = models.BooleanField(default=True)
+	# Lowest and highest price a shopper can pay (per day for rentals), across
+	# active variant overrides. Maintained by ``apps.catalog.cards``.
+	effective_min_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, editable=False)
+	effective_max_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, editable=False)
 	created_at = models.DateTimeField(auto_now_add=True)
 	updated_at = models.DateTimeField(auto_now=True)
 
 	class Meta:
 		ordering = ["-created_at"]
+		indexes = [
+			models.Index(fields=["effective_min_price", "id"]),
+			models.Index(fields=["effective_max_price", "id"]),
+			# Admin moderation queue: status filter, newest first.
+			models.Index(fields=["status", "-created_at", "-id"]),
+		]
 
 	def __str__(self) -> str:
 		return self.name
@@ -147,6 +205,12 @@ class ProductVariant(models.Model):
 		size_str = self.size.get_size_display() if self.size else "No Size"
 		return f"{self.product.name} - {color_str}/{size_str}"
 
+	@property
+	def name(self) -> str:
+		"""Shopper-facing label such as "Red / M"; select ``color`` and ``size`` with the variant."""
+		parts = [self.color.name if self.color else "", self.size.get_size_display() if self.size else ""]
+		return " / ".join(part for part in parts if part) or self.sku
+
 	def save(self, *args, **kwargs):
 		if not self.sku:
 			color_code = self.color.hex_code[1:] if self.color else "NC"
@@ -187,3 +251,112 @@ class RentalAvailability(models.Model):
 
 	def __str__(self) -> str:
 		return f"Rental Availability for {self.product.name}"
+
+
+class RentalBooking(models.Model):
+	"""
+	An inclusive date interval during which a rental product is taken.
+
+	Bookings are made through ``apps.catalog.rentals.book_rental``; blocks
+	mirror ``RentalAvailability.blocked_dates`` as runs of consecutive days.
+	Two active intervals of one product never overlap.
+	"""
+
+	class Kind(models.TextChoices):
+		BOOKING = "booking", "Booking"
+		BLOCK = "block", "Block"
+
+	class Status(models.TextChoices):
+		ACTIVE = "active", "Active"
+		CANCELLED = "cancelled", "Cancelled"
+
+	product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="rental_bookings")
+	kind = models.CharField(max_length=10, choices=Kind.choices, default=Kind.BOOKING)
+	status = models.CharField(max_length=10, choices=Status.choices, default=Status.ACTIVE)
+	start_date = models.DateField()
+	end_date = models.DateField()
+	created_by = models.ForeignKey(
+		User, on_delete=models.SET_NULL, null=True, blank=True, related_name="rental_bookings"
+	)
+	created_at = models.DateTimeField(auto_now_add=True)
+	updated_at = models.DateTimeField(auto_now=True)
+
+	class Meta:
+		ordering = ["start_date", "id"]
+		indexes = [
+			# Overlap checks for one product: product = ? AND start_date <= ? AND end_date >= ?
+			models.Index(fields=["product", "status", "start_date", "end_date"]),
+			# Availability search across products for a window.
+			models.Index(fields=["status", "start_date", "end_date"]),
+		]
+		constraints = [
+			models.CheckConstraint(
+				condition=models.Q(end_date__gte=F("start_date")), name="rental_booking_end_after_start"
+			)
+		]
+
+	def __str__(self) -> str:
+		return f"{self.get_kind_display()} {self.start_date}..{self.end_date} for {self.product_id}"
+
+
+class ProductCard(models.Model):
+	"""
+	Denormalized listing row for a product, maintained by ``apps.catalog.cards``.
+
+	Listings read this single table instead of joining images, variants,
+	colors and sizes for every product on the page.
+	"""
+	product = models.OneToOneField(Product, on_delete=models.CASCADE, primary_key=True, related_name="card")
+	seller = models.ForeignKey(User, on_delete=models.CASCADE, related_name="product_cards")
+	category = models.ForeignKey(Category, on_delete=models.SET_NULL, null=True, blank=True)
+	name = models.CharField(max_length=200)
+	product_type = models.CharField(max_length=20, choices=Product.ProductType.choices)
+	condition = models.CharField(max_length=20, choices=Product.Condition.choices)
+	status = models.CharField(max_length=20, choices=Product.Status.choices)
+	is_active = models.BooleanField(default=True)
+	currency = models.CharField(max_length=3, default="INR")
+	selling_price = models.DecimalField(max_digits=10, decimal_places=2)
+	original_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+	rental_price_per_day = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+	thumbnail = models.CharField(max_length=255, blank=True)
+	colors = models.JSONField(default=list, blank=True)
+	sizes = models.JSONField(default=list, blank=True)
+	in_stock = models.BooleanField(default=False)
+	effective_min_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+	effective_max_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+	created_at = models.DateTimeField()
+	refreshed_at = models.DateTimeField(auto_now=True)
+
+	class Meta:
+		ordering = ["-created_at"]
+		indexes = [
+			models.Index(fields=["status", "is_active", "-created_at"]),
+			models.Index(fields=["seller", "status", "is_active", "-created_at"]),
+			models.Index(fields=["status", "is_active", "effective_min_price", "product"]),
+		]
+
+	def __str__(self) -> str:
+		return f"Card for {self.product_id}"
+
+
+class ProductFacet(models.Model):
+	"""One (facet, value) pair a product can be filtered by, maintained with its ProductCard."""
+	class Facet(models.TextChoices):
+		CATEGORY = "category", "Category"
+		COLOR = "color", "Color"
+		SIZE = "size", "Size"
+		CONDITION = "condition", "Condition"
+		TYPE = "type", "Type"
+		PRICE = "price", "Price"
+
+	product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="facets")
+	facet = models.CharField(max_length=20, choices=Facet.choices)
+	value = models.CharField(max_length=64)
+
+	class Meta:
+		constraints = [
+			models.UniqueConstraint(fields=["facet", "value", "product"], name="unique_product_facet_value")
+		]
+
+	def __str__(self) -> str:
+		return f"{self.product_id} {self.facet}={self.value}"
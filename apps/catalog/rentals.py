@@ -0,0 +1,200 @@
+"""
+Rental calendar.
+
+Every period a rental product is taken is a ``RentalBooking`` row: bookings
+made through ``book_rental`` and blocks copied from
+``RentalAvailability.blocked_dates``. Two inclusive intervals overlap when
+``start <= other_end and end >= other_start``, which the
+(product, status, start_date, end_date) index answers without reading the
+product's whole calendar. Availability search is a NOT EXISTS over the same
+table, so it never loads per-product JSON into Python.
+"""
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import ValidationError
+
+from apps.catalog.models import Product, RentalAvailability, RentalBooking
+
+DEFAULT_CALENDAR_DAYS = 90
+MAX_CALENDAR_DAYS = 366
+
+
+def _as_date(value) -> date | None:
+	if isinstance(value, date):
+		return value
+	try:
+		return parse_date(str(value))
+	except ValueError:
+		return None
+
+
+def intervals_from_dates(values) -> list[tuple[date, date]]:
+	"""Collapses a list of days into sorted (start, end) runs of consecutive days."""
+	days = sorted({day for day in map(_as_date, values or []) if day})
+	runs = []
+	for day in days:
+		if runs and day == runs[-1][1] + timedelta(days=1):
+			runs[-1] = (runs[-1][0], day)
+		else:
+			runs.append((day, day))
+	return runs
+
+
+def overlapping(product_id, start: date, end: date):
+	"""Active bookings and blocks of one product that share at least one day with start..end."""
+	return RentalBooking.objects.filter(
+		product_id=product_id,
+		status=RentalBooking.Status.ACTIVE,
+		start_date__lte=end,
+		end_date__gte=start,
+	)
+
+
+def rental_days(start: date, end: date) -> int:
+	return (end - start).days + 1
+
+
+def _outside_rules(start: date, end: date) -> Q:
+	"""Q matching availability settings that rule the start..end window out."""
+	days = rental_days(start, end)
+	return (
+		Q(is_available_from__gt=start)
+		| Q(is_available_to__lt=end)
+		| Q(min_rental_days__gt=days)
+		| Q(max_rental_days__lt=days)
+	)
+
+
+def filter_available(queryset, start: date, end: date):
+	"""
+	Narrows a Product or ProductCard queryset to rentals free for start..end.
+
+	Both models use the product id as ``pk``, so the same correlated
+	subqueries apply to either.
+	"""
+	busy = overlapping(OuterRef("pk"), start, end)
+	ruled_out = RentalAvailability.objects.filter(_outside_rules(start, end), product_id=OuterRef("pk"))
+	return queryset.filter(product_type=Product.ProductType.RENTAL).exclude(Exists(busy)).exclude(Exists(ruled_out))
+
+
+def parse_window(query_params, start_param: str = "available_from", end_param: str = "available_to"):
+	"""Returns the (start, end) window from the query string, or None when neither is given."""
+	raw_start, raw_end = query_params.get(start_param), query_params.get(end_param)
+	if not raw_start and not raw_end:
+		return None
+	if not (raw_start and raw_end):
+		raise ValidationError({end_param if raw_start else start_param: "Pass both ends of the rental window."})
+	start, end = _as_date(raw_start), _as_date(raw_end)
+	if start is None:
+		raise ValidationError({start_param: "Use YYYY-MM-DD."})
+	if end is None:
+		raise ValidationError({end_param: "Use YYYY-MM-DD."})
+	if end < start:
+		raise ValidationError({end_param: "Must be on or after the start date."})
+	return start, end
+
+
+def calendar_window(query_params) -> tuple[date, date]:
+	"""The ``from``/``to`` window of a calendar request, defaulting to the next DEFAULT_CALENDAR_DAYS."""
+	window = parse_window(query_params, "from", "to")
+	if window is None:
+		today = timezone.localdate()
+		return today, today + timedelta(days=DEFAULT_CALENDAR_DAYS - 1)
+	if rental_days(*window) > MAX_CALENDAR_DAYS:
+		raise ValidationError({"to": f"The calendar covers at most {MAX_CALENDAR_DAYS} days."})
+	return window
+
+
+def validate_window(product: Product, start: date, end: date) -> None:
+	if end < start:
+		raise ValidationError({"end_date": "Must be on or after the start date."})
+	availability = RentalAvailability.objects.filter(product=product).first()
+	if availability is None:
+		return
+	if availability.is_available_from and start < availability.is_available_from:
+		raise ValidationError({"start_date": f"This product can be rented from {availability.is_available_from}."})
+	if availability.is_available_to and end > availability.is_available_to:
+		raise ValidationError({"end_date": f"This product can be rented until {availability.is_available_to}."})
+	days = rental_days(start, end)
+	if not availability.min_rental_days <= days <= availability.max_rental_days:
+		raise ValidationError(
+			f"Rentals of this product last {availability.min_rental_days} to {availability.max_rental_days} days."
+		)
+
+
+@transaction.atomic
+def book_rental(product: Product, start: date, end: date, user=None) -> RentalBooking:
+	"""
+	Books start..end for ``product``.
+
+	The product row is locked first, so two bookings of one product are
+	checked and inserted one after the other and cannot both pass the overlap
+	check. Bookings of different products do not wait on each other.
+	"""
+	product = Product.objects.select_for_update().get(pk=product.pk)
+	if product.product_type != Product.ProductType.RENTAL:
+		raise ValidationError("This product is not a rental product.")
+	validate_window(product, start, end)
+	if overlapping(product.pk, start, end).exists():
+		raise ValidationError("This product is already booked for some of these dates.")
+	return RentalBooking.objects.create(
+		product=product,
+		kind=RentalBooking.Kind.BOOKING,
+		start_date=start,
+		end_date=end,
+		created_by=user,
+	)
+
+
+def cancel_bookings(bookings) -> int:
+	return bookings.filter(status=RentalBooking.Status.ACTIVE).update(
+		status=RentalBooking.Status.CANCELLED, updated_at=timezone.now()
+	)
+
+
+def clear_blocks(product_id) -> None:
+	RentalBooking.objects.filter(product_id=product_id, kind=RentalBooking.Kind.BLOCK).delete()
+
+
+@transaction.atomic
+def sync_blocks(availability: RentalAvailability) -> None:
+	"""
+	Replaces the product's block rows with the runs in ``blocked_dates``.
+
+	Runs under the same product lock as ``book_rental`` and refuses to block
+	a day that an active booking already holds, so active intervals of one
+	product never overlap. Raises ``ValidationError`` naming the booked runs.
+	"""
+	Product.objects.select_for_update().filter(pk=availability.product_id).first()
+	runs = intervals_from_dates(availability.blocked_dates)
+	if runs:
+		overlap = Q()
+		for start, end in runs:
+			overlap |= Q(start_date__lte=end, end_date__gte=start)
+		booked = (
+			RentalBooking.objects.filter(
+				product_id=availability.product_id,
+				kind=RentalBooking.Kind.BOOKING,
+				status=RentalBooking.Status.ACTIVE,
+			)
+			.filter(overlap)
+			.order_by("start_date")
+			.values_list("start_date", "end_date")
+		)
+		if booked:
+			taken = ", ".join(f"{start}..{end}" for start, end in booked)
+			raise ValidationError({"blocked_dates": f"These dates are already booked: {taken}."})
+	clear_blocks(availability.product_id)
+	RentalBooking.objects.bulk_create(
+		RentalBooking(
+			product_id=availability.product_id,
+			kind=RentalBooking.Kind.BLOCK,
+			start_date=start,
+			end_date=end,
+		)
+		for start, end in runs
+	)
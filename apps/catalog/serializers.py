@@ -1,27 +1,36 @@
+from django.core.files.storage import default_storage
 from django.db import transaction
 from rest_framework import serializers
 
 from apps.accounts.models import Address, User
 from apps.accounts.serializers import AddressSerializer
 from apps.catalog.models import (
+	CATEGORY_CYCLE_MESSAGE,
 	Category,
 	Product,
+	ProductCard,
 	ProductColor,
 	ProductImage,
 	ProductSize,
 	ProductVariant,
 	RentalAvailability,
+	RentalBooking,
 )
 
 
 class CategorySerializer(serializers.ModelSerializer):
 	class Meta:
 		model = Category
-		fields = ["id", "name", "slug", "image", "parent"]
+		fields = ["id", "name", "slug", "image", "parent", "path", "depth"]
+		read_only_fields = ["path", "depth"]
 
 	def validate(self, attrs):
 		if self.instance is None and not attrs.get("image"):
 			raise serializers.ValidationError({"image": "Category image is required."})
+		parent = attrs.get("parent")
+		if self.instance is not None and parent is not None:
+			if parent.pk == self.instance.pk or (self.instance.path and parent.path.startswith(self.instance.path)):
+				raise serializers.ValidationError({"parent": CATEGORY_CYCLE_MESSAGE})
 		return super().validate(attrs)
 
 
@@ -98,6 +107,24 @@ class RentalAvailabilitySerializer(serializers.ModelSerializer):
 			"max_rental_days",
 		]
 
+	def validate_blocked_dates(self, value):
+		if not isinstance(value, list):
+			raise serializers.ValidationError("Pass a list of dates.")
+		days = set()
+		for item in value:
+			try:
+				day = serializers.DateField().to_internal_value(item)
+			except serializers.ValidationError:
+				raise serializers.ValidationError(f"{item!r} is not a YYYY-MM-DD date.")
+			days.add(day.isoformat())
+		return sorted(days)
+
+
+class RentalBookingSerializer(serializers.ModelSerializer):
+	class Meta:
+		model = RentalBooking
+		fields = ["kind", "start_date", "end_date"]
+
 
 class ProductSerializer(serializers.ModelSerializer):
 	images = ProductImageSerializer(many=True, required=False)
@@ -141,13 +168,25 @@ class ProductSerializer(serializers.ModelSerializer):
 			"base_sku",
 			"stock_quantity",
 			"is_active",
+			"effective_min_price",
+			"effective_max_price",
 			"created_at",
 			"updated_at",
 			"images",
 			"variants",
 			"rental_availability",
 		]
-		read_only_fields = ["id", "seller", "seller_id", "seller_email", "created_at", "updated_at", "has_variants"]
+		read_only_fields = [
+			"id",
+			"seller",
+			"seller_id",
+			"seller_email",
+			"effective_min_price",
+			"effective_max_price",
+			"created_at",
+			"updated_at",
+			"has_variants",
+		]
 
 	@transaction.atomic
 	def create(self, validated_data):
@@ -214,3 +253,41 @@ class ProductSerializer(serializers.ModelSerializer):
 		
 		return instance
 
+
+class ProductCardSerializer(serializers.ModelSerializer):
+	id = serializers.IntegerField(source="product_id", read_only=True)
+	seller_id = serializers.IntegerField(read_only=True)
+	category_id = serializers.IntegerField(read_only=True, allow_null=True)
+	thumbnail_url = serializers.SerializerMethodField()
+
+	class Meta:
+		model = ProductCard
+		fields = [
+			"id",
+			"seller_id",
+			"category_id",
+			"name",
+			"product_type",
+			"condition",
+			"status",
+			"is_active",
+			"currency",
+			"selling_price",
+			"original_price",
+			"rental_price_per_day",
+			"thumbnail_url",
+			"colors",
+			"sizes",
+			"in_stock",
+			"effective_min_price",
+			"effective_max_price",
+			"created_at",
+		]
+		read_only_fields = fields
+
+	def get_thumbnail_url(self, obj) -> str:
+		if not obj.thumbnail:
+			return ""
+		url = default_storage.url(obj.thumbnail)
+		request = self.context.get("request")
+		return request.build_absolute_uri(url) if request else url
@@ -0,0 +1,98 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.catalog.cards import refresh_cards_on_commit
+from apps.catalog.categories import invalidate_tree
+from apps.catalog.models import (
+	Category,
+	Product,
+	ProductColor,
+	ProductImage,
+	ProductSize,
+	ProductVariant,
+	RentalAvailability,
+)
+from apps.catalog.rentals import clear_blocks, sync_blocks
+
+
+@receiver(post_save, sender=Product)
+def refresh_product_card(sender, instance, **kwargs):
+	refresh_cards_on_commit([instance.pk])
+
+
+@receiver(post_save, sender=ProductVariant)
+@receiver(post_delete, sender=ProductVariant)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def refresh_parent_card(sender, instance, **kwargs):
+	refresh_cards_on_commit([instance.product_id])
+
+
+# Variant field that points at each shared option model.
+VARIANT_OPTION_FIELDS = {ProductColor: "color", ProductSize: "size"}
+
+
+def _option_products(option):
+	return ProductVariant.objects.filter(**{VARIANT_OPTION_FIELDS[type(option)]: option}).values_list(
+		"product_id", flat=True
+	)
+
+
+def _subtree_products(category):
+	if not category.path:
+		return []
+	return Product.objects.filter(category__path__startswith=category.path).values_list("pk", flat=True)
+
+
+@receiver(post_save, sender=ProductColor)
+@receiver(post_save, sender=ProductSize)
+def refresh_option_cards(sender, instance, created, **kwargs):
+	if not created:
+		refresh_cards_on_commit(_option_products(instance))
+
+
+@receiver(pre_delete, sender=ProductColor)
+@receiver(pre_delete, sender=ProductSize)
+def refresh_deleted_option_cards(sender, instance, **kwargs):
+	# SET_NULL on the variants is a bare UPDATE, so their products are collected before it runs.
+	refresh_cards_on_commit(_option_products(instance))
+
+
+@receiver(pre_save, sender=Category)
+def note_category_move(sender, instance, **kwargs):
+	instance.moved = bool(instance.pk) and (
+		Category.objects.filter(pk=instance.pk).exclude(parent_id=instance.parent_id).exists()
+	)
+
+
+@receiver(post_save, sender=Category)
+def refresh_moved_category_cards(sender, instance, created, **kwargs):
+	if getattr(instance, "moved", False):
+		refresh_cards_on_commit(_subtree_products(instance))
+
+
+@receiver(pre_delete, sender=Category)
+def reroot_children(sender, instance, **kwargs):
+	# Products of the whole subtree are collected while its paths still lead here.
+	refresh_cards_on_commit(_subtree_products(instance))
+	# SET_NULL on parent is a bare UPDATE; saving each child moves its subtree paths too.
+	for child in instance.children.all():
+		child.parent = None
+		child.save(update_fields=["parent"])
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_tree(sender, **kwargs):
+	transaction.on_commit(invalidate_tree)
+
+
+@receiver(post_save, sender=RentalAvailability)
+def sync_rental_blocks(sender, instance, **kwargs):
+	sync_blocks(instance)
+
+
+@receiver(post_delete, sender=RentalAvailability)
+def clear_rental_blocks(sender, instance, **kwargs):
+	clear_blocks(instance.product_id)
@@ -0,0 +1,151 @@
+from decimal import Decimal
+from unittest import mock
+
+from django.db import transaction
+from django.test import TestCase
+
+from apps.catalog import cards
+from apps.catalog.models import (
+	Category,
+	Product,
+	ProductCard,
+	ProductColor,
+	ProductFacet,
+	ProductImage,
+	ProductSize,
+	ProductVariant,
+)
+from apps.common.testing import api_client, make_product, make_seller
+
+Facet = ProductFacet.Facet
+
+
+class CardBuildTests(TestCase):
+	def setUp(self):
+		self.seller = make_seller()
+		self.red = ProductColor.objects.create(name="Red", hex_code="#FF0000")
+		self.medium = ProductSize.objects.create(size=ProductSize.SizeChoice.M)
+		self.large = ProductSize.objects.create(size=ProductSize.SizeChoice.L)
+
+	def test_product_with_images_and_variants_is_built_once(self):
+		with mock.patch("apps.catalog.cards.refresh_cards", wraps=cards.refresh_cards) as refresh:
+			with self.captureOnCommitCallbacks(execute=True):
+				product = make_product(self.seller, has_variants=True)
+				ProductImage.objects.create(product=product, image="products/back.jpg", sort_order=2)
+				ProductImage.objects.create(product=product, image="products/front.jpg", sort_order=1)
+				ProductVariant.objects.create(product=product, color=self.red, size=self.medium, sku="K-M", quantity=0)
+				ProductVariant.objects.create(
+					product=product, color=self.red, size=self.large, sku="K-L", quantity=3, price_override=Decimal("1100.00")
+				)
+
+		refresh.assert_called_once_with({product.pk})
+		card = ProductCard.objects.get(pk=product.pk)
+		self.assertEqual(card.thumbnail, "products/front.jpg")
+		self.assertEqual(card.colors, [{"id": self.red.id, "name": "Red", "hex_code": "#FF0000"}])
+		self.assertEqual([size["size"] for size in card.sizes], ["M", "L"])
+		self.assertTrue(card.in_stock)
+		self.assertEqual((card.effective_min_price, card.effective_max_price), (Decimal("900.00"), Decimal("1100.00")))
+
+	def test_variant_edits_rewrite_stock(self):
+		with self.captureOnCommitCallbacks(execute=True):
+			product = make_product(self.seller, has_variants=True)
+			variant = ProductVariant.objects.create(product=product, size=self.medium, sku="K-M", quantity=1)
+
+		with self.captureOnCommitCallbacks(execute=True):
+			variant.quantity = 0
+			variant.save()
+
+		self.assertFalse(ProductCard.objects.get(pk=product.pk).in_stock)
+
+	def test_rolled_back_savepoint_drops_its_rebuild(self):
+		with self.captureOnCommitCallbacks(execute=True):
+			product = make_product(self.seller)
+
+		with mock.patch("apps.catalog.cards.refresh_cards") as refresh:
+			with self.captureOnCommitCallbacks(execute=True):
+				try:
+					with transaction.atomic():
+						product.name = "Saree"
+						product.save()
+						raise RuntimeError
+				except RuntimeError:
+					pass
+				other = make_product(self.seller, name="Lehenga")
+
+		refresh.assert_called_once_with({other.pk})
+
+	def test_listing_reads_cards(self):
+		with self.captureOnCommitCallbacks(execute=True):
+			product = make_product(self.seller)
+		ProductCard.objects.filter(pk=product.pk).update(name="From the card")
+
+		response = api_client().get("/api/catalog/products/all/")
+
+		self.assertEqual([row["name"] for row in response.data], ["From the card"])
+
+
+class CardRefreshTests(TestCase):
+	def setUp(self):
+		self.seller = make_seller()
+
+	def product(self, **fields):
+		with self.captureOnCommitCallbacks(execute=True):
+			return make_product(self.seller, **fields)
+
+	def facet_values(self, product, facet):
+		return set(ProductFacet.objects.filter(product=product, facet=facet).values_list("value", flat=True))
+
+	def test_size_change_rewrites_cards(self):
+		size = ProductSize.objects.create(size=ProductSize.SizeChoice.M)
+		product = self.product(has_variants=True)
+		with self.captureOnCommitCallbacks(execute=True):
+			ProductVariant.objects.create(product=product, size=size, sku="KURTA-M", quantity=2)
+
+		with self.captureOnCommitCallbacks(execute=True):
+			size.size = ProductSize.SizeChoice.L
+			size.save()
+
+		self.assertEqual(ProductCard.objects.get(pk=product.pk).sizes, [{"id": size.id, "size": "L"}])
+
+	def test_size_delete_drops_its_facet(self):
+		size = ProductSize.objects.create(size=ProductSize.SizeChoice.M)
+		product = self.product(has_variants=True)
+		with self.captureOnCommitCallbacks(execute=True):
+			ProductVariant.objects.create(product=product, size=size, sku="KURTA-M", quantity=2)
+		self.assertEqual(self.facet_values(product, Facet.SIZE), {str(size.id)})
+
+		with self.captureOnCommitCallbacks(execute=True):
+			size.delete()
+
+		self.assertEqual(self.facet_values(product, Facet.SIZE), set())
+		self.assertEqual(ProductCard.objects.get(pk=product.pk).sizes, [])
+
+	def test_category_delete_refreshes_its_products(self):
+		parent = Category.objects.create(name="Women", slug="women")
+		child = Category.objects.create(name="Kurtas", slug="kurtas", parent=parent)
+		in_parent = self.product(category=parent)
+		in_child = self.product(category=child)
+
+		with self.captureOnCommitCallbacks(execute=True):
+			parent.delete()
+
+		self.assertIsNone(ProductCard.objects.get(pk=in_parent.pk).category_id)
+		self.assertEqual(self.facet_values(in_parent, Facet.CATEGORY), set())
+		self.assertEqual(self.facet_values(in_child, Facet.CATEGORY), {str(child.id)})
+
+	def test_category_move_refreshes_its_subtree(self):
+		women = Category.objects.create(name="Women", slug="women")
+		men = Category.objects.create(name="Men", slug="men")
+		kurtas = Category.objects.create(name="Kurtas", slug="kurtas", parent=women)
+		product = self.product(category=kurtas)
+		self.product(category=women)
+
+		with mock.patch("apps.catalog.cards.refresh_cards") as refresh:
+			with self.captureOnCommitCallbacks(execute=True):
+				kurtas.parent = men
+				kurtas.save()
+			with self.captureOnCommitCallbacks(execute=True):
+				kurtas.name = "Kurtas & tunics"
+				kurtas.save()
+
+		refresh.assert_called_once_with({product.pk})
@@ -0,0 +1,96 @@
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.test import TestCase
+
+from apps.accounts.models import User
+from apps.catalog.models import Category, Product
+from apps.common.testing import api_client, make_product, make_seller, make_user
+
+
+class CategoryPathTests(TestCase):
+	def setUp(self):
+		self.women = Category.objects.create(name="Women", slug="women")
+		self.ethnic = Category.objects.create(name="Ethnic", slug="ethnic", parent=self.women)
+		self.kurtas = Category.objects.create(name="Kurtas", slug="kurtas", parent=self.ethnic)
+
+	def reload(self, *categories):
+		for category in categories:
+			category.refresh_from_db()
+
+	def test_paths_follow_the_ancestry(self):
+		self.assertEqual(self.women.path, f"{self.women.id}/")
+		self.assertEqual(self.kurtas.path, f"{self.women.id}/{self.ethnic.id}/{self.kurtas.id}/")
+		self.assertEqual((self.women.depth, self.ethnic.depth, self.kurtas.depth), (0, 1, 2))
+
+	def test_move_repaths_the_whole_subtree(self):
+		men = Category.objects.create(name="Men", slug="men")
+
+		self.ethnic.parent = men
+		self.ethnic.save(update_fields=["parent"])
+
+		self.reload(self.ethnic, self.kurtas)
+		self.assertEqual(self.ethnic.path, f"{men.id}/{self.ethnic.id}/")
+		self.assertEqual(self.kurtas.path, f"{men.id}/{self.ethnic.id}/{self.kurtas.id}/")
+		self.assertEqual(self.kurtas.depth, 2)
+
+	def test_moving_under_a_descendant_is_rejected(self):
+		self.women.parent = self.kurtas
+
+		with self.assertRaises(DjangoValidationError):
+			self.women.full_clean()
+		with self.assertRaises(DjangoValidationError):
+			self.women.save()
+		self.assertIsNone(Category.objects.get(pk=self.women.pk).parent_id)
+
+	def test_api_rejects_a_cycle(self):
+		admin = make_user("admin@example.com", User.Role.ADMIN)
+
+		response = api_client(admin).patch(
+			f"/api/catalog/categories/{self.ethnic.id}/", {"parent": self.kurtas.id}, format="json"
+		)
+
+		self.assertEqual(response.status_code, 400)
+		self.assertIn("parent", response.data)
+
+	def test_delete_reroots_children_with_their_subtrees(self):
+		self.women.delete()
+
+		self.reload(self.ethnic, self.kurtas)
+		self.assertIsNone(self.ethnic.parent_id)
+		self.assertEqual(self.ethnic.path, f"{self.ethnic.id}/")
+		self.assertEqual((self.kurtas.path, self.kurtas.depth), (f"{self.ethnic.id}/{self.kurtas.id}/", 1))
+
+
+class CategoryBrowseTests(TestCase):
+	def setUp(self):
+		cache.clear()
+		self.women = Category.objects.create(name="Women", slug="women")
+		self.kurtas = Category.objects.create(name="Kurtas", slug="kurtas", parent=self.women)
+		self.men = Category.objects.create(name="Men", slug="men")
+
+	def test_in_category_matches_the_subtree(self):
+		seller = make_seller()
+		with self.captureOnCommitCallbacks(execute=True):
+			make_product(seller, name="Kurta", category=self.kurtas)
+			make_product(seller, name="Shawl", category=self.women)
+			make_product(seller, name="Sherwani", category=self.men)
+			make_product(seller, name="Draft", category=self.kurtas, status=Product.Status.DRAFT)
+		client = api_client()
+
+		response = client.get("/api/catalog/products/faceted/", {"in_category": self.women.id})
+
+		self.assertEqual({row["name"] for row in response.data["results"]}, {"Kurta", "Shawl"})
+		self.assertEqual(client.get("/api/catalog/products/faceted/", {"in_category": "women"}).status_code, 400)
+
+	def test_tree_nests_children_and_is_refreshed_on_writes(self):
+		client = api_client()
+
+		tree = client.get("/api/catalog/categories/tree/").data
+		self.assertEqual([node["name"] for node in tree], ["Men", "Women"])
+		self.assertEqual([node["name"] for node in tree[1]["children"]], ["Kurtas"])
+
+		with self.captureOnCommitCallbacks(execute=True):
+			Category.objects.create(name="Sarees", slug="sarees", parent=self.women)
+
+		tree = client.get("/api/catalog/categories/tree/").data
+		self.assertEqual([node["name"] for node in tree[1]["children"]], ["Kurtas", "Sarees"])
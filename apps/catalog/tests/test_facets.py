@@ -0,0 +1,87 @@
+from decimal import Decimal
+
+from django.test import SimpleTestCase, TestCase
+
+from apps.catalog.facets import price_bucket
+from apps.catalog.models import Product, ProductColor, ProductFacet, ProductVariant
+from apps.common.testing import api_client, make_product, make_seller
+
+Facet = ProductFacet.Facet
+
+
+class PriceBucketTests(SimpleTestCase):
+	def test_bounds_are_exclusive_and_the_last_bucket_is_open(self):
+		self.assertEqual(price_bucket(Decimal("0")), "0-500")
+		self.assertEqual(price_bucket(Decimal("499.99")), "0-500")
+		self.assertEqual(price_bucket(Decimal("500")), "500-1000")
+		self.assertEqual(price_bucket(Decimal("9999.99")), "5000-10000")
+		self.assertEqual(price_bucket(Decimal("10000")), "10000+")
+
+
+class FacetedBrowseTests(TestCase):
+	def setUp(self):
+		seller = make_seller()
+		self.red = ProductColor.objects.create(name="Red", hex_code="#FF0000")
+		self.blue = ProductColor.objects.create(name="Blue", hex_code="#0000FF")
+		with self.captureOnCommitCallbacks(execute=True):
+			self.red_kurta = self.variant_product(seller, "Red kurta", self.red)
+			self.blue_kurta = self.variant_product(seller, "Blue kurta", self.blue)
+			self.used_saree = make_product(
+				seller,
+				name="Saree",
+				product_type=Product.ProductType.USED,
+				condition=Product.Condition.GENTLY_USED,
+				selling_price=Decimal("3000.00"),
+			)
+			self.draft = self.variant_product(seller, "Draft kurta", self.red, status=Product.Status.DRAFT)
+
+	def variant_product(self, seller, name, color, **fields):
+		product = make_product(seller, name=name, has_variants=True, **fields)
+		ProductVariant.objects.create(product=product, color=color, sku=name, quantity=1)
+		return product
+
+	def browse(self, **params):
+		response = api_client().get("/api/catalog/products/faceted/", params)
+		self.assertEqual(response.status_code, 200)
+		return response
+
+	def names(self, response):
+		return {row["name"] for row in response.data["results"]}
+
+	def test_values_of_one_facet_are_ored(self):
+		response = self.browse(color=f"{self.red.id},{self.blue.id}")
+
+		self.assertEqual(self.names(response), {"Red kurta", "Blue kurta"})
+
+	def test_different_facets_are_anded(self):
+		response = self.browse(color=self.red.id, type=Product.ProductType.NEW)
+		self.assertEqual(self.names(response), {"Red kurta"})
+
+		response = self.browse(color=self.red.id, type=Product.ProductType.USED)
+		self.assertEqual(self.names(response), set())
+
+	def test_counts_cover_the_matching_published_set(self):
+		response = self.browse(type=Product.ProductType.NEW)
+
+		facets = response.data["facets"]
+		self.assertEqual(
+			facets[Facet.COLOR],
+			sorted(
+				[{"value": str(self.red.id), "count": 1}, {"value": str(self.blue.id), "count": 1}],
+				key=lambda row: row["value"],
+			),
+		)
+		self.assertEqual(facets[Facet.PRICE], [{"value": "500-1000", "count": 2}])
+		self.assertEqual(facets[Facet.SIZE], [])
+
+	def test_unfiltered_counts_include_every_facet(self):
+		facets = self.browse().data["facets"]
+
+		self.assertEqual(set(facets), set(Facet.values))
+		self.assertEqual(
+			facets[Facet.TYPE],
+			[{"value": Product.ProductType.NEW, "count": 2}, {"value": Product.ProductType.USED, "count": 1}],
+		)
+		self.assertEqual(
+			{row["value"]: row["count"] for row in facets[Facet.PRICE]}, {"500-1000": 2, "2500-5000": 1}
+		)
@@ -0,0 +1,63 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.catalog.models import Product, ProductVariant
+from apps.common.testing import api_client, make_product, make_seller
+
+
+class EffectivePriceTests(TestCase):
+	def setUp(self):
+		self.seller = make_seller()
+		with self.captureOnCommitCallbacks(execute=True):
+			self.plain = make_product(self.seller, name="Plain", selling_price=Decimal("700.00"))
+			self.sized = make_product(self.seller, name="Sized", selling_price=Decimal("1000.00"), has_variants=True)
+			ProductVariant.objects.create(product=self.sized, sku="S-S", quantity=1)
+			ProductVariant.objects.create(product=self.sized, sku="S-XL", quantity=1, price_override=Decimal("1600.00"))
+			ProductVariant.objects.create(
+				product=self.sized, sku="S-OLD", quantity=1, price_override=Decimal("100.00"), is_active=False
+			)
+			self.rental = make_product(
+				self.seller,
+				name="Rental",
+				product_type=Product.ProductType.RENTAL,
+				selling_price=Decimal("9000.00"),
+				rental_price_per_day=Decimal("1200.00"),
+			)
+
+	def names(self, response):
+		return [row["name"] for row in response.data["results"]]
+
+	def test_range_spans_active_variants_and_rentals_use_the_day_rate(self):
+		self.sized.refresh_from_db()
+		self.rental.refresh_from_db()
+
+		self.assertEqual(
+			(self.sized.effective_min_price, self.sized.effective_max_price), (Decimal("1000.00"), Decimal("1600.00"))
+		)
+		self.assertEqual(self.rental.effective_min_price, Decimal("1200.00"))
+
+	def test_price_filters_match_overlapping_ranges(self):
+		client = api_client()
+
+		response = client.get("/api/catalog/products/by_price/", {"min_price": "1300", "max_price": "1500"})
+		self.assertEqual(self.names(response), ["Sized"])
+
+		response = client.get("/api/catalog/products/", {"max_price": "800"})
+		self.assertEqual([row["name"] for row in response.data], ["Plain"])
+
+	def test_by_price_pages_in_price_order(self):
+		client = api_client()
+
+		ascending = client.get("/api/catalog/products/by_price/", {"page_size": 2})
+		self.assertEqual(self.names(ascending), ["Plain", "Sized"])
+		self.assertEqual(self.names(client.get(ascending.data["next"])), ["Rental"])
+
+		descending = client.get("/api/catalog/products/by_price/", {"order": "desc"})
+		self.assertEqual(self.names(descending), ["Rental", "Sized", "Plain"])
+
+	def test_bad_price_is_rejected(self):
+		client = api_client()
+
+		self.assertEqual(client.get("/api/catalog/products/by_price/", {"min_price": "cheap"}).status_code, 400)
+		self.assertEqual(client.get("/api/catalog/products/by_price/", {"max_price": "-1"}).status_code, 400)
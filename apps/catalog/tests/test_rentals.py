@@ -0,0 +1,95 @@
+from datetime import date
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework.exceptions import ValidationError
+
+from apps.catalog.models import Product, RentalAvailability, RentalBooking
+from apps.catalog.rentals import book_rental, cancel_bookings, intervals_from_dates
+from apps.common.testing import api_client, make_product, make_seller
+
+
+class IntervalTests(SimpleTestCase):
+	def test_consecutive_days_collapse_into_runs(self):
+		runs = intervals_from_dates(["2026-11-03", "2026-11-01", "2026-11-02", "2026-11-05", "not a day", "2026-11-02"])
+
+		self.assertEqual(
+			runs, [(date(2026, 11, 1), date(2026, 11, 3)), (date(2026, 11, 5), date(2026, 11, 5))]
+		)
+
+
+class BookingTests(TestCase):
+	def setUp(self):
+		self.seller = make_seller()
+		with self.captureOnCommitCallbacks(execute=True):
+			self.lehenga = make_product(self.seller, name="Lehenga", product_type=Product.ProductType.RENTAL)
+			self.sherwani = make_product(self.seller, name="Sherwani", product_type=Product.ProductType.RENTAL)
+
+	def test_overlapping_bookings_are_rejected(self):
+		book_rental(self.lehenga, date(2026, 11, 10), date(2026, 11, 12))
+
+		for start, end in [(date(2026, 11, 12), date(2026, 11, 14)), (date(2026, 11, 8), date(2026, 11, 10))]:
+			with self.subTest(start=start, end=end), self.assertRaises(ValidationError):
+				book_rental(self.lehenga, start, end)
+
+		book_rental(self.lehenga, date(2026, 11, 13), date(2026, 11, 14))
+		book_rental(self.sherwani, date(2026, 11, 10), date(2026, 11, 12))
+		self.assertEqual(RentalBooking.objects.count(), 3)
+
+	def test_cancelled_bookings_free_their_days(self):
+		booking = book_rental(self.lehenga, date(2026, 11, 10), date(2026, 11, 12))
+
+		self.assertEqual(cancel_bookings(RentalBooking.objects.filter(pk=booking.pk)), 1)
+
+		book_rental(self.lehenga, date(2026, 11, 11), date(2026, 11, 11))
+
+	def test_availability_rules_bound_the_window(self):
+		RentalAvailability.objects.create(
+			product=self.lehenga, is_available_from=date(2026, 11, 1), min_rental_days=2, max_rental_days=4
+		)
+
+		for start, end in [
+			(date(2026, 10, 30), date(2026, 11, 1)),
+			(date(2026, 11, 5), date(2026, 11, 5)),
+			(date(2026, 11, 5), date(2026, 11, 9)),
+		]:
+			with self.subTest(start=start, end=end), self.assertRaises(ValidationError):
+				book_rental(self.lehenga, start, end)
+
+	def test_blocked_dates_become_blocks_and_refuse_booked_days(self):
+		book_rental(self.lehenga, date(2026, 11, 10), date(2026, 11, 12))
+		availability = RentalAvailability.objects.create(
+			product=self.lehenga, blocked_dates=["2026-11-01", "2026-11-02"]
+		)
+		self.assertEqual(
+			list(
+				RentalBooking.objects.filter(kind=RentalBooking.Kind.BLOCK).values_list("start_date", "end_date")
+			),
+			[(date(2026, 11, 1), date(2026, 11, 2))],
+		)
+		with self.assertRaises(ValidationError):
+			book_rental(self.lehenga, date(2026, 11, 2), date(2026, 11, 3))
+
+		availability.blocked_dates = ["2026-11-12"]
+		with self.assertRaises(ValidationError):
+			availability.save()
+
+	def test_availability_search_skips_taken_products(self):
+		book_rental(self.lehenga, date(2026, 11, 10), date(2026, 11, 12))
+		client = api_client()
+
+		response = client.get(
+			"/api/catalog/products/faceted/", {"available_from": "2026-11-12", "available_to": "2026-11-13"}
+		)
+		self.assertEqual([row["name"] for row in response.data["results"]], ["Sherwani"])
+		self.assertEqual(client.get("/api/catalog/products/faceted/", {"available_from": "2026-11-12"}).status_code, 400)
+
+	def test_calendar_lists_taken_intervals(self):
+		book_rental(self.lehenga, date(2026, 11, 10), date(2026, 11, 12))
+		RentalAvailability.objects.create(product=self.lehenga, blocked_dates=["2026-11-20"])
+
+		response = api_client().get(
+			f"/api/catalog/products/{self.lehenga.id}/rental_calendar/", {"from": "2026-11-01", "to": "2026-11-15"}
+		)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual([row["start_date"] for row in response.data["taken"]], ["2026-11-10"])
@@ -1,4 +1,6 @@
+from django.db import transaction
 from django.db.models import Q
+from drf_spectacular.utils import extend_schema
 from rest_framework import permissions, status, viewsets
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.decorators import action
@@ -9,24 +11,34 @@ import random
 from apps.accounts.models import User
 from apps.accounts.permissions import IsAdmin
 from apps.admin_api.models import MarketplaceSettings
+from apps.admin_api.moderation import bulk_set_status
+from apps.admin_api.serializers import BulkModerationResultSerializer, BulkModerationSerializer
+from apps.catalog.categories import cached_tree, subtree_q
+from apps.catalog.facets import facet_counts, filter_by_facets, filter_by_price, selected_facets
 from apps.catalog.models import (
 	Category,
 	Product,
+	ProductCard,
 	ProductColor,
+	ProductFacet,
 	ProductImage,
 	ProductSize,
 	ProductVariant,
 	RentalAvailability,
 )
+from apps.catalog.rentals import calendar_window, filter_available, overlapping, parse_window
 from apps.catalog.serializers import (
 	CategorySerializer,
+	ProductCardSerializer,
 	ProductColorSerializer,
 	ProductImageSerializer,
 	ProductSerializer,
 	ProductSizeSerializer,
 	ProductVariantSerializer,
 	RentalAvailabilitySerializer,
+	RentalBookingSerializer,
 )
+from apps.common.pagination import CreatedAtCursorPagination, PriceCursorPagination
 
 
 class CategoryViewSet(viewsets.ModelViewSet):
@@ -35,10 +47,15 @@ class CategoryViewSet(viewsets.ModelViewSet):
 	parser_classes = [MultiPartParser, FormParser, JSONParser]
 
 	def get_permissions(self):
-		if self.action in {"list", "retrieve"}:
+		if self.action in {"list", "retrieve", "tree"}:
 			return [permissions.AllowAny()]
 		return [IsAdmin()]
 
+	@action(detail=False, methods=["get"])
+	def tree(self, request):
+		"""Get the full category hierarchy as nested children (cached)"""
+		return Response(cached_tree(lambda category: CategorySerializer(category).data))
+
 
 class ProductColorViewSet(viewsets.ModelViewSet):
 	"""ViewSet for managing product colors"""
@@ -62,11 +79,16 @@ class ProductSizeViewSet(viewsets.ModelViewSet):
 		return [IsAdmin()]
 
 
+def filter_rental_window(queryset, query_params):
+	window = parse_window(query_params)
+	return filter_available(queryset, *window) if window else queryset
+
+
 class ProductViewSet(viewsets.ModelViewSet):
 	serializer_class = ProductSerializer
 	parser_classes = [MultiPartParser, FormParser, JSONParser]
 	search_fields = ["name", "description", "base_sku"]
-	ordering_fields = ["created_at", "selling_price"]
+	ordering_fields = ["created_at", "selling_price", "effective_min_price", "effective_max_price"]
 	filterset_fields = ["condition", "status", "seller", "category", "product_type"]
 
 	def get_queryset(self):
@@ -75,6 +97,12 @@ class ProductViewSet(viewsets.ModelViewSet):
 		)
 		if getattr(self, "swagger_fake_view", False):
 			return queryset.none()
+		if self.action == "list":
+			in_category = self.request.query_params.get("in_category")
+			if in_category:
+				queryset = queryset.filter(subtree_q(in_category))
+			queryset = filter_by_price(queryset, self.request.query_params)
+			queryset = filter_rental_window(queryset, self.request.query_params)
 		user = self.request.user
 		if user.is_authenticated and user.role == User.Role.ADMIN:
 			return queryset
@@ -161,13 +189,31 @@ class ProductViewSet(viewsets.ModelViewSet):
 		
 		serializer = RentalAvailabilitySerializer(data=request.data)
 		if serializer.is_valid():
-			rental_avail, created = RentalAvailability.objects.get_or_create(product=product)
-			for attr, value in serializer.validated_data.items():
-				setattr(rental_avail, attr, value)
-			rental_avail.save()
+			# Saving syncs the calendar blocks, which fails on booked dates; keep the row unchanged then.
+			with transaction.atomic():
+				rental_avail, created = RentalAvailability.objects.get_or_create(product=product)
+				for attr, value in serializer.validated_data.items():
+					setattr(rental_avail, attr, value)
+				rental_avail.save()
 			return Response(RentalAvailabilitySerializer(rental_avail).data)
 		return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+	@action(detail=True, methods=["get"], permission_classes=[permissions.AllowAny])
+	def rental_calendar(self, request, pk=None):
+		"""Booked and blocked intervals of a rental product between ``from`` and ``to``"""
+		product = self.get_object()
+		if product.product_type != Product.ProductType.RENTAL:
+			raise ValidationError("This product is not a rental product.")
+		start, end = calendar_window(request.query_params)
+		taken = overlapping(product.pk, start, end).order_by("start_date")
+		return Response(
+			{
+				"from": start,
+				"to": end,
+				"taken": RentalBookingSerializer(taken, many=True).data,
+			}
+		)
+
 	@action(detail=False, methods=["get"], permission_classes=[permissions.IsAuthenticated])
 	def my_products(self, request):
 		"""Get all products from the authenticated seller"""
@@ -185,12 +231,12 @@ class ProductViewSet(viewsets.ModelViewSet):
 				status=status.HTTP_400_BAD_REQUEST,
 			)
 		
-		products = Product.objects.filter(
+		cards = ProductCard.objects.filter(
 			seller_id=seller_id,
 			status=Product.Status.PUBLISHED,
 			is_active=True,
-		).prefetch_related("images", "variants")
-		serializer = self.get_serializer(products, many=True)
+		)
+		serializer = ProductCardSerializer(cards, many=True, context=self.get_serializer_context())
 		return Response(serializer.data)
 
 	@action(detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated])
@@ -215,10 +261,38 @@ class ProductViewSet(viewsets.ModelViewSet):
 		product.save(update_fields=["status"])
 		return Response({"status": "Product unpublished successfully"})
 
+	def _bulk_set_status(self, request, to_status: str, action_name: str):
+		serializer = BulkModerationSerializer(data=request.data)
+		serializer.is_valid(raise_exception=True)
+		products = Product.objects.all()
+		if request.user.role != User.Role.ADMIN:
+			products = products.filter(seller=request.user)
+		result = bulk_set_status(
+			products,
+			to_status,
+			action_name,
+			request.user,
+			ids=serializer.validated_data.get("ids"),
+			filters=serializer.validated_data.get("filters"),
+		)
+		return Response(BulkModerationResultSerializer(result).data)
+
+	@extend_schema(request=BulkModerationSerializer, responses=BulkModerationResultSerializer)
+	@action(detail=False, methods=["post"], permission_classes=[permissions.IsAuthenticated])
+	def bulk_publish(self, request):
+		"""Publish many of your products by ids or filters in one statement"""
+		return self._bulk_set_status(request, Product.Status.PUBLISHED, "publish")
+
+	@extend_schema(request=BulkModerationSerializer, responses=BulkModerationResultSerializer)
+	@action(detail=False, methods=["post"], permission_classes=[permissions.IsAuthenticated])
+	def bulk_unpublish(self, request):
+		"""Unpublish many of your products by ids or filters in one statement"""
+		return self._bulk_set_status(request, Product.Status.DRAFT, "unpublish")
+
 	@action(detail=False, methods=["get"], permission_classes=[permissions.AllowAny])
 	def all(self, request):
-		"""Get all products with optional filters"""
-		queryset = self.get_queryset()
+		"""Get random product cards with optional filters"""
+		queryset = ProductCard.objects.all()
 
 		# Apply filters
 		name = request.query_params.get("name")
@@ -229,13 +303,17 @@ class ProductViewSet(viewsets.ModelViewSet):
 		if category_id:
 			queryset = queryset.filter(category_id=category_id)
 
+		in_category = request.query_params.get("in_category")
+		if in_category:
+			queryset = queryset.filter(subtree_q(in_category))
+
 		color_id = request.query_params.get("color")
 		if color_id:
-			queryset = queryset.filter(variants__color_id=color_id).distinct()
+			queryset = filter_by_facets(queryset, {ProductFacet.Facet.COLOR: [color_id]})
 
 		size_id = request.query_params.get("size")
 		if size_id:
-			queryset = queryset.filter(variants__size_id=size_id).distinct()
+			queryset = filter_by_facets(queryset, {ProductFacet.Facet.SIZE: [size_id]})
 
 		product_type = request.query_params.get("type")
 		if product_type:
@@ -248,23 +326,60 @@ class ProductViewSet(viewsets.ModelViewSet):
 		availability = request.query_params.get("availability")
 		if availability and availability.lower() == "true":
 			queryset = queryset.filter(is_active=True)
+		queryset = filter_rental_window(queryset, request.query_params)
 
 		# Limit results
 		limit = min(int(request.query_params.get("limit", 10)), 100)
 
 		# Get random products
-		product_ids = list(queryset.values_list("id", flat=True))
+		product_ids = list(queryset.values_list("product_id", flat=True))
 		if not product_ids:
 			return Response([])
 
 		random_ids = random.sample(product_ids, min(limit, len(product_ids)))
-		random_products = Product.objects.filter(id__in=random_ids).prefetch_related(
-			"images", "variants"
-		).select_related("seller", "category")
+		random_cards = ProductCard.objects.filter(product_id__in=random_ids)
 
-		serializer = self.get_serializer(random_products, many=True)
+		serializer = ProductCardSerializer(random_cards, many=True, context=self.get_serializer_context())
 		return Response(serializer.data)
 
+	@action(detail=False, methods=["get"], permission_classes=[permissions.AllowAny])
+	def faceted(self, request):
+		"""Browse published products by facets, with value counts for the matching set"""
+		cards = filter_by_facets(
+			ProductCard.objects.filter(status=Product.Status.PUBLISHED, is_active=True),
+			selected_facets(request.query_params),
+		)
+		in_category = request.query_params.get("in_category")
+		if in_category:
+			cards = cards.filter(subtree_q(in_category))
+		cards = filter_by_price(cards, request.query_params)
+		cards = filter_rental_window(cards, request.query_params)
+		paginator = CreatedAtCursorPagination()
+		page = paginator.paginate_queryset(cards, request, view=self)
+		serializer = ProductCardSerializer(page, many=True, context=self.get_serializer_context())
+		response = paginator.get_paginated_response(serializer.data)
+		response.data["facets"] = facet_counts(cards)
+		return response
+
+	@action(detail=False, methods=["get"], permission_classes=[permissions.AllowAny])
+	def by_price(self, request):
+		"""Browse published products sorted by effective price (order=asc|desc) with keyset pagination"""
+		cards = filter_by_price(
+			filter_by_facets(
+				ProductCard.objects.filter(status=Product.Status.PUBLISHED, is_active=True),
+				selected_facets(request.query_params),
+			),
+			request.query_params,
+		)
+		in_category = request.query_params.get("in_category")
+		if in_category:
+			cards = cards.filter(subtree_q(in_category))
+		cards = filter_rental_window(cards, request.query_params)
+		paginator = PriceCursorPagination()
+		page = paginator.paginate_queryset(cards, request, view=self)
+		serializer = ProductCardSerializer(page, many=True, context=self.get_serializer_context())
+		return paginator.get_paginated_response(serializer.data)
+
 	@action(detail=False, methods=["get"])
 	def search_suggestions(self, request):
 		"""Get search suggestions for product names (minimum 3 characters required)"""
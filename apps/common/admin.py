@@ -1,5 +1,5 @@
 from django.contrib import admin
-from apps.common.models import Carousel, Section, SectionProduct, MarketplaceProduct
+from apps.common.models import Carousel, IdempotencyRecord, Section, SectionProduct, MarketplaceProduct
 
 
 class SectionProductInline(admin.TabularInline):
@@ -40,4 +40,11 @@ class MarketplaceProductAdmin(admin.ModelAdmin):
 	list_filter = ("placement_name", "is_featured", "is_active", "created_at")
 	search_fields = ("product__name", "placement_name", "display_text")
 	ordering = ("order", "-created_at")
-	autocomplete_fields = ['product']
\ No newline at end of file
+	autocomplete_fields = ['product']
+
+
+@admin.register(IdempotencyRecord)
+class IdempotencyRecordAdmin(admin.ModelAdmin):
+	list_display = ("id", "user", "scope", "key", "status", "response_status", "created_at", "expires_at")
+	list_filter = ("scope", "status")
+	search_fields = ("key", "user__email")
@@ -0,0 +1,49 @@
+"""
+Versioned cache scopes.
+
+Entries that belong to one scope (the listing pages of a city, the
+storefront pages of a seller) embed the scope's version in their key.
+Bumping the version orphans every entry of the scope at once without
+tracking their keys; the orphans expire on their own.
+"""
+import hashlib
+
+from django.core.cache import cache
+
+
+def _version_key(namespace: str, scope) -> str:
+	return f"{namespace}:version:{scope}"
+
+
+def scope_version(namespace: str, scope) -> int:
+	key = _version_key(namespace, scope)
+	version = cache.get(key)
+	if version is None:
+		version = 1
+		cache.add(key, version, None)
+	return version
+
+
+def versioned_key(namespace: str, scope, variant: str = "") -> str:
+	"""A cache key for ``variant`` (e.g. a query string) within the current version of ``scope``."""
+	digest = hashlib.sha256(variant.encode("utf-8")).hexdigest()[:32]
+	return f"{namespace}:{scope}:{scope_version(namespace, scope)}:{digest}"
+
+
+def get_or_build(key: str, timeout: int, build):
+	value = cache.get(key)
+	if value is None:
+		value = build()
+		cache.set(key, value, timeout)
+	return value
+
+
+def bump_versions(namespace: str, scopes) -> None:
+	"""Moves each scope to a new version so none of its cached entries is read again."""
+	for scope in set(scopes):
+		key = _version_key(namespace, scope)
+		cache.add(key, 1, None)
+		try:
+			cache.incr(key)
+		except ValueError:
+			cache.set(key, 2, None)
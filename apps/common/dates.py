@@ -0,0 +1,11 @@
+from datetime import date, datetime, time, timedelta
+
+from django.utils import timezone
+
+
+def day_bounds(day: date) -> tuple[datetime, datetime]:
+	"""Returns the aware ``[start, end)`` datetimes of ``day`` in the current time zone."""
+	tz = timezone.get_current_timezone()
+	start = timezone.make_aware(datetime.combine(day, time.min), tz)
+	end = timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min), tz)
+	return start, end
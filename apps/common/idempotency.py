@@ -0,0 +1,227 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.response import Response
+
+from apps.common.models import IdempotencyRecord
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+POLL_INTERVAL_SECONDS = 0.1
+
+
+class IdempotencyKeyInProgress(APIException):
+	status_code = status.HTTP_409_CONFLICT
+	default_detail = "A request with this Idempotency-Key is still being processed."
+	default_code = "idempotency_key_in_progress"
+
+
+class IdempotencyKeyReused(APIException):
+	status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+	default_detail = "This Idempotency-Key was already used with a different request."
+	default_code = "idempotency_key_reused"
+
+
+def request_fingerprint(request) -> str:
+	data = request.data
+	if hasattr(data, "lists"):
+		data = dict(data.lists())
+	raw = json.dumps(
+		{"method": request.method, "path": request.path, "data": data},
+		sort_keys=True,
+		default=str,
+	)
+	return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _claim(user, scope: str, key: str, fingerprint: str) -> tuple[IdempotencyRecord | None, bool]:
+	"""
+	Inserts an in-progress record, or returns the live one already holding the key.
+
+	An in-progress record whose lease ran out belongs to a request that died
+	mid-handler (worker timeout, OOM kill, deploy); a retry with the same body
+	takes it over under a fresh lease instead of waiting for it.
+	"""
+	now = timezone.now()
+	try:
+		with transaction.atomic():
+			record = IdempotencyRecord.objects.create(
+				user=user,
+				scope=scope,
+				key=key,
+				fingerprint=fingerprint,
+				locked_until=now + settings.IDEMPOTENCY_LEASE,
+				expires_at=now + settings.IDEMPOTENCY_KEY_TTL,
+			)
+		return record, True
+	except IntegrityError:
+		pass
+	record = IdempotencyRecord.objects.filter(user=user, scope=scope, key=key).first()
+	if record is not None and record.expires_at <= now:
+		record.delete()
+		record = None
+	elif (
+		record is not None
+		and record.status == IdempotencyRecord.Status.IN_PROGRESS
+		and record.fingerprint == fingerprint
+		and record.locked_until <= now
+	):
+		lease = now + settings.IDEMPOTENCY_LEASE
+		taken = IdempotencyRecord.objects.filter(
+			pk=record.pk, status=IdempotencyRecord.Status.IN_PROGRESS, locked_until=record.locked_until
+		).update(locked_until=lease)
+		if taken:
+			record.locked_until = lease
+			return record, True
+	return record, False
+
+
+def _held(record: IdempotencyRecord):
+	"""The record, as long as this request still holds its lease."""
+	return IdempotencyRecord.objects.filter(pk=record.pk, locked_until=record.locked_until)
+
+
+def _replay(record: IdempotencyRecord) -> Response:
+	return Response(
+		record.response_body,
+		status=record.response_status,
+		headers={REPLAYED_HEADER: "true"},
+	)
+
+
+def _idempotency_key(request) -> str | None:
+	key = request.headers.get(IDEMPOTENCY_HEADER)
+	if not key or not request.user.is_authenticated:
+		return None
+	if len(key) > 255:
+		raise ValidationError({"idempotency_key": "Idempotency-Key must be at most 255 characters."})
+	return key
+
+
+def _check_existing(record: IdempotencyRecord, fingerprint: str, deadline: float) -> Response | None:
+	"""The stored response of a completed duplicate, or None to keep waiting for a running one."""
+	if record.fingerprint != fingerprint:
+		raise IdempotencyKeyReused()
+	if record.status == IdempotencyRecord.Status.COMPLETED:
+		return _replay(record)
+	if time.monotonic() >= deadline:
+		raise IdempotencyKeyInProgress()
+	return None
+
+
+def _complete(response) -> dict | None:
+	"""The fields that store ``response``, or None when it must not be stored."""
+	if response.status_code >= 500:
+		return None
+	return {
+		"status": IdempotencyRecord.Status.COMPLETED,
+		"response_status": response.status_code,
+		"response_body": response.data,
+	}
+
+
+def idempotent(scope: str):
+	"""
+	Makes a view handler safe to retry with an ``Idempotency-Key`` header.
+
+	The first request claims the key and runs the handler; its response is
+	stored until ``IDEMPOTENCY_KEY_TTL`` passes. Retries with the same key and
+	body get the stored response back. Concurrent duplicates wait for the
+	first one to finish instead of running the handler again, unless its
+	``IDEMPOTENCY_LEASE`` runs out first, in which case one of them takes the
+	key over. Outcomes are only stored while the lease is held. Must wrap the
+	handler outside any ``transaction.atomic``. Async handlers get an async
+	wrapper that runs the database steps off the event loop and waits with
+	``asyncio.sleep``.
+	"""
+
+	def decorator(view_method):
+		if inspect.iscoroutinefunction(view_method):
+			return _async_idempotent(scope, view_method)
+
+		@functools.wraps(view_method)
+		def wrapper(self, request, *args, **kwargs):
+			key = _idempotency_key(request)
+			if key is None:
+				return view_method(self, request, *args, **kwargs)
+
+			fingerprint = request_fingerprint(request)
+			deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+			while True:
+				record, claimed = _claim(request.user, scope, key, fingerprint)
+				if claimed:
+					break
+				if record is None:
+					continue
+				replay = _check_existing(record, fingerprint, deadline)
+				if replay is not None:
+					return replay
+				time.sleep(POLL_INTERVAL_SECONDS)
+
+			try:
+				response = view_method(self, request, *args, **kwargs)
+			except Exception:
+				_held(record).delete()
+				raise
+			completed = _complete(response)
+			if completed:
+				_held(record).update(**completed)
+			else:
+				_held(record).delete()
+			return response
+
+		return wrapper
+
+	return decorator
+
+
+def _async_idempotent(scope: str, view_method):
+	claim = sync_to_async(_claim)
+
+	@functools.wraps(view_method)
+	async def wrapper(self, request, *args, **kwargs):
+		key = _idempotency_key(request)
+		if key is None:
+			return await view_method(self, request, *args, **kwargs)
+
+		fingerprint = request_fingerprint(request)
+		deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+		while True:
+			record, claimed = await claim(request.user, scope, key, fingerprint)
+			if claimed:
+				break
+			if record is None:
+				continue
+			replay = _check_existing(record, fingerprint, deadline)
+			if replay is not None:
+				return replay
+			await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+		try:
+			response = await view_method(self, request, *args, **kwargs)
+		except Exception:
+			await _held(record).adelete()
+			raise
+		completed = _complete(response)
+		if completed:
+			await _held(record).aupdate(**completed)
+		else:
+			await _held(record).adelete()
+		return response
+
+	return wrapper
+
+
+def purge_expired_records() -> int:
+	deleted, _ = IdempotencyRecord.objects.filter(expires_at__lte=timezone.now()).delete()
+	return deleted
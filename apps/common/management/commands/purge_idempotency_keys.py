@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.common.idempotency import purge_expired_records
+
+
+class Command(BaseCommand):
+	help = "Deletes stored Idempotency-Key responses whose TTL has passed."
+
+	def handle(self, *args, **options):
+		deleted = purge_expired_records()
+		self.stdout.write(f"Deleted {deleted} expired idempotency records.")
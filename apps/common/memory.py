@@ -0,0 +1,33 @@
+"""Process memory readings for benchmarks and worker reports."""
+import os
+import resource
+import sys
+
+
+def rss_bytes(pid: int | None = None) -> int:
+	"""
+	Resident set size of ``pid`` (default: this process) from /proc.
+
+	Where /proc is missing (macOS), falls back to the peak RSS of the current
+	process, which is the closest number ``getrusage`` offers.
+	"""
+	try:
+		with open(f"/proc/{pid or 'self'}/statm") as statm:
+			return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+	except (OSError, ValueError, IndexError):
+		peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+		return peak if sys.platform == "darwin" else peak * 1024
+
+
+def private_bytes(pid: int | None = None) -> int:
+	"""
+	Memory only ``pid`` holds (its unique set size), from /proc/<pid>/smaps_rollup, or 0 without it.
+
+	For a forked worker, ``rss_bytes() - private_bytes()`` is what it still
+	shares copy-on-write with the master and the other workers.
+	"""
+	try:
+		with open(f"/proc/{pid or 'self'}/smaps_rollup") as rollup:
+			return sum(int(line.split()[1]) * 1024 for line in rollup if line.startswith("Private_"))
+	except (OSError, ValueError, IndexError):
+		return 0
@@ -1,4 +1,6 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from apps.accounts.models import User
 from apps.catalog.models import Product
 
 
@@ -68,3 +70,30 @@ class MarketplaceProduct(models.Model):
 
 	def __str__(self) -> str:
 		return f"{self.product.name} - {self.placement_name}"
+
+
+class IdempotencyRecord(models.Model):
+	"""Stored outcome of a request sent with an Idempotency-Key header"""
+	class Status(models.TextChoices):
+		IN_PROGRESS = "in_progress", "In Progress"
+		COMPLETED = "completed", "Completed"
+
+	user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="idempotency_records")
+	scope = models.CharField(max_length=64)
+	key = models.CharField(max_length=255)
+	fingerprint = models.CharField(max_length=64)
+	status = models.CharField(max_length=20, choices=Status.choices, default=Status.IN_PROGRESS)
+	response_status = models.PositiveSmallIntegerField(null=True, blank=True)
+	response_body = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+	# Lease of the request running the handler; an in-progress record past it was abandoned.
+	locked_until = models.DateTimeField()
+	created_at = models.DateTimeField(auto_now_add=True)
+	expires_at = models.DateTimeField(db_index=True)
+
+	class Meta:
+		constraints = [
+			models.UniqueConstraint(fields=["user", "scope", "key"], name="unique_idempotency_key"),
+		]
+
+	def __str__(self) -> str:
+		return f"{self.scope}:{self.key}"
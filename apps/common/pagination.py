@@ -0,0 +1,44 @@
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+	"""
+	Keyset pagination over ``created_at``; stable and index-friendly for append-heavy tables.
+
+	Bulk inserts give many rows the same ``created_at``, so the primary key
+	breaks ties (``pk`` rather than ``id``, since ``ProductCard`` is keyed by
+	its product) and no row is skipped or repeated between pages.
+	"""
+	ordering = ("-created_at", "-pk")
+	page_size = 20
+	page_size_query_param = "page_size"
+	max_page_size = 100
+
+
+class PriceCursorPagination(CursorPagination):
+	"""
+	Keyset pagination over ``effective_min_price`` with the product id as tie-breaker.
+
+	``?order=desc`` pages from the most expensive product down.
+	"""
+	ordering = ("effective_min_price", "product_id")
+	page_size = 20
+	page_size_query_param = "page_size"
+	max_page_size = 100
+
+	def get_ordering(self, request, queryset, view):
+		if request.query_params.get("order") == "desc":
+			return ("-effective_min_price", "-product_id")
+		return self.ordering
+
+
+class NewestFirstCursorPagination(CursorPagination):
+	"""Keyset pagination over ``created_at`` with the id as tie-breaker, newest first."""
+	ordering = ("-created_at", "-id")
+	page_size = 50
+	page_size_query_param = "page_size"
+	max_page_size = 200
+
+
+class DateJoinedCursorPagination(NewestFirstCursorPagination):
+	ordering = ("-date_joined", "-id")
@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from apps.common.models import Carousel, Section, SectionProduct, MarketplaceProduct
-from apps.catalog.serializers import ProductSerializer
+from apps.catalog.serializers import ProductCardSerializer, ProductSerializer
 
 
 class CarouselSerializer(serializers.ModelSerializer):
@@ -11,7 +11,7 @@ class CarouselSerializer(serializers.ModelSerializer):
 
 
 class SectionProductSerializer(serializers.ModelSerializer):
-	product = ProductSerializer(read_only=True)
+	product = ProductCardSerializer(source="product.card", read_only=True)
 	product_id = serializers.PrimaryKeyRelatedField(
 		queryset=__import__('apps.catalog.models', fromlist=['Product']).Product.objects.all(),
 		write_only=True,
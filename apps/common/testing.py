@@ -0,0 +1,44 @@
+"""Builders shared by the apps' test suites."""
+from decimal import Decimal
+
+from rest_framework.test import APIClient
+
+from apps.accounts.models import User
+from apps.catalog.models import Product
+from apps.orders.models import Order
+
+SHIPPING = {
+	"shipping_name": "Asha Rao",
+	"shipping_phone": "9999999999",
+	"shipping_line1": "1 MG Road",
+	"shipping_city": "Pune",
+	"shipping_state": "MH",
+	"shipping_postal_code": "411001",
+}
+
+
+def make_user(email: str, role=User.Role.CUSTOMER, **fields) -> User:
+	"""A user with an unusable password, so no hasher runs."""
+	return User.objects.create_user(email=email, password=None, role=role, **fields)
+
+
+def make_seller(email: str = "seller@example.com", **fields) -> User:
+	return make_user(email, User.Role.BOUTIQUE_OWNER, **fields)
+
+
+def make_product(seller: User, **fields) -> Product:
+	values = {"name": "Kurta", "selling_price": Decimal("900.00"), "status": Product.Status.PUBLISHED}
+	values.update(fields)
+	return Product.objects.create(seller=seller, **values)
+
+
+def make_order(customer: User, seller: User, total="1000.00", **fields) -> Order:
+	total = Decimal(total)
+	return Order.objects.create(customer=customer, seller=seller, subtotal=total, total=total, **SHIPPING, **fields)
+
+
+def api_client(user: User | None = None) -> APIClient:
+	client = APIClient()
+	if user is not None:
+		client.force_authenticate(user)
+	return client
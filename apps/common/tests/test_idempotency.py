@@ -0,0 +1,104 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.common.idempotency import REPLAYED_HEADER
+from apps.common.models import IdempotencyRecord
+from apps.common.testing import SHIPPING, api_client, make_order, make_product, make_seller, make_user
+from apps.orders.models import Order
+
+
+class OrderIdempotencyTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.product = make_product(make_seller())
+		self.client = api_client(self.customer)
+		self.body = {"items": [{"product": self.product.id, "quantity": 1}], **SHIPPING}
+
+	def create(self, body=None, key="key-1"):
+		return self.client.post("/api/orders/", body or self.body, format="json", HTTP_IDEMPOTENCY_KEY=key)
+
+	def test_replay_returns_the_stored_response(self):
+		first = self.create()
+		second = self.create()
+
+		self.assertEqual(first.status_code, 201)
+		self.assertEqual(second.status_code, 201)
+		self.assertEqual(second.json(), first.json())
+		self.assertEqual(second.headers[REPLAYED_HEADER], "true")
+		self.assertEqual(Order.objects.count(), 1)
+
+	def test_key_reused_with_another_body_is_refused(self):
+		self.create()
+
+		response = self.create({**self.body, "shipping_city": "Mumbai"})
+
+		self.assertEqual(response.status_code, 422)
+		self.assertEqual(Order.objects.count(), 1)
+
+	def test_other_keys_and_requests_without_a_key_run_normally(self):
+		self.create(key="key-1")
+		self.create(key="key-2")
+		self.client.post("/api/orders/", self.body, format="json")
+
+		self.assertEqual(Order.objects.count(), 3)
+
+	def test_failed_request_releases_the_key(self):
+		response = self.create({**self.body, "items": []})
+		self.assertEqual(response.status_code, 400)
+
+		self.assertEqual(self.create().status_code, 201)
+
+
+@override_settings(IDEMPOTENCY_WAIT_SECONDS=0)
+class IdempotencyLeaseTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.client = api_client(self.customer)
+		self.body = {"items": [{"product": make_product(make_seller()).id, "quantity": 1}], **SHIPPING}
+		self.client.post("/api/orders/", self.body, format="json", HTTP_IDEMPOTENCY_KEY="key-1")
+		self.record = IdempotencyRecord.objects.get()
+
+	def hold(self, locked_until):
+		IdempotencyRecord.objects.filter(pk=self.record.pk).update(
+			status=IdempotencyRecord.Status.IN_PROGRESS, locked_until=locked_until
+		)
+
+	def test_live_lease_makes_duplicates_wait(self):
+		self.hold(timezone.now() + timedelta(minutes=1))
+
+		response = self.client.post("/api/orders/", self.body, format="json", HTTP_IDEMPOTENCY_KEY="key-1")
+
+		self.assertEqual(response.status_code, 409)
+		self.assertEqual(Order.objects.count(), 1)
+
+	def test_expired_lease_is_taken_over(self):
+		self.hold(timezone.now() - timedelta(seconds=1))
+
+		response = self.client.post("/api/orders/", self.body, format="json", HTTP_IDEMPOTENCY_KEY="key-1")
+
+		self.assertEqual(response.status_code, 201)
+		self.assertEqual(IdempotencyRecord.objects.get().status, IdempotencyRecord.Status.COMPLETED)
+
+
+@override_settings(RAZORPAY_KEY_ID="rzp_test", RAZORPAY_KEY_SECRET="secret")
+class AsyncIdempotencyTests(TestCase):
+	def test_payment_initiation_calls_the_gateway_once(self):
+		customer = make_user("customer@example.com")
+		order = make_order(customer, make_seller())
+		client = api_client(customer)
+		gateway = mock.AsyncMock(return_value={"id": "order_1", "amount": 100000, "currency": "INR"})
+
+		with mock.patch("apps.integrations.views.create_razorpay_order", gateway):
+			responses = [
+				client.post(
+					"/api/secure/make-payment/", {"order_id": order.id}, format="json", HTTP_IDEMPOTENCY_KEY="pay-1"
+				)
+				for _ in range(2)
+			]
+
+		self.assertEqual([response.status_code for response in responses], [201, 201])
+		self.assertEqual(responses[1].json(), responses[0].json())
+		self.assertEqual(gateway.await_count, 1)
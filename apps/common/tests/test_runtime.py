@@ -0,0 +1,119 @@
+import importlib.util
+import os
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from apps.common.memory import private_bytes, rss_bytes
+
+GUNICORN_CONF = Path(settings.BASE_DIR) / "gunicorn.conf.py"
+
+
+def exec_gunicorn_conf():
+	"""Executes gunicorn.conf.py as gunicorn would, against the current environment."""
+	spec = importlib.util.spec_from_file_location("gunicorn_conf", GUNICORN_CONF)
+	module = importlib.util.module_from_spec(spec)
+	spec.loader.exec_module(module)
+	return module
+
+
+def load_gunicorn_conf(**environ):
+	with mock.patch.dict(os.environ, environ):
+		return exec_gunicorn_conf()
+
+
+class CgroupCpuLimitTests(SimpleTestCase):
+	def setUp(self):
+		self.conf = load_gunicorn_conf()
+
+	def limit(self, files):
+		with mock.patch.object(self.conf, "read_first_line", lambda path: files.get(path)):
+			return self.conf.cgroup_cpu_limit()
+
+	def test_v2_quota_rounds_up_to_whole_cores(self):
+		self.assertEqual(self.limit({"/sys/fs/cgroup/cpu.max": ["150000", "100000"]}), 2)
+		self.assertEqual(self.limit({"/sys/fs/cgroup/cpu.max": ["50000", "100000"]}), 1)
+
+	def test_v1_quota_is_read_when_v2_is_missing(self):
+		files = {
+			"/sys/fs/cgroup/cpu/cpu.cfs_quota_us": ["400000"],
+			"/sys/fs/cgroup/cpu/cpu.cfs_period_us": ["100000"],
+		}
+		self.assertEqual(self.limit(files), 4)
+
+	def test_unlimited_or_unreadable_quota_is_no_limit(self):
+		for files in [
+			{},
+			{"/sys/fs/cgroup/cpu.max": ["max", "100000"]},
+			{"/sys/fs/cgroup/cpu/cpu.cfs_quota_us": ["-1"], "/sys/fs/cgroup/cpu/cpu.cfs_period_us": ["100000"]},
+			{"/sys/fs/cgroup/cpu.max": ["abc", "100000"]},
+			{"/sys/fs/cgroup/cpu.max": ["0", "100000"]},
+		]:
+			with self.subTest(files=files):
+				self.assertIsNone(self.limit(files))
+
+	def test_quota_caps_the_affinity_core_count(self):
+		with (
+			mock.patch.object(os, "sched_getaffinity", return_value=set(range(16))),
+			mock.patch.object(self.conf, "cgroup_cpu_limit", return_value=2),
+		):
+			self.assertEqual(self.conf.available_cores(), 2)
+		with (
+			mock.patch.object(os, "sched_getaffinity", return_value={0, 1}),
+			mock.patch.object(self.conf, "cgroup_cpu_limit", return_value=None),
+		):
+			self.assertEqual(self.conf.available_cores(), 2)
+
+
+class GunicornProfileTests(SimpleTestCase):
+	def test_profiles_size_workers_from_cores(self):
+		conf = load_gunicorn_conf(GUNICORN_PROFILE="sync")
+		self.assertEqual(conf.worker_class, "gthread")
+		self.assertEqual(conf.workers, conf.CORES * 2 + 1)
+		self.assertEqual(conf.max_requests_jitter, conf.max_requests // 10)
+
+		conf = load_gunicorn_conf(GUNICORN_PROFILE="asgi", WEB_CONCURRENCY="3", DB_CONN_MAX_AGE="")
+		self.assertEqual(conf.wsgi_app, "config.asgi:application")
+		self.assertEqual(conf.workers, 3)
+
+	def test_asgi_profile_defaults_to_closing_connections(self):
+		environ = {key: value for key, value in os.environ.items() if key != "DB_CONN_MAX_AGE"}
+		with mock.patch.dict(os.environ, {**environ, "GUNICORN_PROFILE": "asgi"}, clear=True):
+			exec_gunicorn_conf()
+			self.assertEqual(os.environ["DB_CONN_MAX_AGE"], "0")
+
+		with mock.patch.dict(os.environ, {"GUNICORN_PROFILE": "asgi", "DB_CONN_MAX_AGE": "60"}):
+			exec_gunicorn_conf()
+			self.assertEqual(os.environ["DB_CONN_MAX_AGE"], "60")
+
+	def test_unknown_profile_is_refused(self):
+		with self.assertRaisesMessage(RuntimeError, "Unknown GUNICORN_PROFILE 'gevent'"):
+			load_gunicorn_conf(GUNICORN_PROFILE="gevent")
+
+	def test_memory_is_reported_every_n_requests(self):
+		conf = load_gunicorn_conf(GUNICORN_MEMORY_REPORT_EVERY="2")
+		worker = mock.Mock(handled_requests=0, pid=os.getpid())
+
+		for _ in range(5):
+			conf.post_request(worker, None, {}, None)
+
+		self.assertEqual(worker.handled_requests, 5)
+		self.assertEqual(
+			[call.args[1] for call in worker.log.info.call_args_list],
+			["worker after 2 requests", "worker after 4 requests"],
+		)
+
+
+class MemoryTests(SimpleTestCase):
+	def test_readings_come_from_proc(self):
+		rss = rss_bytes()
+		self.assertGreater(rss, 0)
+		if os.path.exists("/proc/self/smaps_rollup"):
+			self.assertTrue(0 < private_bytes() <= rss)
+
+	def test_missing_proc_falls_back(self):
+		with mock.patch("builtins.open", side_effect=FileNotFoundError):
+			self.assertGreater(rss_bytes(), 0)
+			self.assertEqual(private_bytes(), 0)
@@ -2,6 +2,7 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.db import transaction
+from django.db.models import Prefetch
 
 from apps.common.models import Carousel, Section, SectionProduct, MarketplaceProduct
 from apps.common.serializers import (
@@ -34,7 +35,9 @@ class SectionViewSet(viewsets.ModelViewSet):
 	- GET: Anyone can fetch sections
 	- POST/PUT/DELETE: Only admin can create/edit/delete sections
 	"""
-	queryset = Section.objects.filter(is_active=True)
+	queryset = Section.objects.filter(is_active=True).prefetch_related(
+		Prefetch("products", queryset=SectionProduct.objects.select_related("product__card"))
+	)
 	serializer_class = SectionSerializer
 
 	def get_permissions(self):
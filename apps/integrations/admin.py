@@ -1 +1,11 @@
 from django.contrib import admin
+
+from apps.integrations.models import PaymentWebhookEvent
+
+
+@admin.register(PaymentWebhookEvent)
+class PaymentWebhookEventAdmin(admin.ModelAdmin):
+    list_display = ("id", "event_id", "event_type", "status", "received_at", "processed_at")
+    list_filter = ("status", "event_type")
+    search_fields = ("event_id",)
+    readonly_fields = ("event_id", "event_type", "payload", "received_at", "processed_at")
@@ -0,0 +1,141 @@
+"""
+Async HTTP calls to Razorpay and RunPod.
+
+Views served by uvicorn workers await these instead of holding a worker
+thread for the whole round trip, so one process keeps many payment and
+try-on requests in flight.
+
+Behind a WSGI worker an async view runs each request on a short-lived loop
+of its own, so every call opens its own ``httpx.AsyncClient`` and closes it
+(and its sockets) before the loop goes away. ``config.asgi`` calls
+``reuse_clients_per_loop``: a uvicorn worker has a single loop for its
+lifetime, so one client (one connection pool) is kept per loop there and
+connections are reused across requests.
+"""
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+
+import httpx
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+RAZORPAY_API_URL = "https://api.razorpay.com/v1"
+RUNPOD_API_URL = "https://api.runpod.ai/v2"
+RUNPOD_PENDING = {"IN_QUEUE", "IN_PROGRESS"}
+RUNPOD_POLL_SECONDS = 1.0
+# RunPod holds a runsync request open for at most this long before answering IN_PROGRESS.
+RUNPOD_MAX_WAIT_MS = 90_000
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_reuse_clients = False
+
+
+class UpstreamError(APIException):
+	status_code = status.HTTP_502_BAD_GATEWAY
+	default_detail = "The upstream service failed."
+	default_code = "upstream_error"
+
+
+class UpstreamTimeout(APIException):
+	status_code = status.HTTP_504_GATEWAY_TIMEOUT
+	default_detail = "The upstream service did not answer in time."
+	default_code = "upstream_timeout"
+
+
+def reuse_clients_per_loop() -> None:
+	"""Keeps one client per event loop; only for servers whose loops live as long as the process."""
+	global _reuse_clients
+	_reuse_clients = True
+
+
+def _new_client() -> httpx.AsyncClient:
+	return httpx.AsyncClient(
+		timeout=settings.UPSTREAM_TIMEOUT_SECONDS,
+		limits=httpx.Limits(max_connections=settings.UPSTREAM_MAX_CONNECTIONS),
+	)
+
+
+@asynccontextmanager
+async def upstream_client():
+	"""The loop's shared client when clients are reused, else one closed when the block ends."""
+	if not _reuse_clients:
+		async with _new_client() as client:
+			yield client
+		return
+	loop = asyncio.get_running_loop()
+	client = _clients.get(loop)
+	if client is None or client.is_closed:
+		client = _clients[loop] = _new_client()
+	yield client
+
+
+async def _request(client: httpx.AsyncClient, service: str, method: str, url: str, **kwargs) -> dict:
+	try:
+		response = await client.request(method, url, **kwargs)
+	except httpx.TimeoutException:
+		raise UpstreamTimeout(f"{service} did not answer in time.")
+	except httpx.HTTPError:
+		raise UpstreamError(f"Could not reach {service}.")
+	try:
+		body = response.json()
+	except ValueError:
+		body = {}
+	if response.status_code >= 500:
+		raise UpstreamError(f"{service} failed with status {response.status_code}.")
+	if response.status_code >= 400:
+		error = body.get("error") if isinstance(body, dict) else None
+		detail = error.get("description") if isinstance(error, dict) else error
+		raise ValidationError({service.lower(): detail or f"{service} rejected the request."})
+	return body
+
+
+async def create_razorpay_order(payload: dict) -> dict:
+	if not settings.RAZORPAY_KEY_ID or not settings.RAZORPAY_KEY_SECRET:
+		raise ValidationError("Razorpay keys are not configured.")
+	async with upstream_client() as client:
+		return await _request(
+			client,
+			"Razorpay",
+			"POST",
+			f"{RAZORPAY_API_URL}/orders",
+			json=payload,
+			auth=(settings.RAZORPAY_KEY_ID, settings.RAZORPAY_KEY_SECRET),
+		)
+
+
+async def run_runpod_job(endpoint_id: str, payload: dict, timeout: float):
+	"""
+	Runs a RunPod job and returns its output.
+
+	``runsync`` answers as soon as the job finishes or after its own wait
+	limit; a job still queued or running then is polled until ``timeout``
+	seconds have passed since the call.
+	"""
+	loop = asyncio.get_running_loop()
+	deadline = loop.time() + timeout
+	headers = {"Authorization": f"Bearer {settings.RUNPOD_API_KEY}"}
+	wait_ms = min(int(timeout * 1000), RUNPOD_MAX_WAIT_MS)
+	async with upstream_client() as client:
+		job = await _request(
+			client,
+			"RunPod",
+			"POST",
+			f"{RUNPOD_API_URL}/{endpoint_id}/runsync",
+			params={"wait": wait_ms},
+			json=payload,
+			headers=headers,
+			timeout=wait_ms / 1000 + settings.UPSTREAM_TIMEOUT_SECONDS,
+		)
+		while job.get("status") in RUNPOD_PENDING:
+			remaining = deadline - loop.time()
+			if remaining <= 0:
+				raise UpstreamTimeout("The RunPod job did not finish in time.")
+			await asyncio.sleep(min(RUNPOD_POLL_SECONDS, remaining))
+			job = await _request(
+				client, "RunPod", "GET", f"{RUNPOD_API_URL}/{endpoint_id}/status/{job['id']}", headers=headers
+			)
+	if job.get("status") != "COMPLETED":
+		raise ValidationError({"runpod": job.get("error") or f"The job ended with status {job.get('status')}."})
+	return job.get("output")
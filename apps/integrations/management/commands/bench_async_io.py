@@ -0,0 +1,155 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from django.core.management.base import BaseCommand
+
+from apps.common.memory import rss_bytes
+
+RESPONSE = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 11\r\nConnection: close\r\n\r\n{\"ok\":true}"
+
+
+def serve_slow_upstream(port: int, latency: float, ready) -> None:
+	"""A stand-in for Razorpay/RunPod: answers every request after ``latency`` seconds."""
+
+	async def handle(reader, writer):
+		await reader.readuntil(b"\r\n\r\n")
+		await asyncio.sleep(latency)
+		writer.write(RESPONSE)
+		await writer.drain()
+		writer.close()
+
+	async def main():
+		server = await asyncio.start_server(handle, "127.0.0.1", port, backlog=4096)
+		ready.set()
+		async with server:
+			await server.serve_forever()
+
+	asyncio.run(main())
+
+
+class PeakRSS:
+	"""Samples this process's RSS in the background and keeps the highest reading."""
+
+	def __init__(self, interval: float = 0.005):
+		self.interval = interval
+		self.peak = rss_bytes()
+		self._stop = threading.Event()
+		self._thread = threading.Thread(target=self._sample, daemon=True)
+
+	def _sample(self):
+		while not self._stop.wait(self.interval):
+			self.peak = max(self.peak, rss_bytes())
+
+	def __enter__(self):
+		self._thread.start()
+		return self
+
+	def __exit__(self, *exc):
+		self._stop.set()
+		self._thread.join()
+
+
+def run_sync(url: str, requests: int, concurrency: int) -> tuple[int, int]:
+	"""One blocking client per thread, like a gthread worker with ``concurrency`` threads."""
+	local = threading.local()
+	errors = 0
+
+	def call(_):
+		nonlocal errors
+		if not hasattr(local, "client"):
+			local.client = httpx.Client(timeout=30)
+		try:
+			local.client.get(url).raise_for_status()
+		except httpx.HTTPError:
+			errors += 1
+
+	with ThreadPoolExecutor(max_workers=concurrency) as pool:
+		list(pool.map(call, range(requests)))
+	return requests, errors
+
+
+def run_async(url: str, requests: int, concurrency: int) -> tuple[int, int]:
+	"""Coroutines on one event loop sharing a client, like an ASGI worker."""
+
+	async def main():
+		errors = 0
+		gate = asyncio.Semaphore(concurrency)
+		limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=0)
+		async with httpx.AsyncClient(timeout=30, limits=limits) as client:
+
+			async def call():
+				nonlocal errors
+				async with gate:
+					try:
+						(await client.get(url)).raise_for_status()
+					except httpx.HTTPError:
+						errors += 1
+
+			await asyncio.gather(*(call() for _ in range(requests)))
+		return requests, errors
+
+	return asyncio.run(main())
+
+
+def measure(mode: str, url: str, requests: int, concurrency: int, results) -> None:
+	"""Runs one mode in a fresh process so its memory growth is not mixed with the other's."""
+	httpx.Client().close()  # load httpx and ssl before the baseline reading
+	baseline = rss_bytes()
+	runner = run_async if mode == "async" else run_sync
+	started = time.perf_counter()
+	with PeakRSS() as peak:
+		done, errors = runner(url, requests, concurrency)
+	elapsed = time.perf_counter() - started
+	results.put((mode, done, errors, elapsed, baseline, peak.peak))
+
+
+class Command(BaseCommand):
+	help = (
+		"Benchmarks outbound I/O the way the payment and try-on views do it, against a local "
+		"upstream that answers after --latency-ms. Compares blocking calls on a thread pool "
+		"(the sync/gthread worker model) with coroutines on one event loop (the ASGI model) and "
+		"reports throughput and the memory each in-flight request costs."
+	)
+
+	def add_arguments(self, parser):
+		parser.add_argument("--requests", type=int, default=2000)
+		parser.add_argument("--concurrency", type=int, default=200)
+		parser.add_argument("--latency-ms", type=int, default=250)
+		parser.add_argument("--port", type=int, default=8765)
+		parser.add_argument("--mode", choices=["sync", "async", "both"], default="both")
+
+	def handle(self, *args, **options):
+		url = f"http://127.0.0.1:{options['port']}/"
+		ready = multiprocessing.Event()
+		upstream = multiprocessing.Process(
+			target=serve_slow_upstream,
+			args=(options["port"], options["latency_ms"] / 1000, ready),
+			daemon=True,
+		)
+		upstream.start()
+		ready.wait(10)
+		modes = ["sync", "async"] if options["mode"] == "both" else [options["mode"]]
+		try:
+			for mode in modes:
+				results = multiprocessing.Queue()
+				worker = multiprocessing.Process(
+					target=measure, args=(mode, url, options["requests"], options["concurrency"], results)
+				)
+				worker.start()
+				mode, done, errors, elapsed, baseline, peak = results.get()
+				worker.join()
+				growth = max(peak - baseline, 0)
+				self.stdout.write(
+					f"{mode:<6} requests={done} concurrency={options['concurrency']} "
+					f"latency={options['latency_ms']}ms elapsed={elapsed:.3f}s "
+					f"throughput={done / elapsed:,.0f}/s errors={errors} "
+					f"rss_growth={growth / 2**20:.1f}MiB "
+					f"per_in_flight={growth / options['concurrency'] / 1024:.1f}KiB"
+				)
+		finally:
+			upstream.terminate()
+			upstream.join()
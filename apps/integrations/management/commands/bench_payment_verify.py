@@ -0,0 +1,102 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import razorpay
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.integrations.payments import compute_signature, verify_payment_signature
+from apps.orders.models import Order
+
+
+class Command(BaseCommand):
+	help = (
+		"Benchmarks payment signature verification under concurrent callbacks for one order. "
+		"Compares the Razorpay SDK path with the local HMAC path. With --order-id the full "
+		"locked critical section is exercised and rolled back, so no data changes."
+	)
+
+	def add_arguments(self, parser):
+		parser.add_argument("--callbacks", type=int, default=2000)
+		parser.add_argument("--threads", type=int, default=16)
+		parser.add_argument("--order-id", type=int, default=None)
+
+	def handle(self, *args, **options):
+		secret = settings.RAZORPAY_KEY_SECRET or "bench-secret"
+		key_id = settings.RAZORPAY_KEY_ID or "bench-key"
+		razorpay_order_id = "order_bench"
+		order = None
+		if options["order_id"]:
+			order = Order.objects.filter(id=options["order_id"]).first()
+			if order is None:
+				raise CommandError("Order not found.")
+			razorpay_order_id = order.razorpay_order_id or razorpay_order_id
+
+		payment_id = "pay_bench"
+		signature = compute_signature(f"{razorpay_order_id}|{payment_id}", secret)
+		params = {
+			"razorpay_order_id": razorpay_order_id,
+			"razorpay_payment_id": payment_id,
+			"razorpay_signature": signature,
+		}
+
+		def sdk_verify():
+			client = razorpay.Client(auth=(key_id, secret))
+			client.utility.verify_payment_signature(params)
+
+		def local_verify():
+			if not verify_payment_signature(razorpay_order_id, payment_id, signature, secret=secret):
+				raise CommandError("Local signature check failed.")
+
+		def sdk_callback():
+			with transaction.atomic():
+				locked = Order.objects.select_for_update().get(id=order.id)
+				sdk_verify()
+				locked.razorpay_payment_id = payment_id
+				locked.payment_status = Order.PaymentStatus.PAID
+				locked.save(update_fields=["razorpay_payment_id", "payment_status", "updated_at"])
+				transaction.set_rollback(True)
+
+		def local_callback():
+			local_verify()
+			with transaction.atomic():
+				Order.objects.filter(id=order.id).filter(
+					Q(razorpay_order_id="") | Q(razorpay_order_id=razorpay_order_id)
+				).exclude(payment_status=Order.PaymentStatus.PAID).update(
+					razorpay_payment_id=payment_id,
+					payment_status=Order.PaymentStatus.PAID,
+					updated_at=timezone.now(),
+				)
+				transaction.set_rollback(True)
+
+		if order is None:
+			runs = [("sdk", sdk_verify), ("local", local_verify)]
+		else:
+			runs = [("sdk+lock", sdk_callback), ("local+update", local_callback)]
+
+		for label, func in runs:
+			elapsed, errors = self._run(func, options["callbacks"], options["threads"])
+			rate = options["callbacks"] / elapsed if elapsed else 0
+			self.stdout.write(
+				f"{label:<14} callbacks={options['callbacks']} threads={options['threads']} "
+				f"elapsed={elapsed:.3f}s throughput={rate:,.0f}/s errors={errors}"
+			)
+
+	@staticmethod
+	def _run(func, callbacks: int, threads: int) -> tuple[float, int]:
+		errors = 0
+
+		def call(_):
+			nonlocal errors
+			try:
+				func()
+			except Exception:
+				errors += 1
+
+		started = time.perf_counter()
+		with ThreadPoolExecutor(max_workers=threads) as pool:
+			list(pool.map(call, range(callbacks)))
+		return time.perf_counter() - started, errors
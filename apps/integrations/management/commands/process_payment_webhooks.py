@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.integrations.webhooks import process_pending_events
+
+
+class Command(BaseCommand):
+	help = "Applies pending Razorpay webhook events to order payment status in batches."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--batch-size", type=int, default=500)
+		parser.add_argument("--loop", action="store_true", help="Keep polling for new events.")
+		parser.add_argument("--interval", type=float, default=2.0, help="Seconds to sleep when idle.")
+
+	def handle(self, *args, **options):
+		total = 0
+		while True:
+			processed = process_pending_events(batch_size=options["batch_size"])
+			total += processed
+			if processed:
+				continue
+			if not options["loop"]:
+				break
+			time.sleep(options["interval"])
+		self.stdout.write(f"Processed {total} webhook events.")
@@ -1 +1,26 @@
 from django.db import models
+
+
+class PaymentWebhookEvent(models.Model):
+	"""Inbox of verified Razorpay webhook deliveries, applied to orders in batches."""
+
+	class Status(models.TextChoices):
+		PENDING = "pending", "Pending"
+		PROCESSED = "processed", "Processed"
+		IGNORED = "ignored", "Ignored"
+		FAILED = "failed", "Failed"
+
+	event_id = models.CharField(max_length=120, unique=True)
+	event_type = models.CharField(max_length=64)
+	payload = models.JSONField(default=dict)
+	status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+	error = models.TextField(blank=True)
+	received_at = models.DateTimeField(auto_now_add=True)
+	processed_at = models.DateTimeField(null=True, blank=True)
+
+	class Meta:
+		ordering = ["id"]
+		indexes = [models.Index(fields=["status", "id"])]
+
+	def __str__(self) -> str:
+		return f"{self.event_type} ({self.event_id})"
@@ -0,0 +1,39 @@
+import hashlib
+import hmac
+
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+
+
+def _get_key_secret() -> str:
+	if not settings.RAZORPAY_KEY_SECRET:
+		raise ValidationError("Razorpay keys are not configured.")
+	return settings.RAZORPAY_KEY_SECRET
+
+
+def compute_signature(message: str | bytes, secret: str) -> str:
+	if isinstance(message, str):
+		message = message.encode("utf-8")
+	return hmac.new(secret.encode("utf-8"), message, hashlib.sha256).hexdigest()
+
+
+def signature_matches(message: str | bytes, signature: str, secret: str) -> bool:
+	"""Constant-time comparison of a hex HMAC-SHA256 signature."""
+	return hmac.compare_digest(compute_signature(message, secret), str(signature))
+
+
+def verify_payment_signature(
+	razorpay_order_id: str,
+	razorpay_payment_id: str,
+	razorpay_signature: str,
+	secret: str | None = None,
+) -> bool:
+	"""
+	Checks the checkout signature Razorpay returns to the client.
+
+	Equivalent to ``razorpay.Client.utility.verify_payment_signature`` but
+	computed locally, so no gateway client is built and nothing raises.
+	"""
+	secret = secret or _get_key_secret()
+	message = f"{razorpay_order_id}|{razorpay_payment_id}"
+	return signature_matches(message, razorpay_signature, secret)
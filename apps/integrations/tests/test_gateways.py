@@ -0,0 +1,123 @@
+import asyncio
+from unittest import mock
+
+import httpx
+from asgiref.sync import async_to_sync
+from django.test import SimpleTestCase, override_settings
+from rest_framework.exceptions import ValidationError
+
+from apps.integrations import gateways
+
+
+def razorpay(request):
+	return httpx.Response(200, json={"id": "order_1"})
+
+
+@override_settings(RAZORPAY_KEY_ID="rzp_test", RAZORPAY_KEY_SECRET="secret")
+class UpstreamClientTests(SimpleTestCase):
+	def setUp(self):
+		self.clients = []
+		patcher = mock.patch.object(gateways, "_new_client", self.new_client)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+
+	def new_client(self):
+		client = httpx.AsyncClient(transport=httpx.MockTransport(razorpay))
+		self.clients.append(client)
+		return client
+
+	def test_each_call_closes_its_client_on_short_lived_loops(self):
+		for _ in range(2):
+			self.assertEqual(async_to_sync(gateways.create_razorpay_order)({"amount": 100}), {"id": "order_1"})
+
+		self.assertEqual(len(self.clients), 2)
+		self.assertTrue(all(client.is_closed for client in self.clients))
+
+	@mock.patch.object(gateways, "_reuse_clients", True)
+	def test_long_lived_loop_reuses_one_client(self):
+		async def two_calls():
+			await gateways.create_razorpay_order({"amount": 100})
+			await gateways.create_razorpay_order({"amount": 100})
+
+		loop = asyncio.new_event_loop()
+		try:
+			loop.run_until_complete(two_calls())
+			self.assertEqual(len(self.clients), 1)
+			self.assertFalse(self.clients[0].is_closed)
+		finally:
+			loop.run_until_complete(self.clients[0].aclose())
+			loop.close()
+
+
+@override_settings(RAZORPAY_KEY_ID="rzp_test", RAZORPAY_KEY_SECRET="secret", RUNPOD_API_KEY="rp_test")
+class UpstreamResponseTests(SimpleTestCase):
+	def serve(self, handler):
+		"""Routes the gateways' requests to ``handler`` and records them."""
+		self.requests = []
+
+		def record(request):
+			self.requests.append(request)
+			return handler(request)
+
+		patcher = mock.patch.object(
+			gateways, "_new_client", lambda: httpx.AsyncClient(transport=httpx.MockTransport(record))
+		)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+
+	def create_order(self):
+		return async_to_sync(gateways.create_razorpay_order)({"amount": 100})
+
+	def test_server_errors_and_timeouts_map_to_gateway_statuses(self):
+		def timeout(request):
+			raise httpx.ReadTimeout("slow", request=request)
+
+		for handler, expected in [
+			(lambda request: httpx.Response(503), gateways.UpstreamError),
+			(timeout, gateways.UpstreamTimeout),
+		]:
+			with self.subTest(expected=expected.__name__):
+				self.serve(handler)
+				with self.assertRaises(expected):
+					self.create_order()
+
+	def test_client_errors_carry_the_upstream_description(self):
+		self.serve(lambda request: httpx.Response(400, json={"error": {"description": "Amount too small."}}))
+
+		with self.assertRaises(ValidationError) as raised:
+			self.create_order()
+
+		self.assertEqual(raised.exception.detail, {"razorpay": "Amount too small."})
+
+	@mock.patch.object(gateways, "RUNPOD_POLL_SECONDS", 0)
+	def test_runpod_job_is_polled_until_it_completes(self):
+		statuses = iter(["IN_QUEUE", "IN_PROGRESS", "COMPLETED"])
+
+		def runpod(request):
+			state = next(statuses)
+			body = {"id": "job-1", "status": state}
+			if state == "COMPLETED":
+				body["output"] = {"output_image": "aW1n"}
+			return httpx.Response(200, json=body)
+
+		self.serve(runpod)
+
+		output = async_to_sync(gateways.run_runpod_job)("endpoint", {"input": {}}, timeout=5)
+
+		self.assertEqual(output, {"output_image": "aW1n"})
+		self.assertEqual(
+			[(request.method, request.url.path) for request in self.requests],
+			[("POST", "/v2/endpoint/runsync"), ("GET", "/v2/endpoint/status/job-1"), ("GET", "/v2/endpoint/status/job-1")],
+		)
+		self.assertEqual(self.requests[0].headers["Authorization"], "Bearer rp_test")
+
+	@mock.patch.object(gateways, "RUNPOD_POLL_SECONDS", 0)
+	def test_runpod_job_that_outlives_the_timeout_or_fails_is_refused(self):
+		self.serve(lambda request: httpx.Response(200, json={"id": "job-1", "status": "IN_QUEUE"}))
+		with self.assertRaises(gateways.UpstreamTimeout):
+			async_to_sync(gateways.run_runpod_job)("endpoint", {}, timeout=0.05)
+
+		self.serve(lambda request: httpx.Response(200, json={"id": "job-1", "status": "FAILED", "error": "OOM"}))
+		with self.assertRaises(ValidationError) as raised:
+			async_to_sync(gateways.run_runpod_job)("endpoint", {}, timeout=5)
+		self.assertEqual(raised.exception.detail, {"runpod": "OOM"})
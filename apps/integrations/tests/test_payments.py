@@ -0,0 +1,64 @@
+import hashlib
+import hmac
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.common.testing import api_client, make_order, make_seller, make_user
+from apps.integrations.payments import compute_signature, signature_matches, verify_payment_signature
+from apps.orders.models import Order
+
+SECRET = "key-secret"
+
+
+class SignatureTests(SimpleTestCase):
+	def test_matches_razorpay_hmac(self):
+		expected = hmac.new(SECRET.encode(), b"order_1|pay_1", hashlib.sha256).hexdigest()
+
+		self.assertEqual(compute_signature("order_1|pay_1", SECRET), expected)
+		self.assertTrue(verify_payment_signature("order_1", "pay_1", expected, secret=SECRET))
+
+	def test_rejects_tampered_ids_and_signatures(self):
+		signature = compute_signature("order_1|pay_1", SECRET)
+
+		self.assertFalse(verify_payment_signature("order_1", "pay_2", signature, secret=SECRET))
+		self.assertFalse(verify_payment_signature("order_1", "pay_1", signature[:-1] + "0", secret=SECRET))
+		self.assertFalse(signature_matches(b"order_1|pay_1", None, SECRET))
+
+
+@override_settings(RAZORPAY_KEY_ID="rzp_test", RAZORPAY_KEY_SECRET=SECRET)
+class VerifyPaymentViewTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.order = make_order(self.customer, make_seller(), razorpay_order_id="order_1")
+
+	def verify(self, signature, payment_id="pay_1", user=None):
+		return api_client(user or self.customer).post(
+			"/api/secure/verify-payment/",
+			{
+				"order_id": self.order.id,
+				"razorpay_order_id": "order_1",
+				"razorpay_payment_id": payment_id,
+				"razorpay_signature": signature,
+			},
+			format="json",
+		)
+
+	def test_valid_signature_marks_the_order_paid(self):
+		response = self.verify(compute_signature("order_1|pay_1", SECRET))
+
+		self.assertEqual(response.status_code, 200)
+		self.order.refresh_from_db()
+		self.assertEqual(self.order.payment_status, Order.PaymentStatus.PAID)
+		self.assertEqual(self.order.razorpay_payment_id, "pay_1")
+
+	def test_bad_signature_leaves_the_order_unpaid(self):
+		response = self.verify(compute_signature("order_1|pay_1", "other-secret"))
+
+		self.assertEqual(response.status_code, 400)
+		self.order.refresh_from_db()
+		self.assertEqual(self.order.payment_status, Order.PaymentStatus.UNPAID)
+
+	def test_only_the_customer_can_verify(self):
+		response = self.verify(compute_signature("order_1|pay_1", SECRET), user=make_user("other@example.com"))
+
+		self.assertEqual(response.status_code, 403)
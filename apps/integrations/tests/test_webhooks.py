@@ -0,0 +1,129 @@
+import json
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+
+from apps.common.testing import api_client, make_order, make_seller, make_user
+from apps.integrations.models import PaymentWebhookEvent
+from apps.integrations.payments import compute_signature
+from apps.integrations.webhooks import process_pending_events
+from apps.orders.models import Order
+from apps.wallet.ledger import get_balance
+from apps.wallet.services import get_or_create_wallet, settle_delivered_orders
+
+WEBHOOK_SECRET = "webhook-secret"
+Status = PaymentWebhookEvent.Status
+
+
+def refund_event(event_id, refund_id, payment_id, paise):
+	return PaymentWebhookEvent.objects.create(
+		event_id=event_id,
+		event_type="refund.processed",
+		payload={"payload": {"refund": {"entity": {"id": refund_id, "payment_id": payment_id, "amount": paise}}}},
+	)
+
+
+@override_settings(RAZORPAY_WEBHOOK_SECRET=WEBHOOK_SECRET)
+class WebhookInboxTests(TestCase):
+	def deliver(self, payload, event_id="evt_1", secret=WEBHOOK_SECRET):
+		body = json.dumps(payload).encode()
+		return api_client().generic(
+			"POST",
+			"/api/secure/webhooks/razorpay/",
+			body,
+			content_type="application/json",
+			HTTP_X_RAZORPAY_SIGNATURE=compute_signature(body, secret),
+			HTTP_X_RAZORPAY_EVENT_ID=event_id,
+		)
+
+	def test_redelivered_event_is_stored_once(self):
+		payload = {"event": "payment.captured", "payload": {}}
+
+		self.assertEqual(self.deliver(payload).status_code, 200)
+		self.assertEqual(self.deliver(payload).status_code, 200)
+
+		self.assertEqual(PaymentWebhookEvent.objects.count(), 1)
+
+	def test_bad_signature_is_refused(self):
+		response = self.deliver({"event": "payment.captured"}, secret="other")
+
+		self.assertEqual(response.status_code, 403)
+		self.assertFalse(PaymentWebhookEvent.objects.exists())
+
+
+@override_settings(PLATFORM_COMMISSION_PERCENT="10")
+class ProcessEventsTests(TestCase):
+	def setUp(self):
+		self.seller = make_seller()
+		self.customer = make_user("customer@example.com")
+
+	def paid_order(self, total="1000.00", **fields):
+		return make_order(
+			self.customer,
+			self.seller,
+			total,
+			payment_status=Order.PaymentStatus.PAID,
+			razorpay_payment_id="pay_1",
+			**fields,
+		)
+
+	def test_capture_marks_the_order_paid(self):
+		order = make_order(self.customer, self.seller, razorpay_order_id="order_1")
+		PaymentWebhookEvent.objects.create(
+			event_id="evt_1",
+			event_type="payment.captured",
+			payload={"payload": {"payment": {"entity": {"id": "pay_9", "order_id": "order_1"}}}},
+		)
+
+		process_pending_events()
+
+		order.refresh_from_db()
+		self.assertEqual((order.payment_status, order.razorpay_payment_id), (Order.PaymentStatus.PAID, "pay_9"))
+		self.assertEqual(PaymentWebhookEvent.objects.get().status, Status.PROCESSED)
+
+	def test_partial_refund_keeps_the_order_paid(self):
+		order = self.paid_order()
+		refund_event("evt_1", "rfnd_1", "pay_1", 30000)
+		refund_event("evt_2", "rfnd_1", "pay_1", 30000)
+
+		process_pending_events()
+
+		order.refresh_from_db()
+		self.assertEqual(order.amount_refunded, Decimal("300.00"))
+		self.assertEqual(order.payment_status, Order.PaymentStatus.PAID)
+
+	def test_refunds_are_capped_at_the_order_total(self):
+		order = self.paid_order()
+		refund_event("evt_1", "rfnd_1", "pay_1", 80000)
+		process_pending_events()
+		refund_event("evt_2", "rfnd_2", "pay_1", 80000)
+		process_pending_events()
+
+		order.refresh_from_db()
+		self.assertEqual(order.amount_refunded, Decimal("1000.00"))
+		self.assertEqual(order.payment_status, Order.PaymentStatus.REFUNDED)
+
+	def test_refunds_after_settlement_take_the_sellers_share_back(self):
+		self.paid_order(status=Order.Status.DELIVERED)
+		settle_delivered_orders()
+		wallet = get_or_create_wallet(self.seller)
+		self.assertEqual(get_balance(wallet), Decimal("900.00"))
+
+		refund_event("evt_1", "rfnd_1", "pay_1", 30000)
+		process_pending_events()
+		self.assertEqual(get_balance(wallet), Decimal("630.00"))
+
+		refund_event("evt_2", "rfnd_2", "pay_1", 70000)
+		process_pending_events()
+		self.assertEqual(get_balance(wallet), Decimal("0.00"))
+
+	def test_unknown_and_malformed_events_are_set_aside(self):
+		PaymentWebhookEvent.objects.create(event_id="evt_1", event_type="order.paid", payload={})
+		PaymentWebhookEvent.objects.create(event_id="evt_2", event_type="refund.processed", payload={})
+
+		process_pending_events()
+
+		self.assertEqual(
+			dict(PaymentWebhookEvent.objects.values_list("event_id", "status")),
+			{"evt_1": Status.IGNORED, "evt_2": Status.FAILED},
+		)
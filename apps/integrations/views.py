@@ -1,11 +1,13 @@
 import base64
+import hashlib
+import json
 from io import BytesIO
 
-import razorpay
-import runpod
+from adrf.views import APIView as AsyncAPIView
 from django.conf import settings
-from django.db import transaction
+from django.db.models import Q
 from django.http import FileResponse
+from django.utils import timezone
 from drf_spectacular.utils import extend_schema, OpenApiExample
 from rest_framework import permissions, serializers
 from rest_framework.exceptions import PermissionDenied, ValidationError
@@ -13,6 +15,10 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from apps.accounts.models import User
+from apps.common.idempotency import idempotent
+from apps.integrations.gateways import create_razorpay_order, run_runpod_job
+from apps.integrations.models import PaymentWebhookEvent
+from apps.integrations.payments import signature_matches, verify_payment_signature
 from apps.integrations.serializers import (
 	MakePaymentSerializer,
 	MakePaymentResponseSerializer,
@@ -22,12 +28,7 @@ from apps.integrations.serializers import (
 	VTONTryOnResponseSerializer,
 )
 from apps.orders.models import Order
-
-
-def _get_razorpay_client():
-	if not settings.RAZORPAY_KEY_ID or not settings.RAZORPAY_KEY_SECRET:
-		raise ValidationError("Razorpay keys are not configured.")
-	return razorpay.Client(auth=(settings.RAZORPAY_KEY_ID, settings.RAZORPAY_KEY_SECRET))
+from apps.orders.signals import orders_updated
 
 
 def _file_to_base64(file_obj) -> str:
@@ -35,7 +36,8 @@ def _file_to_base64(file_obj) -> str:
 	return base64.b64encode(file_obj.read()).decode("utf-8")
 
 
-class MakePaymentView(APIView):
+class MakePaymentView(AsyncAPIView):
+	"""Async so a uvicorn worker keeps serving while Razorpay creates the order."""
 	permission_classes = [permissions.IsAuthenticated]
 
 	@extend_schema(
@@ -44,11 +46,12 @@ class MakePaymentView(APIView):
 		summary="Create Razorpay payment order",
 		description="Creates a Razorpay payment order for the specified order ID",
 	)
-	def post(self, request, *args, **kwargs):
+	@idempotent("integrations.make_payment")
+	async def post(self, request, *args, **kwargs):
 		serializer = MakePaymentSerializer(data=request.data)
 		serializer.is_valid(raise_exception=True)
 
-		order = Order.objects.filter(id=serializer.validated_data["order_id"]).first()
+		order = await Order.objects.filter(id=serializer.validated_data["order_id"]).afirst()
 		if order is None:
 			raise ValidationError({"order_id": "Order not found."})
 
@@ -57,12 +60,11 @@ class MakePaymentView(APIView):
 		if order.payment_status == Order.PaymentStatus.PAID:
 			raise ValidationError("Order is already paid.")
 
-		client = _get_razorpay_client()
 		amount_paise = int(order.total * 100)
 		if amount_paise <= 0:
 			raise ValidationError("Order total must be greater than 0.")
 
-		rzp_order = client.order.create(
+		rzp_order = await create_razorpay_order(
 			{
 				"amount": amount_paise,
 				"currency": order.currency,
@@ -75,7 +77,7 @@ class MakePaymentView(APIView):
 		)
 
 		order.razorpay_order_id = rzp_order.get("id", "")
-		order.save(update_fields=["razorpay_order_id", "updated_at"])
+		await order.asave(update_fields=["razorpay_order_id", "updated_at"])
 
 		return Response(
 			{
@@ -89,7 +91,7 @@ class MakePaymentView(APIView):
 		)
 
 
-class VerifyPaymentView(APIView):
+class VerifyPaymentView(AsyncAPIView):
 	permission_classes = [permissions.IsAuthenticated]
 
 	@extend_schema(
@@ -98,66 +100,102 @@ class VerifyPaymentView(APIView):
 		summary="Verify Razorpay payment",
 		description="Verifies Razorpay payment signature and updates order payment status",
 	)
-	@transaction.atomic
-	def post(self, request, *args, **kwargs):
+	async def post(self, request, *args, **kwargs):
 		serializer = VerifyPaymentSerializer(data=request.data)
 		serializer.is_valid(raise_exception=True)
 		payload = serializer.validated_data
 
-		order = Order.objects.select_for_update().filter(id=payload["order_id"]).first()
+		order = await Order.objects.filter(id=payload["order_id"]).afirst()
 		if order is None:
 			raise ValidationError({"order_id": "Order not found."})
 
 		if order.customer_id != request.user.id and request.user.role != User.Role.ADMIN:
 			raise PermissionDenied("You can only verify payment for your own order.")
 		if order.payment_status == Order.PaymentStatus.PAID:
-			return Response(
-				{
-					"order_id": order.id,
-					"payment_status": order.payment_status,
-					"razorpay_order_id": order.razorpay_order_id,
-					"razorpay_payment_id": order.razorpay_payment_id,
-				}
-			)
+			return Response(self._payment_response(order))
 
 		razorpay_order_id = payload["razorpay_order_id"]
 		if order.razorpay_order_id and razorpay_order_id != order.razorpay_order_id:
 			raise ValidationError("Razorpay order id mismatch.")
 
-		client = _get_razorpay_client()
-		client.utility.verify_payment_signature(
-			{
-				"razorpay_order_id": razorpay_order_id,
-				"razorpay_payment_id": payload["razorpay_payment_id"],
-				"razorpay_signature": payload["razorpay_signature"],
-			}
+		# Verified before touching the row so the only locked work is the UPDATE below.
+		if not verify_payment_signature(
+			razorpay_order_id,
+			payload["razorpay_payment_id"],
+			payload["razorpay_signature"],
+		):
+			raise ValidationError("Razorpay signature verification failed.")
+
+		updated = await (
+			Order.objects.filter(id=order.id)
+			.filter(Q(razorpay_order_id="") | Q(razorpay_order_id=razorpay_order_id))
+			.exclude(payment_status=Order.PaymentStatus.PAID)
+			.aupdate(
+				razorpay_order_id=razorpay_order_id,
+				razorpay_payment_id=payload["razorpay_payment_id"],
+				razorpay_signature=payload["razorpay_signature"],
+				payment_status=Order.PaymentStatus.PAID,
+				updated_at=timezone.now(),
+			)
 		)
+		if updated:
+			await orders_updated.asend(sender=Order, order_ids=[order.id], fields=["payment_status"])
+		await order.arefresh_from_db()
+		if not updated and order.payment_status != Order.PaymentStatus.PAID:
+			raise ValidationError("Razorpay order id mismatch.")
 
-		order.razorpay_order_id = razorpay_order_id
-		order.razorpay_payment_id = payload["razorpay_payment_id"]
-		order.razorpay_signature = payload["razorpay_signature"]
-		order.payment_status = Order.PaymentStatus.PAID
-		order.save(
-			update_fields=[
-				"razorpay_order_id",
-				"razorpay_payment_id",
-				"razorpay_signature",
-				"payment_status",
-				"updated_at",
-			]
-		)
+		return Response(self._payment_response(order))
 
-		return Response(
-			{
-				"order_id": order.id,
-				"payment_status": order.payment_status,
-				"razorpay_order_id": order.razorpay_order_id,
-				"razorpay_payment_id": order.razorpay_payment_id,
-			}
+	@staticmethod
+	def _payment_response(order: Order) -> dict:
+		return {
+			"order_id": order.id,
+			"payment_status": order.payment_status,
+			"razorpay_order_id": order.razorpay_order_id,
+			"razorpay_payment_id": order.razorpay_payment_id,
+		}
+
+
+class RazorpayWebhookView(APIView):
+	authentication_classes = []
+	permission_classes = [permissions.AllowAny]
+
+	@extend_schema(
+		request=None,
+		responses={200: None},
+		summary="Razorpay webhook",
+		description="Verifies the webhook signature and queues the event for batched processing.",
+	)
+	def post(self, request, *args, **kwargs):
+		if not settings.RAZORPAY_WEBHOOK_SECRET:
+			raise ValidationError("Razorpay webhook secret is not configured.")
+
+		body = request.body
+		signature = request.headers.get("X-Razorpay-Signature", "")
+		if not signature or not signature_matches(body, signature, settings.RAZORPAY_WEBHOOK_SECRET):
+			raise PermissionDenied("Invalid webhook signature.")
+
+		try:
+			payload = json.loads(body)
+		except ValueError:
+			raise ValidationError("Webhook body is not valid JSON.")
+
+		event_id = request.headers.get("X-Razorpay-Event-Id") or hashlib.sha256(body).hexdigest()
+		PaymentWebhookEvent.objects.bulk_create(
+			[
+				PaymentWebhookEvent(
+					event_id=event_id,
+					event_type=str(payload.get("event", "")),
+					payload=payload,
+				)
+			],
+			ignore_conflicts=True,
 		)
+		return Response({"status": "accepted"}, status=200)
 
 
-class VTONTryOnView(APIView):
+class VTONTryOnView(AsyncAPIView):
+	"""Async: a try-on job can take minutes, which would otherwise pin a worker thread."""
 	permission_classes = [permissions.IsAuthenticated]
 
 	@extend_schema(
@@ -185,16 +223,13 @@ class VTONTryOnView(APIView):
 			),
 		],
 	)
-	def post(self, request, *args, **kwargs):
+	async def post(self, request, *args, **kwargs):
 		serializer = VTONTryOnSerializer(data=request.data)
 		serializer.is_valid(raise_exception=True)
 
 		if not settings.RUNPOD_API_KEY or not settings.RUNPOD_VTON_ENDPOINT_ID:
 			raise ValidationError("RunPod VTON settings are not configured.")
 
-		runpod.api_key = settings.RUNPOD_API_KEY
-		endpoint = runpod.Endpoint(settings.RUNPOD_VTON_ENDPOINT_ID)
-
 		payload = {
 			"input": {
 				"person_image": _file_to_base64(serializer.validated_data["person_image"]),
@@ -203,7 +238,9 @@ class VTONTryOnView(APIView):
 			}
 		}
 
-		response = endpoint.run_sync(payload, timeout=serializer.validated_data["timeout"])
+		response = await run_runpod_job(
+			settings.RUNPOD_VTON_ENDPOINT_ID, payload, timeout=serializer.validated_data["timeout"]
+		)
 
 		if not isinstance(response, dict):
 			raise ValidationError("Unexpected RunPod response format.")
@@ -0,0 +1,115 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.integrations.models import PaymentWebhookEvent
+from apps.orders.models import Order
+from apps.orders.signals import orders_updated
+from apps.wallet.services import reverse_refunded_settlements
+
+PAYMENT_CAPTURED = "payment.captured"
+REFUND_PROCESSED = "refund.processed"
+
+
+def _entity(payload: dict, name: str) -> dict:
+	return ((payload.get("payload") or {}).get(name) or {}).get("entity") or {}
+
+
+@transaction.atomic
+def process_pending_events(batch_size: int = 500) -> int:
+	"""
+	Applies one batch of pending webhook events to orders.
+
+	Events are folded in memory first (captures, then refunds), so each batch
+	costs one SELECT and one bulk UPDATE on orders no matter how many
+	callbacks arrived for the same order. Refund amounts accumulate in
+	``amount_refunded``; the order becomes REFUNDED only once they cover its
+	total, and refunds on settled orders debit the seller's share back.
+	"""
+	events = list(
+		PaymentWebhookEvent.objects.select_for_update(skip_locked=True)
+		.filter(status=PaymentWebhookEvent.Status.PENDING)
+		.order_by("id")[:batch_size]
+	)
+	if not events:
+		return 0
+
+	captured: dict[str, str] = {}
+	refunds: dict[str, dict[str, int]] = defaultdict(dict)
+	applied, ignored, failed = [], [], {}
+	for event in events:
+		if event.event_type == PAYMENT_CAPTURED:
+			payment = _entity(event.payload, "payment")
+			if not payment.get("id") or not payment.get("order_id"):
+				failed[event.id] = "Payment entity is missing id or order_id."
+				continue
+			captured[payment["order_id"]] = payment["id"]
+			applied.append(event.id)
+		elif event.event_type == REFUND_PROCESSED:
+			refund = _entity(event.payload, "refund")
+			if not refund.get("id") or not refund.get("payment_id") or not isinstance(refund.get("amount"), int):
+				failed[event.id] = "Refund entity is missing id, payment_id or amount."
+				continue
+			refunds[refund["payment_id"]][refund["id"]] = refund["amount"]
+			applied.append(event.id)
+		else:
+			ignored.append(event.id)
+
+	now = timezone.now()
+	if captured or refunds:
+		orders = (
+			Order.objects.select_for_update()
+			.filter(Q(razorpay_order_id__in=captured) | Q(razorpay_payment_id__in=refunds))
+			.only(
+				"id",
+				"seller_id",
+				"total",
+				"payment_status",
+				"razorpay_order_id",
+				"razorpay_payment_id",
+				"amount_refunded",
+				"seller_settlement_credited",
+				"seller_settlement_amount",
+			)
+		)
+		changed, reversals = [], []
+		for order in orders:
+			before = (order.payment_status, order.razorpay_payment_id, order.amount_refunded)
+			payment_id = captured.get(order.razorpay_order_id)
+			if payment_id and order.payment_status not in {
+				Order.PaymentStatus.PAID,
+				Order.PaymentStatus.REFUNDED,
+			}:
+				order.payment_status = Order.PaymentStatus.PAID
+				order.razorpay_payment_id = payment_id
+			if order.razorpay_payment_id in refunds:
+				refunded = Decimal(sum(refunds[order.razorpay_payment_id].values())) / 100
+				order.amount_refunded = min(order.amount_refunded + refunded, order.total)
+				# A partial refund leaves the order paid; only the refunded amount is recorded.
+				if order.amount_refunded >= order.total:
+					order.payment_status = Order.PaymentStatus.REFUNDED
+				if order.seller_settlement_credited:
+					reversals.append((order, order.amount_refunded - before[2]))
+			if (order.payment_status, order.razorpay_payment_id, order.amount_refunded) != before:
+				order.updated_at = now
+				changed.append(order)
+		fields = ["payment_status", "razorpay_payment_id", "amount_refunded", "updated_at"]
+		Order.objects.bulk_update(changed, fields)
+		if changed:
+			orders_updated.send(sender=Order, order_ids=[order.id for order in changed], fields=fields)
+		reverse_refunded_settlements(reversals)
+
+	PaymentWebhookEvent.objects.filter(id__in=applied).update(
+		status=PaymentWebhookEvent.Status.PROCESSED, processed_at=now
+	)
+	PaymentWebhookEvent.objects.filter(id__in=ignored).update(
+		status=PaymentWebhookEvent.Status.IGNORED, processed_at=now
+	)
+	for event_id, error in failed.items():
+		PaymentWebhookEvent.objects.filter(id=event_id).update(
+			status=PaymentWebhookEvent.Status.FAILED, error=error, processed_at=now
+		)
+	return len(events)
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from apps.orders.models import CustomizationRequest, Order, OrderItem
+from apps.orders.models import CustomizationRequest, Order, OrderItem, SellerProductDailyStat
 
 
 class OrderItemInline(admin.TabularInline):
@@ -19,8 +19,9 @@ class OrderAdmin(admin.ModelAdmin):
 
 @admin.register(OrderItem)
 class OrderItemAdmin(admin.ModelAdmin):
-    list_display = ("id", "order", "product", "variant", "quantity", "line_total")
-    search_fields = ("order__id", "product__name", "variant__name")
+    list_display = ("id", "order", "product", "variant", "quantity", "line_total", "rental_end", "returned_at")
+    list_filter = ("penalty_finalized",)
+    search_fields = ("order__id", "product__name", "variant__sku")
 
 
 @admin.register(CustomizationRequest)
@@ -28,3 +29,9 @@ class CustomizationRequestAdmin(admin.ModelAdmin):
     list_display = ("id", "product", "customer", "status", "quote_price", "created_at")
     list_filter = ("status",)
     search_fields = ("product__name", "customer__email", "seller__email")
+
+
+@admin.register(SellerProductDailyStat)
+class SellerProductDailyStatAdmin(admin.ModelAdmin):
+    list_display = ("date", "seller", "product", "orders_count", "units", "revenue")
+    list_select_related = ("seller", "product")
@@ -0,0 +1,161 @@
+"""
+Per-seller, per-day, per-product sales rollups.
+
+A (day, seller) slice is recomputed from that day's paid orders whenever one
+of them changes, so the analytics endpoint only reads
+``SellerProductDailyStat`` rows and never scans ``Order`` or ``OrderItem``.
+Orders are bucketed by the day they were placed.
+"""
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, DateField, DecimalField, F, Sum, Value
+from django.db.models.functions import Coalesce, Trunc
+from django.utils import timezone
+
+from apps.common.dates import day_bounds
+from apps.orders.models import Order, OrderItem, SellerProductDailyStat
+
+ZERO = Decimal("0.00")
+MONEY = DecimalField(max_digits=14, decimal_places=2)
+BUCKETS = ("day", "week", "month")
+
+
+def refresh_seller_day(day: date, seller_ids=None) -> int:
+	"""Rebuilds the rows for ``day``, limited to ``seller_ids`` when given. Returns the number of rows written."""
+	start, end = day_bounds(day)
+	items = OrderItem.objects.filter(
+		order__created_at__gte=start,
+		order__created_at__lt=end,
+		order__payment_status=Order.PaymentStatus.PAID,
+	)
+	existing = SellerProductDailyStat.objects.filter(date=day)
+	if seller_ids is not None:
+		items = items.filter(order__seller_id__in=seller_ids)
+		existing = existing.filter(seller_id__in=seller_ids)
+	rows = [
+		SellerProductDailyStat(
+			seller_id=row["order__seller_id"],
+			product_id=row["product_id"],
+			date=day,
+			orders_count=row["orders_count"],
+			units=row["units"] or 0,
+			revenue=row["revenue"],
+		)
+		for row in items.values("order__seller_id", "product_id")
+		.annotate(
+			orders_count=Count("order_id", distinct=True),
+			units=Sum("quantity"),
+			revenue=Coalesce(Sum("line_total", output_field=MONEY), Value(ZERO), output_field=MONEY),
+		)
+		.order_by()
+	]
+	# Upsert, then drop the pairs that no longer sold: concurrent refreshes of one
+	# (seller, day) each leave a consistent slice instead of racing on the unique key.
+	kept = {(row.seller_id, row.product_id) for row in rows}
+	with transaction.atomic():
+		SellerProductDailyStat.objects.bulk_create(
+			rows,
+			update_conflicts=True,
+			unique_fields=["seller", "date", "product"],
+			update_fields=["orders_count", "units", "revenue"],
+		)
+		stale = [
+			row_id
+			for row_id, seller_id, product_id in existing.values_list("id", "seller_id", "product_id")
+			if (seller_id, product_id) not in kept
+		]
+		if stale:
+			SellerProductDailyStat.objects.filter(id__in=stale).delete()
+	return len(rows)
+
+
+def refresh_on_commit(orders) -> None:
+	"""Schedules one refresh per affected day for ``(seller_id, created_at)`` pairs once the transaction commits."""
+	sellers_by_day = defaultdict(set)
+	for seller_id, created_at in orders:
+		sellers_by_day[timezone.localdate(created_at)].add(seller_id)
+	for day, seller_ids in sorted(sellers_by_day.items()):
+		transaction.on_commit(lambda day=day, seller_ids=seller_ids: refresh_seller_day(day, seller_ids))
+
+
+def rebuild(date_from: date | None = None, date_to: date | None = None, seller_ids=None) -> int:
+	"""Rebuilds the rollups one day at a time so each pass touches a bounded slice of orders."""
+	orders = Order.objects.order_by()
+	if date_from:
+		orders = orders.filter(created_at__gte=day_bounds(date_from)[0])
+	if date_to:
+		orders = orders.filter(created_at__lt=day_bounds(date_to)[1])
+	if seller_ids is not None:
+		orders = orders.filter(seller_id__in=seller_ids)
+	days = [value.date() for value in orders.datetimes("created_at", "day")]
+
+	stale = SellerProductDailyStat.objects.exclude(date__in=days)
+	if date_from:
+		stale = stale.filter(date__gte=date_from)
+	if date_to:
+		stale = stale.filter(date__lte=date_to)
+	if seller_ids is not None:
+		stale = stale.filter(seller_id__in=seller_ids)
+	stale.delete()
+
+	for day in days:
+		refresh_seller_day(day, seller_ids)
+	return len(days)
+
+
+def _period_start(day: date, bucket: str) -> date:
+	if bucket == "week":
+		return day - timedelta(days=day.weekday())
+	if bucket == "month":
+		return day.replace(day=1)
+	return day
+
+
+def _next_period(start: date, bucket: str) -> date:
+	if bucket == "week":
+		return start + timedelta(days=7)
+	if bucket == "month":
+		return (start + timedelta(days=32)).replace(day=1)
+	return start + timedelta(days=1)
+
+
+def sales_summary(seller_id: int, date_from: date, date_to: date, bucket: str = "day", top: int = 5) -> dict:
+	"""
+	Reads revenue and units for one seller from the rollups.
+
+	Cost depends on the number of days and products in the range, not on how
+	many orders the seller has. Periods without sales are returned as zeros;
+	weeks start on Monday.
+	"""
+	stats = SellerProductDailyStat.objects.filter(seller_id=seller_id, date__gte=date_from, date__lte=date_to).order_by()
+	money = Coalesce(Sum("revenue", output_field=MONEY), Value(ZERO), output_field=MONEY)
+	period = F("date") if bucket == "day" else Trunc("date", bucket, output_field=DateField())
+	by_period = {
+		row["period"]: row
+		for row in stats.annotate(period=period).values("period").annotate(revenue=money, units=Sum("units"))
+	}
+
+	series = []
+	start = _period_start(date_from, bucket)
+	while start <= date_to:
+		row = by_period.get(start, {})
+		series.append({"period": start, "revenue": row.get("revenue", ZERO), "units": row.get("units") or 0})
+		start = _next_period(start, bucket)
+
+	top_products = (
+		stats.values("product_id", product_name=F("product__name"))
+		.annotate(revenue=money, units=Sum("units"), orders_count=Sum("orders_count"))
+		.order_by("-revenue", "product_id")[:top]
+	)
+	return {
+		"bucket": bucket,
+		"date_from": date_from,
+		"date_to": date_to,
+		"revenue": sum((row["revenue"] for row in series), ZERO),
+		"units": sum(row["units"] for row in series),
+		"series": series,
+		"top_products": list(top_products),
+	}
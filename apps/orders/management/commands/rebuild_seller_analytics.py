@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from apps.orders.analytics import rebuild
+
+
+class Command(BaseCommand):
+	help = (
+		"Rebuilds the per-seller, per-day, per-product sales rollups from historical orders, "
+		"one day of orders at a time."
+	)
+
+	def add_arguments(self, parser):
+		parser.add_argument("--from", dest="date_from", default=None, help="First day to rebuild (YYYY-MM-DD).")
+		parser.add_argument("--to", dest="date_to", default=None, help="Last day to rebuild (YYYY-MM-DD).")
+		parser.add_argument("--seller", type=int, action="append", default=None, help="Limit to a seller id (repeatable).")
+
+	def handle(self, *args, **options):
+		date_from = self._parse(options["date_from"], "--from")
+		date_to = self._parse(options["date_to"], "--to")
+		days = rebuild(date_from, date_to, seller_ids=options["seller"])
+		self.stdout.write(f"Rebuilt seller analytics for {days} days.")
+
+	@staticmethod
+	def _parse(value, option):
+		if value is None:
+			return None
+		day = parse_date(value)
+		if day is None:
+			raise CommandError(f"{option} must be YYYY-MM-DD.")
+		return day
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.11 on 2026-10-19 18:28
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_refunded(apps, schema_editor):
+    Order = apps.get_model("orders", "Order")
+    Order.objects.filter(payment_status="refunded").update(amount_refunded=F("total"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0006_admin_list_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='amount_refunded',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.RunPython(backfill_refunded, migrations.RunPython.noop),
+    ]
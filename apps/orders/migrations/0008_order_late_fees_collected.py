@@ -0,0 +1,26 @@
+# Generated by Django 5.2.11 on 2026-10-19 18:34
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_collected(apps, schema_editor):
+    # Penalties assessed so far were already credited to sellers; treat them as collected.
+    Order = apps.get_model("orders", "Order")
+    Order.objects.filter(late_fees__gt=0).update(late_fees_collected=F("late_fees"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0007_order_amount_refunded'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='late_fees_collected',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.RunPython(backfill_collected, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,7 @@
 from django.db import models
 
 from apps.accounts.models import User
-from apps.catalog.models import Product, ProductVariant
+from apps.catalog.models import Product, ProductVariant, RentalBooking
 
 
 class Order(models.Model):
@@ -31,6 +31,12 @@ class Order(models.Model):
 	total = models.DecimalField(max_digits=10, decimal_places=2, default=0)
 	seller_settlement_credited = models.BooleanField(default=False)
 	seller_settlement_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+	# Sum of processed Razorpay refunds; the order is REFUNDED once this reaches ``total``.
+	amount_refunded = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+	# Late-return penalties assessed so far on rental items; billed on top of ``total``.
+	late_fees = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+	# The part of ``late_fees`` collected from the customer and credited to the seller.
+	late_fees_collected = models.DecimalField(max_digits=10, decimal_places=2, default=0)
 	currency = models.CharField(max_length=3, default="INR")
 	customer_note = models.TextField(blank=True)
 	shipping_name = models.CharField(max_length=150)
@@ -46,6 +52,13 @@ class Order(models.Model):
 
 	class Meta:
 		ordering = ["-created_at"]
+		indexes = [
+			models.Index(fields=["created_at"]),
+			# Admin order filters, each served newest first.
+			models.Index(fields=["status", "-created_at", "-id"]),
+			models.Index(fields=["seller", "-created_at", "-id"]),
+			models.Index(fields=["customer", "-created_at", "-id"]),
+		]
 
 	def __str__(self) -> str:
 		return f"Order {self.id}"
@@ -59,6 +72,26 @@ class OrderItem(models.Model):
 	price_snapshot = models.DecimalField(max_digits=10, decimal_places=2)
 	line_total = models.DecimalField(max_digits=10, decimal_places=2)
 
+	# Rental lines: price_snapshot is the price per day and line_total covers
+	# rental_days plus the damage protection fee.
+	rental_start = models.DateField(null=True, blank=True)
+	rental_end = models.DateField(null=True, blank=True)
+	rental_days = models.PositiveIntegerField(null=True, blank=True)
+	rental_booking = models.OneToOneField(
+		RentalBooking, on_delete=models.SET_NULL, null=True, blank=True, related_name="order_item"
+	)
+	damage_protection_fee = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+	late_penalty_per_day = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+	returned_at = models.DateTimeField(null=True, blank=True)
+	penalty_days = models.PositiveIntegerField(default=0)
+	penalty_amount = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+	penalty_assessed_on = models.DateField(null=True, blank=True)
+	# Set once the item is back and its penalty can no longer grow.
+	penalty_finalized = models.BooleanField(default=False)
+
+	class Meta:
+		indexes = [models.Index(fields=["penalty_finalized", "rental_end"])]
+
 	def __str__(self) -> str:
 		return f"{self.product_id} x {self.quantity}"
 
@@ -90,3 +123,22 @@ class CustomizationRequest(models.Model):
 
 	def __str__(self) -> str:
 		return f"Customization {self.id}"
+
+
+class SellerProductDailyStat(models.Model):
+	"""Paid sales of one product on one day (in TIME_ZONE), rebuilt by ``apps.orders.analytics``."""
+
+	seller = models.ForeignKey(User, on_delete=models.CASCADE, related_name="product_daily_stats")
+	product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="daily_stats")
+	date = models.DateField()
+	orders_count = models.PositiveIntegerField(default=0)
+	units = models.PositiveIntegerField(default=0)
+	revenue = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+
+	class Meta:
+		constraints = [
+			models.UniqueConstraint(fields=["seller", "date", "product"], name="unique_seller_product_daily_stat")
+		]
+
+	def __str__(self) -> str:
+		return f"{self.product_id} on {self.date}"
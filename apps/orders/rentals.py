@@ -0,0 +1,41 @@
+"""
+Rental order lines.
+
+A rental line books one product for an inclusive date range. Its price is
+worked out here from the product, never taken from the client: the per-day
+rate times the number of days, plus the one-time damage protection fee.
+The late-return rate is copied onto the line so later price edits do not
+change what an ongoing rental is charged; penalties themselves are assessed
+in bulk by ``apps.wallet.services.assess_rental_penalties``.
+"""
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.catalog.models import Product
+from apps.catalog.rentals import rental_days
+from apps.orders.models import Order
+
+
+def rental_line(product: Product, start, end) -> dict:
+	"""OrderItem field values for renting ``product`` from start to end."""
+	days = rental_days(start, end)
+	per_day = product.rental_price_per_day or product.selling_price
+	return {
+		"price_snapshot": per_day,
+		"line_total": per_day * days + product.damage_protection_fee,
+		"rental_start": start,
+		"rental_end": end,
+		"rental_days": days,
+		"damage_protection_fee": product.damage_protection_fee,
+		"late_penalty_per_day": product.late_return_penalty,
+	}
+
+
+def mark_items_returned(order: Order, item_ids=None) -> int:
+	"""Stamps ``returned_at`` on the order's outstanding rental items, or only on ``item_ids``."""
+	items = order.items.filter(rental_start__isnull=False, returned_at__isnull=True)
+	if item_ids is not None:
+		if not isinstance(item_ids, list) or not all(isinstance(item_id, int) for item_id in item_ids):
+			raise ValidationError({"items": "Pass a list of order item ids."})
+		items = items.filter(id__in=item_ids)
+	return items.update(returned_at=timezone.now())
@@ -18,8 +18,34 @@ class OrderItemSerializer(serializers.ModelSerializer):
 			"quantity",
 			"price_snapshot",
 			"line_total",
+			"rental_start",
+			"rental_end",
+			"rental_days",
+			"damage_protection_fee",
+			"late_penalty_per_day",
+			"returned_at",
+			"penalty_days",
+			"penalty_amount",
 		]
-		read_only_fields = ["id", "price_snapshot", "line_total"]
+		read_only_fields = [
+			"id",
+			"price_snapshot",
+			"line_total",
+			"rental_days",
+			"damage_protection_fee",
+			"late_penalty_per_day",
+			"returned_at",
+			"penalty_days",
+			"penalty_amount",
+		]
+
+	def validate(self, attrs):
+		start, end = attrs.get("rental_start"), attrs.get("rental_end")
+		if (start is None) != (end is None):
+			raise serializers.ValidationError("Pass both rental_start and rental_end for a rental.")
+		if start and end < start:
+			raise serializers.ValidationError({"rental_end": "Must be on or after rental_start."})
+		return attrs
 
 
 class OrderSerializer(serializers.ModelSerializer):
@@ -40,6 +66,8 @@ class OrderSerializer(serializers.ModelSerializer):
 			"total",
 			"seller_settlement_credited",
 			"seller_settlement_amount",
+			"late_fees",
+			"late_fees_collected",
 			"currency",
 			"customer_note",
 			"shipping_name",
@@ -66,6 +94,8 @@ class OrderSerializer(serializers.ModelSerializer):
 			"total",
 			"seller_settlement_credited",
 			"seller_settlement_amount",
+			"late_fees",
+			"late_fees_collected",
 			"created_at",
 			"updated_at",
 		]
@@ -105,3 +135,27 @@ class CustomizationRequestSerializer(serializers.ModelSerializer):
 			"created_at",
 			"updated_at",
 		]
+
+
+class SalesPeriodSerializer(serializers.Serializer):
+	period = serializers.DateField()
+	revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+	units = serializers.IntegerField()
+
+
+class TopProductSerializer(serializers.Serializer):
+	product_id = serializers.IntegerField()
+	product_name = serializers.CharField()
+	revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+	units = serializers.IntegerField()
+	orders_count = serializers.IntegerField()
+
+
+class SalesAnalyticsSerializer(serializers.Serializer):
+	bucket = serializers.ChoiceField(choices=["day", "week", "month"])
+	date_from = serializers.DateField()
+	date_to = serializers.DateField()
+	revenue = serializers.DecimalField(max_digits=14, decimal_places=2)
+	units = serializers.IntegerField()
+	series = SalesPeriodSerializer(many=True)
+	top_products = TopProductSerializer(many=True)
@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import Signal, receiver
+
+from apps.orders.analytics import refresh_on_commit
+from apps.orders.models import Order
+
+# Sent with ``order_ids`` and the changed ``fields`` after queryset or bulk
+# updates that bypass Order.save(), so listeners keyed on post_save still see
+# those changes.
+orders_updated = Signal()
+
+ANALYTICS_FIELDS = {"payment_status", "total"}
+
+
+@receiver(post_save, sender=Order)
+def refresh_seller_analytics(sender, instance, created, update_fields=None, **kwargs):
+	if created or update_fields is None or ANALYTICS_FIELDS.intersection(update_fields):
+		refresh_on_commit([(instance.seller_id, instance.created_at)])
+
+
+@receiver(post_delete, sender=Order)
+def refresh_deleted_order_analytics(sender, instance, **kwargs):
+	refresh_on_commit([(instance.seller_id, instance.created_at)])
+
+
+@receiver(orders_updated)
+def refresh_bulk_order_analytics(sender, order_ids, fields=None, **kwargs):
+	if fields is not None and not ANALYTICS_FIELDS.intersection(fields):
+		return
+	refresh_on_commit(Order.objects.filter(id__in=order_ids).order_by().values_list("seller_id", "created_at"))
@@ -0,0 +1,30 @@
+"""
+Order status changes.
+
+Sellers and admins move orders through their statuses from different
+views; both go through ``change_status`` so the checks and side effects of
+a transition are the same whoever makes it.
+"""
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from apps.catalog.models import RentalBooking
+from apps.catalog.rentals import cancel_bookings
+from apps.orders.models import Order
+
+# Statuses that end an order without the rental going ahead; its dates are released.
+RELEASING_STATUSES = {Order.Status.CANCELED, Order.Status.REFUNDED}
+
+
+@transaction.atomic
+def change_status(order: Order, new_status) -> Order:
+	"""Moves ``order`` to ``new_status``, releasing its rental bookings when it is canceled or refunded."""
+	if new_status not in Order.Status.values:
+		raise ValidationError("Invalid status.")
+	if new_status == Order.Status.DELIVERED and order.payment_status != Order.PaymentStatus.PAID:
+		raise ValidationError("Cannot mark unpaid order as delivered.")
+	order.status = new_status
+	order.save(update_fields=["status", "updated_at"])
+	if new_status in RELEASING_STATUSES:
+		cancel_bookings(RentalBooking.objects.filter(order_item__order=order))
+	return order
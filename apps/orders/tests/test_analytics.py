@@ -0,0 +1,102 @@
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.common.testing import api_client, make_order, make_product, make_seller, make_user
+from apps.orders.analytics import rebuild, sales_summary
+from apps.orders.models import Order, OrderItem, SellerProductDailyStat
+
+PAID = Order.PaymentStatus.PAID
+
+
+class SellerAnalyticsTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.seller = make_seller()
+		self.kurta = make_product(self.seller)
+		self.saree = make_product(self.seller, name="Saree")
+		self.today = timezone.localdate()
+
+	def sell(self, lines, payment_status=PAID):
+		"""Places one order with ``(product, quantity, line_total)`` lines and runs its on-commit refresh."""
+		total = sum(Decimal(line_total) for _, _, line_total in lines)
+		with self.captureOnCommitCallbacks(execute=True):
+			order = make_order(self.customer, self.seller, total, payment_status=payment_status)
+			for product, quantity, line_total in lines:
+				OrderItem.objects.create(
+					order=order,
+					product=product,
+					quantity=quantity,
+					price_snapshot=Decimal(line_total) / quantity,
+					line_total=Decimal(line_total),
+				)
+		return order
+
+	def test_paid_orders_roll_up_per_product_and_day(self):
+		self.sell([(self.kurta, 2, "1800.00"), (self.saree, 1, "2500.00")])
+		self.sell([(self.kurta, 1, "900.00")])
+		self.sell([(self.kurta, 5, "4500.00")], payment_status=Order.PaymentStatus.UNPAID)
+
+		kurta = SellerProductDailyStat.objects.get(seller=self.seller, product=self.kurta, date=self.today)
+		self.assertEqual((kurta.orders_count, kurta.units, kurta.revenue), (2, 3, Decimal("2700.00")))
+		self.assertEqual(SellerProductDailyStat.objects.count(), 2)
+
+	def test_refresh_follows_payment_status(self):
+		order = self.sell([(self.saree, 1, "2500.00")], payment_status=Order.PaymentStatus.UNPAID)
+		self.assertFalse(SellerProductDailyStat.objects.exists())
+
+		with self.captureOnCommitCallbacks(execute=True):
+			order.payment_status = PAID
+			order.save(update_fields=["payment_status", "updated_at"])
+		self.assertTrue(SellerProductDailyStat.objects.filter(product=self.saree).exists())
+
+		with self.captureOnCommitCallbacks(execute=True):
+			order.payment_status = Order.PaymentStatus.REFUNDED
+			order.save(update_fields=["payment_status", "updated_at"])
+		self.assertFalse(SellerProductDailyStat.objects.exists())
+
+	def test_weeks_start_on_monday_and_empty_periods_are_zero(self):
+		monday = date(2026, 10, 12)
+		SellerProductDailyStat.objects.create(
+			seller=self.seller, product=self.kurta, date=monday + timedelta(days=2), units=2, revenue=Decimal("1800.00")
+		)
+		SellerProductDailyStat.objects.create(
+			seller=self.seller, product=self.saree, date=monday + timedelta(days=6), units=1, revenue=Decimal("2500.00")
+		)
+
+		summary = sales_summary(self.seller.id, monday - timedelta(days=3), monday + timedelta(days=6), "week")
+
+		self.assertEqual(
+			[(row["period"], row["revenue"], row["units"]) for row in summary["series"]],
+			[(monday - timedelta(days=7), Decimal("0.00"), 0), (monday, Decimal("4300.00"), 3)],
+		)
+		self.assertEqual([row["product_name"] for row in summary["top_products"]], ["Saree", "Kurta"])
+
+	def test_rebuild_drops_rows_for_days_without_orders(self):
+		self.sell([(self.kurta, 1, "900.00")])
+		stale_day = self.today - timedelta(days=10)
+		SellerProductDailyStat.objects.create(seller=self.seller, product=self.saree, date=stale_day, units=1)
+		SellerProductDailyStat.objects.all().update(units=99)
+
+		self.assertEqual(rebuild(), 1)
+
+		self.assertEqual(list(SellerProductDailyStat.objects.values_list("date", "units")), [(self.today, 1)])
+
+	def test_endpoint_scopes_and_validates(self):
+		self.sell([(self.kurta, 1, "900.00")])
+		other = make_seller("other-seller@example.com")
+
+		mine = api_client(self.seller).get("/api/orders/analytics/")
+		theirs = api_client(other).get("/api/orders/analytics/")
+
+		self.assertEqual(mine.status_code, 200)
+		self.assertEqual(Decimal(mine.data["revenue"]), Decimal("900.00"))
+		self.assertEqual(len(mine.data["series"]), 30)
+		self.assertEqual(Decimal(theirs.data["revenue"]), Decimal("0.00"))
+		self.assertEqual(api_client(self.customer).get("/api/orders/analytics/").status_code, 403)
+		self.assertEqual(
+			api_client(self.seller).get("/api/orders/analytics/", {"date_from": "2020-01-01"}).status_code, 400
+		)
+		self.assertEqual(api_client(self.seller).get("/api/orders/analytics/", {"bucket": "year"}).status_code, 400)
@@ -0,0 +1,86 @@
+import csv
+import io
+import json
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.common.testing import api_client, make_order, make_seller, make_user
+from apps.orders.models import Order
+from apps.wallet.ledger import append_entry
+from apps.wallet.models import WalletTransaction
+from apps.wallet.services import get_or_create_wallet
+
+CREDIT = WalletTransaction.TransactionType.CREDIT
+SETTLEMENT = WalletTransaction.Source.ORDER_SETTLEMENT
+
+
+def read_stream(response):
+	return b"".join(response.streaming_content).decode()
+
+
+class OrderExportTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.seller = make_seller()
+		self.mine = make_order(self.customer, self.seller, "1000.00")
+		self.other = make_order(make_user("other@example.com"), make_seller("other-seller@example.com"))
+
+	def test_csv_streams_only_the_callers_orders(self):
+		response = api_client(self.customer).get("/api/orders/export/")
+
+		self.assertEqual(response.status_code, 200)
+		self.assertTrue(response.streaming)
+		self.assertEqual(response["Content-Type"], "text/csv")
+		self.assertIn('filename="orders.csv"', response["Content-Disposition"])
+		rows = list(csv.DictReader(io.StringIO(read_stream(response))))
+		self.assertEqual([row["id"] for row in rows], [str(self.mine.id)])
+		self.assertEqual(rows[0]["total"], "1000.00")
+		self.assertEqual(rows[0]["seller_settlement_credited"], "False")
+
+	def test_jsonl_emits_one_object_per_line(self):
+		newer = make_order(self.customer, self.seller, "250.00")
+
+		response = api_client(self.seller).get("/api/orders/export/", {"export_format": "jsonl"})
+
+		self.assertEqual(response["Content-Type"], "application/x-ndjson")
+		lines = read_stream(response).splitlines()
+		self.assertEqual([json.loads(line)["id"] for line in lines], [newer.id, self.mine.id])
+		self.assertEqual(json.loads(lines[0])["total"], "250.00")
+
+	def test_date_range_is_inclusive_by_day(self):
+		Order.objects.filter(pk=self.mine.pk).update(created_at=timezone.now() - timedelta(days=3))
+		today = timezone.localdate()
+		client = api_client(self.customer)
+
+		recent = read_stream(client.get("/api/orders/export/", {"export_format": "jsonl", "date_from": today}))
+		older = read_stream(
+			client.get("/api/orders/export/", {"export_format": "jsonl", "date_to": today - timedelta(days=3)})
+		)
+
+		self.assertEqual(recent, "")
+		self.assertEqual(json.loads(older)["id"], self.mine.id)
+
+	def test_bad_parameters_are_rejected(self):
+		client = api_client(self.customer)
+
+		self.assertEqual(client.get("/api/orders/export/", {"export_format": "xlsx"}).status_code, 400)
+		self.assertEqual(client.get("/api/orders/export/", {"date_from": "19-10-2026"}).status_code, 400)
+
+
+class WalletStatementExportTests(TestCase):
+	def test_statement_lists_only_the_callers_wallet(self):
+		seller = make_seller()
+		wallet = get_or_create_wallet(seller)
+		entry = append_entry(wallet, CREDIT, SETTLEMENT, Decimal("120.00"))
+		other = get_or_create_wallet(make_seller("other-seller@example.com"))
+		append_entry(other, CREDIT, SETTLEMENT, Decimal("50.00"))
+
+		response = api_client(seller).get("/api/wallet/transactions/export/")
+
+		rows = list(csv.DictReader(io.StringIO(read_stream(response))))
+		self.assertEqual([row["id"] for row in rows], [str(entry.id)])
+		self.assertEqual(rows[0]["amount"], "120.00")
+		self.assertIn('filename="wallet-statement.csv"', response["Content-Disposition"])
@@ -0,0 +1,141 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.catalog.models import Product, RentalBooking
+from apps.catalog.rentals import book_rental
+from apps.common.testing import SHIPPING, api_client, make_order, make_product, make_seller, make_user
+from apps.orders.models import Order, OrderItem
+from apps.wallet.models import WalletTransaction
+from apps.wallet.services import assess_rental_penalties, collect_late_fees
+
+
+class RentalCheckoutTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.seller = make_seller()
+		self.lehenga = make_product(
+			self.seller,
+			name="Lehenga",
+			product_type=Product.ProductType.RENTAL,
+			rental_price_per_day=Decimal("400.00"),
+			damage_protection_fee=Decimal("150.00"),
+			late_return_penalty=Decimal("200.00"),
+		)
+		self.start = timezone.localdate() + timedelta(days=10)
+
+	def checkout(self, start, end, **item):
+		payload = {
+			"items": [{"product": self.lehenga.id, "quantity": 1, "rental_start": start, "rental_end": end, **item}],
+			**SHIPPING,
+		}
+		return api_client(self.customer).post("/api/orders/", payload, format="json")
+
+	def test_rental_lines_are_priced_from_the_product(self):
+		response = self.checkout(self.start, self.start + timedelta(days=2), price_snapshot="1.00", line_total="1.00")
+
+		self.assertEqual(response.status_code, 201)
+		item = OrderItem.objects.get(order_id=response.data["id"])
+		self.assertEqual((item.rental_days, item.price_snapshot), (3, Decimal("400.00")))
+		self.assertEqual(item.line_total, Decimal("1350.00"))
+		self.assertEqual(item.late_penalty_per_day, Decimal("200.00"))
+		self.assertEqual(item.rental_booking.start_date, self.start)
+		self.assertEqual(Decimal(response.data["total"]), Decimal("1350.00"))
+
+	def test_overlapping_dates_fail_the_whole_order(self):
+		book_rental(self.lehenga, self.start, self.start)
+
+		response = self.checkout(self.start - timedelta(days=1), self.start)
+
+		self.assertEqual(response.status_code, 400)
+		self.assertFalse(Order.objects.exists())
+		self.assertEqual(RentalBooking.objects.count(), 1)
+
+	def test_dates_on_a_regular_product_are_rejected(self):
+		kurta = make_product(self.seller)
+		payload = {
+			"items": [{"product": kurta.id, "quantity": 1, "rental_start": self.start, "rental_end": self.start}],
+			**SHIPPING,
+		}
+
+		response = api_client(self.customer).post("/api/orders/", payload, format="json")
+
+		self.assertEqual(response.status_code, 400)
+
+
+@override_settings(PLATFORM_COMMISSION_PERCENT="10")
+class LatePenaltyTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.seller = make_seller()
+		self.product = make_product(self.seller, name="Lehenga", product_type=Product.ProductType.RENTAL)
+		self.end = date(2026, 10, 10)
+		self.order = make_order(
+			self.customer,
+			self.seller,
+			"1500.00",
+			status=Order.Status.DELIVERED,
+			payment_status=Order.PaymentStatus.PAID,
+		)
+		self.item = OrderItem.objects.create(
+			order=self.order,
+			product=self.product,
+			price_snapshot=Decimal("500.00"),
+			line_total=Decimal("1500.00"),
+			rental_start=self.end - timedelta(days=2),
+			rental_end=self.end,
+			late_penalty_per_day=Decimal("100.00"),
+		)
+
+	def late_fees(self):
+		self.order.refresh_from_db()
+		return self.order.late_fees
+
+	def test_penalties_grow_daily_and_reruns_change_nothing(self):
+		self.assertEqual(assess_rental_penalties(today=self.end), 0)
+
+		self.assertEqual(assess_rental_penalties(today=self.end + timedelta(days=2)), 1)
+		self.assertEqual(assess_rental_penalties(today=self.end + timedelta(days=2)), 0)
+		self.assertEqual(self.late_fees(), Decimal("200.00"))
+
+		assess_rental_penalties(today=self.end + timedelta(days=5))
+		self.assertEqual(self.late_fees(), Decimal("500.00"))
+		self.assertFalse(WalletTransaction.objects.exists())
+
+	def test_returned_items_stop_accruing(self):
+		returned_at = timezone.make_aware(datetime.combine(self.end + timedelta(days=3), time(12)))
+		OrderItem.objects.filter(pk=self.item.pk).update(returned_at=returned_at)
+
+		assess_rental_penalties(today=self.end + timedelta(days=9))
+
+		self.item.refresh_from_db()
+		self.assertTrue(self.item.penalty_finalized)
+		self.assertEqual((self.item.penalty_days, self.item.penalty_amount), (3, Decimal("300.00")))
+		self.assertEqual(assess_rental_penalties(today=self.end + timedelta(days=10)), 0)
+
+	def test_collected_fees_are_credited_net_of_commission(self):
+		assess_rental_penalties(today=self.end + timedelta(days=3))
+
+		entry = collect_late_fees(self.order, Decimal("200.00"))
+
+		self.assertEqual(entry.source, WalletTransaction.Source.RENTAL_PENALTY)
+		self.assertEqual(entry.amount, Decimal("180.00"))
+		with self.assertRaises(ValidationError):
+			collect_late_fees(self.order, Decimal("100.01"))
+		collect_late_fees(self.order)
+		self.order.refresh_from_db()
+		self.assertEqual(self.order.late_fees_collected, Decimal("300.00"))
+
+	def test_seller_marks_items_returned(self):
+		response = api_client(self.seller).post(f"/api/orders/{self.order.id}/mark_returned/", {}, format="json")
+
+		self.assertEqual(response.status_code, 200)
+		self.item.refresh_from_db()
+		self.assertIsNotNone(self.item.returned_at)
+		self.assertEqual(
+			api_client(self.seller).post(f"/api/orders/{self.order.id}/mark_returned/", {}, format="json").status_code,
+			400,
+		)
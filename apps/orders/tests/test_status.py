@@ -0,0 +1,73 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.accounts.models import User
+from apps.catalog.models import Product, RentalBooking
+from apps.catalog.rentals import book_rental
+from apps.common.testing import api_client, make_order, make_product, make_seller, make_user
+from apps.orders.models import Order, OrderItem
+
+
+class RentalStatusChangeTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.seller = make_seller()
+		self.admin = make_user("admin@example.com", User.Role.ADMIN)
+		self.product = make_product(
+			self.seller, name="Lehenga", selling_price=Decimal("500.00"), product_type=Product.ProductType.RENTAL
+		)
+		self.start = timezone.localdate() + timedelta(days=10)
+		self.end = self.start + timedelta(days=2)
+		self.booking = book_rental(self.product, self.start, self.end, self.customer)
+		self.order = make_order(self.customer, self.seller, "1500.00")
+		OrderItem.objects.create(
+			order=self.order,
+			product=self.product,
+			price_snapshot=Decimal("500.00"),
+			line_total=Decimal("1500.00"),
+			rental_start=self.start,
+			rental_end=self.end,
+			rental_booking=self.booking,
+		)
+
+	def post_status(self, user, url, status):
+		return api_client(user).post(url, {"status": status}, format="json")
+
+	def assert_dates_released(self):
+		self.booking.refresh_from_db()
+		self.assertEqual(self.booking.status, RentalBooking.Status.CANCELLED)
+		book_rental(self.product, self.start, self.end, self.customer)
+
+	def test_seller_cancel_releases_dates(self):
+		response = self.post_status(self.seller, f"/api/orders/{self.order.id}/update_status/", Order.Status.CANCELED)
+
+		self.assertEqual(response.status_code, 200)
+		self.assert_dates_released()
+
+	def test_admin_cancel_releases_dates(self):
+		response = self.post_status(
+			self.admin, f"/api/admin/orders/{self.order.id}/update_status/", Order.Status.CANCELED
+		)
+
+		self.assertEqual(response.status_code, 200)
+		self.assert_dates_released()
+
+	def test_admin_refund_releases_dates(self):
+		response = self.post_status(
+			self.admin, f"/api/admin/orders/{self.order.id}/update_status/", Order.Status.REFUNDED
+		)
+
+		self.assertEqual(response.status_code, 200)
+		self.assert_dates_released()
+
+	def test_unpaid_order_cannot_be_delivered(self):
+		response = self.post_status(
+			self.admin, f"/api/admin/orders/{self.order.id}/update_status/", Order.Status.DELIVERED
+		)
+
+		self.assertEqual(response.status_code, 400)
+		self.booking.refresh_from_db()
+		self.assertEqual(self.booking.status, RentalBooking.Status.ACTIVE)
@@ -1,6 +1,10 @@
+from datetime import timedelta
+
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.utils import timezone
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import permissions, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
@@ -8,9 +12,52 @@ from rest_framework.response import Response
 
 from apps.accounts.models import User
 from apps.accounts.permissions import IsAdmin
+from apps.catalog.models import Product
+from apps.catalog.rentals import book_rental
+from apps.common.exports import (
+	EXPORT_PARAMETERS,
+	filter_date_range,
+	get_export_format,
+	parse_day_param,
+	stream_export,
+)
+from apps.common.idempotency import idempotent
+from apps.orders.analytics import BUCKETS, sales_summary
 from apps.orders.models import CustomizationRequest, Order, OrderItem
-from apps.orders.serializers import CustomizationRequestSerializer, OrderSerializer
-from apps.wallet.services import credit_seller_on_order_delivery
+from apps.orders.rentals import mark_items_returned, rental_line
+from apps.orders.serializers import CustomizationRequestSerializer, OrderSerializer, SalesAnalyticsSerializer
+from apps.orders.status import change_status
+
+DEFAULT_ANALYTICS_DAYS = 30
+MAX_ANALYTICS_DAYS = 731
+DEFAULT_TOP_PRODUCTS = 5
+MAX_TOP_PRODUCTS = 20
+
+ORDER_EXPORT_COLUMNS = [
+	("id", "id"),
+	("created_at", "created_at"),
+	("status", "status"),
+	("payment_status", "payment_status"),
+	("customer_id", "customer_id"),
+	("seller_id", "seller_id"),
+	("subtotal", "subtotal"),
+	("shipping_fee", "shipping_fee"),
+	("total", "total"),
+	("currency", "currency"),
+	("seller_settlement_credited", "seller_settlement_credited"),
+	("seller_settlement_amount", "seller_settlement_amount"),
+	("late_fees", "late_fees"),
+	("late_fees_collected", "late_fees_collected"),
+	("razorpay_order_id", "razorpay_order_id"),
+	("razorpay_payment_id", "razorpay_payment_id"),
+	("shipping_city", "shipping_city"),
+	("shipping_state", "shipping_state"),
+]
+
+# OrderItemSerializer reads the product name and the variant's color and size.
+ORDER_ITEMS_PREFETCH = Prefetch(
+	"items", queryset=OrderItem.objects.select_related("product", "variant__color", "variant__size")
+)
 
 
 class OrderViewSet(viewsets.ModelViewSet):
@@ -23,8 +70,8 @@ class OrderViewSet(viewsets.ModelViewSet):
 		if not user.is_authenticated:
 			return Order.objects.none()
 		if user.is_authenticated and user.role == User.Role.ADMIN:
-			return Order.objects.all().prefetch_related("items")
-		return Order.objects.filter(Q(customer=user) | Q(seller=user)).prefetch_related("items")
+			return Order.objects.all().prefetch_related(ORDER_ITEMS_PREFETCH)
+		return Order.objects.filter(Q(customer=user) | Q(seller=user)).prefetch_related(ORDER_ITEMS_PREFETCH)
 
 	def get_permissions(self):
 		if self.action in {"list", "retrieve"}:
@@ -37,6 +84,7 @@ class OrderViewSet(viewsets.ModelViewSet):
 			return [permissions.IsAuthenticated()]
 		return [permissions.IsAuthenticated()]
 
+	@idempotent("orders.create")
 	@transaction.atomic
 	def create(self, request, *args, **kwargs):
 		serializer = self.get_serializer(data=request.data)
@@ -57,10 +105,19 @@ class OrderViewSet(viewsets.ModelViewSet):
 				seller = product.seller
 			if product.seller_id != seller.id:
 				raise ValidationError("All items must be from the same seller.")
-			unit_price = variant.price_override if variant and variant.price_override else product.selling_price
-			line_total = unit_price * item["quantity"]
-			subtotal += line_total
-			order_items.append((product, variant, item["quantity"], unit_price, line_total))
+			if product.product_type == Product.ProductType.RENTAL:
+				if item.get("rental_start") is None:
+					raise ValidationError("Rental products need rental_start and rental_end.")
+				if item["quantity"] != 1:
+					raise ValidationError("Rental products are booked one at a time.")
+				fields = rental_line(product, item["rental_start"], item["rental_end"])
+			elif item.get("rental_start") is not None:
+				raise ValidationError("Only rental products can be booked for dates.")
+			else:
+				unit_price = variant.price_override if variant and variant.price_override else product.selling_price
+				fields = {"price_snapshot": unit_price, "line_total": unit_price * item["quantity"]}
+			subtotal += fields["line_total"]
+			order_items.append(OrderItem(product=product, variant=variant, quantity=item["quantity"], **fields))
 
 		order = Order.objects.create(
 			customer=request.user,
@@ -69,15 +126,13 @@ class OrderViewSet(viewsets.ModelViewSet):
 			total=subtotal + serializer.validated_data.get("shipping_fee", 0),
 			**serializer.validated_data,
 		)
-		for product, variant, quantity, price_snapshot, line_total in order_items:
-			OrderItem.objects.create(
-				order=order,
-				product=product,
-				variant=variant,
-				quantity=quantity,
-				price_snapshot=price_snapshot,
-				line_total=line_total,
-			)
+		for order_item in order_items:
+			order_item.order = order
+			if order_item.rental_start:
+				order_item.rental_booking = book_rental(
+					order_item.product, order_item.rental_start, order_item.rental_end, user=request.user
+				)
+			order_item.save()
 		return Response(OrderSerializer(order).data, status=201)
 
 	@action(detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated])
@@ -86,18 +141,78 @@ class OrderViewSet(viewsets.ModelViewSet):
 		order = self.get_object()
 		if request.user.role != User.Role.ADMIN and order.seller_id != request.user.id:
 			raise PermissionDenied("You can only update your own sales.")
-		new_status = request.data.get("status")
-		if new_status not in Order.Status.values:
-			raise ValidationError("Invalid status.")
-		was_delivered = order.status == Order.Status.DELIVERED
-		if new_status == Order.Status.DELIVERED and order.payment_status != Order.PaymentStatus.PAID:
-			raise ValidationError("Cannot mark unpaid order as delivered.")
-		order.status = new_status
-		order.save(update_fields=["status", "updated_at"])
-		if new_status == Order.Status.DELIVERED and not was_delivered:
-			credit_seller_on_order_delivery(order)
+		change_status(order, request.data.get("status"))
+		return Response(OrderSerializer(order).data)
+
+	@action(detail=True, methods=["post"], permission_classes=[permissions.IsAuthenticated])
+	def mark_returned(self, request, pk=None):
+		"""Record that the rental items of an order are back with the seller"""
+		order = self.get_object()
+		if request.user.role != User.Role.ADMIN and order.seller_id != request.user.id:
+			raise PermissionDenied("You can only update your own sales.")
+		returned = mark_items_returned(order, request.data.get("items"))
+		if not returned:
+			raise ValidationError("No unreturned rental items matched.")
+		order.refresh_from_db()
 		return Response(OrderSerializer(order).data)
 
+	@extend_schema(
+		summary="Export order history",
+		description="Streams the caller's orders (as customer or seller) as CSV or JSONL, optionally limited to a date range.",
+		parameters=EXPORT_PARAMETERS,
+		responses={(200, "text/csv"): OpenApiTypes.STR},
+	)
+	@action(detail=False, methods=["get"], permission_classes=[permissions.IsAuthenticated])
+	def export(self, request):
+		queryset = filter_date_range(self.get_queryset(), request).order_by("-created_at", "-id")
+		return stream_export(queryset, ORDER_EXPORT_COLUMNS, get_export_format(request), "orders")
+
+	@extend_schema(
+		summary="Seller sales analytics",
+		description=(
+			"Revenue and units sold per day, week or month, plus the top products, for paid orders placed in "
+			f"the range. Defaults to the last {DEFAULT_ANALYTICS_DAYS} days; ranges are capped at "
+			f"{MAX_ANALYTICS_DAYS} days. Admins may pass seller."
+		),
+		parameters=[
+			OpenApiParameter("bucket", str, enum=list(BUCKETS)),
+			OpenApiParameter("date_from", OpenApiTypes.DATE),
+			OpenApiParameter("date_to", OpenApiTypes.DATE),
+			OpenApiParameter("top", int, description=f"Number of top products (max {MAX_TOP_PRODUCTS})."),
+			OpenApiParameter("seller", int, description="Seller id (admins only)."),
+		],
+		responses=SalesAnalyticsSerializer,
+	)
+	@action(detail=False, methods=["get"], permission_classes=[permissions.IsAuthenticated])
+	def analytics(self, request):
+		user = request.user
+		if user.role == User.Role.ADMIN and request.query_params.get("seller"):
+			try:
+				seller_id = int(request.query_params["seller"])
+			except ValueError:
+				raise ValidationError({"seller": "Must be a seller id."})
+		elif user.role == User.Role.CUSTOMER:
+			raise PermissionDenied("Only sellers have sales analytics.")
+		else:
+			seller_id = user.id
+
+		bucket = request.query_params.get("bucket", "day")
+		if bucket not in BUCKETS:
+			raise ValidationError({"bucket": f"Choose one of: {', '.join(BUCKETS)}."})
+		date_to = parse_day_param(request, "date_to") or timezone.localdate()
+		date_from = parse_day_param(request, "date_from") or date_to - timedelta(days=DEFAULT_ANALYTICS_DAYS - 1)
+		if date_from > date_to:
+			raise ValidationError({"date_from": "Must not be after date_to."})
+		if (date_to - date_from).days >= MAX_ANALYTICS_DAYS:
+			raise ValidationError({"date_from": f"Ranges are limited to {MAX_ANALYTICS_DAYS} days."})
+		try:
+			top = max(1, min(int(request.query_params.get("top", DEFAULT_TOP_PRODUCTS)), MAX_TOP_PRODUCTS))
+		except ValueError:
+			top = DEFAULT_TOP_PRODUCTS
+
+		summary = sales_summary(seller_id, date_from, date_to, bucket, top)
+		return Response(SalesAnalyticsSerializer(summary).data)
+
 
 class CustomizationRequestViewSet(viewsets.ModelViewSet):
 	serializer_class = CustomizationRequestSerializer
@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from apps.wallet.models import Wallet, WalletTransaction, WithdrawalRequest
+from apps.wallet.models import Wallet, WalletBalanceSnapshot, WalletTransaction, WithdrawalRequest
 
 
 @admin.register(Wallet)
@@ -18,6 +18,7 @@ class WalletTransactionAdmin(admin.ModelAdmin):
         "source",
         "amount",
         "balance_after",
+        "ledger_sequence",
         "created_at",
     )
     list_filter = ("transaction_type", "source")
@@ -29,3 +30,9 @@ class WithdrawalRequestAdmin(admin.ModelAdmin):
     list_display = ("id", "seller", "amount", "status", "created_at", "reviewed_at")
     list_filter = ("status",)
     search_fields = ("seller__email",)
+
+
+@admin.register(WalletBalanceSnapshot)
+class WalletBalanceSnapshotAdmin(admin.ModelAdmin):
+    list_display = ("id", "wallet", "balance", "last_sequence", "created_at")
+    search_fields = ("wallet__user__email",)
@@ -0,0 +1,187 @@
+"""
+Append-only wallet ledger.
+
+``WalletTransaction`` rows are the source of truth. Entries are appended
+without touching the ``Wallet`` row, so concurrent credits for one seller do
+not block each other. A new entry has no ``ledger_sequence`` or
+``balance_after`` until ``take_snapshot`` folds it into the chain. The
+balance is the latest ``WalletBalanceSnapshot`` plus the signed sum of
+entries that have not been folded yet. ``Wallet.balance`` is only a cached
+copy of the latest snapshot; the overview aggregates on ``Wallet``
+(lifetime credits, commission this month) advance with each fold.
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import DecimalField, F, Q, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.wallet.models import Wallet, WalletBalanceSnapshot, WalletTransaction
+
+ZERO = Decimal("0.00")
+# Credits paid out net of the platform commission, which record it in meta["commission_amount"].
+COMMISSIONED_SOURCES = {WalletTransaction.Source.ORDER_SETTLEMENT, WalletTransaction.Source.RENTAL_PENALTY}
+
+
+def signed_amount(tx: WalletTransaction) -> Decimal:
+    if tx.transaction_type == WalletTransaction.TransactionType.DEBIT:
+        return -Decimal(tx.amount)
+    return Decimal(tx.amount)
+
+
+def append_entry(wallet: Wallet, transaction_type: str, source: str, amount: Decimal, **fields) -> WalletTransaction:
+    return WalletTransaction.objects.create(
+        wallet=wallet,
+        transaction_type=transaction_type,
+        source=source,
+        amount=amount,
+        **fields,
+    )
+
+
+def latest_snapshot(wallet_id: int) -> WalletBalanceSnapshot | None:
+    return WalletBalanceSnapshot.objects.filter(wallet_id=wallet_id).order_by("-last_sequence").first()
+
+
+def pending_totals(wallet_id: int) -> tuple[Decimal, Decimal]:
+    """Returns (credits, debits) of entries not yet folded into a snapshot."""
+    money = DecimalField(max_digits=14, decimal_places=2)
+    totals = WalletTransaction.objects.filter(wallet_id=wallet_id, ledger_sequence__isnull=True).aggregate(
+        credits=Coalesce(
+            Sum("amount", filter=Q(transaction_type=WalletTransaction.TransactionType.CREDIT)),
+            Value(ZERO),
+            output_field=money,
+        ),
+        debits=Coalesce(
+            Sum("amount", filter=Q(transaction_type=WalletTransaction.TransactionType.DEBIT)),
+            Value(ZERO),
+            output_field=money,
+        ),
+    )
+    return totals["credits"], totals["debits"]
+
+
+def get_balance(wallet: Wallet) -> Decimal:
+    snapshot = latest_snapshot(wallet.id)
+    base = snapshot.balance if snapshot else ZERO
+    credits, debits = pending_totals(wallet.id)
+    return base + credits - debits
+
+
+def load_live_totals(wallet: Wallet) -> Wallet:
+    """Brings ``balance`` and ``lifetime_credits`` on the instance up to date with unfolded entries."""
+    snapshot = latest_snapshot(wallet.id)
+    credits, debits = pending_totals(wallet.id)
+    wallet.balance = (snapshot.balance if snapshot else ZERO) + credits - debits
+    wallet.lifetime_credits = wallet.lifetime_credits + credits
+    return wallet
+
+
+def _fold_summary(wallet: Wallet, folded: list[WalletTransaction]) -> dict:
+    month = wallet.commission_month
+    month_total = Decimal(wallet.commission_month_total)
+    credits = ZERO
+    for tx in folded:
+        if tx.transaction_type != WalletTransaction.TransactionType.CREDIT:
+            continue
+        credits += Decimal(tx.amount)
+        if tx.source not in COMMISSIONED_SOURCES:
+            continue
+        tx_month = timezone.localdate(tx.created_at).replace(day=1)
+        if month is None or tx_month > month:
+            month, month_total = tx_month, ZERO
+        if tx_month == month:
+            month_total += Decimal(tx.meta.get("commission_amount", "0"))
+    return {
+        "lifetime_credits": F("lifetime_credits") + credits,
+        "commission_month": month,
+        "commission_month_total": month_total,
+    }
+
+
+@transaction.atomic
+def debit_wallet(wallet: Wallet, amount: Decimal, source: str, **fields) -> WalletTransaction:
+    """
+    Appends a debit after checking the derived balance.
+
+    Debits lock the wallet row so two withdrawals cannot overdraw it. Credits
+    never take this lock, and snapshots only lock it for the short fold, so
+    settlements keep flowing while a debit is checked.
+    """
+    Wallet.objects.select_for_update().filter(pk=wallet.pk).first()
+    if amount > get_balance(wallet):
+        raise ValidationError("Insufficient wallet balance for this approval.")
+    return append_entry(wallet, WalletTransaction.TransactionType.DEBIT, source, amount, **fields)
+
+
+@transaction.atomic
+def take_snapshot(wallet: Wallet) -> WalletBalanceSnapshot | None:
+    """Folds unsequenced entries into the balance_after chain and records a snapshot."""
+    wallet = Wallet.objects.select_for_update().get(pk=wallet.pk)
+    snapshot = latest_snapshot(wallet.id)
+    pending = list(
+        WalletTransaction.objects.filter(wallet=wallet, ledger_sequence__isnull=True).order_by("created_at", "id")
+    )
+    if not pending:
+        return snapshot
+
+    balance = snapshot.balance if snapshot else ZERO
+    sequence = snapshot.last_sequence if snapshot else 0
+    for tx in pending:
+        sequence += 1
+        balance += signed_amount(tx)
+        tx.ledger_sequence = sequence
+        tx.balance_after = balance
+    WalletTransaction.objects.bulk_update(pending, ["ledger_sequence", "balance_after"])
+
+    snapshot = WalletBalanceSnapshot.objects.create(wallet=wallet, balance=balance, last_sequence=sequence)
+    Wallet.objects.filter(pk=wallet.pk).update(
+        balance=balance,
+        updated_at=timezone.now(),
+        **_fold_summary(wallet, pending),
+    )
+    return snapshot
+
+
+def snapshot_wallets(wallet_ids=None) -> int:
+    pending = WalletTransaction.objects.filter(ledger_sequence__isnull=True)
+    if wallet_ids is not None:
+        pending = pending.filter(wallet_id__in=wallet_ids)
+    count = 0
+    for wallet in Wallet.objects.filter(id__in=pending.values("wallet_id")).iterator():
+        take_snapshot(wallet)
+        count += 1
+    return count
+
+
+def reconcile_wallet(wallet: Wallet) -> list[str]:
+    """Returns a description of every break in the wallet's balance_after chain."""
+    issues = []
+    snapshots = {
+        s.last_sequence: s.balance for s in WalletBalanceSnapshot.objects.filter(wallet=wallet)
+    }
+    balance = snapshots.get(0, ZERO)
+    expected_sequence = 0
+    queryset = WalletTransaction.objects.filter(wallet=wallet, ledger_sequence__isnull=False).order_by(
+        "ledger_sequence"
+    )
+    for tx in queryset.iterator(chunk_size=2000):
+        expected_sequence += 1
+        if tx.ledger_sequence != expected_sequence:
+            issues.append(f"Sequence gap: expected #{expected_sequence}, found #{tx.ledger_sequence} (tx {tx.id}).")
+            expected_sequence = tx.ledger_sequence
+        balance += signed_amount(tx)
+        if tx.balance_after != balance:
+            issues.append(f"Entry #{tx.ledger_sequence} (tx {tx.id}): balance_after {tx.balance_after}, expected {balance}.")
+        snapshot_balance = snapshots.get(tx.ledger_sequence)
+        if snapshot_balance is not None and snapshot_balance != balance:
+            issues.append(f"Snapshot at #{tx.ledger_sequence}: balance {snapshot_balance}, expected {balance}.")
+
+    latest = latest_snapshot(wallet.id)
+    if latest is not None and latest.last_sequence != expected_sequence:
+        issues.append(f"Latest snapshot covers #{latest.last_sequence} but the ledger ends at #{expected_sequence}.")
+    if latest is not None and wallet.balance != latest.balance:
+        issues.append(f"Cached wallet balance {wallet.balance} differs from snapshot balance {latest.balance}.")
+    return issues
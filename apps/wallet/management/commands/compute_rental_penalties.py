@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.wallet.services import assess_rental_penalties
+
+
+class Command(BaseCommand):
+    help = "Assesses late-return penalties on overdue rental items and adds them to the orders' outstanding late fees."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        total = 0
+        while True:
+            assessed = assess_rental_penalties(batch_size=options["batch_size"])
+            if not assessed:
+                break
+            total += assessed
+        self.stdout.write(f"Assessed {total} rental items.")
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.wallet.ledger import reconcile_wallet
+from apps.wallet.models import Wallet
+
+
+class Command(BaseCommand):
+    help = "Verifies every wallet's balance_after chain against its snapshots and cached balance."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wallet", type=int, action="append", dest="wallet_ids", help="Limit to wallet id(s).")
+
+    def handle(self, *args, **options):
+        wallets = Wallet.objects.select_related("user").order_by("id")
+        if options["wallet_ids"]:
+            wallets = wallets.filter(id__in=options["wallet_ids"])
+
+        broken = 0
+        for wallet in wallets.iterator():
+            issues = reconcile_wallet(wallet)
+            if not issues:
+                continue
+            broken += 1
+            self.stdout.write(self.style.ERROR(f"Wallet {wallet.id} ({wallet.user.email}):"))
+            for issue in issues:
+                self.stdout.write(f"  {issue}")
+
+        if broken:
+            raise CommandError(f"{broken} wallet(s) failed reconciliation.")
+        self.stdout.write(self.style.SUCCESS("All wallet ledgers reconcile."))
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.wallet.services import settle_delivered_orders
+
+
+class Command(BaseCommand):
+    help = "Credits seller wallets for delivered, paid orders that have not been settled yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--loop", action="store_true", help="Keep polling for newly delivered orders.")
+        parser.add_argument("--interval", type=float, default=60.0, help="Seconds to sleep when idle.")
+
+    def handle(self, *args, **options):
+        total = 0
+        while True:
+            settled = settle_delivered_orders(batch_size=options["batch_size"])
+            total += settled
+            if settled:
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(f"Settled {total} orders.")
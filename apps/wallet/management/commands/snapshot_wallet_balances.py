@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from apps.wallet.ledger import snapshot_wallets
+
+
+class Command(BaseCommand):
+    help = "Folds new ledger entries into balance_after chains and records balance snapshots."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--wallet", type=int, action="append", dest="wallet_ids", help="Limit to wallet id(s).")
+
+    def handle(self, *args, **options):
+        count = snapshot_wallets(options["wallet_ids"])
+        self.stdout.write(f"Snapshotted {count} wallets.")
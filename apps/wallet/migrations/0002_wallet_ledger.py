@@ -0,0 +1,67 @@
+# Generated by Django 5.2.11 on 2026-10-19 17:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def sequence_existing_transactions(apps, schema_editor):
+    Wallet = apps.get_model("wallet", "Wallet")
+    WalletTransaction = apps.get_model("wallet", "WalletTransaction")
+    WalletBalanceSnapshot = apps.get_model("wallet", "WalletBalanceSnapshot")
+    for wallet in Wallet.objects.all().iterator():
+        transactions = list(WalletTransaction.objects.filter(wallet=wallet).order_by("created_at", "id"))
+        for sequence, tx in enumerate(transactions, start=1):
+            tx.ledger_sequence = sequence
+        WalletTransaction.objects.bulk_update(transactions, ["ledger_sequence"])
+        WalletBalanceSnapshot.objects.create(
+            wallet=wallet,
+            balance=wallet.balance,
+            last_sequence=len(transactions),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_order_razorpay_order_id_order_razorpay_payment_id_and_more'),
+        ('wallet', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WalletBalanceSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('balance', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('last_sequence', models.PositiveBigIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-last_sequence'],
+            },
+        ),
+        migrations.AddField(
+            model_name='wallettransaction',
+            name='ledger_sequence',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='wallettransaction',
+            name='balance_after',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=12, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='wallettransaction',
+            index=models.Index(fields=['wallet', 'ledger_sequence'], name='wallet_wall_wallet__0b21d7_idx'),
+        ),
+        migrations.AddField(
+            model_name='walletbalancesnapshot',
+            name='wallet',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='snapshots', to='wallet.wallet'),
+        ),
+        migrations.AddIndex(
+            model_name='walletbalancesnapshot',
+            index=models.Index(fields=['wallet', '-last_sequence'], name='wallet_wall_wallet__9472a8_idx'),
+        ),
+        migrations.RunPython(sequence_existing_transactions, migrations.RunPython.noop),
+    ]
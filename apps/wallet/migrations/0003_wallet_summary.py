@@ -0,0 +1,71 @@
+# Generated by Django 5.2.11 on 2026-10-19 17:28
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Sum
+from django.utils import timezone
+
+
+def backfill_wallet_summary(apps, schema_editor):
+    Wallet = apps.get_model("wallet", "Wallet")
+    WalletTransaction = apps.get_model("wallet", "WalletTransaction")
+    WithdrawalRequest = apps.get_model("wallet", "WithdrawalRequest")
+    month = timezone.localdate().replace(day=1)
+    for wallet in Wallet.objects.all().iterator():
+        folded = WalletTransaction.objects.filter(wallet=wallet, ledger_sequence__isnull=False)
+        wallet.lifetime_credits = (
+            folded.filter(transaction_type="credit").aggregate(total=Sum("amount"))["total"] or Decimal("0")
+        )
+        wallet.pending_withdrawals = (
+            WithdrawalRequest.objects.filter(wallet=wallet, status="pending").aggregate(total=Sum("amount"))["total"]
+            or Decimal("0")
+        )
+        wallet.commission_month = month
+        wallet.commission_month_total = sum(
+            (
+                Decimal(meta.get("commission_amount", "0"))
+                for created_at, meta in folded.filter(source="order_settlement").values_list("created_at", "meta")
+                if timezone.localdate(created_at).replace(day=1) == month
+            ),
+            Decimal("0"),
+        )
+        wallet.save(
+            update_fields=["lifetime_credits", "pending_withdrawals", "commission_month", "commission_month_total"]
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0002_order_razorpay_order_id_order_razorpay_payment_id_and_more'),
+        ('wallet', '0002_wallet_ledger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='wallet',
+            name='commission_month',
+            field=models.DateField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='wallet',
+            name='commission_month_total',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddField(
+            model_name='wallet',
+            name='lifetime_credits',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=14),
+        ),
+        migrations.AddField(
+            model_name='wallet',
+            name='pending_withdrawals',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddIndex(
+            model_name='wallettransaction',
+            index=models.Index(fields=['wallet', '-created_at'], name='wallet_wall_wallet__ccf672_idx'),
+        ),
+        migrations.RunPython(backfill_wallet_summary, migrations.RunPython.noop),
+    ]
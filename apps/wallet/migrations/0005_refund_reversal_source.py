@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-19 18:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('wallet', '0004_rental_penalty_source'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='wallettransaction',
+            name='source',
+            field=models.CharField(choices=[('order_settlement', 'Order Settlement'), ('withdrawal', 'Withdrawal'), ('rental_penalty', 'Rental Penalty'), ('refund_reversal', 'Refund Reversal')], max_length=30),
+        ),
+    ]
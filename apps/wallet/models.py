@@ -1,4 +1,7 @@
+from decimal import Decimal
+
 from django.db import models
+from django.utils import timezone
 
 from apps.accounts.models import BankDetails, User
 
@@ -6,12 +9,22 @@ from apps.accounts.models import BankDetails, User
 class Wallet(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="wallet")
     balance = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    lifetime_credits = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    pending_withdrawals = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    commission_month = models.DateField(null=True, blank=True)
+    commission_month_total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self) -> str:
         return f"Wallet<{self.user.email}>"
 
+    @property
+    def commission_paid_this_month(self):
+        if self.commission_month != timezone.localdate().replace(day=1):
+            return Decimal("0.00")
+        return Decimal(self.commission_month_total)
+
 
 class WithdrawalRequest(models.Model):
     class Status(models.TextChoices):
@@ -55,12 +68,15 @@ class WalletTransaction(models.Model):
     class Source(models.TextChoices):
         ORDER_SETTLEMENT = "order_settlement", "Order Settlement"
         WITHDRAWAL = "withdrawal", "Withdrawal"
+        RENTAL_PENALTY = "rental_penalty", "Rental Penalty"
+        REFUND_REVERSAL = "refund_reversal", "Refund Reversal"
 
     wallet = models.ForeignKey(Wallet, on_delete=models.CASCADE, related_name="transactions")
     transaction_type = models.CharField(max_length=20, choices=TransactionType.choices)
     source = models.CharField(max_length=30, choices=Source.choices)
     amount = models.DecimalField(max_digits=12, decimal_places=2)
-    balance_after = models.DecimalField(max_digits=12, decimal_places=2)
+    balance_after = models.DecimalField(max_digits=12, decimal_places=2, null=True, blank=True)
+    ledger_sequence = models.PositiveBigIntegerField(null=True, blank=True)
     order = models.ForeignKey(
         "orders.Order",
         on_delete=models.SET_NULL,
@@ -81,6 +97,24 @@ class WalletTransaction(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["wallet", "ledger_sequence"]),
+            models.Index(fields=["wallet", "-created_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.wallet.user.email} {self.transaction_type} {self.amount}"
+
+
+class WalletBalanceSnapshot(models.Model):
+    wallet = models.ForeignKey(Wallet, on_delete=models.CASCADE, related_name="snapshots")
+    balance = models.DecimalField(max_digits=12, decimal_places=2)
+    last_sequence = models.PositiveBigIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-last_sequence"]
+        indexes = [models.Index(fields=["wallet", "-last_sequence"])]
+
+    def __str__(self) -> str:
+        return f"Snapshot<{self.wallet_id}> #{self.last_sequence} {self.balance}"
@@ -1,13 +1,14 @@
 from decimal import Decimal
 
+from django.urls import reverse
 from rest_framework import serializers
 
 from apps.wallet.models import Wallet, WalletTransaction, WithdrawalRequest
 
 
 class WalletTransactionSerializer(serializers.ModelSerializer):
-    order_id = serializers.IntegerField(source="order.id", read_only=True)
-    withdrawal_request_id = serializers.IntegerField(source="withdrawal_request.id", read_only=True)
+    order_id = serializers.IntegerField(read_only=True)
+    withdrawal_request_id = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = WalletTransaction
@@ -27,13 +28,29 @@ class WalletTransactionSerializer(serializers.ModelSerializer):
 
 
 class WalletSerializer(serializers.ModelSerializer):
-    transactions = WalletTransactionSerializer(many=True, read_only=True)
+    commission_paid_this_month = serializers.DecimalField(max_digits=12, decimal_places=2, read_only=True)
+    transactions = WalletTransactionSerializer(source="recent_transactions", many=True, read_only=True)
+    transactions_url = serializers.SerializerMethodField()
 
     class Meta:
         model = Wallet
-        fields = ["id", "balance", "updated_at", "transactions"]
+        fields = [
+            "id",
+            "balance",
+            "lifetime_credits",
+            "pending_withdrawals",
+            "commission_paid_this_month",
+            "updated_at",
+            "transactions",
+            "transactions_url",
+        ]
         read_only_fields = fields
 
+    def get_transactions_url(self, obj) -> str:
+        url = reverse("wallet-transactions-list")
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
+
 
 class WithdrawalRequestSerializer(serializers.ModelSerializer):
     bank_details_id = serializers.IntegerField(source="bank_details.id", read_only=True)
@@ -1,12 +1,21 @@
+from collections import defaultdict
 from decimal import Decimal, ROUND_HALF_UP
 
 from django.conf import settings
 from django.db import transaction
+from django.db.models import Q, Sum
+from django.utils import timezone
 from rest_framework.exceptions import ValidationError
 
-from apps.orders.models import Order
+from apps.orders.models import Order, OrderItem
+from apps.orders.signals import orders_updated
+from apps.wallet.ledger import append_entry, take_snapshot
 from apps.wallet.models import Wallet, WalletTransaction
 
+SETTLEMENT_FIELDS = ["seller_settlement_credited", "seller_settlement_amount", "updated_at"]
+LATE_FEE_FIELDS = ["late_fees", "updated_at"]
+PENALTY_ITEM_FIELDS = ["penalty_days", "penalty_amount", "penalty_assessed_on", "penalty_finalized"]
+
 
 def _to_money(value: Decimal) -> Decimal:
     return value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
@@ -17,45 +26,242 @@ def get_or_create_wallet(user):
     return wallet
 
 
-@transaction.atomic
-def credit_seller_on_order_delivery(order: Order):
-    if order.seller_settlement_credited:
-        return None
-    if order.payment_status != Order.PaymentStatus.PAID:
-        raise ValidationError("Only paid orders can be settled to seller wallet.")
-
-    commission_percent = Decimal(str(settings.PLATFORM_COMMISSION_PERCENT))
-    gross = _to_money(Decimal(order.total))
+def _commission_percent() -> Decimal:
+    return Decimal(str(settings.PLATFORM_COMMISSION_PERCENT))
+
+
+def settlement_breakdown(total, commission_percent: Decimal) -> tuple[Decimal, Decimal, Decimal]:
+    """Returns (gross, commission, net) for an order total, rounded half-up to paise."""
+    gross = _to_money(Decimal(total))
     commission_amount = _to_money((gross * commission_percent) / Decimal("100"))
     net_amount = _to_money(gross - commission_amount)
     if net_amount < 0:
         net_amount = Decimal("0.00")
+    return gross, commission_amount, net_amount
 
-    wallet = Wallet.objects.select_for_update().filter(user=order.seller).first()
-    if wallet is None:
-        wallet = Wallet.objects.create(user=order.seller)
 
-    wallet.balance = _to_money(Decimal(wallet.balance) + net_amount)
-    wallet.save(update_fields=["balance", "updated_at"])
+def _settlement_meta(gross: Decimal, commission_percent: Decimal, commission_amount: Decimal, net_amount: Decimal) -> dict:
+    return {
+        "gross_order_total": str(gross),
+        "commission_percent": str(commission_percent),
+        "commission_amount": str(commission_amount),
+        "net_settlement_amount": str(net_amount),
+    }
 
-    tx = WalletTransaction.objects.create(
-        wallet=wallet,
-        transaction_type=WalletTransaction.TransactionType.CREDIT,
-        source=WalletTransaction.Source.ORDER_SETTLEMENT,
-        amount=net_amount,
-        balance_after=wallet.balance,
-        order=order,
-        description=f"Settlement credited for order #{order.id}",
-        meta={
-            "gross_order_total": str(gross),
-            "commission_percent": str(commission_percent),
-            "commission_amount": str(commission_amount),
-            "net_settlement_amount": str(net_amount),
-        },
+
+def _wallets_for_users(user_ids) -> dict[int, Wallet]:
+    user_ids = set(user_ids)
+    wallets = {wallet.user_id: wallet for wallet in Wallet.objects.filter(user_id__in=user_ids)}
+    missing = user_ids - wallets.keys()
+    if missing:
+        Wallet.objects.bulk_create([Wallet(user_id=user_id) for user_id in missing], ignore_conflicts=True)
+        wallets.update({wallet.user_id: wallet for wallet in Wallet.objects.filter(user_id__in=missing)})
+    return wallets
+
+
+@transaction.atomic
+def settle_delivered_orders(batch_size: int = 500) -> int:
+    """
+    Settles one batch of delivered, paid and unsettled orders.
+
+    Each batch writes one ledger entry per order with a single bulk INSERT,
+    flags the orders with a single bulk UPDATE, then folds each affected
+    seller's wallet once. Rows another worker already claimed are skipped.
+    """
+    orders = list(
+        Order.objects.select_for_update(skip_locked=True)
+        .filter(
+            status=Order.Status.DELIVERED,
+            payment_status=Order.PaymentStatus.PAID,
+            seller_settlement_credited=False,
+        )
+        .only("id", "seller_id", "total", "amount_refunded")
+        .order_by("id")[:batch_size]
     )
+    if not orders:
+        return 0
+
+    commission_percent = _commission_percent()
+    wallets = _wallets_for_users(order.seller_id for order in orders)
+    now = timezone.now()
+    entries = []
+    for order in orders:
+        # Partial refunds processed before delivery are not paid out.
+        gross, commission_amount, net_amount = settlement_breakdown(
+            order.total - order.amount_refunded, commission_percent
+        )
+        order.seller_settlement_credited = True
+        order.seller_settlement_amount = net_amount
+        order.updated_at = now
+        entries.append(
+            WalletTransaction(
+                wallet=wallets[order.seller_id],
+                transaction_type=WalletTransaction.TransactionType.CREDIT,
+                source=WalletTransaction.Source.ORDER_SETTLEMENT,
+                amount=net_amount,
+                order=order,
+                description=f"Settlement credited for order #{order.id}",
+                meta=_settlement_meta(gross, commission_percent, commission_amount, net_amount),
+            )
+        )
+
+    WalletTransaction.objects.bulk_create(entries)
+    Order.objects.bulk_update(orders, SETTLEMENT_FIELDS)
+    orders_updated.send(sender=Order, order_ids=[order.id for order in orders], fields=SETTLEMENT_FIELDS)
+    for wallet in wallets.values():
+        take_snapshot(wallet)
+    return len(orders)
 
-    order.seller_settlement_credited = True
-    order.seller_settlement_amount = net_amount
-    order.save(update_fields=["seller_settlement_credited", "seller_settlement_amount", "updated_at"])
 
+@transaction.atomic
+def reverse_refunded_settlements(refunds: list[tuple[Order, Decimal]]) -> int:
+    """
+    Takes back the seller's share of refunds on orders that were already settled.
+
+    ``refunds`` pairs each settled order, with ``amount_refunded`` already
+    raised, with the amount refunded by this batch. A partial refund debits
+    its amount net of commission; once the order is fully refunded, whatever
+    is left of the settlement is debited, so the reversals add up to exactly
+    the settled amount. Writes one bulk INSERT and one fold per seller wallet.
+    """
+    refunds = [(order, amount) for order, amount in refunds if amount > 0]
+    if not refunds:
+        return 0
+    reversed_so_far = dict(
+        WalletTransaction.objects.filter(
+            order_id__in=[order.id for order, _ in refunds], source=WalletTransaction.Source.REFUND_REVERSAL
+        )
+        .values("order_id")
+        .annotate(total=Sum("amount"))
+        .values_list("order_id", "total")
+    )
+    commission_percent = _commission_percent()
+    wallets = _wallets_for_users(order.seller_id for order, _ in refunds)
+    entries = []
+    for order, amount in refunds:
+        remaining = order.seller_settlement_amount - reversed_so_far.get(order.id, Decimal("0.00"))
+        if order.amount_refunded >= order.total:
+            reversal = remaining
+        else:
+            reversal = min(settlement_breakdown(amount, commission_percent)[2], remaining)
+        if reversal <= 0:
+            continue
+        # The platform hands back its commission on the refunded amount.
+        commission_amount = max(amount - reversal, Decimal("0.00"))
+        entries.append(
+            WalletTransaction(
+                wallet=wallets[order.seller_id],
+                transaction_type=WalletTransaction.TransactionType.DEBIT,
+                source=WalletTransaction.Source.REFUND_REVERSAL,
+                amount=reversal,
+                order=order,
+                description=f"Refund reversal for order #{order.id}",
+                meta={
+                    "refunded": str(amount),
+                    "amount_refunded": str(order.amount_refunded),
+                    "commission_amount": str(commission_amount),
+                },
+            )
+        )
+    WalletTransaction.objects.bulk_create(entries)
+    for wallet in {entry.wallet for entry in entries}:
+        take_snapshot(wallet)
+    return len(entries)
+
+
+@transaction.atomic
+def assess_rental_penalties(batch_size: int = 500, today=None) -> int:
+    """
+    Assesses late-return penalties for one batch of overdue rental items.
+
+    A rental item on a delivered order is overdue once its end date has
+    passed. Its penalty is the days it stayed out past the end date (up to
+    its return, once it is back) times the per-day rate copied at checkout.
+    Only the increase since the previous run is added to the order's
+    ``late_fees``: one bulk UPDATE of items and one of orders. Nothing is
+    credited here; the seller is paid when the fee is collected
+    (``collect_late_fees``). Items already assessed today are skipped, so the
+    job can be rerun safely.
+    """
+    today = today or timezone.localdate()
+    items = list(
+        OrderItem.objects.select_for_update(skip_locked=True)
+        .filter(penalty_finalized=False, rental_end__lt=today, order__status=Order.Status.DELIVERED)
+        .filter(Q(penalty_assessed_on__isnull=True) | Q(penalty_assessed_on__lt=today))
+        .select_related("order")
+        .only(
+            "id",
+            "rental_end",
+            "returned_at",
+            "late_penalty_per_day",
+            "penalty_days",
+            "penalty_amount",
+            "penalty_assessed_on",
+            "penalty_finalized",
+            "order__id",
+            "order__late_fees",
+        )
+        .order_by("id")[:batch_size]
+    )
+    if not items:
+        return 0
+
+    increases = defaultdict(lambda: Decimal("0.00"))
+    orders = {}
+    for item in items:
+        last_day = today
+        if item.returned_at is not None:
+            last_day = min(today, timezone.localdate(item.returned_at))
+            item.penalty_finalized = True
+        item.penalty_days = max((last_day - item.rental_end).days, 0)
+        amount = _to_money(item.late_penalty_per_day * item.penalty_days)
+        if amount > item.penalty_amount:
+            increases[item.order_id] += amount - item.penalty_amount
+            item.penalty_amount = amount
+            orders[item.order_id] = item.order
+        item.penalty_assessed_on = today
+    OrderItem.objects.bulk_update(items, PENALTY_ITEM_FIELDS)
+    if not orders:
+        return len(items)
+
+    now = timezone.now()
+    for order in orders.values():
+        order.late_fees += increases[order.id]
+        order.updated_at = now
+    Order.objects.bulk_update(orders.values(), LATE_FEE_FIELDS)
+    orders_updated.send(sender=Order, order_ids=list(orders), fields=LATE_FEE_FIELDS)
+    return len(items)
+
+
+@transaction.atomic
+def collect_late_fees(order: Order, amount: Decimal | None = None) -> WalletTransaction:
+    """
+    Records ``amount`` (default: everything outstanding) of the order's late fees as collected.
+
+    The seller is credited the collected amount net of the platform
+    commission, the same split as an order settlement. Penalties that were
+    only assessed are never paid out, so the platform cannot pay sellers
+    money it has not received.
+    """
+    order = Order.objects.select_for_update().get(pk=order.pk)
+    outstanding = order.late_fees - order.late_fees_collected
+    amount = outstanding if amount is None else _to_money(Decimal(amount))
+    if amount <= 0 or amount > outstanding:
+        raise ValidationError({"amount": f"Outstanding late fees on this order are {outstanding}."})
+
+    commission_percent = _commission_percent()
+    gross, commission_amount, net_amount = settlement_breakdown(amount, commission_percent)
+    order.late_fees_collected += amount
+    order.save(update_fields=["late_fees_collected", "updated_at"])
+    wallet = get_or_create_wallet(order.seller)
+    tx = append_entry(
+        wallet,
+        WalletTransaction.TransactionType.CREDIT,
+        WalletTransaction.Source.RENTAL_PENALTY,
+        net_amount,
+        order=order,
+        description=f"Late return penalty collected for order #{order.id}",
+        meta=_settlement_meta(gross, commission_percent, commission_amount, net_amount),
+    )
+    take_snapshot(wallet)
     return tx
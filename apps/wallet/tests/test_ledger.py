@@ -0,0 +1,87 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from rest_framework.exceptions import ValidationError
+
+from apps.common.testing import make_seller
+from apps.wallet.ledger import append_entry, debit_wallet, get_balance, reconcile_wallet, take_snapshot
+from apps.wallet.models import WalletBalanceSnapshot, WalletTransaction
+from apps.wallet.services import get_or_create_wallet
+
+CREDIT = WalletTransaction.TransactionType.CREDIT
+SETTLEMENT = WalletTransaction.Source.ORDER_SETTLEMENT
+WITHDRAWAL = WalletTransaction.Source.WITHDRAWAL
+
+
+class LedgerTests(TestCase):
+    def setUp(self):
+        self.wallet = get_or_create_wallet(make_seller())
+
+    def credit(self, amount, commission="0.00"):
+        return append_entry(self.wallet, CREDIT, SETTLEMENT, Decimal(amount), meta={"commission_amount": commission})
+
+    def test_balance_counts_entries_before_they_are_folded(self):
+        self.credit("100.00")
+        self.credit("50.00")
+
+        self.assertEqual(get_balance(self.wallet), Decimal("150.00"))
+        self.assertFalse(WalletBalanceSnapshot.objects.exists())
+
+    def test_folds_keep_one_consistent_chain(self):
+        self.credit("100.00")
+        take_snapshot(self.wallet)
+        debit_wallet(self.wallet, Decimal("30.00"), WITHDRAWAL)
+        self.credit("45.50")
+        take_snapshot(self.wallet)
+        self.credit("4.50")
+        take_snapshot(self.wallet)
+
+        chain = list(
+            WalletTransaction.objects.filter(wallet=self.wallet)
+            .order_by("ledger_sequence")
+            .values_list("ledger_sequence", "balance_after")
+        )
+        self.assertEqual(
+            chain,
+            [(1, Decimal("100.00")), (2, Decimal("70.00")), (3, Decimal("115.50")), (4, Decimal("120.00"))],
+        )
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.balance, Decimal("120.00"))
+        self.assertEqual(get_balance(self.wallet), Decimal("120.00"))
+        self.assertEqual(reconcile_wallet(self.wallet), [])
+
+    def test_fold_without_new_entries_writes_no_snapshot(self):
+        self.credit("10.00")
+        first = take_snapshot(self.wallet)
+
+        self.assertEqual(take_snapshot(self.wallet), first)
+        self.assertEqual(WalletBalanceSnapshot.objects.count(), 1)
+
+    def test_fold_advances_the_overview_aggregates(self):
+        self.credit("90.00", commission="10.00")
+        self.credit("45.00", commission="5.00")
+        debit_wallet(self.wallet, Decimal("20.00"), WITHDRAWAL)
+        take_snapshot(self.wallet)
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.lifetime_credits, Decimal("135.00"))
+        self.assertEqual(self.wallet.commission_paid_this_month, Decimal("15.00"))
+
+    def test_debit_cannot_overdraw(self):
+        self.credit("10.00")
+
+        with self.assertRaises(ValidationError):
+            debit_wallet(self.wallet, Decimal("10.01"), WITHDRAWAL)
+        self.assertEqual(get_balance(self.wallet), Decimal("10.00"))
+
+    def test_reconcile_reports_a_broken_chain(self):
+        self.credit("10.00")
+        self.credit("5.00")
+        take_snapshot(self.wallet)
+        WalletTransaction.objects.filter(wallet=self.wallet, ledger_sequence=2).update(balance_after=Decimal("99.00"))
+        self.wallet.refresh_from_db()
+
+        issues = reconcile_wallet(self.wallet)
+
+        self.assertEqual(len(issues), 1)
+        self.assertIn("Entry #2", issues[0])
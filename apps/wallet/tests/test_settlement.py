@@ -0,0 +1,79 @@
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from apps.common.testing import api_client, make_order, make_seller, make_user
+from apps.orders.models import Order
+from apps.wallet.ledger import get_balance, reconcile_wallet
+from apps.wallet.models import WalletTransaction
+from apps.wallet.services import get_or_create_wallet, settle_delivered_orders
+
+PAID = Order.PaymentStatus.PAID
+DELIVERED = Order.Status.DELIVERED
+
+
+@override_settings(PLATFORM_COMMISSION_PERCENT="10")
+class SettlementTests(TestCase):
+    def setUp(self):
+        self.seller = make_seller()
+        self.customer = make_user("customer@example.com")
+
+    def order(self, total="1000.00", status=DELIVERED, payment_status=PAID):
+        return make_order(self.customer, self.seller, total, status=status, payment_status=payment_status)
+
+    def test_only_delivered_paid_orders_are_settled(self):
+        settled = self.order()
+        unpaid = self.order(payment_status=Order.PaymentStatus.UNPAID)
+        shipped = self.order(status=Order.Status.SHIPPED)
+
+        self.assertEqual(settle_delivered_orders(), 1)
+
+        self.assertEqual(
+            set(Order.objects.filter(seller_settlement_credited=True).values_list("id", flat=True)), {settled.id}
+        )
+        self.assertFalse(WalletTransaction.objects.filter(order__in=[unpaid, shipped]).exists())
+
+    def test_seller_is_credited_net_of_commission(self):
+        order = self.order("999.99")
+
+        settle_delivered_orders()
+
+        order.refresh_from_db()
+        entry = WalletTransaction.objects.get(order=order)
+        self.assertEqual(order.seller_settlement_amount, Decimal("899.99"))
+        self.assertEqual(entry.amount, Decimal("899.99"))
+        self.assertEqual(entry.meta["commission_amount"], "100.00")
+        self.assertEqual(entry.balance_after, Decimal("899.99"))
+
+    def test_rerunning_settles_nothing_twice(self):
+        for _ in range(3):
+            self.order()
+
+        self.assertEqual(settle_delivered_orders(batch_size=2), 2)
+        self.assertEqual(settle_delivered_orders(batch_size=2), 1)
+        self.assertEqual(settle_delivered_orders(batch_size=2), 0)
+
+        wallet = get_or_create_wallet(self.seller)
+        self.assertEqual(WalletTransaction.objects.count(), 3)
+        self.assertEqual(get_balance(wallet), Decimal("2700.00"))
+        self.assertEqual(reconcile_wallet(wallet), [])
+
+    def test_delivery_itself_does_not_credit_the_seller(self):
+        order = self.order(status=Order.Status.SHIPPED)
+
+        api_client(self.seller).post(f"/api/orders/{order.id}/update_status/", {"status": DELIVERED}, format="json")
+
+        order.refresh_from_db()
+        self.assertEqual(order.status, DELIVERED)
+        self.assertFalse(WalletTransaction.objects.exists())
+
+    def test_command_settles_every_batch(self):
+        for _ in range(3):
+            self.order()
+        out = StringIO()
+
+        call_command("settle_delivered_orders", "--batch-size", "2", stdout=out)
+
+        self.assertIn("Settled 3 orders.", out.getvalue())
@@ -0,0 +1,179 @@
+from datetime import timedelta
+from decimal import Decimal
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.accounts.models import BankDetails, User
+from apps.wallet.ledger import append_entry, get_balance, take_snapshot
+from apps.wallet.models import Wallet, WalletTransaction, WithdrawalRequest
+from apps.wallet.services import get_or_create_wallet
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+class WalletTransactionPaginationTests(TestCase):
+    def test_rows_sharing_a_timestamp_are_paged_exactly_once(self):
+        seller = User.objects.create_user(email="seller@example.com", password=None, role=User.Role.BOUTIQUE_OWNER)
+        wallet = get_or_create_wallet(seller)
+        WalletTransaction.objects.bulk_create(
+            WalletTransaction(
+                wallet=wallet,
+                transaction_type=WalletTransaction.TransactionType.CREDIT,
+                source=WalletTransaction.Source.ORDER_SETTLEMENT,
+                amount=Decimal("10.00"),
+            )
+            for _ in range(7)
+        )
+        WalletTransaction.objects.update(created_at=timezone.now())
+        client = client_for(seller)
+
+        seen = []
+        url = "/api/wallet/transactions/?page_size=3"
+        while url:
+            page = client.get(url).json()
+            seen += [row["id"] for row in page["results"]]
+            url = page["next"]
+
+        self.assertEqual(sorted(seen), sorted(WalletTransaction.objects.values_list("id", flat=True)))
+        self.assertEqual(len(seen), len(set(seen)))
+
+
+class WalletOverviewTests(TestCase):
+    def setUp(self):
+        self.seller = User.objects.create_user(email="seller@example.com", password=None, role=User.Role.BOUTIQUE_OWNER)
+        self.wallet = get_or_create_wallet(self.seller)
+        self.client = client_for(self.seller)
+
+    def settle(self, amount, commission):
+        return append_entry(
+            self.wallet,
+            WalletTransaction.TransactionType.CREDIT,
+            WalletTransaction.Source.ORDER_SETTLEMENT,
+            Decimal(amount),
+            meta={"commission_amount": commission},
+        )
+
+    def test_recent_transactions_are_bounded_and_newest_first(self):
+        entries = [self.settle("10.00", "1.00") for _ in range(25)]
+
+        default = self.client.get("/api/wallet/me/").json()
+        capped = self.client.get("/api/wallet/me/?limit=500").json()
+        three = self.client.get("/api/wallet/me/?limit=3").json()
+
+        self.assertEqual(len(default["transactions"]), 20)
+        self.assertEqual(len(capped["transactions"]), 25)
+        self.assertEqual([row["id"] for row in three["transactions"]], [tx.id for tx in reversed(entries[-3:])])
+        self.assertTrue(three["transactions_url"].endswith("/api/wallet/transactions/"))
+        self.assertEqual(self.client.get("/api/wallet/me/?limit=abc").status_code, 400)
+
+    def test_query_count_does_not_grow_with_history(self):
+        self.settle("10.00", "1.00")
+        with CaptureQueriesContext(connection) as short:
+            self.client.get("/api/wallet/me/")
+        for _ in range(40):
+            self.settle("10.00", "1.00")
+        take_snapshot(self.wallet)
+        with CaptureQueriesContext(connection) as long:
+            self.client.get("/api/wallet/me/")
+
+        self.assertEqual(len(long), len(short))
+
+    def test_aggregates_cover_folded_and_unfolded_entries(self):
+        self.settle("900.00", "100.00")
+        take_snapshot(self.wallet)
+        self.settle("450.00", "50.00")
+        append_entry(
+            self.wallet,
+            WalletTransaction.TransactionType.DEBIT,
+            WalletTransaction.Source.WITHDRAWAL,
+            Decimal("200.00"),
+        )
+        Wallet.objects.filter(pk=self.wallet.pk).update(pending_withdrawals=Decimal("300.00"))
+
+        data = self.client.get("/api/wallet/me/").json()
+
+        self.assertEqual(data["balance"], "1150.00")
+        self.assertEqual(data["lifetime_credits"], "1350.00")
+        self.assertEqual(data["pending_withdrawals"], "300.00")
+        # Commission is counted when an entry is folded into a snapshot.
+        self.assertEqual(data["commission_paid_this_month"], "100.00")
+
+        take_snapshot(self.wallet)
+        data = self.client.get("/api/wallet/me/").json()
+        self.assertEqual(data["lifetime_credits"], "1350.00")
+        self.assertEqual(data["commission_paid_this_month"], "150.00")
+
+    def test_last_months_commission_is_not_reported(self):
+        last_month = (timezone.localdate().replace(day=1) - timedelta(days=1)).replace(day=1)
+        Wallet.objects.filter(pk=self.wallet.pk).update(
+            commission_month=last_month, commission_month_total=Decimal("75.00")
+        )
+
+        data = self.client.get("/api/wallet/me/").json()
+
+        self.assertEqual(data["commission_paid_this_month"], "0.00")
+
+
+class WithdrawalReviewTests(TestCase):
+    def setUp(self):
+        self.seller = User.objects.create_user(
+            email="seller@example.com", password=None, role=User.Role.BOUTIQUE_OWNER
+        )
+        self.admin = User.objects.create_user(email="admin@example.com", password=None, role=User.Role.ADMIN)
+        self.bank_details = BankDetails.objects.create(
+            user=self.seller, account_holder_name="Asha", account_number="1234567890", ifsc_code="HDFC0000001"
+        )
+        self.wallet = get_or_create_wallet(self.seller)
+        WalletTransaction.objects.create(
+            wallet=self.wallet,
+            transaction_type=WalletTransaction.TransactionType.CREDIT,
+            source=WalletTransaction.Source.ORDER_SETTLEMENT,
+            amount=Decimal("1000.00"),
+        )
+
+    def request_withdrawal(self, amount="400.00"):
+        response = client_for(self.seller).post(
+            "/api/wallet/withdrawals/", {"amount": amount, "bank_details": self.bank_details.id}, format="json"
+        )
+        self.assertEqual(response.status_code, 201)
+        return response.json()["id"]
+
+    def test_create_reserves_the_amount(self):
+        self.request_withdrawal()
+
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.pending_withdrawals, Decimal("400.00"))
+
+    def test_second_approval_is_refused_and_debits_once(self):
+        withdrawal_id = self.request_withdrawal()
+        admin = client_for(self.admin)
+
+        first = admin.post(f"/api/wallet/withdrawals/{withdrawal_id}/approve/", {}, format="json")
+        second = admin.post(f"/api/wallet/withdrawals/{withdrawal_id}/approve/", {}, format="json")
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 400)
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.pending_withdrawals, Decimal("0.00"))
+        self.assertEqual(get_balance(self.wallet), Decimal("600.00"))
+
+    def test_reject_after_approval_leaves_the_counter_alone(self):
+        withdrawal_id = self.request_withdrawal()
+        admin = client_for(self.admin)
+        admin.post(f"/api/wallet/withdrawals/{withdrawal_id}/approve/", {}, format="json")
+
+        response = admin.post(f"/api/wallet/withdrawals/{withdrawal_id}/reject/", {}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.wallet.refresh_from_db()
+        self.assertEqual(self.wallet.pending_withdrawals, Decimal("0.00"))
+        self.assertEqual(WithdrawalRequest.objects.get().status, WithdrawalRequest.Status.APPROVED)
+        self.assertEqual(Wallet.objects.count(), 1)
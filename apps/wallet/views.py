@@ -1,8 +1,10 @@
 from decimal import Decimal
 
 from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
-from drf_spectacular.utils import OpenApiExample, extend_schema, extend_schema_view, inline_serializer
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema, extend_schema_view, inline_serializer
 from rest_framework import generics, permissions, serializers, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import PermissionDenied, ValidationError
@@ -10,7 +12,10 @@ from rest_framework.response import Response
 
 from apps.accounts.models import User
 from apps.accounts.permissions import IsAdmin
-from apps.wallet.models import WalletTransaction, WithdrawalRequest
+from apps.common.exports import EXPORT_PARAMETERS, filter_date_range, get_export_format, stream_export
+from apps.common.pagination import CreatedAtCursorPagination
+from apps.wallet.ledger import debit_wallet, get_balance, load_live_totals
+from apps.wallet.models import Wallet, WalletTransaction, WithdrawalRequest
 from apps.wallet.serializers import (
     WalletSerializer,
     WalletTransactionSerializer,
@@ -19,6 +24,21 @@ from apps.wallet.serializers import (
 from apps.wallet.services import get_or_create_wallet
 
 
+DEFAULT_RECENT_TRANSACTIONS = 20
+MAX_RECENT_TRANSACTIONS = 50
+WALLET_STATEMENT_COLUMNS = [
+    ("id", "id"),
+    ("created_at", "created_at"),
+    ("wallet_id", "wallet_id"),
+    ("transaction_type", "transaction_type"),
+    ("source", "source"),
+    ("amount", "amount"),
+    ("balance_after", "balance_after"),
+    ("order_id", "order_id"),
+    ("withdrawal_request_id", "withdrawal_request_id"),
+    ("description", "description"),
+]
+
 WithdrawalCreateRequestSerializer = inline_serializer(
     name="WithdrawalCreateRequest",
     fields={
@@ -49,15 +69,30 @@ class WalletMeView(generics.RetrieveAPIView):
     @extend_schema(
         tags=["Wallet"],
         summary="Get current user wallet",
-        description="Returns the authenticated user's wallet with current balance and recent transactions.",
+        description=(
+            "Returns the authenticated user's wallet overview: current balance, summary aggregates and "
+            "the most recent transactions. Use transactions_url to page through the full history."
+        ),
+        parameters=[
+            OpenApiParameter(
+                "limit",
+                int,
+                description=f"Number of recent transactions to include (max {MAX_RECENT_TRANSACTIONS}).",
+            )
+        ],
         responses={200: WalletSerializer},
     )
     def get(self, request, *args, **kwargs):
         return super().get(request, *args, **kwargs)
 
     def get_object(self):
-        wallet = get_or_create_wallet(self.request.user)
-        wallet.transactions.all()[:20]
+        wallet = load_live_totals(get_or_create_wallet(self.request.user))
+        try:
+            limit = int(self.request.query_params.get("limit", DEFAULT_RECENT_TRANSACTIONS))
+        except ValueError:
+            raise ValidationError({"limit": "limit must be an integer."})
+        limit = max(0, min(limit, MAX_RECENT_TRANSACTIONS))
+        wallet.recent_transactions = list(wallet.transactions.order_by("-created_at", "-id")[:limit])
         return wallet
 
 
@@ -65,7 +100,7 @@ class WalletMeView(generics.RetrieveAPIView):
     list=extend_schema(
         tags=["Wallet"],
         summary="List wallet transactions",
-        description="Returns wallet transactions. Admins can view all transactions, while non-admin users can view only their own.",
+        description="Returns wallet transactions, newest first, using cursor pagination. Admins can view all transactions, while non-admin users can view only their own.",
         responses={200: WalletTransactionSerializer(many=True)},
     ),
     retrieve=extend_schema(
@@ -78,16 +113,27 @@ class WalletMeView(generics.RetrieveAPIView):
 class WalletTransactionViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = WalletTransactionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
 
     def get_queryset(self):
         user = self.request.user
         if not user.is_authenticated:
             return WalletTransaction.objects.none()
         if user.role == User.Role.ADMIN:
-            return WalletTransaction.objects.select_related("wallet", "order", "withdrawal_request")
-        return WalletTransaction.objects.filter(wallet__user=user).select_related(
-            "wallet", "order", "withdrawal_request"
-        )
+            return WalletTransaction.objects.all()
+        return WalletTransaction.objects.filter(wallet__user=user)
+
+    @extend_schema(
+        tags=["Wallet"],
+        summary="Export wallet statement",
+        description="Streams wallet transactions as CSV or JSONL, newest first, optionally limited to a date range.",
+        parameters=EXPORT_PARAMETERS,
+        responses={(200, "text/csv"): OpenApiTypes.STR},
+    )
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        queryset = filter_date_range(self.get_queryset(), request).order_by("-created_at", "-id")
+        return stream_export(queryset, WALLET_STATEMENT_COLUMNS, get_export_format(request), "wallet-statement")
 
 
 @extend_schema_view(
@@ -131,6 +177,12 @@ class WithdrawalRequestViewSet(viewsets.ModelViewSet):
             return queryset
         return queryset.filter(seller=user)
 
+    def get_locked_object(self):
+        """The request row locked until the transaction ends, so two reviews of it run one after the other."""
+        withdrawal = self.get_object()
+        return WithdrawalRequest.objects.select_for_update().get(pk=withdrawal.pk)
+
+    @transaction.atomic
     def perform_create(self, serializer):
         user = self.request.user
         if user.role == User.Role.ADMIN:
@@ -142,10 +194,10 @@ class WithdrawalRequestViewSet(viewsets.ModelViewSet):
 
         wallet = get_or_create_wallet(user)
         amount = Decimal(serializer.validated_data["amount"])
-        if amount > wallet.balance:
+        if amount > get_balance(wallet):
             raise ValidationError({"amount": "Insufficient wallet balance."})
 
-        serializer.save(
+        withdrawal = serializer.save(
             seller=user,
             wallet=wallet,
             bank_details=bank_details,
@@ -154,11 +206,12 @@ class WithdrawalRequestViewSet(viewsets.ModelViewSet):
             ifsc_code_snapshot=bank_details.ifsc_code,
             upi_id_snapshot=bank_details.upi_id,
         )
+        Wallet.objects.filter(pk=wallet.pk).update(pending_withdrawals=F("pending_withdrawals") + withdrawal.amount)
 
     @extend_schema(
         tags=["Wallet"],
         summary="Approve withdrawal request",
-        description="Admin-only endpoint. Approves a pending withdrawal, debits wallet balance, and creates a wallet debit transaction record.",
+        description="Admin-only endpoint. Approves a pending withdrawal and appends a debit entry to the wallet ledger.",
         request=WithdrawalReviewRequestSerializer,
         responses={200: WithdrawalRequestSerializer},
         examples=[
@@ -172,25 +225,14 @@ class WithdrawalRequestViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=["post"], permission_classes=[IsAdmin])
     @transaction.atomic
     def approve(self, request, pk=None):
-        withdrawal = self.get_object()
+        withdrawal = self.get_locked_object()
         if withdrawal.status != WithdrawalRequest.Status.PENDING:
             raise ValidationError("Only pending withdrawal requests can be approved.")
 
-        wallet = withdrawal.wallet
-        wallet = wallet.__class__.objects.select_for_update().get(pk=wallet.pk)
-        amount = Decimal(withdrawal.amount)
-        if amount > wallet.balance:
-            raise ValidationError("Insufficient wallet balance for this approval.")
-
-        wallet.balance = wallet.balance - amount
-        wallet.save(update_fields=["balance", "updated_at"])
-
-        WalletTransaction.objects.create(
-            wallet=wallet,
-            transaction_type=WalletTransaction.TransactionType.DEBIT,
-            source=WalletTransaction.Source.WITHDRAWAL,
-            amount=amount,
-            balance_after=wallet.balance,
+        debit_wallet(
+            withdrawal.wallet,
+            Decimal(withdrawal.amount),
+            WalletTransaction.Source.WITHDRAWAL,
             withdrawal_request=withdrawal,
             description=f"Withdrawal approved for request #{withdrawal.id}",
             meta={
@@ -199,6 +241,9 @@ class WithdrawalRequestViewSet(viewsets.ModelViewSet):
             },
         )
 
+        Wallet.objects.filter(pk=withdrawal.wallet_id).update(
+            pending_withdrawals=F("pending_withdrawals") - withdrawal.amount
+        )
         withdrawal.status = WithdrawalRequest.Status.APPROVED
         withdrawal.reviewed_by = request.user
         withdrawal.reviewed_at = timezone.now()
@@ -222,11 +267,15 @@ class WithdrawalRequestViewSet(viewsets.ModelViewSet):
         ],
     )
     @action(detail=True, methods=["post"], permission_classes=[IsAdmin])
+    @transaction.atomic
     def reject(self, request, pk=None):
-        withdrawal = self.get_object()
+        withdrawal = self.get_locked_object()
         if withdrawal.status != WithdrawalRequest.Status.PENDING:
             raise ValidationError("Only pending withdrawal requests can be rejected.")
 
+        Wallet.objects.filter(pk=withdrawal.wallet_id).update(
+            pending_withdrawals=F("pending_withdrawals") - withdrawal.amount
+        )
         withdrawal.status = WithdrawalRequest.Status.REJECTED
         withdrawal.reviewed_by = request.user
         withdrawal.reviewed_at = timezone.now()
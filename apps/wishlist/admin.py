@@ -1,9 +1,17 @@
 from django.contrib import admin
 
-from apps.wishlist.models import WishlistItem
+from apps.wishlist.models import WishlistAlert, WishlistItem
 
 
 @admin.register(WishlistItem)
 class WishlistItemAdmin(admin.ModelAdmin):
     list_display = ("id", "user", "product", "variant", "created_at")
-    search_fields = ("user__email", "product__name", "variant__name")
+    search_fields = ("user__email", "product__name", "variant__sku")
+
+
+@admin.register(WishlistAlert)
+class WishlistAlertAdmin(admin.ModelAdmin):
+    list_display = ("id", "user", "item", "kind", "old_price", "new_price", "read_at", "created_at")
+    list_filter = ("kind",)
+    search_fields = ("user__email",)
+    list_select_related = ("user",)
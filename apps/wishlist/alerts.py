@@ -0,0 +1,105 @@
+"""
+Wishlist price and stock tracking.
+
+An item's live price and stock come from its variant when it has one, and
+from the product card otherwise. ``with_live_state`` annotates both onto a
+WishlistItem queryset, so the list endpoint and the alert job share one
+definition. Each item keeps the values it had at the previous run
+(``seen_price``/``seen_in_stock``); the job selects only the rows whose live
+values differ, one keyset batch per query, and records a ``WishlistAlert``
+for each drop in price or return to stock.
+"""
+from django.db import transaction
+from django.db.models import BooleanField, Case, DecimalField, F, Q, Value, When
+from django.db.models.functions import Coalesce
+
+from apps.catalog.models import Product
+from apps.wishlist.models import WishlistAlert, WishlistItem
+
+SEEN_FIELDS = ["seen_price", "seen_in_stock"]
+
+
+def live_price():
+	return Case(
+		When(
+			product__product_type=Product.ProductType.RENTAL,
+			then=Coalesce("product__rental_price_per_day", "product__selling_price"),
+		),
+		When(variant__isnull=False, then=Coalesce("variant__price_override", "product__selling_price")),
+		default=Coalesce("product__card__effective_min_price", "product__selling_price"),
+		output_field=DecimalField(max_digits=10, decimal_places=2),
+	)
+
+
+def live_in_stock():
+	return Case(
+		When(~Q(product__status=Product.Status.PUBLISHED) | Q(product__is_active=False), then=Value(False)),
+		When(product__product_type=Product.ProductType.RENTAL, then=Value(True)),
+		When(variant__isnull=False, variant__is_active=True, variant__quantity__gt=0, then=Value(True)),
+		When(variant__isnull=False, then=Value(False)),
+		When(product__card__in_stock=True, then=Value(True)),
+		default=Value(False),
+		output_field=BooleanField(),
+	)
+
+
+def with_live_state(queryset):
+	return queryset.annotate(live_price=live_price(), live_in_stock=live_in_stock())
+
+
+def remember_seen(items) -> None:
+	"""Stores the live state of ``with_live_state`` items as the baseline for the next run."""
+	for item in items:
+		item.seen_price = item.live_price
+		item.seen_in_stock = item.live_in_stock
+	WishlistItem.objects.bulk_update(items, SEEN_FIELDS)
+
+
+@transaction.atomic
+def record_alerts(batch_size: int = 500) -> int:
+	"""
+	Records alerts for one batch of wishlist items whose price or stock changed.
+
+	Items without a baseline yet (added before tracking existed) only get one
+	on their first run. Every selected item is brought up to date, so calling
+	this until it returns 0 covers the whole table once.
+	"""
+	items = list(
+		with_live_state(WishlistItem.objects.select_for_update(skip_locked=True, of=("self",)))
+		.filter(
+			Q(seen_price__isnull=True)
+			| ~Q(live_price=F("seen_price"))
+			| ~Q(live_in_stock=F("seen_in_stock"))
+		)
+		.only("id", "user_id", *SEEN_FIELDS)
+		.order_by("id")[:batch_size]
+	)
+	if not items:
+		return 0
+
+	alerts = []
+	for item in items:
+		if item.seen_price is None:
+			continue
+		if item.live_price < item.seen_price:
+			alerts.append(
+				WishlistAlert(
+					user_id=item.user_id,
+					item=item,
+					kind=WishlistAlert.Kind.PRICE_DROP,
+					old_price=item.seen_price,
+					new_price=item.live_price,
+				)
+			)
+		if item.live_in_stock and not item.seen_in_stock:
+			alerts.append(
+				WishlistAlert(
+					user_id=item.user_id,
+					item=item,
+					kind=WishlistAlert.Kind.BACK_IN_STOCK,
+					new_price=item.live_price,
+				)
+			)
+	remember_seen(items)
+	WishlistAlert.objects.bulk_create(alerts)
+	return len(items)
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.wishlist.alerts import record_alerts
+
+
+class Command(BaseCommand):
+	help = "Records price-drop and back-in-stock alerts for wishlist items whose price or stock changed."
+
+	def add_arguments(self, parser):
+		parser.add_argument("--batch-size", type=int, default=500)
+
+	def handle(self, *args, **options):
+		total = 0
+		while True:
+			checked = record_alerts(batch_size=options["batch_size"])
+			if not checked:
+				break
+			total += checked
+		self.stdout.write(f"Checked {total} changed wishlist items.")
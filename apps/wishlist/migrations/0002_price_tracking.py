@@ -0,0 +1,69 @@
+# Generated by Django 5.2.11 on 2026-10-19 18:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def drop_duplicate_plain_items(apps, schema_editor):
+    """Keeps the oldest of each user's duplicate wishlist rows for a product without a variant."""
+    WishlistItem = apps.get_model("wishlist", "WishlistItem")
+    plain = WishlistItem.objects.filter(variant__isnull=True)
+    keep = plain.values("user_id", "product_id").annotate(keep_id=Min("id")).values_list("keep_id", flat=True)
+    plain.exclude(id__in=list(keep)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalog', '0010_admin_list_indexes'),
+        ('wishlist', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WishlistAlert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('price_drop', 'Price Drop'), ('back_in_stock', 'Back In Stock')], max_length=20)),
+                ('old_price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('new_price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('read_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='wishlistitem',
+            name='seen_in_stock',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='wishlistitem',
+            name='seen_price',
+            field=models.DecimalField(blank=True, decimal_places=2, editable=False, max_digits=10, null=True),
+        ),
+        migrations.RunPython(drop_duplicate_plain_items, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='wishlistitem',
+            constraint=models.UniqueConstraint(condition=models.Q(('variant__isnull', True)), fields=('user', 'product'), name='wishlist_unique_product_without_variant'),
+        ),
+        migrations.AddField(
+            model_name='wishlistalert',
+            name='item',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='alerts', to='wishlist.wishlistitem'),
+        ),
+        migrations.AddField(
+            model_name='wishlistalert',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='wishlist_alerts', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='wishlistalert',
+            index=models.Index(fields=['user', '-created_at'], name='wishlist_wi_user_id_8537db_idx'),
+        ),
+    ]
@@ -8,10 +8,44 @@ class WishlistItem(models.Model):
 	user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="wishlist_items")
 	product = models.ForeignKey(Product, on_delete=models.CASCADE)
 	variant = models.ForeignKey(ProductVariant, on_delete=models.SET_NULL, null=True, blank=True)
+	# Price and stock as of the last alert run (or when the item was added);
+	# ``apps.wishlist.alerts`` compares the live values against these.
+	seen_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, editable=False)
+	seen_in_stock = models.BooleanField(default=False, editable=False)
 	created_at = models.DateTimeField(auto_now_add=True)
 
 	class Meta:
 		unique_together = ("user", "product", "variant")
+		constraints = [
+			# unique_together treats NULL variants as distinct, so it cannot stop duplicates of plain products.
+			models.UniqueConstraint(
+				fields=["user", "product"],
+				condition=models.Q(variant__isnull=True),
+				name="wishlist_unique_product_without_variant",
+			),
+		]
 
 	def __str__(self) -> str:
 		return f"Wishlist {self.user_id} -> {self.product_id}"
+
+
+class WishlistAlert(models.Model):
+	"""A price drop or restock of a wishlisted item, recorded by the alert job."""
+	class Kind(models.TextChoices):
+		PRICE_DROP = "price_drop", "Price Drop"
+		BACK_IN_STOCK = "back_in_stock", "Back In Stock"
+
+	user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="wishlist_alerts")
+	item = models.ForeignKey(WishlistItem, on_delete=models.CASCADE, related_name="alerts")
+	kind = models.CharField(max_length=20, choices=Kind.choices)
+	old_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+	new_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
+	read_at = models.DateTimeField(null=True, blank=True)
+	created_at = models.DateTimeField(auto_now_add=True)
+
+	class Meta:
+		ordering = ["-created_at"]
+		indexes = [models.Index(fields=["user", "-created_at"])]
+
+	def __str__(self) -> str:
+		return f"{self.get_kind_display()} for wishlist item {self.item_id}"
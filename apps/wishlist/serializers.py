@@ -1,13 +1,95 @@
 from rest_framework import serializers
 
-from apps.wishlist.models import WishlistItem
+from apps.catalog.models import Product, ProductVariant
+from apps.catalog.serializers import ProductCardSerializer
+from apps.wishlist.models import WishlistAlert, WishlistItem
+
+BULK_WISHLIST_LIMIT = 100
 
 
 class WishlistItemSerializer(serializers.ModelSerializer):
 	product_name = serializers.CharField(source="product.name", read_only=True)
-	variant_name = serializers.CharField(source="variant.name", read_only=True)
+	variant_name = serializers.CharField(source="variant.name", read_only=True, allow_null=True, default=None)
+	product_card = ProductCardSerializer(source="product.card", read_only=True)
+	price = serializers.DecimalField(source="live_price", max_digits=10, decimal_places=2, read_only=True)
+	in_stock = serializers.BooleanField(source="live_in_stock", read_only=True)
 
 	class Meta:
 		model = WishlistItem
-		fields = ["id", "product", "product_name", "variant", "variant_name", "created_at"]
+		fields = [
+			"id",
+			"product",
+			"product_name",
+			"product_card",
+			"variant",
+			"variant_name",
+			"price",
+			"in_stock",
+			"created_at",
+		]
 		read_only_fields = ["id", "created_at"]
+
+	def validate(self, attrs):
+		# A PATCH may send only one of the two; the other keeps its saved value.
+		product = attrs.get("product") or self.instance.product
+		variant = attrs["variant"] if "variant" in attrs else getattr(self.instance, "variant", None)
+		if variant is not None and variant.product_id != product.id:
+			raise serializers.ValidationError({"variant": "This variant belongs to another product."})
+		return attrs
+
+
+class WishlistEntrySerializer(serializers.Serializer):
+	product = serializers.IntegerField(min_value=1)
+	variant = serializers.IntegerField(min_value=1, required=False, allow_null=True)
+
+
+class WishlistBulkAddSerializer(serializers.Serializer):
+	items = WishlistEntrySerializer(many=True, allow_empty=False, max_length=BULK_WISHLIST_LIMIT)
+
+	def validate_items(self, items):
+		"""Checks every product and variant with one query each and returns (product_id, variant_id) pairs."""
+		pairs = list(dict.fromkeys((item["product"], item.get("variant")) for item in items))
+		product_ids = {product_id for product_id, _ in pairs}
+		found = set(Product.objects.filter(id__in=product_ids).values_list("id", flat=True))
+		variants = dict(
+			ProductVariant.objects.filter(id__in={variant_id for _, variant_id in pairs if variant_id}).values_list(
+				"id", "product_id"
+			)
+		)
+		errors = {}
+		for product_id, variant_id in pairs:
+			if product_id not in found:
+				errors[str(product_id)] = "Product not found."
+			elif variant_id and variants.get(variant_id) != product_id:
+				errors[str(product_id)] = f"Variant {variant_id} does not belong to this product."
+		if errors:
+			raise serializers.ValidationError(errors)
+		return pairs
+
+
+class WishlistBulkRemoveSerializer(serializers.Serializer):
+	ids = serializers.ListField(
+		child=serializers.IntegerField(min_value=1), required=False, max_length=BULK_WISHLIST_LIMIT
+	)
+	products = serializers.ListField(
+		child=serializers.IntegerField(min_value=1), required=False, max_length=BULK_WISHLIST_LIMIT
+	)
+
+	def validate(self, attrs):
+		if bool(attrs.get("ids")) == bool(attrs.get("products")):
+			raise serializers.ValidationError("Pass either a non-empty ids list or products, not both.")
+		return attrs
+
+
+class WishlistAlertSerializer(serializers.ModelSerializer):
+	product = serializers.IntegerField(source="item.product_id", read_only=True)
+	product_name = serializers.CharField(source="item.product.name", read_only=True)
+
+	class Meta:
+		model = WishlistAlert
+		fields = ["id", "item", "product", "product_name", "kind", "old_price", "new_price", "read_at", "created_at"]
+		read_only_fields = fields
+
+
+class WishlistAlertReadSerializer(serializers.Serializer):
+	ids = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
@@ -0,0 +1,76 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.catalog.models import Product, ProductVariant
+from apps.common.testing import api_client, make_product, make_seller, make_user
+from apps.wishlist.alerts import record_alerts
+from apps.wishlist.models import WishlistAlert, WishlistItem
+
+Kind = WishlistAlert.Kind
+
+
+class WishlistAlertTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		self.seller = make_seller()
+		with self.captureOnCommitCallbacks(execute=True):
+			self.saree = make_product(self.seller, name="Saree", selling_price=Decimal("1900.00"), stock_quantity=0)
+			self.kurta = make_product(self.seller, has_variants=True)
+			self.medium = ProductVariant.objects.create(product=self.kurta, sku="KURTA-M", quantity=2)
+		self.saree_item = WishlistItem.objects.create(user=self.customer, product=self.saree)
+		self.kurta_item = WishlistItem.objects.create(user=self.customer, product=self.kurta, variant=self.medium)
+
+	def run_job(self):
+		total = 0
+		while batch := record_alerts(batch_size=1):
+			total += batch
+		return total
+
+	def edit(self, instance, **fields):
+		with self.captureOnCommitCallbacks(execute=True):
+			for name, value in fields.items():
+				setattr(instance, name, value)
+			instance.save()
+
+	def test_first_run_only_sets_the_baseline(self):
+		self.assertEqual(self.run_job(), 2)
+
+		self.assertFalse(WishlistAlert.objects.exists())
+		self.assertEqual(self.run_job(), 0)
+
+	def test_price_drops_and_restocks_are_recorded_once(self):
+		self.run_job()
+		self.edit(self.saree, selling_price=Decimal("1500.00"), stock_quantity=1)
+		self.edit(self.medium, price_override=Decimal("950.00"))
+
+		self.assertEqual(self.run_job(), 2)
+		self.assertEqual(self.run_job(), 0)
+
+		alerts = {(alert.item_id, alert.kind): alert for alert in WishlistAlert.objects.all()}
+		self.assertEqual(set(alerts), {(self.saree_item.id, Kind.PRICE_DROP), (self.saree_item.id, Kind.BACK_IN_STOCK)})
+		drop = alerts[(self.saree_item.id, Kind.PRICE_DROP)]
+		self.assertEqual((drop.old_price, drop.new_price), (Decimal("1900.00"), Decimal("1500.00")))
+
+	def test_unpublished_products_count_as_out_of_stock(self):
+		self.run_job()
+		self.edit(self.kurta, status=Product.Status.DRAFT)
+		self.run_job()
+		self.edit(self.kurta, status=Product.Status.PUBLISHED)
+
+		self.run_job()
+
+		self.assertEqual(list(WishlistAlert.objects.values_list("kind", flat=True)), [Kind.BACK_IN_STOCK])
+
+	def test_alerts_are_listed_and_marked_read_per_user(self):
+		self.run_job()
+		self.edit(self.saree, selling_price=Decimal("1500.00"))
+		self.run_job()
+		client = api_client(self.customer)
+
+		listed = client.get("/api/wishlist/alerts/", {"read_at__isnull": "true"})
+		self.assertEqual([row["product_name"] for row in listed.data["results"]], ["Saree"])
+		other = api_client(make_user("other@example.com")).post("/api/wishlist/alerts/mark_read/", {}, format="json")
+		self.assertEqual(other.data, {"updated": 0})
+		self.assertEqual(client.post("/api/wishlist/alerts/mark_read/", {}, format="json").data, {"updated": 1})
+		self.assertEqual(client.get("/api/wishlist/alerts/", {"read_at__isnull": "true"}).data["results"], [])
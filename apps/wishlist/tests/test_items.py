@@ -0,0 +1,96 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from apps.catalog.models import ProductVariant
+from apps.common.testing import api_client, make_product, make_seller, make_user
+from apps.wishlist.models import WishlistItem
+
+
+class WishlistBulkTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		seller = make_seller()
+		with self.captureOnCommitCallbacks(execute=True):
+			self.kurta = make_product(seller, has_variants=True)
+			self.saree = make_product(seller, name="Saree", selling_price=Decimal("1900.00"), stock_quantity=2)
+			self.medium = ProductVariant.objects.create(
+				product=self.kurta, sku="KURTA-M", quantity=0, price_override=Decimal("850.00")
+			)
+		self.client = api_client(self.customer)
+
+	def bulk_add(self, items):
+		return self.client.post("/api/wishlist/items/bulk_add/", {"items": items}, format="json")
+
+	def test_bulk_add_keeps_existing_items_and_returns_live_state(self):
+		WishlistItem.objects.create(user=self.customer, product=self.saree)
+
+		response = self.bulk_add(
+			[{"product": self.saree.id}, {"product": self.kurta.id, "variant": self.medium.id}, {"product": self.saree.id}]
+		)
+
+		self.assertEqual(response.status_code, 201)
+		self.assertEqual(WishlistItem.objects.count(), 2)
+		state = {row["product"]: (row["price"], row["in_stock"]) for row in response.data}
+		self.assertEqual(state, {self.saree.id: ("1900.00", True), self.kurta.id: ("850.00", False)})
+
+	def test_bulk_add_rejects_the_whole_batch_on_a_bad_pair(self):
+		response = self.bulk_add([{"product": self.saree.id}, {"product": self.saree.id, "variant": self.medium.id}])
+
+		self.assertEqual(response.status_code, 400)
+		self.assertFalse(WishlistItem.objects.exists())
+
+	def test_bulk_remove_by_ids_or_products(self):
+		self.bulk_add(
+			[{"product": self.saree.id}, {"product": self.kurta.id}, {"product": self.kurta.id, "variant": self.medium.id}]
+		)
+		saree_item = WishlistItem.objects.get(product=self.saree)
+
+		removed = self.client.post("/api/wishlist/items/bulk_remove/", {"products": [self.kurta.id]}, format="json")
+		self.assertEqual(removed.data, {"removed": 2})
+		removed = self.client.post("/api/wishlist/items/bulk_remove/", {"ids": [saree_item.id]}, format="json")
+		self.assertEqual(removed.data, {"removed": 1})
+
+	def test_list_is_one_query(self):
+		self.bulk_add([{"product": self.saree.id}, {"product": self.kurta.id, "variant": self.medium.id}])
+
+		with self.assertNumQueries(1):
+			response = self.client.get("/api/wishlist/items/")
+
+		self.assertEqual(len(response.data), 2)
+
+
+class WishlistItemUpdateTests(TestCase):
+	def setUp(self):
+		self.customer = make_user("customer@example.com")
+		seller = make_seller()
+		self.product = make_product(seller)
+		self.other = make_product(seller, name="Saree", selling_price=Decimal("1900.00"))
+		self.variant = ProductVariant.objects.create(product=self.product, sku="KURTA-M", quantity=3)
+		self.other_variant = ProductVariant.objects.create(product=self.other, sku="SAREE-1", quantity=1)
+		self.item = WishlistItem.objects.create(user=self.customer, product=self.product)
+		self.client = api_client(self.customer)
+
+	def patch(self, data):
+		return self.client.patch(f"/api/wishlist/items/{self.item.id}/", data, format="json")
+
+	def test_patch_variant_alone_checks_the_saved_product(self):
+		response = self.patch({"variant": self.variant.id})
+
+		self.assertEqual(response.status_code, 200)
+		self.item.refresh_from_db()
+		self.assertEqual(self.item.variant, self.variant)
+
+	def test_patch_variant_of_another_product_is_rejected(self):
+		response = self.patch({"variant": self.other_variant.id})
+
+		self.assertEqual(response.status_code, 400)
+		self.assertIn("variant", response.json())
+
+	def test_patch_product_alone_checks_the_saved_variant(self):
+		self.item.variant = self.variant
+		self.item.save()
+
+		response = self.patch({"product": self.other.id})
+
+		self.assertEqual(response.status_code, 400)
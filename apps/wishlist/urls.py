@@ -1,10 +1,11 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from apps.wishlist.views import WishlistItemViewSet
+from apps.wishlist.views import WishlistAlertViewSet, WishlistItemViewSet
 
 router = DefaultRouter()
 router.register("items", WishlistItemViewSet, basename="wishlist-item")
+router.register("alerts", WishlistAlertViewSet, basename="wishlist-alert")
 
 urlpatterns = [
     path("", include(router.urls)),
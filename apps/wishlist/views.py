@@ -1,9 +1,29 @@
-from rest_framework import permissions, viewsets
-from apps.wishlist.models import WishlistItem
-from apps.wishlist.serializers import WishlistItemSerializer
+from django.db import transaction
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema, inline_serializer
+from rest_framework import permissions, serializers, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from apps.common.pagination import CreatedAtCursorPagination
+from apps.wishlist.alerts import remember_seen, with_live_state
+from apps.wishlist.models import WishlistAlert, WishlistItem
+from apps.wishlist.serializers import (
+	WishlistAlertReadSerializer,
+	WishlistAlertSerializer,
+	WishlistBulkAddSerializer,
+	WishlistBulkRemoveSerializer,
+	WishlistItemSerializer,
+)
 
 
 class WishlistItemViewSet(viewsets.ModelViewSet):
+	"""
+	Wishlist items with their product card, live price and stock.
+
+	A page costs one query however many items it holds: the card, variant,
+	color and size are joined, and price and stock are computed in SQL.
+	"""
 	serializer_class = WishlistItemSerializer
 	permission_classes = [permissions.IsAuthenticated]
 
@@ -12,7 +32,96 @@ class WishlistItemViewSet(viewsets.ModelViewSet):
 			return WishlistItem.objects.none()
 		if not self.request.user.is_authenticated:
 			return WishlistItem.objects.none()
-		return WishlistItem.objects.filter(user=self.request.user).select_related("product", "variant")
+		return with_live_state(
+			WishlistItem.objects.filter(user=self.request.user).select_related(
+				"product__card", "variant__color", "variant__size"
+			)
+		).order_by("-created_at", "-id")
 
 	def perform_create(self, serializer):
-		serializer.save(user=self.request.user)
+		data = serializer.validated_data
+		item, _ = WishlistItem.objects.get_or_create(
+			user=self.request.user, product=data["product"], variant=data.get("variant")
+		)
+		serializer.instance = self._hydrate([(item.product_id, item.variant_id)])[0]
+
+	def _hydrate(self, pairs) -> list[WishlistItem]:
+		"""Reads back the user's items for (product_id, variant_id) pairs, starting tracking on new ones."""
+		wanted = set(pairs)
+		items = [
+			item
+			for item in self.get_queryset().filter(product_id__in={product_id for product_id, _ in pairs})
+			if (item.product_id, item.variant_id) in wanted
+		]
+		remember_seen([item for item in items if item.seen_price is None])
+		return items
+
+	@extend_schema(request=WishlistBulkAddSerializer, responses=WishlistItemSerializer(many=True))
+	@action(detail=False, methods=["post"])
+	@transaction.atomic
+	def bulk_add(self, request):
+		"""Add up to 100 products or variants at once; items already on the wishlist are kept as they are"""
+		serializer = WishlistBulkAddSerializer(data=request.data)
+		serializer.is_valid(raise_exception=True)
+		pairs = serializer.validated_data["items"]
+		existing = set(
+			WishlistItem.objects.filter(
+				user=request.user, product_id__in={product_id for product_id, _ in pairs}
+			).values_list("product_id", "variant_id")
+		)
+		WishlistItem.objects.bulk_create(
+			[
+				WishlistItem(user=request.user, product_id=product_id, variant_id=variant_id)
+				for product_id, variant_id in pairs
+				if (product_id, variant_id) not in existing
+			],
+			ignore_conflicts=True,
+		)
+		items = self._hydrate(pairs)
+		return Response(WishlistItemSerializer(items, many=True).data, status=status.HTTP_201_CREATED)
+
+	@extend_schema(
+		request=WishlistBulkRemoveSerializer,
+		responses=inline_serializer("WishlistBulkRemoveResult", {"removed": serializers.IntegerField()}),
+	)
+	@action(detail=False, methods=["post"])
+	def bulk_remove(self, request):
+		"""Remove items by their ids, or every item of the given products"""
+		serializer = WishlistBulkRemoveSerializer(data=request.data)
+		serializer.is_valid(raise_exception=True)
+		items = WishlistItem.objects.filter(user=request.user)
+		if serializer.validated_data.get("ids"):
+			items = items.filter(id__in=serializer.validated_data["ids"])
+		else:
+			items = items.filter(product_id__in=serializer.validated_data["products"])
+		_, deleted = items.delete()
+		return Response({"removed": deleted.get(WishlistItem._meta.label, 0)})
+
+
+class WishlistAlertViewSet(viewsets.ReadOnlyModelViewSet):
+	"""Price drops and restocks of the user's wishlist items, newest first."""
+	serializer_class = WishlistAlertSerializer
+	permission_classes = [permissions.IsAuthenticated]
+	pagination_class = CreatedAtCursorPagination
+	filterset_fields = {"kind": ["exact"], "read_at": ["isnull"]}
+
+	def get_queryset(self):
+		if getattr(self, "swagger_fake_view", False):
+			return WishlistAlert.objects.none()
+		if not self.request.user.is_authenticated:
+			return WishlistAlert.objects.none()
+		return WishlistAlert.objects.filter(user=self.request.user).select_related("item__product")
+
+	@extend_schema(
+		request=WishlistAlertReadSerializer,
+		responses=inline_serializer("WishlistAlertReadResult", {"updated": serializers.IntegerField()}),
+	)
+	@action(detail=False, methods=["post"])
+	def mark_read(self, request):
+		"""Mark the given alerts, or all unread ones, as read"""
+		serializer = WishlistAlertReadSerializer(data=request.data)
+		serializer.is_valid(raise_exception=True)
+		alerts = WishlistAlert.objects.filter(user=request.user, read_at__isnull=True)
+		if serializer.validated_data.get("ids"):
+			alerts = alerts.filter(id__in=serializer.validated_data["ids"])
+		return Response({"updated": alerts.update(read_at=timezone.now())})
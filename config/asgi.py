@@ -5,3 +5,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_asgi_application()
+
+from apps.integrations.gateways import reuse_clients_per_loop  # noqa: E402
+
+# ASGI servers run one event loop per worker for its whole life.
+reuse_clients_per_loop()
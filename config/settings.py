@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import os
+import sys
 from datetime import timedelta
 from pathlib import Path
 
 import dj_database_url
+from corsheaders.defaults import default_headers
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -43,6 +46,7 @@ INSTALLED_APPS = [
     "apps.common",
     "apps.accounts",
     "apps.catalog",
+    "apps.boutiques",
     "apps.cart",
     "apps.wishlist",
     "apps.orders",
@@ -84,10 +88,12 @@ WSGI_APPLICATION = "config.wsgi.application"
 ASGI_APPLICATION = "config.asgi.application"
 
 DATABASE_URL = os.environ.get("DATABASE_URL")
+# Persistent connections suit WSGI workers; set 0 when serving through ASGI (see README).
+DB_CONN_MAX_AGE = int(os.environ.get("DB_CONN_MAX_AGE", "600"))
 if DATABASE_URL:
     DATABASES = {
         "default": dj_database_url.parse(
-            DATABASE_URL, conn_max_age=600, ssl_require=not DEBUG
+            DATABASE_URL, conn_max_age=DB_CONN_MAX_AGE, ssl_require=not DEBUG
         )
     }
 else:
@@ -126,6 +132,54 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Login hashing profile: "argon2" (argon2-cffi) or "scrypt" (stdlib). Hashes
+# made by any listed hasher still verify and are upgraded on the next login.
+PASSWORD_HASH_PROFILE = os.environ.get("PASSWORD_HASH_PROFILE", "argon2")
+PASSWORD_ARGON2 = {
+    "time_cost": int(os.environ.get("ARGON2_TIME_COST", "2")),
+    "memory_cost": int(os.environ.get("ARGON2_MEMORY_KIB", "19456")),
+    "parallelism": int(os.environ.get("ARGON2_PARALLELISM", "1")),
+}
+PASSWORD_SCRYPT = {
+    "work_factor": 2 ** int(os.environ.get("SCRYPT_LOG2_N", "14")),
+    "block_size": int(os.environ.get("SCRYPT_BLOCK_SIZE", "8")),
+    "parallelism": int(os.environ.get("SCRYPT_PARALLELISM", "1")),
+}
+_PROFILE_HASHERS = {
+    "argon2": "apps.accounts.hashers.TunedArgon2PasswordHasher",
+    "scrypt": "apps.accounts.hashers.TunedScryptPasswordHasher",
+}
+PASSWORD_HASHERS = [
+    _PROFILE_HASHERS[PASSWORD_HASH_PROFILE],
+    *(path for profile, path in _PROFILE_HASHERS.items() if profile != PASSWORD_HASH_PROFILE),
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+
+REDIS_URL = os.environ.get("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    # Per-process only: login limits, cached user state and cache version bumps are not shared
+    # between workers, so each gunicorn worker would enforce its own limits and serve its own
+    # stale copies. Only acceptable for development, a deliberately single-process deployment,
+    # or manage.py (check, migrate, test, ...), which must keep working on a fresh checkout.
+    running_manage_py = Path(sys.argv[0]).name in {"manage.py", "django-admin"}
+    if not DEBUG and not running_manage_py and not env_bool("ALLOW_LOCAL_CACHE", False):
+        raise ImproperlyConfigured(
+            "REDIS_URL must be set when DEBUG is off (or set ALLOW_LOCAL_CACHE=true for a single-process deployment)."
+        )
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = os.environ.get("TIME_ZONE", "UTC")
 USE_I18N = True
@@ -153,7 +207,7 @@ AUTH_USER_MODEL = "accounts.User"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.accounts.authentication.LazyJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
@@ -164,10 +218,16 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
     ],
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    "DEFAULT_THROTTLE_RATES": {
+        "login_ip": os.environ.get("LOGIN_IP_RATE", "30/min"),
+        "login_account": os.environ.get("LOGIN_ACCOUNT_RATE", "10/min"),
+    },
+    "NUM_PROXIES": int(os.environ["NUM_PROXIES"]) if os.environ.get("NUM_PROXIES") else None,
 }
 
 CORS_ALLOW_ALL_ORIGINS = env_bool("CORS_ALLOW_ALL_ORIGINS", False)
 CORS_ALLOW_CREDENTIALS = env_bool("CORS_ALLOW_CREDENTIALS", True)
+CORS_ALLOW_HEADERS = (*default_headers, "idempotency-key")
 CORS_ALLOWED_ORIGINS = env_list(
     "CORS_ALLOWED_ORIGINS",
     "http://localhost:3000,http://127.0.0.1:3000,http://localhost:5173,http://127.0.0.1:5173",
@@ -178,11 +238,26 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=int(os.environ.get("REFRESH_TOKEN_DAYS", "30"))),
 }
 
+USER_STATE_CACHE_SECONDS = int(os.environ.get("USER_STATE_CACHE_SECONDS", "60"))
+REVOKED_TOKEN_REFRESH_SECONDS = float(os.environ.get("REVOKED_TOKEN_REFRESH_SECONDS", "5"))
+REVOKED_TOKEN_BLOOM_BITS = int(os.environ.get("REVOKED_TOKEN_BLOOM_BITS", str(1 << 20)))
+CATEGORY_TREE_CACHE_SECONDS = int(os.environ.get("CATEGORY_TREE_CACHE_SECONDS", "300"))
+BOUTIQUE_LISTING_CACHE_SECONDS = int(os.environ.get("BOUTIQUE_LISTING_CACHE_SECONDS", "300"))
+STOREFRONT_CACHE_SECONDS = int(os.environ.get("STOREFRONT_CACHE_SECONDS", "300"))
+
 PLATFORM_COMMISSION_PERCENT = os.environ.get("PLATFORM_COMMISSION_PERCENT", "10")
 RAZORPAY_KEY_ID = os.environ.get("RAZORPAY_KEY_ID", "")
 RAZORPAY_KEY_SECRET = os.environ.get("RAZORPAY_KEY_SECRET", "")
+RAZORPAY_WEBHOOK_SECRET = os.environ.get("RAZORPAY_WEBHOOK_SECRET", "")
+IDEMPOTENCY_KEY_TTL = timedelta(hours=int(os.environ.get("IDEMPOTENCY_KEY_TTL_HOURS", "24")))
+IDEMPOTENCY_WAIT_SECONDS = float(os.environ.get("IDEMPOTENCY_WAIT_SECONDS", "10"))
+# How long a claimed key stays locked to its request. Keep it above the gunicorn worker
+# timeout: a request whose worker died is taken over by a retry once the lease runs out.
+IDEMPOTENCY_LEASE = timedelta(seconds=int(os.environ.get("IDEMPOTENCY_LEASE_SECONDS", "90")))
 RUNPOD_API_KEY = os.environ.get("RUNPOD_API_KEY", "")
 RUNPOD_VTON_ENDPOINT_ID = os.environ.get("RUNPOD_VTON_ENDPOINT_ID", "")
+UPSTREAM_TIMEOUT_SECONDS = float(os.environ.get("UPSTREAM_TIMEOUT_SECONDS", "15"))
+UPSTREAM_MAX_CONNECTIONS = int(os.environ.get("UPSTREAM_MAX_CONNECTIONS", "100"))
 
 SPECTACULAR_SETTINGS = {
     "TITLE": "Boutique Marketplace API",
@@ -194,5 +269,6 @@ SPECTACULAR_SETTINGS = {
         "OrderStatusEnum": "apps.orders.models.Order.Status",
         "CustomizationRequestStatusEnum": "apps.orders.models.CustomizationRequest.Status",
         "OrderPaymentStatusEnum": "apps.orders.models.Order.PaymentStatus",
+        "BoutiqueStatusEnum": "apps.boutiques.models.Boutique.Status",
     },
 }
@@ -0,0 +1,175 @@
+"""
+Gunicorn runtime profiles.
+
+``GUNICORN_PROFILE`` picks how the app is served:
+
+- ``sync`` (default): config.wsgi on threaded (gthread) workers.
+- ``asgi``: config.asgi on uvicorn workers, one event loop per worker.
+
+Workers are sized from the CPU cores this process may run on (the cgroup CPU
+quota when there is one, else CPU affinity), not the host's core count, and every value can be overridden from the environment
+(WEB_CONCURRENCY, GUNICORN_THREADS, GUNICORN_MAX_REQUESTS, ...). The app is
+loaded once in the master (``preload_app``) so workers share its imported code
+copy-on-write, and workers are recycled after a jittered number of requests
+so slow leaks stay bounded. Each worker logs its memory when it starts, every
+GUNICORN_MEMORY_REPORT_EVERY requests and when it exits.
+"""
+import gc
+import math
+import os
+
+
+def env_int(name, default):
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def env_bool(name, default):
+    value = os.environ.get(name)
+    return value.lower() in {"1", "true", "yes"} if value else default
+
+
+def read_first_line(path):
+    try:
+        with open(path) as f:
+            return f.readline().split()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit():
+    """The container's CPU quota in whole cores, or None when it has none."""
+    fields = read_first_line("/sys/fs/cgroup/cpu.max")  # cgroup v2: "<quota|max> <period>"
+    if fields is None:
+        quota = read_first_line("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")  # cgroup v1
+        period = read_first_line("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+        fields = quota + period if quota and period else None
+    if not fields or len(fields) < 2 or fields[0] in {"max", "-1"}:
+        return None
+    try:
+        quota, period = int(fields[0]), int(fields[1])
+    except ValueError:
+        return None
+    if quota <= 0 or period <= 0:
+        return None
+    return max(1, math.ceil(quota / period))
+
+
+def available_cores():
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    # Affinity still lists every host core when a container is throttled by a
+    # CFS quota, so the quota wins when it is the tighter of the two.
+    limit = cgroup_cpu_limit()
+    return min(cores, limit) if limit else cores
+
+
+CORES = available_cores()
+
+PROFILES = {
+    "sync": {
+        "wsgi_app": "config.wsgi:application",
+        "worker_class": "gthread",
+        # Requests mostly wait on the database and on Razorpay/RunPod, so a few
+        # threads per worker keep a core busy without adding whole processes.
+        "workers": CORES * 2 + 1,
+        "threads": 4,
+        "max_requests": 1000,
+    },
+    "asgi": {
+        "wsgi_app": "config.asgi:application",
+        "worker_class": "uvicorn_worker.UvicornWorker",
+        # Concurrency for the async views comes from coroutines, but every sync
+        # view in a worker runs on its one thread-sensitive executor thread, so
+        # size like the sync profile's process count to keep those moving too.
+        "workers": CORES * 2 + 1,
+        "threads": 1,
+        "max_requests": 5000,
+    },
+}
+
+profile_name = os.environ.get("GUNICORN_PROFILE", "sync")
+if profile_name not in PROFILES:
+    raise RuntimeError(f"Unknown GUNICORN_PROFILE {profile_name!r}; expected one of {sorted(PROFILES)}.")
+profile = PROFILES[profile_name]
+
+if profile_name == "asgi":
+    # Async views do not close persistent connections at request end (see README).
+    os.environ.setdefault("DB_CONN_MAX_AGE", "0")
+
+wsgi_app = profile["wsgi_app"]
+worker_class = profile["worker_class"]
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = env_int("WEB_CONCURRENCY", profile["workers"])
+threads = env_int("GUNICORN_THREADS", profile["threads"])
+preload_app = env_bool("GUNICORN_PRELOAD", True)
+max_requests = env_int("GUNICORN_MAX_REQUESTS", profile["max_requests"])
+max_requests_jitter = env_int("GUNICORN_MAX_REQUESTS_JITTER", max_requests // 10)
+timeout = env_int("GUNICORN_TIMEOUT", 60)
+graceful_timeout = env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+keepalive = env_int("GUNICORN_KEEPALIVE", 5)
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+accesslog = os.environ.get("GUNICORN_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOG_LEVEL", "info")
+
+memory_report_every = env_int("GUNICORN_MEMORY_REPORT_EVERY", 500)
+
+
+def report_memory(log, label, pid):
+    from apps.common.memory import private_bytes, rss_bytes
+
+    rss, private = rss_bytes(pid), private_bytes(pid)
+    log.info(
+        "%s pid=%s rss=%.1fMiB shared=%.1fMiB private=%.1fMiB",
+        label,
+        pid,
+        rss / 2**20,
+        (rss - private) / 2**20,
+        private / 2**20,
+    )
+
+
+def when_ready(server):
+    server.log.info(
+        "profile=%s worker_class=%s workers=%s threads=%s cores=%s preload=%s max_requests=%s+%s",
+        profile_name,
+        worker_class,
+        workers,
+        threads,
+        CORES,
+        preload_app,
+        max_requests,
+        max_requests_jitter,
+    )
+    if preload_app:
+        # Move everything the app import allocated out of the collector's reach,
+        # so collections in the workers don't touch (and copy) the shared pages.
+        gc.freeze()
+        report_memory(server.log, "master", os.getpid())
+
+
+def post_fork(server, worker):
+    from django.apps import apps
+
+    if apps.ready:
+        # Connections opened while preloading belong to the master; a worker must
+        # never reuse their sockets.
+        from django.db import connections
+
+        connections.close_all()
+    worker.handled_requests = 0
+    report_memory(worker.log, "worker started", worker.pid)
+
+
+def post_request(worker, req, environ, resp):
+    # Only sync/gthread workers call this hook; uvicorn workers report at start and exit.
+    worker.handled_requests += 1
+    if memory_report_every and worker.handled_requests % memory_report_every == 0:
+        report_memory(worker.log, f"worker after {worker.handled_requests} requests", worker.pid)
+
+
+def worker_exit(server, worker):
+    report_memory(server.log, f"worker exiting after {getattr(worker, 'handled_requests', 0)} requests", worker.pid)